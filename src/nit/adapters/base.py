@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from nit.adapters.coverage.base import CoverageReport
+    from nit.adapters.worker_pool import WarmRunner
     from nit.llm.prompts.base import PromptTemplate
 
 
@@ -141,6 +142,22 @@ class TestFrameworkAdapter(ABC):
         """
         return []
 
+    def create_warm_runner(self, project_path: Path) -> WarmRunner | None:
+        """Return a long-lived runner for repeated small runs, if supported.
+
+        Override this method when the framework can keep a runner process
+        alive and execute test files on request, skipping start-up cost on
+        every run.  The runner is not started yet; ``WorkerPool`` does that.
+
+        Args:
+            project_path: Root of the project containing the tests.
+
+        Returns:
+            A ``WarmRunner``, or ``None`` to always use ``run_tests``.
+        """
+        _ = project_path  # No warm runner by default
+        return None
+
 
 class DocFrameworkAdapter(ABC):
     """Abstract base class for documentation framework adapters.
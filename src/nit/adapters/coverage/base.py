@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class LineCoverage:
@@ -101,6 +105,24 @@ class CoverageReport:
 
     files: dict[str, FileCoverage] = field(default_factory=dict)
 
+    @classmethod
+    def from_files(cls, files: Iterable[FileCoverage]) -> CoverageReport:
+        """Build a report from per-file coverage, merging entries for the same path."""
+        report = cls()
+        for file_coverage in files:
+            report.add_file(file_coverage)
+        return report
+
+    def add_file(self, file_coverage: FileCoverage) -> None:
+        """Add coverage for one file, merging it into an existing entry for that path."""
+        existing = self.files.get(file_coverage.file_path)
+        if existing is None:
+            self.files[file_coverage.file_path] = file_coverage
+            return
+        existing.lines.extend(file_coverage.lines)
+        existing.functions.extend(file_coverage.functions)
+        existing.branches.extend(file_coverage.branches)
+
     @property
     def overall_line_coverage(self) -> float:
         """Return overall line coverage percentage across all files."""
@@ -209,3 +231,60 @@ class CoverageAdapter(ABC):
         Returns:
             A CoverageReport with parsed coverage data.
         """
+
+    def find_coverage_file(self, project_path: Path) -> Path | None:
+        """Locate the native report a coverage run left in project_path.
+
+        Returns:
+            Path of the report, or None if there is none or the adapter
+            does not know where its tool writes reports.
+        """
+        _ = project_path  # No known report location by default
+        return None
+
+    def iter_coverage_file(self, coverage_file: Path) -> Iterator[FileCoverage]:
+        """Yield the coverage of each file in a native report as it is parsed.
+
+        The default parses the whole report first; adapters for formats
+        whose reports grow large read them incrementally instead.  Unlike
+        ``parse_coverage_file``, malformed input raises (``ValueError``,
+        ``OSError`` or the XML parser's error) after the files parsed so far.
+
+        Args:
+            coverage_file: Path to the native coverage report file.
+        """
+        yield from self.parse_coverage_file(coverage_file).files.values()
+
+    async def stream_coverage(
+        self,
+        project_path: Path,
+        *,
+        test_files: list[Path] | None = None,
+        timeout: float = 120.0,
+    ) -> Iterable[FileCoverage]:
+        """Run coverage collection and stream the report it writes.
+
+        The default runs ``run_coverage`` and so holds the whole report;
+        adapters whose tool writes a report to disk override this to run
+        the tool only and hand back ``iter_coverage_file`` of that report.
+        The returned iterable is lazy and blocking, so iterate it off the
+        event loop.
+
+        Args:
+            project_path: Root of the project to collect coverage for.
+            test_files: Specific test files to run. None runs all.
+            timeout: Maximum seconds to wait for coverage collection.
+
+        Returns:
+            The coverage of each file, parsed as it is iterated.
+        """
+        report = await self.run_coverage(project_path, test_files=test_files, timeout=timeout)
+        return report.files.values()
+
+    def _stream_found_report(self, project_path: Path) -> Iterable[FileCoverage]:
+        """Stream the report ``find_coverage_file`` locates, if any."""
+        coverage_file = self.find_coverage_file(project_path)
+        if coverage_file is None:
+            logger.warning("No %s coverage report found in %s", self.name, project_path)
+            return ()
+        return self.iter_coverage_file(coverage_file)
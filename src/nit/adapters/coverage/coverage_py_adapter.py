@@ -7,11 +7,11 @@ used via pytest-cov plugin, which integrates seamlessly with pytest.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
 
 from nit.adapters.coverage.base import (
@@ -22,6 +22,7 @@ from nit.adapters.coverage.base import (
     FunctionCoverage,
     LineCoverage,
 )
+from nit.adapters.coverage.streaming import JsonStream
 
 logger = logging.getLogger(__name__)
 
@@ -123,18 +124,36 @@ class CoveragePyAdapter(CoverageAdapter):
             Unified CoverageReport.
         """
         # Use pytest-cov to run coverage
-        return await self._run_pytest_coverage(project_path, test_files, timeout)
+        await self._run_pytest_coverage(project_path, test_files, timeout)
+
+        # Parse the generated coverage file, falling back to other locations
+        coverage_file = self.find_coverage_file(project_path)
+        if coverage_file is not None:
+            return self.parse_coverage_file(coverage_file)
+
+        # No coverage file found - return empty report
+        logger.warning("No coverage file found in %s", project_path)
+        return CoverageReport()
+
+    async def stream_coverage(
+        self,
+        project_path: Path,
+        *,
+        test_files: list[Path] | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> Iterable[FileCoverage]:
+        """Run pytest-cov, then stream the coverage.json it writes."""
+        await self._run_pytest_coverage(project_path, test_files, timeout)
+        return self._stream_found_report(project_path)
 
     async def _run_pytest_coverage(
         self,
         project_path: Path,
         test_files: list[Path] | None,
         timeout: float,
-    ) -> CoverageReport:
+    ) -> None:
         """Run pytest with coverage enabled via pytest-cov."""
         # Generate JSON report for easier parsing
-        coverage_json = project_path / "coverage.json"
-
         cmd = [
             ".venv/bin/python",
             "-m",
@@ -166,19 +185,13 @@ class CoveragePyAdapter(CoverageAdapter):
         except Exception as e:
             logger.error("Failed to run pytest coverage: %s", e)
 
-        # Parse the generated coverage file
-        if coverage_json.exists():
-            return self.parse_coverage_file(coverage_json)
-
-        # Fallback to other locations
+    def find_coverage_file(self, project_path: Path) -> Path | None:
+        """Return the first coverage.py JSON report in its standard locations."""
         for coverage_path in _COVERAGE_PATHS:
             full_path = project_path / coverage_path
             if full_path.exists():
-                return self.parse_coverage_file(full_path)
-
-        # No coverage file found - return empty report
-        logger.warning("No coverage file found in %s", project_path)
-        return CoverageReport()
+                return full_path
+        return None
 
     # ── Coverage parsing ─────────────────────────────────────────
 
@@ -208,20 +221,26 @@ class CoveragePyAdapter(CoverageAdapter):
         }
         """
         try:
-            with coverage_file.open() as f:
-                coverage_data = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            return CoverageReport.from_files(self.iter_coverage_file(coverage_file))
+        except (ValueError, OSError) as e:
             logger.error("Failed to parse coverage file %s: %s", coverage_file, e)
             return CoverageReport()
 
-        files: dict[str, FileCoverage] = {}
+    def iter_coverage_file(self, coverage_file: Path) -> Iterator[FileCoverage]:
+        """Yield each file of a coverage.py JSON report as it is read.
 
-        # Parse each file's coverage data
-        files_data = coverage_data.get("files", {})
-        for file_path, file_data in files_data.items():
-            files[file_path] = self._parse_file_coverage(file_path, file_data)
-
-        return CoverageReport(files=files)
+        Only one entry of ``files`` is decoded at a time; ``meta`` and
+        ``totals`` are skipped.
+        """
+        with coverage_file.open(encoding="utf-8") as f:
+            stream = JsonStream(f)
+            for key in stream.members():
+                if key != "files":
+                    stream.skip()
+                    continue
+                # Parse each file's coverage data
+                for file_path in stream.members():
+                    yield self._parse_file_coverage(file_path, stream.value())
 
     def _parse_file_coverage(self, file_path: str, data: dict[str, Any]) -> FileCoverage:
         """Parse coverage data for a single file."""
@@ -24,6 +24,7 @@ from nit.adapters.coverage.base import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
     from xml.etree.ElementTree import Element as XmlElement
 
@@ -135,32 +136,49 @@ def _process_class_element(
         )
 
 
+def _iter_cobertura_xml(coverage_file: Path) -> Iterator[FileCoverage]:
+    """Yield the files of a Cobertura XML report one <package> at a time.
+
+    The report is read with ``iterparse``; each class is cleared once
+    converted and each package is dropped from the tree when it ends, so
+    memory is bounded by the largest package rather than the whole report.
+    """
+    open_elements: list[XmlElement] = []
+    package_names: list[str] = []
+    files: dict[str, FileCoverage] = {}
+    # Cobertura: coverage/packages/package/classes/class (or package/class)
+    for event, elem in ElementTree.iterparse(coverage_file, events=("start", "end")):
+        tag = _local_name(elem)
+        if event == "start":
+            if not open_elements and tag != "coverage":
+                logger.warning("Cobertura XML root is not <coverage>: %s", elem.tag)
+                return
+            if tag == "package":
+                package_names.append(elem.get("name", ""))
+            open_elements.append(elem)
+            continue
+
+        open_elements.pop()
+        if tag == "class" and package_names:
+            _process_class_element(elem, package_names[-1], files)
+            elem.clear()
+        elif tag == "package":
+            package_names.pop()
+            if not package_names:
+                yield from files.values()
+                files = {}
+            if open_elements:
+                open_elements[-1].remove(elem)
+
+
 def _parse_cobertura_xml(coverage_file: Path) -> CoverageReport:
     """Parse Cobertura XML report into unified CoverageReport."""
-    files: dict[str, FileCoverage] = {}
     try:
-        tree = ElementTree.parse(coverage_file)
+        return CoverageReport.from_files(_iter_cobertura_xml(coverage_file))
     except (DefusedParseError, OSError) as e:
         logger.error("Failed to parse Cobertura XML %s: %s", coverage_file, e)
         return CoverageReport()
 
-    root = tree.getroot()
-    if _local_name(root) != "coverage":
-        logger.warning("Cobertura XML root is not <coverage>: %s", root.tag)
-        return CoverageReport()
-
-    # Cobertura: coverage/packages/package/classes/class (or package/class)
-    for package in root.iter():
-        if _local_name(package) != "package":
-            continue
-        package_name = package.get("name", "")
-        for class_elem in package.iter():
-            if _local_name(class_elem) != "class":
-                continue
-            _process_class_element(class_elem, package_name, files)
-
-    return CoverageReport(files=files)
-
 
 def _find_cobertura_report(project_path: Path) -> Path | None:
     """Locate a Cobertura XML report under project_path."""
@@ -222,12 +240,44 @@ class CoverletAdapter(CoverageAdapter):
         Uses dotnet test --collect:"XPlat Code Coverage" which produces
         coverage.cobertura.xml in TestResults when coverlet.collector is referenced.
         """
+        if not await self._run_dotnet_test(project_path, test_files, timeout):
+            return CoverageReport()
+
+        report_path = _find_cobertura_report(project_path)
+        if report_path is not None:
+            return self.parse_coverage_file(report_path)
+        logger.warning("No Cobertura report found under %s", project_path)
+        return CoverageReport()
+
+    async def stream_coverage(
+        self,
+        project_path: Path,
+        *,
+        test_files: list[Path] | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> Iterable[FileCoverage]:
+        """Run dotnet test with Coverlet, then stream the Cobertura XML."""
+        if not await self._run_dotnet_test(project_path, test_files, timeout):
+            return ()
+        return self._stream_found_report(project_path)
+
+    async def _run_dotnet_test(
+        self,
+        project_path: Path,
+        test_files: list[Path] | None,
+        timeout: float,
+    ) -> bool:
+        """Run dotnet test with the Coverlet collector.
+
+        Returns:
+            False if there was nothing to run or the run did not finish.
+        """
         sln_or_csproj = next(project_path.glob("*.sln"), None) or next(
             project_path.glob("*.csproj"), None
         )
         if sln_or_csproj is None:
             logger.warning("No .sln or .csproj found under %s", project_path)
-            return CoverageReport()
+            return False
 
         cmd = [
             "dotnet",
@@ -251,17 +301,20 @@ class CoverletAdapter(CoverageAdapter):
             await asyncio.wait_for(proc.communicate(), timeout=timeout)
         except TimeoutError:
             logger.warning("Coverage collection timed out after %s s", timeout)
-            return CoverageReport()
+            return False
         except FileNotFoundError:
             logger.warning("dotnet not found")
-            return CoverageReport()
+            return False
+        return True
 
-        report_path = _find_cobertura_report(project_path)
-        if report_path is not None:
-            return self.parse_coverage_file(report_path)
-        logger.warning("No Cobertura report found under %s", project_path)
-        return CoverageReport()
+    def find_coverage_file(self, project_path: Path) -> Path | None:
+        """Return the Cobertura report at the root or under ``TestResults``."""
+        return _find_cobertura_report(project_path)
 
     def parse_coverage_file(self, coverage_file: Path) -> CoverageReport:
         """Parse a Cobertura XML report into unified format."""
         return _parse_cobertura_xml(coverage_file)
+
+    def iter_coverage_file(self, coverage_file: Path) -> Iterator[FileCoverage]:
+        """Yield the files of a Cobertura XML report one package at a time."""
+        return _iter_cobertura_xml(coverage_file)
@@ -6,6 +6,7 @@ export JSON format into the unified CoverageReport.
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import re
@@ -20,9 +21,11 @@ from nit.adapters.coverage.base import (
     FunctionCoverage,
     LineCoverage,
 )
+from nit.adapters.coverage.streaming import JsonStream
 from nit.utils.subprocess_runner import run_subprocess
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -225,19 +228,24 @@ class GcovAdapter(CoverageAdapter):
                     continue
         return CoverageReport()
 
-    def _find_and_parse_existing(self, project_path: Path) -> CoverageReport:
-        """Find and parse existing coverage.info or coverage JSON."""
+    def find_coverage_file(self, project_path: Path) -> Path | None:
+        """Return an existing coverage.info or llvm-cov JSON report."""
         for name in ["coverage.info", "lcov.info", "coverage.lcov"]:
             p = project_path / name
             if p.exists():
-                return self.parse_coverage_file(p)
+                return p
         for name in _LLVM_COV_JSON_NAMES:
             p = project_path / name
             if p.exists():
-                return self.parse_coverage_file(p)
-        for path in project_path.rglob("*.info"):
-            return self.parse_coverage_file(path)
-        return CoverageReport()
+                return p
+        return next(project_path.rglob("*.info"), None)
+
+    def _find_and_parse_existing(self, project_path: Path) -> CoverageReport:
+        """Find and parse existing coverage.info or coverage JSON."""
+        coverage_file = self.find_coverage_file(project_path)
+        if coverage_file is None:
+            return CoverageReport()
+        return self.parse_coverage_file(coverage_file)
 
     # ── Coverage parsing ─────────────────────────────────────────
 
@@ -259,14 +267,33 @@ class GcovAdapter(CoverageAdapter):
             return self._parse_lcov_file(coverage_file)
         # Try content: JSON vs LCOV text
         try:
-            raw = coverage_file.read_text()
-            if raw.strip().startswith("{"):
-                return self._parse_llvm_cov_json_string(raw)
-            return self._parse_lcov_string(raw)
+            if self._is_json_file(coverage_file):
+                return self._parse_llvm_cov_file(coverage_file)
+            return self._parse_lcov_string(coverage_file.read_text())
         except OSError as e:
             logger.error("Failed to read coverage file %s: %s", coverage_file, e)
             return CoverageReport()
 
+    def iter_coverage_file(self, coverage_file: Path) -> Iterator[FileCoverage]:
+        """Yield each file of a coverage report as it is parsed.
+
+        llvm-cov export JSON is read incrementally, one entry of ``files``
+        at a time; LCOV text is parsed as a whole.
+        """
+        suffix = coverage_file.suffix.lower()
+        is_lcov = suffix in (".info", ".lcov")
+        if suffix == ".json" or (not is_lcov and self._is_json_file(coverage_file)):
+            with coverage_file.open(encoding="utf-8") as f:
+                yield from self._iter_llvm_cov(JsonStream(f))
+        else:
+            yield from super().iter_coverage_file(coverage_file)
+
+    @staticmethod
+    def _is_json_file(coverage_file: Path) -> bool:
+        """Whether the file content starts with a JSON object."""
+        with coverage_file.open(encoding="utf-8", errors="replace") as f:
+            return JsonStream(f).peek() == "{"
+
     def _parse_lcov_file(self, path: Path) -> CoverageReport:
         """Parse LCOV-format file."""
         try:
@@ -404,36 +431,57 @@ class GcovAdapter(CoverageAdapter):
     def _parse_llvm_cov_file(self, path: Path) -> CoverageReport:
         """Parse llvm-cov export JSON file."""
         try:
-            return self._parse_llvm_cov_json_string(path.read_text())
-        except (OSError, json.JSONDecodeError) as e:
+            with path.open(encoding="utf-8") as f:
+                return CoverageReport.from_files(self._iter_llvm_cov(JsonStream(f)))
+        except (OSError, ValueError) as e:
             logger.error("Failed to parse llvm-cov JSON %s: %s", path, e)
             return CoverageReport()
 
     def _parse_llvm_cov_json_string(self, content: str) -> CoverageReport:
         """Parse llvm-cov export JSON string into CoverageReport."""
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            return CoverageReport.from_files(self._iter_llvm_cov(JsonStream(io.StringIO(content))))
+        except ValueError as e:
             logger.error("Invalid JSON for llvm-cov: %s", e)
             return CoverageReport()
-        files: dict[str, FileCoverage] = {}
-        # Structure: Data[] -> Files[] with filename, segments, branches, etc.
-        data_list = data.get("data", []) if isinstance(data, dict) else []
-        if not data_list and isinstance(data, dict) and "data" not in data:
-            data_list = [data]
-        for export_block in data_list:
-            if not isinstance(export_block, dict):
+
+    def _iter_llvm_cov(self, stream: JsonStream) -> Iterator[FileCoverage]:
+        """Yield the files of an llvm-cov export document as they are read.
+
+        Structure: data[] -> files[] with filename, segments, branches, etc.
+        A document without ``data`` is read as a single export block.
+        """
+        if stream.peek() != "{":
+            stream.skip()
+            return
+        seen_data = False
+        for key in stream.members():
+            if key == "data" and stream.peek() == "[":
+                seen_data = True
+                for _ in stream.elements():
+                    if stream.peek() != "{":
+                        stream.skip()
+                        continue
+                    for block_key in stream.members():
+                        if block_key == "files" and stream.peek() == "[":
+                            yield from self._iter_llvm_cov_files(stream)
+                        else:
+                            stream.skip()
+            elif key == "files" and not seen_data and stream.peek() == "[":
+                yield from self._iter_llvm_cov_files(stream)
+            else:
+                seen_data = seen_data or key == "data"
+                stream.skip()
+
+    def _iter_llvm_cov_files(self, stream: JsonStream) -> Iterator[FileCoverage]:
+        """Yield the entries of one ``files`` array, decoding one file at a time."""
+        for _ in stream.elements():
+            file_info = stream.value()
+            if not isinstance(file_info, dict):
                 continue
-            for file_info in export_block.get("files", []):
-                if not isinstance(file_info, dict):
-                    continue
-                path = file_info.get("filename")
-                if not path:
-                    continue
-                fc = self._file_coverage_from_llvm_cov(file_info)
-                if fc:
-                    files[path] = fc
-        return CoverageReport(files=files)
+            fc = self._file_coverage_from_llvm_cov(file_info)
+            if fc:
+                yield fc
 
     def _file_coverage_from_llvm_cov(self, file_info: dict[str, Any]) -> FileCoverage | None:
         """Build FileCoverage from one file entry in llvm-cov export."""
@@ -12,6 +12,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
 
 from nit.adapters.coverage.base import (
@@ -22,6 +23,7 @@ from nit.adapters.coverage.base import (
     FunctionCoverage,
     LineCoverage,
 )
+from nit.adapters.coverage.streaming import JsonStream
 
 logger = logging.getLogger(__name__)
 
@@ -115,20 +117,42 @@ class IstanbulAdapter(CoverageAdapter):
         Returns:
             Unified CoverageReport.
         """
+        await self._run_test_coverage(project_path, test_files, timeout)
+        return self._find_and_parse_coverage(project_path)
+
+    async def stream_coverage(
+        self,
+        project_path: Path,
+        *,
+        test_files: list[Path] | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> Iterable[FileCoverage]:
+        """Run Vitest or Jest coverage, then stream the JSON report it writes."""
+        await self._run_test_coverage(project_path, test_files, timeout)
+        return self._stream_found_report(project_path)
+
+    async def _run_test_coverage(
+        self,
+        project_path: Path,
+        test_files: list[Path] | None,
+        timeout: float,
+    ) -> None:
+        """Run coverage with the project's test runner."""
         # Determine which test runner to use
         if _has_vitest(project_path):
-            return await self._run_vitest_coverage(project_path, test_files, timeout)
-        if _has_jest(project_path):
-            return await self._run_jest_coverage(project_path, test_files, timeout)
-        msg = f"No supported test runner found in {project_path}"
-        raise RuntimeError(msg)
+            await self._run_vitest_coverage(project_path, test_files, timeout)
+        elif _has_jest(project_path):
+            await self._run_jest_coverage(project_path, test_files, timeout)
+        else:
+            msg = f"No supported test runner found in {project_path}"
+            raise RuntimeError(msg)
 
     async def _run_vitest_coverage(
         self,
         project_path: Path,
         test_files: list[Path] | None,
         timeout: float,
-    ) -> CoverageReport:
+    ) -> None:
         """Run Vitest with coverage enabled."""
         cmd = ["npx", "vitest", "run", "--coverage"]
         if test_files:
@@ -153,15 +177,12 @@ class IstanbulAdapter(CoverageAdapter):
         except Exception as e:
             logger.error("Failed to run Vitest coverage: %s", e)
 
-        # Parse the generated coverage file
-        return self._find_and_parse_coverage(project_path)
-
     async def _run_jest_coverage(
         self,
         project_path: Path,
         test_files: list[Path] | None,
         timeout: float,
-    ) -> CoverageReport:
+    ) -> None:
         """Run Jest with coverage enabled."""
         cmd = ["npx", "jest", "--coverage"]
         if test_files:
@@ -185,14 +206,19 @@ class IstanbulAdapter(CoverageAdapter):
         except Exception as e:
             logger.error("Failed to run Jest coverage: %s", e)
 
-        return self._find_and_parse_coverage(project_path)
-
-    def _find_and_parse_coverage(self, project_path: Path) -> CoverageReport:
-        """Find and parse the coverage JSON file."""
+    def find_coverage_file(self, project_path: Path) -> Path | None:
+        """Return the first Istanbul JSON report in its standard locations."""
         for coverage_path in _COVERAGE_PATHS:
             full_path = project_path / coverage_path
             if full_path.exists():
-                return self.parse_coverage_file(full_path)
+                return full_path
+        return None
+
+    def _find_and_parse_coverage(self, project_path: Path) -> CoverageReport:
+        """Find and parse the coverage JSON file."""
+        coverage_file = self.find_coverage_file(project_path)
+        if coverage_file is not None:
+            return self.parse_coverage_file(coverage_file)
 
         # No coverage file found - return empty report
         logger.warning("No coverage file found in %s", project_path)
@@ -217,18 +243,21 @@ class IstanbulAdapter(CoverageAdapter):
         }
         """
         try:
-            with coverage_file.open() as f:
-                istanbul_data = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            return CoverageReport.from_files(self.iter_coverage_file(coverage_file))
+        except (ValueError, OSError) as e:
             logger.error("Failed to parse coverage file %s: %s", coverage_file, e)
             return CoverageReport()
 
-        files: dict[str, FileCoverage] = {}
-
-        for file_path, file_data in istanbul_data.items():
-            files[file_path] = self._parse_file_coverage(file_path, file_data)
+    def iter_coverage_file(self, coverage_file: Path) -> Iterator[FileCoverage]:
+        """Yield each file of an Istanbul JSON report as it is read.
 
-        return CoverageReport(files=files)
+        Only one file's entry is decoded at a time, so memory does not grow
+        with the size of the report.
+        """
+        with coverage_file.open(encoding="utf-8") as f:
+            stream = JsonStream(f)
+            for file_path in stream.members():
+                yield self._parse_file_coverage(file_path, stream.value())
 
     def _parse_file_coverage(self, file_path: str, data: dict[str, Any]) -> FileCoverage:
         """Parse coverage data for a single file."""
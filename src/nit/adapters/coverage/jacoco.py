@@ -23,6 +23,7 @@ from nit.adapters.coverage.base import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
     from xml.etree.ElementTree import Element as XmlElement
 
@@ -123,45 +124,64 @@ def _ensure_functions(
     )
 
 
+def _class_file_coverage(class_elem: XmlElement, package_name: str) -> FileCoverage:
+    """Coverage of the source file of one <class> element."""
+    class_name = class_elem.get("name", "")
+    source_filename = class_elem.get("sourcefilename", "")
+    file_path = _file_path_from_class(package_name, class_name, source_filename)
+
+    functions_list, lines_list, branches_list = _parse_class_counters(class_elem)
+    _ensure_functions(functions_list, lines_list, class_name, file_path)
+
+    return FileCoverage(
+        file_path=file_path,
+        lines=lines_list,
+        functions=functions_list,
+        branches=branches_list,
+    )
+
+
+def _iter_jacoco_xml(coverage_file: Path) -> Iterator[FileCoverage]:
+    """Yield the files of a JaCoCo XML report one <package> at a time.
+
+    The report is read with ``iterparse`` and each package is dropped from
+    the tree once its classes are converted, so memory is bounded by the
+    largest package rather than the whole report.
+    """
+    open_elements: list[XmlElement] = []
+    package = CoverageReport()
+    package_name = ""
+    for event, elem in ElementTree.iterparse(coverage_file, events=("start", "end")):
+        if event == "start":
+            if not open_elements and elem.tag != "report":
+                logger.warning("JaCoCo XML root is not <report>: %s", elem.tag)
+                return
+            if elem.tag == "package":
+                package_name = elem.get("name", "")
+            open_elements.append(elem)
+            continue
+
+        open_elements.pop()
+        parent = open_elements[-1] if open_elements else None
+        if elem.tag == "package":
+            yield from package.files.values()
+            package = CoverageReport()
+            if parent is not None:
+                parent.remove(elem)
+        elif parent is not None and parent.tag == "package":
+            if elem.tag == "class":
+                package.add_file(_class_file_coverage(elem, package_name))
+            elem.clear()
+
+
 def _parse_jacoco_xml(coverage_file: Path) -> CoverageReport:
     """Parse JaCoCo XML report into unified CoverageReport."""
-    files: dict[str, FileCoverage] = {}
     try:
-        tree = ElementTree.parse(coverage_file)
+        return CoverageReport.from_files(_iter_jacoco_xml(coverage_file))
     except (DefusedParseError, OSError) as e:
         logger.error("Failed to parse JaCoCo XML %s: %s", coverage_file, e)
         return CoverageReport()
 
-    root = tree.getroot()
-    if root.tag != "report":
-        logger.warning("JaCoCo XML root is not <report>: %s", root.tag)
-        return CoverageReport()
-
-    for package in root.findall(".//package"):
-        package_name = package.get("name", "")
-        for class_elem in package.findall("class"):
-            class_name = class_elem.get("name", "")
-            source_filename = class_elem.get("sourcefilename", "")
-            file_path = _file_path_from_class(package_name, class_name, source_filename)
-
-            functions_list, lines_list, branches_list = _parse_class_counters(class_elem)
-            _ensure_functions(functions_list, lines_list, class_name, file_path)
-
-            if file_path in files:
-                existing = files[file_path]
-                existing.lines.extend(lines_list)
-                existing.functions.extend(functions_list)
-                existing.branches.extend(branches_list)
-            else:
-                files[file_path] = FileCoverage(
-                    file_path=file_path,
-                    lines=lines_list,
-                    functions=functions_list,
-                    branches=branches_list,
-                )
-
-    return CoverageReport(files=files)
-
 
 class JaCoCoAdapter(CoverageAdapter):
     """JaCoCo coverage adapter for Java projects.
@@ -206,50 +226,60 @@ class JaCoCoAdapter(CoverageAdapter):
         timeout: float = _DEFAULT_TIMEOUT,
     ) -> CoverageReport:
         """Run coverage via Gradle or Maven and parse JaCoCo XML."""
-        output_path: Path | None = None
-        gradlew = project_path / "gradlew"
-        if gradlew.is_file():
-            cmd = ["./gradlew", "test", "jacocoTestReport"]
-            if test_files:
-                class_names = [p.stem for p in test_files if p.suffix == ".java"]
-                if class_names:
-                    cmd.extend(["--tests", "|".join(class_names)])
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=str(project_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await asyncio.wait_for(proc.communicate(), timeout=timeout)
-            for candidate in _JACOCO_PATHS:
-                p = project_path / candidate
-                if p.is_file():
-                    output_path = p
-                    break
-        else:
-            cmd = ["mvn", "test", "jacoco:report", "-q"]
-            if test_files:
-                class_names = [p.stem for p in test_files if p.suffix == ".java"]
-                if class_names:
-                    cmd.extend(["-Dtest=" + ",".join(class_names)])
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=str(project_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await asyncio.wait_for(proc.communicate(), timeout=timeout)
-            for candidate in _JACOCO_PATHS:
-                p = project_path / candidate
-                if p.is_file():
-                    output_path = p
-                    break
-
+        await self._run_jacoco_build(project_path, test_files, timeout)
+        output_path = self.find_coverage_file(project_path)
         if output_path is not None:
             return self.parse_coverage_file(output_path)
         logger.warning("No JaCoCo report found under %s", project_path)
         return CoverageReport()
 
+    async def stream_coverage(
+        self,
+        project_path: Path,
+        *,
+        test_files: list[Path] | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> Iterable[FileCoverage]:
+        """Run coverage via Gradle or Maven, then stream the JaCoCo XML."""
+        await self._run_jacoco_build(project_path, test_files, timeout)
+        return self._stream_found_report(project_path)
+
+    async def _run_jacoco_build(
+        self,
+        project_path: Path,
+        test_files: list[Path] | None,
+        timeout: float,
+    ) -> None:
+        """Run the tests and the JaCoCo report task with Gradle or Maven."""
+        class_names = [p.stem for p in test_files or () if p.suffix == ".java"]
+        if (project_path / "gradlew").is_file():
+            cmd = ["./gradlew", "test", "jacocoTestReport"]
+            if class_names:
+                cmd.extend(["--tests", "|".join(class_names)])
+        else:
+            cmd = ["mvn", "test", "jacoco:report", "-q"]
+            if class_names:
+                cmd.extend(["-Dtest=" + ",".join(class_names)])
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(project_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        await asyncio.wait_for(proc.communicate(), timeout=timeout)
+
+    def find_coverage_file(self, project_path: Path) -> Path | None:
+        """Return the first JaCoCo XML report in the Gradle and Maven locations."""
+        for candidate in _JACOCO_PATHS:
+            p = project_path / candidate
+            if p.is_file():
+                return p
+        return None
+
     def parse_coverage_file(self, coverage_file: Path) -> CoverageReport:
         """Parse JaCoCo XML report into unified CoverageReport."""
         return _parse_jacoco_xml(coverage_file)
+
+    def iter_coverage_file(self, coverage_file: Path) -> Iterator[FileCoverage]:
+        """Yield the files of a JaCoCo XML report one package at a time."""
+        return _iter_jacoco_xml(coverage_file)
@@ -0,0 +1,141 @@
+"""Incremental JSON reading for large native coverage reports.
+
+Istanbul ``coverage-final.json``, coverage.py ``coverage.json`` and
+``llvm-cov export`` output are single JSON documents that grow to hundreds
+of MB for large projects; ``json.load`` turns them into a Python object
+graph many times that size.  ``JsonStream`` reads such a document from a
+text stream one value at a time: containers are walked key by key (or
+element by element) and only the values a caller asks for are decoded, so
+memory stays proportional to the largest single entry (usually one source
+file's coverage) rather than to the whole report.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+_CHUNK_SIZE = 1 << 16
+
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+# Characters that end a number or a literal
+_SCALAR_END = re.compile(r"[ \t\n\r,\]}]")
+
+
+class JsonStream:
+    """Reads one JSON document from a text stream, value by value.
+
+    ``members`` and ``elements`` walk an object or array without decoding
+    it; for each member or element the caller must consume the value, by
+    decoding it (``value``), dropping it (``skip``) or walking into it,
+    before asking for the next one.  Malformed input raises ``ValueError``
+    (``json.JSONDecodeError`` for invalid values).
+    """
+
+    def __init__(self, source: TextIO, *, chunk_size: int = _CHUNK_SIZE) -> None:
+        self._source = source
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or ``""`` at the end of input."""
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+            self._pos = len(self._buffer)
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        start = self.peek()
+        if not start:
+            msg = "Unexpected end of JSON input"
+            raise ValueError(msg)
+        if start not in '{["':
+            # A number or literal is only complete once what follows it is read
+            while _SCALAR_END.search(self._buffer, self._pos) is None:
+                if not self._fill(self._chunk_size):
+                    break
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value may continue past the buffer; read at least as
+                # much again so a large value is decoded a bounded number of times
+                if not self._fill(max(self._chunk_size, len(self._buffer) - self._pos)):
+                    raise
+                continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        """Consume the next value without keeping it."""
+        self.value()
+
+    def members(self) -> Iterator[str]:
+        """Walk the object at the current position, yielding each key."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                msg = f"JSON object key is not a string: {key!r}"
+                raise ValueError(msg)
+            self._expect(":")
+            yield key
+            if not self._next_item("}"):
+                return
+
+    def elements(self) -> Iterator[int]:
+        """Walk the array at the current position, yielding each index."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if not self._next_item("]"):
+                return
+
+    def _next_item(self, closing: str) -> bool:
+        """Consume the separator after an item; False if the container ended."""
+        if self.peek() == ",":
+            self._pos += 1
+            return True
+        self._expect(closing)
+        return False
+
+    def _expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            msg = f"Expected {char!r} in JSON input, found {found or 'end of input'!r}"
+            raise ValueError(msg)
+        self._pos += 1
+
+    def _fill(self, size: int) -> bool:
+        """Append up to *size* characters to the buffer; False at the end of input."""
+        if self._eof:
+            return False
+        chunk = self._source.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
@@ -21,6 +21,7 @@ from nit.adapters.base import (
     ValidationResult,
 )
 from nit.adapters.coverage.coverage_py_adapter import CoveragePyAdapter
+from nit.adapters.worker_pool import JsonLineRunner
 from nit.llm.prompts.pytest_prompt import PytestTemplate
 from nit.parsing.treesitter import (
     collect_error_ranges,
@@ -45,6 +46,8 @@ _TEST_PATTERNS = [
 
 _DEFAULT_TIMEOUT = 120.0
 
+_WORKER_SCRIPT = Path(__file__).with_name("pytest_worker.py")
+
 _PYTHON_LANGUAGE = "python"
 
 
@@ -199,6 +202,14 @@ class PytestAdapter(TestFrameworkAdapter):
             if json_report_file and json_report_file.exists():
                 json_report_file.unlink()
 
+    def create_warm_runner(self, project_path: Path) -> PytestWarmRunner | None:
+        """Return a long-lived pytest worker under the project's interpreter."""
+        env = detect_python_environment(project_path)
+        python = get_command_path("python", env) or get_command_path("python3", env)
+        if python is None:
+            return None
+        return PytestWarmRunner(python, project_path)
+
     # ── Validation (1.11.4) ──────────────────────────────────────
 
     def validate_test(self, test_code: str) -> ValidationResult:
@@ -214,6 +225,34 @@ class PytestAdapter(TestFrameworkAdapter):
         return ["python"]
 
 
+# ── Warm runner ──────────────────────────────────────────────────
+
+
+class PytestWarmRunner(JsonLineRunner):
+    """pytest kept alive between runs, so start-up and imports are paid once.
+
+    Drives ``pytest_worker.py`` and reports results exactly like
+    ``PytestAdapter.run_tests`` (without coverage collection).
+    """
+
+    def __init__(self, python: Path, project_path: Path) -> None:
+        super().__init__([str(python), str(_WORKER_SCRIPT)], project_path)
+
+    def run(self, test_files: list[Path], timeout: float) -> RunResult:
+        json_report_fd, json_report_path = tempfile.mkstemp(suffix=".json", prefix="pytest_")
+        os.close(json_report_fd)
+        json_report_file = Path(json_report_path)
+        try:
+            response = self.request(
+                {"files": [str(f) for f in test_files], "report": json_report_path},
+                timeout,
+            )
+            json_content = json_report_file.read_text(encoding="utf-8")
+        finally:
+            json_report_file.unlink(missing_ok=True)
+        return _parse_pytest_json(json_content, str(response.get("output", "")))
+
+
 # ── Detection helpers ────────────────────────────────────────────
 
 
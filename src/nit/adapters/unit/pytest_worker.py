@@ -0,0 +1,97 @@
+"""Long-lived pytest worker used by ``PytestWarmRunner``.
+
+Runs as a standalone script under the project's Python interpreter, so it
+must only depend on the standard library and pytest.  It answers one JSON
+line on stdout for every JSON request line read from stdin:
+
+    request:  {"files": ["tests/test_x.py"], "report": "/tmp/report.json"}
+    response: {"exit_code": 0, "output": "<pytest terminal output>"}
+
+``pytest.main`` runs in the same interpreter every time, so modules stay
+imported between runs.  Requested test modules are dropped before each
+run so an edited test is picked up, but a conftest or project module
+would keep its old code and module-level state.  A run that imported any
+of those is therefore the worker's last: its response carries
+``"recycle": true`` and the worker exits.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TextIO
+
+
+def _send(channel: TextIO, message: dict[str, object]) -> None:
+    channel.write(json.dumps(message) + "\n")
+    channel.flush()
+
+
+def _forget_modules(files: list[str]) -> None:
+    """Drop cached imports of *files* so pytest re-imports their new content."""
+    targets = {Path(f).resolve() for f in files}
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and Path(module_file).resolve() in targets:
+            del sys.modules[name]
+
+
+def _imports_project_code(names: set[str], root: Path, files: list[str]) -> bool:
+    """Whether modules *names* include a conftest or project module besides *files*."""
+    requested = {Path(f).resolve() for f in files}
+    for name in names:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if not module_file:
+            continue
+        path = Path(module_file).resolve()
+        if path in requested or "site-packages" in path.parts:
+            continue
+        if root in path.parents:
+            return True
+    return False
+
+
+def main() -> int:
+    """Serve pytest runs until stdin is closed."""
+    # Keep the real stdout for the protocol; anything a test or plugin
+    # prints to fd 1 goes to stderr instead of corrupting responses.
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    try:
+        import pytest
+    except ImportError as exc:
+        _send(channel, {"ready": False, "error": f"pytest is not importable: {exc}"})
+        return 1
+    _send(channel, {"ready": True})
+
+    root = Path.cwd().resolve()
+    for line in sys.stdin:
+        request = json.loads(line)
+        files = [str(f) for f in request.get("files", [])]
+        _forget_modules(files)
+
+        loaded = set(sys.modules)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = pytest.main(
+                ["--json-report", f"--json-report-file={request['report']}", "-q", *files]
+            )
+        response: dict[str, object] = {"exit_code": int(exit_code), "output": output.getvalue()}
+        recycle = _imports_project_code(set(sys.modules) - loaded, root, files)
+        if recycle:
+            response["recycle"] = True
+        _send(channel, response)
+        if recycle:
+            break
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
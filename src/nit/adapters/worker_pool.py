@@ -0,0 +1,375 @@
+"""Warm test-runner workers for repeated validation runs.
+
+Validating a generated test means running one small file, often several
+times in a row.  For most frameworks the cost of that is dominated by
+starting the runner (interpreter start-up, plugin loading, conftest and
+project imports), not by the test itself.
+
+Adapters that can keep a runner process alive between runs return a
+``WarmRunner`` from ``TestFrameworkAdapter.create_warm_runner``.
+``WorkerPool`` keeps a few of those alive per adapter and project, hands
+each run to an idle one, and retires workers that time out, crash, have
+served ``max_runs_per_worker`` runs or report that they cannot be reused.
+A worker retired that way is replaced in the background, so the next run
+still finds a started one.  Adapters without warm support, and any run a
+warm worker cannot take, use the adapter's regular (cold) ``run_tests``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from nit.adapters.base import RunResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from nit.adapters.base import TestFrameworkAdapter
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_MAX_RUNS_PER_WORKER = 50
+_STARTUP_TIMEOUT = 30.0
+
+
+class WarmRunnerError(Exception):
+    """Raised when a warm runner cannot start or stops responding."""
+
+
+class WarmRunner(ABC):
+    """A long-lived test runner process that executes test files on request.
+
+    Methods block; ``WorkerPool`` calls them from worker threads.
+    """
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start the runner and wait until it is ready.
+
+        Raises:
+            WarmRunnerError: If the runner cannot be started.
+        """
+
+    @abstractmethod
+    def run(self, test_files: list[Path], timeout: float) -> RunResult:
+        """Run *test_files* and return structured results.
+
+        Raises:
+            TimeoutError: If the run exceeds *timeout*; the runner is killed.
+            WarmRunnerError: If the runner died or broke the protocol.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop the runner process."""
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the runner can take another run."""
+        return True
+
+
+class JsonLineRunner(WarmRunner):
+    """Warm runner speaking newline-delimited JSON over stdin/stdout.
+
+    The worker process must write ``{"ready": true}`` once it is ready (or
+    ``{"ready": false, "error": ...}``) and then answer every request line
+    with exactly one response line.  A response carrying ``"recycle": true``
+    is the worker's last; it exits after sending it.
+    """
+
+    def __init__(self, command: list[str], cwd: Path) -> None:
+        """Initialize the runner.
+
+        Args:
+            command: Command line that starts the worker process.
+            cwd: Working directory for the worker.
+        """
+        self._command = command
+        self._cwd = cwd
+        self._proc: subprocess.Popen[str] | None = None
+        self._recycled = False
+
+    def start(self) -> None:
+        try:
+            self._proc = subprocess.Popen(
+                self._command,
+                cwd=str(self._cwd),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+            )
+        except OSError as exc:
+            raise WarmRunnerError(f"Could not start worker: {exc}") from exc
+
+        try:
+            ready = self._receive(_STARTUP_TIMEOUT)
+        except TimeoutError as exc:
+            raise WarmRunnerError("Worker did not become ready") from exc
+        if not ready.get("ready"):
+            self.close()
+            raise WarmRunnerError(f"Worker failed to start: {ready.get('error', 'unknown error')}")
+
+    @property
+    def reusable(self) -> bool:
+        return self._proc is not None and not self._recycled
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    def request(self, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """Send one request and wait for its response.
+
+        Raises:
+            TimeoutError: If no response arrives within *timeout*.
+            WarmRunnerError: If the worker died or answered garbage.
+        """
+        proc = self._proc
+        if proc is None or proc.stdin is None:
+            raise WarmRunnerError("Worker is not running")
+        try:
+            proc.stdin.write(json.dumps(payload) + "\n")
+            proc.stdin.flush()
+        except OSError as exc:
+            raise WarmRunnerError(f"Worker stopped accepting requests: {exc}") from exc
+        response = self._receive(timeout)
+        if response.get("recycle"):
+            self._recycled = True
+        return response
+
+    def _receive(self, timeout: float) -> dict[str, Any]:
+        """Read one response line, killing the worker if it takes too long."""
+        proc = self._proc
+        if proc is None or proc.stdout is None:
+            raise WarmRunnerError("Worker is not running")
+
+        timed_out = threading.Event()
+
+        def _expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, _expire)
+        watchdog.start()
+        try:
+            line = proc.stdout.readline()
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set():
+            self.close()
+            raise TimeoutError(f"Worker did not answer within {timeout:.1f}s")
+        if not line:
+            self.close()
+            raise WarmRunnerError("Worker exited unexpectedly")
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise WarmRunnerError(f"Malformed worker response: {line[:200]!r}") from exc
+        if not isinstance(message, dict):
+            raise WarmRunnerError(f"Malformed worker response: {line[:200]!r}")
+        return message
+
+
+class WorkerPool:
+    """Pool of warm runners keyed by adapter and project.
+
+    Runs that cannot get a warm runner — the adapter has no warm support,
+    the worker failed to start, or every worker for the key is busy — are
+    executed cold through ``adapter.run_tests``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        max_runs_per_worker: int = _DEFAULT_MAX_RUNS_PER_WORKER,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: Maximum warm runners per adapter and project.
+            max_runs_per_worker: Runs after which a runner is replaced, so
+                state leaking between runs cannot accumulate.
+        """
+        self._max_workers = max(max_workers, 1)
+        self._max_runs = max(max_runs_per_worker, 1)
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str], list[tuple[WarmRunner, int]]] = {}
+        self._busy: dict[tuple[str, str], int] = {}
+        self._unsupported: set[tuple[str, str]] = set()
+        self._spares: list[threading.Thread] = []
+
+    async def run_tests(
+        self,
+        adapter: TestFrameworkAdapter,
+        project_path: Path,
+        test_files: list[Path],
+        *,
+        timeout: float,
+    ) -> RunResult:
+        """Run *test_files* on a warm runner, falling back to a cold run.
+
+        Args:
+            adapter: Adapter for the test framework.
+            project_path: Root of the project containing the tests.
+            test_files: Test files to run.
+            timeout: Maximum seconds to wait for the run.
+
+        Returns:
+            A ``RunResult`` for the run.
+        """
+        key = (adapter.name, str(project_path.resolve()))
+        lease = await asyncio.to_thread(self._acquire, adapter, project_path, key)
+        if lease is None:
+            return await adapter.run_tests(project_path, test_files=test_files, timeout=timeout)
+
+        runner, runs = lease
+        try:
+            result = await asyncio.to_thread(runner.run, test_files, timeout)
+        except TimeoutError:
+            logger.warning("%s run timed out after %.1fs", adapter.name, timeout)
+            self._retire(key, runner)
+            return RunResult(raw_output=f"{adapter.name} run timed out", success=False)
+        except WarmRunnerError as exc:
+            logger.warning("Warm %s worker failed, running cold: %s", adapter.name, exc)
+            self._retire(key, runner)
+            return await adapter.run_tests(project_path, test_files=test_files, timeout=timeout)
+
+        if runner.reusable:
+            self._release(key, runner, runs + 1)
+        else:
+            self._retire(key, runner)
+            self._start_spare(adapter, project_path, key)
+        return result
+
+    def close(self) -> None:
+        """Stop every idle runner, after any replacement still starting."""
+        with self._lock:
+            spares, self._spares = self._spares, []
+        for thread in spares:
+            thread.join()
+        with self._lock:
+            runners = [runner for idle in self._idle.values() for runner, _ in idle]
+            self._idle.clear()
+        for runner in runners:
+            runner.close()
+
+    def _acquire(
+        self, adapter: TestFrameworkAdapter, project_path: Path, key: tuple[str, str]
+    ) -> tuple[WarmRunner, int] | None:
+        """Take an idle runner or start a new one; ``None`` means run cold."""
+        with self._lock:
+            if key in self._unsupported:
+                return None
+            idle = self._idle.get(key)
+            if idle:
+                lease = idle.pop()
+                self._busy[key] = self._busy.get(key, 0) + 1
+                return lease
+            if self._busy.get(key, 0) >= self._max_workers:
+                return None
+            self._busy[key] = self._busy.get(key, 0) + 1
+
+        runner = self._start_runner(adapter, project_path, key)
+        return None if runner is None else (runner, 0)
+
+    def _start_runner(
+        self, adapter: TestFrameworkAdapter, project_path: Path, key: tuple[str, str]
+    ) -> WarmRunner | None:
+        """Create and start a runner counted as busy; ``None`` marks the key unsupported."""
+        runner = adapter.create_warm_runner(project_path)
+        if not isinstance(runner, WarmRunner):
+            self._mark_unsupported(key)
+            return None
+        try:
+            runner.start()
+        except WarmRunnerError as exc:
+            logger.info("No warm %s worker for %s: %s", adapter.name, project_path, exc)
+            self._mark_unsupported(key)
+            return None
+        return runner
+
+    def _start_spare(
+        self, adapter: TestFrameworkAdapter, project_path: Path, key: tuple[str, str]
+    ) -> None:
+        """Start a replacement runner in the background and park it as idle."""
+        with self._lock:
+            if self._busy.get(key, 0) >= self._max_workers:
+                return
+            self._busy[key] = self._busy.get(key, 0) + 1
+
+        def _start() -> None:
+            runner = self._start_runner(adapter, project_path, key)
+            if runner is not None:
+                self._release(key, runner, 0)
+
+        thread = threading.Thread(target=_start, name=f"nit-{adapter.name}-spare", daemon=True)
+        with self._lock:
+            self._spares = [t for t in self._spares if t.is_alive()]
+            self._spares.append(thread)
+            thread.start()
+
+    def _release(self, key: tuple[str, str], runner: WarmRunner, runs: int) -> None:
+        if runs >= self._max_runs:
+            self._retire(key, runner)
+            return
+        with self._lock:
+            self._busy[key] -= 1
+            self._idle.setdefault(key, []).append((runner, runs))
+
+    def _retire(self, key: tuple[str, str], runner: WarmRunner) -> None:
+        with self._lock:
+            self._busy[key] -= 1
+        runner.close()
+
+    def _mark_unsupported(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            self._busy[key] -= 1
+            self._unsupported.add(key)
+
+
+class _PoolSingleton:
+    """Singleton holder for the worker pool."""
+
+    _instance: WorkerPool | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> WorkerPool:
+        """Return the pool, creating it (and its exit hook) on first call."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = WorkerPool()
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+
+def get_worker_pool() -> WorkerPool:
+    """Get the process-wide worker pool.
+
+    Returns:
+        The global ``WorkerPool`` instance.
+    """
+    return _PoolSingleton.get()
@@ -36,6 +36,7 @@ from nit.agents.analyzers.coverage import (
     CoverageAnalyzer,
     CoverageGapReport,
     FunctionGap,
+    FunctionGapIndex,
     GapPriority,
     StaleTest,
 )
@@ -128,6 +129,7 @@ __all__ = [
     "FlowMappingResult",
     "FunctionCall",
     "FunctionGap",
+    "FunctionGapIndex",
     "GapCategory",
     "GapPriority",
     "GraphQLField",
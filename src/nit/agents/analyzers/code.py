@@ -3,8 +3,10 @@
 This agent (task 1.20):
 1. Parses source files with tree-sitter → extracts structured code map
 2. Calculates cyclomatic complexity per function
-3. Builds call graphs (which functions call which)
+3. Builds call graphs (which functions call which); with a project symbol
+   index, calls into the project files a file imports are included
 4. Detects side effects (DB, filesystem, HTTP, external services)
+   (2-4 come from a single walk of the syntax tree, see ``nit.parsing.metrics``)
 5. Provides detailed code metrics for prioritization
 """
 
@@ -18,11 +20,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
-from nit.parsing.languages import extract_from_file
-from nit.parsing.treesitter import detect_language
+from nit.parsing.languages import extract_from_source
+from nit.parsing.metrics import FunctionFacts, collect_function_facts
+from nit.parsing.symbol_index import KIND_CLASS
+from nit.parsing.treesitter import detect_language, parse_code
 
 if TYPE_CHECKING:
-    from nit.parsing.treesitter import ClassInfo, FunctionInfo, ImportInfo, ParseResult
+    from nit.parsing.symbol_index import SymbolIndex
+    from nit.parsing.treesitter import ClassInfo, FunctionInfo, ImportInfo
 
 logger = logging.getLogger(__name__)
 
@@ -99,37 +104,34 @@ SIDE_EFFECT_PATTERNS = {
     ],
 }
 
-# Call expression patterns for side effect detection
-CALL_PATTERNS = {
-    SideEffectType.FILESYSTEM: [
-        r"\bopen\(",
-        r"\breadFile\(",
-        r"\bwriteFile\(",
-        r"\bwriteFileSync\(",
-        r"\breadFileSync\(",
-        r"\bread_text\(",
-        r"\bwrite_text\(",
-        r"\bunlink\(",
-        r"\brm\(",
-        r"\bmkdir\(",
-    ],
-    SideEffectType.HTTP: [
-        r"\bfetch\(",
-        r"\bget\(",
-        r"\bpost\(",
-        r"\bput\(",
-        r"\bdelete\(",
-        r"\brequest\(",
-        r"\baxios\.",
-    ],
-    SideEffectType.EXTERNAL_PROCESS: [
-        r"\bexec\(",
-        r"\bspawn\(",
-        r"\bpopen\(",
-        r"\brun\(",
-    ],
+# Called names that indicate a side effect (matched case-insensitively)
+SIDE_EFFECT_CALLS = {
+    SideEffectType.FILESYSTEM: frozenset(
+        {
+            "open",
+            "readfile",
+            "writefile",
+            "writefilesync",
+            "readfilesync",
+            "read_text",
+            "write_text",
+            "unlink",
+            "rm",
+            "mkdir",
+        }
+    ),
+    SideEffectType.HTTP: frozenset({"fetch", "get", "post", "put", "delete", "request"}),
+    SideEffectType.EXTERNAL_PROCESS: frozenset({"exec", "spawn", "popen", "run"}),
+}
+
+_COMPILED_SIDE_EFFECT_PATTERNS = {
+    effect_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for effect_type, patterns in SIDE_EFFECT_PATTERNS.items()
 }
 
+# Separators of module path components across languages
+_MODULE_SEPARATORS = re.compile(r"[./:\\]+")
+
 
 # ── Data models ──────────────────────────────────────────────────
 
@@ -209,7 +211,7 @@ class CodeMap:
     """Side effects per function (keyed by function name)."""
 
     call_graph: list[FunctionCall] = field(default_factory=list)
-    """All function calls in the file."""
+    """Calls to functions of the file (and, with a symbol index, of the files it imports)."""
 
     has_errors: bool = False
     """Whether the file has parse errors."""
@@ -247,13 +249,19 @@ class CodeAnalyzer(BaseAgent):
     and detects side effects for prioritization and risk analysis.
     """
 
-    def __init__(self, project_root: Path | None = None) -> None:
+    def __init__(
+        self, project_root: Path | None = None, *, symbols: SymbolIndex | None = None
+    ) -> None:
         """Initialize the CodeAnalyzer.
 
         Args:
             project_root: Root directory of the project (optional).
+            symbols: Symbol index of the project (optional); when it covers
+                an analyzed file, the call graph also records calls to
+                functions defined in the project files it imports.
         """
         self._root = project_root
+        self._symbols = symbols
 
     @property
     def name(self) -> str:
@@ -330,9 +338,11 @@ class CodeAnalyzer(BaseAgent):
                 has_errors=True,
             )
 
-        # Parse with tree-sitter
+        # Parse with tree-sitter (the extractor and the metrics walk share one tree)
         try:
-            parse_result = extract_from_file(str(file_path))
+            source = file_path.read_bytes()
+            parse_result = extract_from_source(source, language)
+            tree = parse_code(source, language)
         except Exception as exc:
             logger.warning("Failed to parse %s: %s", file_path, exc)
             return CodeMap(
@@ -354,184 +364,111 @@ class CodeAnalyzer(BaseAgent):
         # Cache parse_result for downstream consumers
         code_map.parse_result = parse_result
 
-        # Task 1.20.2: Calculate complexity for each function
-        for func in parse_result.functions:
-            code_map.complexity_map[func.name] = self._calculate_complexity(func)
-
-        # Also analyze class methods
-        for cls in parse_result.classes:
-            for method in cls.methods:
-                full_name = f"{cls.name}.{method.name}"
-                code_map.complexity_map[full_name] = self._calculate_complexity(method)
-                # Add method to functions list for consistency
-                code_map.functions.append(method)
+        # Functions and class methods, keyed as in the code map
+        entries = [(func.name, func) for func in parse_result.functions]
+        entries.extend(
+            (f"{cls.name}.{method.name}", method)
+            for cls in parse_result.classes
+            for method in cls.methods
+        )
+        known_functions = {func.name for _, func in entries}
+        known_functions.update(self._imported_functions(file_path))
+        import_evidence = self._build_import_evidence(parse_result.imports)
+        watch = {
+            name
+            for imports in import_evidence.values()
+            for imp in imports
+            for name in _import_bindings(imp)
+        }
 
-        # Task 1.20.3: Build call graph
-        code_map.call_graph = self._build_call_graph(parse_result)
+        # Tasks 1.20.2-1.20.4: complexity, call graph and side effects from one walk
+        all_facts = collect_function_facts(
+            tree.root_node,
+            parse_result.language,
+            [func.body_text for _, func in entries],
+            watch=watch,
+        )
+        for (key, func), facts in zip(entries, all_facts, strict=True):
+            function_facts = facts or FunctionFacts()
+            code_map.complexity_map[key] = self._calculate_complexity(function_facts)
+            code_map.call_graph.extend(
+                self._extract_function_calls(key, func, function_facts, known_functions)
+            )
+            side_effects = self._analyze_function_side_effects(
+                func, function_facts, import_evidence
+            )
+            if side_effects:
+                code_map.side_effects_map[key] = side_effects
 
-        # Task 1.20.4: Detect side effects
-        code_map.side_effects_map = self._detect_side_effects(parse_result)
+        # Add methods to functions list for consistency
+        for cls in parse_result.classes:
+            code_map.functions.extend(cls.methods)
 
         return code_map
 
-    def _calculate_complexity(self, func: FunctionInfo) -> ComplexityMetrics:
+    def _calculate_complexity(self, facts: FunctionFacts) -> ComplexityMetrics:
         """Calculate cyclomatic complexity for a function.
 
         Args:
-            func: Function information from tree-sitter.
+            facts: Decision points found in the function body.
 
         Returns:
             ComplexityMetrics with detailed breakdown.
         """
-        # Base complexity is 1
-        complexity = 1
-        decision_points: dict[str, int] = {}
-
-        body = func.body_text
-
-        # Define patterns for each decision point type
-        patterns = {
-            "if": [r"\bif\b", r"\belif\b", r"\belse\s+if\b"],
-            "else": [r"\belse\b"],
-            "for": [r"\bfor\b", r"\bforeach\b"],
-            "while": [r"\bwhile\b"],
-            "case": [r"\bcase\b", r"\bwhen\b"],
-            "catch": [r"\bcatch\b", r"\bexcept\b", r"\brescue\b"],
-            "and": [r"\band\b", r"&&"],
-            "or": [r"\bor\b", r"\|\|"],
-            "ternary": [r"\?[^?]*:", r"\bif\b.*\belse\b"],  # Ternary operators
-            "match": [r"\bmatch\b"],  # Rust/modern pattern matching
-        }
-
-        # Count each type of decision point
-        for decision_type, type_patterns in patterns.items():
-            count = 0
-            for pattern in type_patterns:
-                count += len(re.findall(pattern, body, re.IGNORECASE))
-            if count > 0:
-                decision_points[decision_type] = count
-                # Add to total complexity
-                # Note: 'else' doesn't add complexity, other keywords do
-                if decision_type != "else":
-                    complexity += count
-
         return ComplexityMetrics(
-            cyclomatic=complexity,
-            decision_points=decision_points,
+            cyclomatic=facts.cyclomatic,
+            decision_points=dict(facts.decision_points),
         )
 
-    def _build_call_graph(self, parse_result: ParseResult) -> list[FunctionCall]:
-        """Build a call graph for all functions in the file.
-
-        Args:
-            parse_result: Parsed source code.
-
-        Returns:
-            List of FunctionCall entries.
-        """
-        call_graph: list[FunctionCall] = []
-
-        # Build a set of known function names in this file
-        known_functions = {f.name for f in parse_result.functions}
-        for cls in parse_result.classes:
-            known_functions.update(m.name for m in cls.methods)
-
-        # Analyze each function for calls to known functions
-        for func in parse_result.functions:
-            calls = self._extract_function_calls(func, known_functions)
-            call_graph.extend(calls)
-
-        # Also analyze class methods
-        for cls in parse_result.classes:
-            for method in cls.methods:
-                caller_name = f"{cls.name}.{method.name}"
-                calls = self._extract_function_calls(method, known_functions, caller_name)
-                call_graph.extend(calls)
-
-        return call_graph
-
     def _extract_function_calls(
         self,
+        caller: str,
         func: FunctionInfo,
+        facts: FunctionFacts,
         known_functions: set[str],
-        caller_override: str | None = None,
     ) -> list[FunctionCall]:
-        """Extract function calls from a function body.
+        """Extract calls to functions defined in this file or the files it imports.
 
         Args:
-            func: Function to analyze.
-            known_functions: Set of function names defined in this file.
-            caller_override: Override for caller name (for methods).
+            caller: Name of the calling function (``Class.method`` for methods).
+            func: Function the calls were found in.
+            facts: Call sites found in the function body.
+            known_functions: Names of the functions defined in this file or,
+                with a symbol index, in the project files it imports.
 
         Returns:
             List of FunctionCall entries.
         """
-        calls: list[FunctionCall] = []
-        body = func.body_text
-        caller_name = caller_override or func.name
-
-        # Find function calls using regex
-        # Matches: function_name( or function_name (
-        call_pattern = r"\b([a-zA-Z_]\w*)\s*\("
-
-        for match in re.finditer(call_pattern, body):
-            callee = match.group(1)
-            # Only track calls to known functions
-            if callee in known_functions and callee != func.name:
-                # Estimate line number (rough approximation)
-                line_offset = body[: match.start()].count("\n")
-                line_number = func.start_line + line_offset
-
-                calls.append(
-                    FunctionCall(
-                        caller=caller_name,
-                        callee=callee,
-                        line_number=line_number,
-                    )
-                )
-
-        return calls
-
-    def _detect_side_effects(self, parse_result: ParseResult) -> dict[str, list[SideEffect]]:
-        """Detect side effects in all functions.
-
-        Args:
-            parse_result: Parsed source code.
-
-        Returns:
-            Dictionary mapping function names to their side effects.
-        """
-        side_effects_map: dict[str, list[SideEffect]] = {}
-
-        # Build import evidence
-        import_evidence = self._build_import_evidence(parse_result.imports)
-
-        # Analyze each function
-        for func in parse_result.functions:
-            side_effects = self._analyze_function_side_effects(func, import_evidence)
-            if side_effects:
-                side_effects_map[func.name] = side_effects
-
-        # Also analyze class methods
-        for cls in parse_result.classes:
-            for method in cls.methods:
-                side_effects = self._analyze_function_side_effects(method, import_evidence)
-                if side_effects:
-                    full_name = f"{cls.name}.{method.name}"
-                    side_effects_map[full_name] = side_effects
-
-        return side_effects_map
+        return [
+            FunctionCall(caller=caller, callee=callee, line_number=line)
+            for callee, line in facts.calls
+            if callee in known_functions and callee != func.name
+        ]
+
+    def _imported_functions(self, file_path: Path) -> set[str]:
+        """Names of the functions and methods defined in the files *file_path* imports."""
+        symbols = self._symbols
+        if symbols is None or not symbols.has_file(file_path):
+            return set()
+        return {
+            symbol.name.rpartition(".")[2]
+            for dependency in symbols.dependencies(file_path)
+            for symbol in symbols.defined_in(dependency)
+            if symbol.kind != KIND_CLASS
+        }
 
-    def _build_import_evidence(self, imports: list[ImportInfo]) -> dict[SideEffectType, list[str]]:
+    def _build_import_evidence(
+        self, imports: list[ImportInfo]
+    ) -> dict[SideEffectType, list[ImportInfo]]:
         """Build evidence map from imports.
 
         Args:
             imports: List of import statements.
 
         Returns:
-            Dictionary mapping side effect types to matching import modules.
+            Dictionary mapping side effect types to matching imports.
         """
-        evidence: dict[SideEffectType, list[str]] = {t: [] for t in SideEffectType}
+        evidence: dict[SideEffectType, list[ImportInfo]] = {t: [] for t in SideEffectType}
 
         # Check each import against patterns
         for imp in imports:
@@ -540,63 +477,72 @@ class CodeAnalyzer(BaseAgent):
                 module_text += f" {names.lower()}"
 
             # Check against each side effect type
-            for effect_type, patterns in SIDE_EFFECT_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, module_text, re.IGNORECASE):
-                        evidence[effect_type].append(imp.module)
-                        break
+            for effect_type, patterns in _COMPILED_SIDE_EFFECT_PATTERNS.items():
+                if any(pattern.search(module_text) for pattern in patterns):
+                    evidence[effect_type].append(imp)
 
         return evidence
 
     def _analyze_function_side_effects(
         self,
         func: FunctionInfo,
-        import_evidence: dict[SideEffectType, list[str]],
+        facts: FunctionFacts,
+        import_evidence: dict[SideEffectType, list[ImportInfo]],
     ) -> list[SideEffect]:
         """Analyze a single function for side effects.
 
         Args:
             func: Function to analyze.
+            facts: Call sites and imported names used in the function body.
             import_evidence: Evidence from imports.
 
         Returns:
             List of detected side effects.
         """
         side_effects: list[SideEffect] = []
-        body = func.body_text.lower()
-
-        # Check import-based evidence
-        for effect_type, modules in import_evidence.items():
-            if modules:
-                # Check if this function uses any of the imported modules
-                for module in modules:
-                    if module.lower() in body:
-                        side_effects.append(
-                            SideEffect(
-                                type=effect_type,
-                                evidence=f"import: {module}",
-                                line_number=func.start_line,
-                            )
-                        )
-                        break  # Only add once per type
-
-        # Check call patterns in function body
-        for effect_type, patterns in CALL_PATTERNS.items():
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, body, re.IGNORECASE))
-                if matches:
-                    # Estimate line number of first match
-                    first_match = matches[0]
-                    line_offset = body[: first_match.start()].count("\n")
-                    line_number = func.start_line + line_offset
 
+        # Check import-based evidence: the function uses a name the import binds
+        for effect_type, imports in import_evidence.items():
+            for imp in imports:
+                lines = [
+                    facts.identifiers[name]
+                    for name in _import_bindings(imp)
+                    if name in facts.identifiers
+                ]
+                if lines:
                     side_effects.append(
                         SideEffect(
                             type=effect_type,
-                            evidence=f"call: {first_match.group(0)}",
-                            line_number=line_number,
+                            evidence=f"import: {imp.module}",
+                            line_number=min(lines),
                         )
                     )
                     break  # Only add once per type
 
+        # Check calls in function body
+        for effect_type, names in SIDE_EFFECT_CALLS.items():
+            call = next(
+                ((callee, line) for callee, line in facts.calls if callee.lower() in names), None
+            )
+            if call is not None:
+                callee, line = call
+                side_effects.append(
+                    SideEffect(
+                        type=effect_type,
+                        evidence=f"call: {callee}(",
+                        line_number=line or func.start_line,
+                    )
+                )
+
         return side_effects
+
+
+def _import_bindings(imp: ImportInfo) -> set[str]:
+    """Names an import makes available: imported names, alias and module components."""
+    bindings = {name for name in imp.names if name and name != "*"}
+    if imp.alias:
+        bindings.add(imp.alias)
+    parts = [part for part in _MODULE_SEPARATORS.split(imp.module.strip("\"'<>@")) if part]
+    if parts:
+        bindings.update({parts[0], parts[-1]})
+    return bindings
@@ -37,6 +37,8 @@ from nit.parsing.languages import extract_from_file
 from nit.parsing.treesitter import detect_language
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Sequence
+
     from nit.adapters.coverage.base import (
         CoverageAdapter,
         FileCoverage,
@@ -59,6 +61,15 @@ class GapPriority(Enum):
     LOW = "low"  # Simple code, low risk
 
 
+GAP_PRIORITY_ORDER: dict[GapPriority, int] = {
+    GapPriority.CRITICAL: 0,
+    GapPriority.HIGH: 1,
+    GapPriority.MEDIUM: 2,
+    GapPriority.LOW: 3,
+}
+"""Sort rank for each gap priority (lower = more urgent)."""
+
+
 # Cyclomatic complexity thresholds
 COMPLEXITY_HIGH = 10  # High complexity threshold
 COMPLEXITY_MODERATE = 5  # Moderate complexity threshold
@@ -68,6 +79,23 @@ UNDERTESTED_THRESHOLD = 50.0  # Functions below this coverage % are undertested
 COVERAGE_LOW = 25.0  # Low coverage threshold for high priority
 COVERAGE_MODERATE = 50.0  # Moderate coverage threshold for public APIs
 
+# Directories whose files are never reported as gaps
+_GAP_EXCLUDE_DIRS = frozenset(
+    {
+        "node_modules",
+        ".venv",
+        "venv",
+        ".git",
+        "build",
+        "dist",
+        "__pycache__",
+        ".pytest_cache",
+        "coverage",
+        ".coverage",
+        "site-packages",
+    }
+)
+
 
 # ── Data models ──────────────────────────────────────────────────
 
@@ -88,6 +116,14 @@ class CoverageAnalysisTask(TaskInput):
     coverage_threshold: float = 80.0
     """Target coverage percentage (default: 80%)."""
 
+    bounded_memory: bool = False
+    """Analyze each file as its coverage is parsed instead of loading whole reports.
+
+    The coverage tools still run; their fresh reports are then streamed file
+    by file and per-file coverage is released once analyzed, so the returned
+    ``coverage_report`` is empty.
+    """
+
     def __post_init__(self) -> None:
         """Initialize base TaskInput fields if not already set."""
         if not self.target and self.project_root:
@@ -137,6 +173,35 @@ class StaleTest:
     """Human-readable explanation of why this test is stale."""
 
 
+class FunctionGapIndex:
+    """Function gaps looked up by file and by (file, function).
+
+    Built in one pass over the gaps, so per-file and per-function lookups
+    by the analyzers cost O(1) instead of a scan of every gap.
+    """
+
+    def __init__(self, gaps: Sequence[FunctionGap]) -> None:
+        self._gaps = gaps
+        self._size = len(gaps)
+        self._by_file: dict[str, list[FunctionGap]] = {}
+        self._by_function: dict[tuple[str, str], FunctionGap] = {}
+        for gap in gaps:
+            self._by_file.setdefault(gap.file_path, []).append(gap)
+            self._by_function.setdefault((gap.file_path, gap.function_name), gap)
+
+    def for_file(self, file_path: str) -> list[FunctionGap]:
+        """Gaps in *file_path*, in report order (do not modify)."""
+        return self._by_file.get(file_path, [])
+
+    def for_function(self, file_path: str, function_name: str) -> FunctionGap | None:
+        """The first gap reported for *function_name* in *file_path*."""
+        return self._by_function.get((file_path, function_name))
+
+    def indexes(self, gaps: Sequence[FunctionGap]) -> bool:
+        """Whether this index was built from *gaps* as they are now."""
+        return gaps is self._gaps and len(gaps) == self._size
+
+
 @dataclass
 class CoverageGapReport:
     """Complete gap analysis report."""
@@ -156,15 +221,36 @@ class CoverageGapReport:
     target_coverage: float = 80.0
     """Target coverage percentage."""
 
+    _gap_index: FunctionGapIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def gap_index(self) -> FunctionGapIndex:
+        """Index of ``function_gaps`` by file and by (file, function).
+
+        Built on first use and rebuilt if ``function_gaps`` is replaced or
+        grows.
+        """
+        if self._gap_index is None or not self._gap_index.indexes(self.function_gaps):
+            self._gap_index = FunctionGapIndex(self.function_gaps)
+        return self._gap_index
+
     def get_prioritized_gaps(self) -> list[FunctionGap]:
         """Return function gaps sorted by priority (critical first)."""
-        priority_order = {
-            GapPriority.CRITICAL: 0,
-            GapPriority.HIGH: 1,
-            GapPriority.MEDIUM: 2,
-            GapPriority.LOW: 3,
-        }
-        return sorted(self.function_gaps, key=lambda g: priority_order[g.priority])
+        return sorted(self.function_gaps, key=lambda g: GAP_PRIORITY_ORDER[g.priority])
+
+
+@dataclass
+class _StreamTally:
+    """Running totals of a bounded-memory gap analysis."""
+
+    source_files: set[str] = field(default_factory=set)
+    """Normalized paths of the files analyzed so far."""
+
+    total_lines: int = 0
+    """Instrumented lines across those files."""
+
+    covered_lines: int = 0
+    """Covered lines across those files."""
 
 
 # ── CoverageAnalyzer ─────────────────────────────────────────────
@@ -240,24 +326,31 @@ class CoverageAnalyzer(BaseAgent):
 
             logger.info("Running coverage analysis on %s", project_root)
 
-            # Step 1: Run coverage tool and get report (task 1.19.1)
-            coverage_report = await self._run_coverage(project_root)
-
-            # Step 2: Identify gaps (tasks 1.19.2, 1.19.3)
-            if coverage_report is not None and coverage_report.files:
-                logger.info(
-                    "Coverage collected: %.1f%% overall (%d files)",
-                    coverage_report.overall_line_coverage,
-                    len(coverage_report.files),
-                )
-                gap_report = self._analyze_gaps(coverage_report, task.coverage_threshold)
+            # Steps 1-2: Run coverage tool, parse the report (task 1.19.1) and
+            # identify gaps (tasks 1.19.2, 1.19.3)
+            gap_report: CoverageGapReport | None = None
+            coverage_report: CoverageReport | None = None
+            if task.bounded_memory:
+                gap_report = await self._stream_gaps(project_root, task.coverage_threshold)
             else:
+                coverage_report = await self._run_coverage(project_root)
+                if coverage_report is not None and coverage_report.files:
+                    logger.info(
+                        "Coverage collected: %.1f%% overall (%d files)",
+                        coverage_report.overall_line_coverage,
+                        len(coverage_report.files),
+                    )
+                    gap_report = self._analyze_gaps(coverage_report, task.coverage_threshold)
+
+            if gap_report is None:
                 # No coverage data available — fall back to source-file scanning.
                 # This finds all source files that have no corresponding test file
                 # and reports every public function as a gap.
                 logger.warning("No coverage data available — falling back to source-file scanning")
                 coverage_report = CoverageReport()
                 gap_report = self._scan_for_untested_sources(project_root, task.coverage_threshold)
+            elif coverage_report is None:
+                coverage_report = CoverageReport()
 
             logger.info(
                 "Gap analysis complete: %d untested files, %d function gaps, %d stale tests",
@@ -412,6 +505,109 @@ class CoverageAnalyzer(BaseAgent):
 
         return merged
 
+    # ── Bounded-memory analysis ──────────────────────────────────
+
+    async def _stream_gaps(
+        self, project_root: Path, target_coverage: float
+    ) -> CoverageGapReport | None:
+        """Identify gaps file by file while coverage reports are parsed.
+
+        Each adapter runs its coverage tool through
+        ``CoverageAdapter.stream_coverage`` and the fresh report is then
+        iterated on a worker thread.  Each file is analyzed as soon as it
+        is parsed and only its path is kept afterwards, so memory does not
+        grow with the size of the reports.  A report that fails part way
+        keeps the files parsed before the failure.
+
+        Args:
+            project_root: Root directory of the project.
+            target_coverage: Target coverage percentage.
+
+        Returns:
+            CoverageGapReport, or None if no coverage data was found.
+        """
+        gap_report = CoverageGapReport(target_coverage=target_coverage)
+        tally = _StreamTally()
+
+        for adapter, directory in self._coverage_sources(project_root):
+            try:
+                logger.info("Using coverage adapter: %s", adapter.name)
+                files = await adapter.stream_coverage(directory)
+                await asyncio.to_thread(
+                    self._add_streamed_files, files, project_root, gap_report, tally
+                )
+            except Exception as exc:
+                logger.warning("Coverage adapter %s failed: %s", adapter.name, exc)
+                reporter.print_warning(
+                    f"Coverage adapter '{adapter.name}' failed: {exc}. "
+                    "Some coverage data may be incomplete."
+                )
+
+        if not tally.source_files:
+            logger.warning("No coverage data could be streamed for %s", project_root)
+            return None
+
+        gap_report.overall_coverage = (
+            tally.covered_lines / tally.total_lines * 100.0 if tally.total_lines else 100.0
+        )
+        logger.info(
+            "Coverage streamed: %.1f%% overall (%d files)",
+            gap_report.overall_coverage,
+            len(tally.source_files),
+        )
+        gap_report.stale_tests = self._identify_stale_tests(tally.source_files)
+        return gap_report
+
+    def _add_streamed_files(
+        self,
+        files: Iterable[FileCoverage],
+        project_root: Path,
+        gap_report: CoverageGapReport,
+        tally: _StreamTally,
+    ) -> None:
+        """Analyze each file of a streamed report into *gap_report* and *tally*.
+
+        Blocking: parsing happens as *files* is iterated.
+        """
+        for file_coverage in files:
+            file_path = self._normalize_coverage_path(file_coverage.file_path, project_root)
+            if file_path in tally.source_files:
+                continue
+            tally.source_files.add(file_path)
+            tally.total_lines += len(file_coverage.lines)
+            tally.covered_lines += sum(1 for line in file_coverage.lines if line.is_covered)
+
+            if any(excluded in file_path for excluded in _GAP_EXCLUDE_DIRS):
+                continue
+            if file_coverage.line_coverage_percentage == 0.0:
+                gap_report.untested_files.append(file_path)
+            gap_report.function_gaps.extend(self._analyze_file_gaps(file_path, file_coverage))
+
+    def _coverage_sources(self, project_root: Path) -> list[tuple[CoverageAdapter, Path]]:
+        """Adapters to collect coverage with and the directory each runs in.
+
+        Mirrors ``_run_coverage``: the first matching adapter of each
+        monorepo package, otherwise every adapter matching the root.
+        """
+        sources: list[tuple[CoverageAdapter, Path]] = []
+        workspace = detect_workspace(project_root)
+        if workspace.is_monorepo:
+            for package in workspace.packages:
+                pkg_path = (project_root / package.path).resolve()
+                if not pkg_path.is_dir():
+                    continue
+                for adapter in self._coverage_adapters:
+                    if adapter.detect(pkg_path):
+                        sources.append((adapter, pkg_path))
+                        break
+        if not sources:
+            sources = [
+                (adapter, project_root)
+                for adapter in self._coverage_adapters
+                if adapter.detect(project_root)
+            ]
+        return sources
+
     @staticmethod
     def _normalize_coverage_path(file_path: str, project_root: Path) -> str:
         """Normalize a coverage file path to be relative to the project root.
@@ -447,21 +643,6 @@ class CoverageAnalyzer(BaseAgent):
         Returns:
             CoverageGapReport with all identified gaps.
         """
-        # Directories to exclude from analysis
-        exclude_dirs = {
-            "node_modules",
-            ".venv",
-            "venv",
-            ".git",
-            "build",
-            "dist",
-            "__pycache__",
-            ".pytest_cache",
-            "coverage",
-            ".coverage",
-            "site-packages",
-        }
-
         gap_report = CoverageGapReport(
             overall_coverage=coverage_report.overall_line_coverage,
             target_coverage=target_coverage,
@@ -470,20 +651,20 @@ class CoverageAnalyzer(BaseAgent):
         # Task 1.19.2: Identify untested files (0% coverage)
         all_untested = coverage_report.get_uncovered_files()
         gap_report.untested_files = [
-            f for f in all_untested if not any(excluded in f for excluded in exclude_dirs)
+            f for f in all_untested if not any(excluded in f for excluded in _GAP_EXCLUDE_DIRS)
         ]
 
         # Task 1.19.2: Identify undertested functions
         for file_path, file_coverage in coverage_report.files.items():
             # Skip files in excluded directories
-            if any(excluded in file_path for excluded in exclude_dirs):
+            if any(excluded in file_path for excluded in _GAP_EXCLUDE_DIRS):
                 continue
 
             function_gaps = self._analyze_file_gaps(file_path, file_coverage)
             gap_report.function_gaps.extend(function_gaps)
 
         # Task 1.19.3: Identify stale tests
-        gap_report.stale_tests = self._identify_stale_tests(coverage_report)
+        gap_report.stale_tests = self._identify_stale_tests(coverage_report.files)
 
         return gap_report
 
@@ -814,11 +995,11 @@ class CoverageAnalyzer(BaseAgent):
         # Low: everything else
         return GapPriority.LOW
 
-    def _identify_stale_tests(self, coverage_report: CoverageReport) -> list[StaleTest]:
+    def _identify_stale_tests(self, source_files: Collection[str]) -> list[StaleTest]:
         """Identify test files that reference non-existent code.
 
         Args:
-            coverage_report: Coverage report with all source files.
+            source_files: Paths of all source files in the coverage report.
 
         Returns:
             List of StaleTest entries.
@@ -852,7 +1033,7 @@ class CoverageAnalyzer(BaseAgent):
 
         # Check each test file for imports that don't resolve
         for test_file in test_files:
-            missing_imports = self._check_test_imports(test_file, coverage_report)
+            missing_imports = self._check_test_imports(test_file, source_files)
             if missing_imports:
                 stale = StaleTest(
                     test_file=str(test_file.relative_to(self._root)),
@@ -863,12 +1044,12 @@ class CoverageAnalyzer(BaseAgent):
 
         return stale_tests
 
-    def _check_test_imports(self, test_file: Path, coverage_report: CoverageReport) -> list[str]:
+    def _check_test_imports(self, test_file: Path, source_files: Collection[str]) -> list[str]:
         """Check if a test file imports non-existent modules.
 
         Args:
             test_file: Path to the test file.
-            coverage_report: Coverage report with all source files.
+            source_files: Paths of all source files in the coverage report.
 
         Returns:
             List of import statements that don't resolve.
@@ -889,7 +1070,7 @@ class CoverageAnalyzer(BaseAgent):
                 for match in re.finditer(pattern, content, re.MULTILINE):
                     module = match.group(1)
                     if self._is_project_module(module) and not self._module_exists(
-                        module, coverage_report
+                        module, source_files
                     ):
                         missing.append(module)
 
@@ -924,12 +1105,12 @@ class CoverageAnalyzer(BaseAgent):
 
         return False
 
-    def _module_exists(self, module: str, coverage_report: CoverageReport) -> bool:
+    def _module_exists(self, module: str, source_files: Collection[str]) -> bool:
         """Check if a module exists in the current source code.
 
         Args:
             module: Module name (e.g., 'myapp.utils.helpers').
-            coverage_report: Coverage report with all source files.
+            source_files: Paths of all source files in the coverage report.
 
         Returns:
             True if the module exists, False otherwise.
@@ -947,7 +1128,7 @@ class CoverageAnalyzer(BaseAgent):
         ]
 
         # Check if any of these paths exist in the coverage report
-        for file_path in coverage_report.files:
+        for file_path in source_files:
             if any(file_path.endswith(p) for p in potential_paths):
                 return True
 
@@ -14,15 +14,19 @@ import re
 import shutil
 import subprocess
 from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
+from nit.utils.git_history import load_history_index
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from nit.utils.git_history import GitHistoryIndex
+
 logger = logging.getLogger(__name__)
 
 # ── Constants ────────────────────────────────────────────────────
@@ -32,6 +36,9 @@ MIN_DIFF_PARTS = 2
 NUMSTAT_PARTS = 3
 RENAMED_PARTS = 3
 
+# Window for the recent-commit count of changed files (days)
+CHURN_WINDOW_DAYS = 90
+
 # Display limits for CLI output
 MAX_FILES_DISPLAY = 20
 MAX_MAPPINGS_DISPLAY = 15
@@ -104,6 +111,9 @@ class FileChange:
     lines_removed: int = 0
     """Number of lines removed."""
 
+    recent_commits: int = 0
+    """Commits touching the file in the last 90 days (from the git history index)."""
+
 
 @dataclass
 class FileMapping:
@@ -184,14 +194,17 @@ class DiffAnalyzer(BaseAgent):
     for efficient analysis of only what changed.
     """
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(self, project_root: Path, history: GitHistoryIndex | None = None) -> None:
         """Initialize the DiffAnalyzer.
 
         Args:
             project_root: Root directory of the project.
+            history: Git history index for the churn of changed files;
+                loaded (and shared with other analyzers) on first use if omitted.
         """
         self._root = project_root
         self._git_path = shutil.which("git") or "git"
+        self._history = history
 
     def _run_git(self, args: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
         """Run a git command safely.
@@ -270,6 +283,7 @@ class DiffAnalyzer(BaseAgent):
             )
 
             logger.info("Detected %d changed files", len(changed_files))
+            self._annotate_churn(changed_files, project_root)
 
             # Step 2: Separate source files from test files
             result = self._categorize_changes(changed_files)
@@ -449,6 +463,14 @@ class DiffAnalyzer(BaseAgent):
             if line
         ]
 
+    def _annotate_churn(self, changed_files: list[FileChange], project_root: Path) -> None:
+        """Record how often each changed file changed recently."""
+        if self._history is None:
+            self._history = load_history_index(project_root)
+        since = datetime.now(UTC) - timedelta(days=CHURN_WINDOW_DAYS)
+        for change in changed_files:
+            change.recent_commits = self._history.commit_count(change.path, since=since)
+
     def _categorize_changes(self, changed_files: list[FileChange]) -> DiffAnalysisResult:
         """Categorize changed files into source files and test files.
 
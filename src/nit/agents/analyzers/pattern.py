@@ -462,7 +462,7 @@ class PatternAnalyzer(BaseAgent):
             profile: The extracted convention profile.
         """
         try:
-            memory = GlobalMemory(project_root)
+            memory = GlobalMemory(project_root, auto_flush=False)
 
             # Store conventions in memory
             conventions = {
@@ -501,6 +501,8 @@ class PatternAnalyzer(BaseAgent):
                         context={"count": count, "language": profile.language},
                     )
 
+            memory.flush()
+
             logger.info(
                 "Seeded GlobalMemory with conventions from %d test files", profile.files_analyzed
             )
@@ -3,29 +3,35 @@
 This agent (task 1.21):
 1. Composite risk scoring: combines complexity, coverage, recency, criticality
 2. Domain criticality detection: identifies auth, payment, PII, encryption code
-3. Recency scoring: weights recently changed files higher via git log
+3. Recency scoring: weights recently changed files higher via the git history index,
+   and recently changed functions via the function-level churn index
 4. Outputs prioritized risk report for orchestrator task ordering
 5. Provides per-file and per-function risk metrics
 """
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
-import shutil
-import subprocess
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from nit.agents.analyzers.coverage import FunctionGapIndex
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
+from nit.utils.git_churn import load_function_churn
+from nit.utils.git_history import load_history_index
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from nit.agents.analyzers.code import CodeMap
     from nit.agents.analyzers.coverage import FunctionGap
+    from nit.parsing.treesitter import FunctionInfo
+    from nit.utils.git_churn import FunctionChurnIndex
+    from nit.utils.git_history import GitHistoryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +53,9 @@ RECENCY_VERY_RECENT = 7  # Changed in last week
 RECENCY_RECENT = 30  # Changed in last month
 RECENCY_MODERATE = 90  # Changed in last 3 months
 
+# Window for commit counts and recent authors (days)
+RECENCY_WINDOW_DAYS = 90
+
 # Commit frequency thresholds (for 90-day window)
 COMMITS_HIGH_ACTIVITY = 10  # Many recent commits
 COMMITS_MODERATE_ACTIVITY = 5  # Some recent commits
@@ -176,7 +185,7 @@ CRITICALITY_PATTERNS = {
 
 @dataclass
 class RecencyInfo:
-    """Information about recent changes to a file."""
+    """Information about recent changes to a file or function."""
 
     last_modified: datetime | None = None
     """Last modification timestamp from git."""
@@ -273,6 +282,9 @@ class FunctionRisk:
     is_public: bool = True
     """Whether this is a public function."""
 
+    recency_info: RecencyInfo = field(default_factory=RecencyInfo)
+    """Recent changes to the function's lines (the file's, without line history)."""
+
 
 @dataclass
 class RiskReport:
@@ -318,6 +330,10 @@ class RiskAnalysisTask(TaskInput):
     function_gaps: list[FunctionGap] = field(default_factory=list)
     """Coverage gaps from CoverageAnalyzer."""
 
+    gap_index: FunctionGapIndex | None = None
+    """Prebuilt index of ``function_gaps`` (``CoverageGapReport.gap_index``);
+    built from ``function_gaps`` if omitted."""
+
     def __post_init__(self) -> None:
         """Initialize base TaskInput fields if not already set."""
         if not self.target and self.project_root:
@@ -334,14 +350,24 @@ class RiskAnalyzer(BaseAgent):
     to produce prioritized risk reports for orchestrator task ordering.
     """
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        history: GitHistoryIndex | None = None,
+        churn: FunctionChurnIndex | None = None,
+    ) -> None:
         """Initialize the RiskAnalyzer.
 
         Args:
             project_root: Root directory of the project.
+            history: Git history index to read recency data from; loaded
+                (and shared with other analyzers) on first use if omitted.
+            churn: Function-level churn index of the analyzed files; built
+                from the code maps on first use if omitted.
         """
         self._root = project_root
-        self._git_path = shutil.which("git") or "git"
+        self._history = history
+        self._churn = churn
 
     @property
     def name(self) -> str:
@@ -405,15 +431,20 @@ class RiskAnalyzer(BaseAgent):
             Complete risk report with prioritized files and functions.
         """
         report = RiskReport()
+        gap_index = task.gap_index
+        if gap_index is None or not gap_index.indexes(task.function_gaps):
+            gap_index = FunctionGapIndex(task.function_gaps)
 
         # Build file-level risk assessments
+        recency_by_file: dict[str, RecencyInfo] = {}
         for file_path, code_map in task.code_maps.items():
             file_risk = self._analyze_file_risk(
                 file_path=file_path,
                 code_map=code_map,
-                function_gaps=task.function_gaps,
+                gap_index=gap_index,
             )
             report.file_risks.append(file_risk)
+            recency_by_file[file_path] = file_risk.recency_info
 
             # Track critical/high risk files
             if file_risk.risk_score.level == RiskLevel.CRITICAL:
@@ -422,11 +453,14 @@ class RiskAnalyzer(BaseAgent):
                 report.high_risk_files.append(file_path)
 
         # Build function-level risk assessments
+        if task.code_maps:
+            self._get_churn(task.code_maps)
         for file_path, code_map in task.code_maps.items():
             function_risks = self._analyze_function_risks(
                 file_path=file_path,
                 code_map=code_map,
-                function_gaps=task.function_gaps,
+                gap_index=gap_index,
+                recency_info=recency_by_file.get(file_path),
             )
             report.function_risks.extend(function_risks)
 
@@ -436,14 +470,14 @@ class RiskAnalyzer(BaseAgent):
         self,
         file_path: str,
         code_map: CodeMap,
-        function_gaps: list[FunctionGap],
+        gap_index: FunctionGapIndex,
     ) -> FileRisk:
         """Analyze risk for a single file.
 
         Args:
             file_path: Path to the file.
             code_map: Code analysis results.
-            function_gaps: Coverage gaps.
+            gap_index: Coverage gaps by file and function.
 
         Returns:
             FileRisk assessment.
@@ -458,7 +492,7 @@ class RiskAnalyzer(BaseAgent):
         )
 
         # Calculate coverage percentage
-        file_gaps = [g for g in function_gaps if g.file_path == file_path]
+        file_gaps = gap_index.for_file(file_path)
         if file_gaps:
             avg_coverage = sum(g.coverage_percentage for g in file_gaps) / len(file_gaps)
         else:
@@ -488,20 +522,24 @@ class RiskAnalyzer(BaseAgent):
         self,
         file_path: str,
         code_map: CodeMap,
-        function_gaps: list[FunctionGap],
+        gap_index: FunctionGapIndex,
+        recency_info: RecencyInfo | None = None,
     ) -> list[FunctionRisk]:
         """Analyze risk for all functions in a file.
 
         Args:
             file_path: Path to the file.
             code_map: Code analysis results.
-            function_gaps: Coverage gaps.
+            gap_index: Coverage gaps by file and function.
+            recency_info: Recency of the file, if already looked up.  Used
+                for functions whose lines have no churn data.
 
         Returns:
             List of FunctionRisk assessments.
         """
         function_risks: list[FunctionRisk] = []
-        recency_info = self._get_recency_info(file_path)
+        if recency_info is None:
+            recency_info = self._get_recency_info(file_path)
 
         for func in code_map.functions:
             # Get complexity
@@ -509,21 +547,19 @@ class RiskAnalyzer(BaseAgent):
             complexity = complexity_metrics.cyclomatic if complexity_metrics else 1
 
             # Get coverage
-            matching_gaps = [
-                g
-                for g in function_gaps
-                if g.file_path == file_path and g.function_name == func.name
-            ]
-            coverage_percentage = matching_gaps[0].coverage_percentage if matching_gaps else 100.0
+            gap = gap_index.for_function(file_path, func.name)
+            coverage_percentage = gap.coverage_percentage if gap is not None else 100.0
 
             # Detect criticality for this function
             func_criticality = self._detect_function_criticality(func.name, func.body_text)
 
+            func_recency = self._get_function_recency(file_path, func, recency_info)
+
             # Calculate risk score
             risk_score = self._calculate_risk_score(
                 complexity=float(complexity),
                 coverage_percentage=coverage_percentage,
-                recency_info=recency_info,
+                recency_info=func_recency,
                 criticality_domains=func_criticality,
             )
 
@@ -538,50 +574,56 @@ class RiskAnalyzer(BaseAgent):
                     complexity=complexity,
                     coverage_percentage=coverage_percentage,
                     is_public=is_public,
+                    recency_info=func_recency,
                 )
             )
 
         return function_risks
 
-    def _safe_git_run(self, args: list[str]) -> subprocess.CompletedProcess[str]:
-        """Execute git command safely with validated inputs.
-
-        This method centralizes subprocess calls to git, ensuring:
-        - Full executable path (no shell injection via PATH)
-        - List-based arguments (no shell parsing)
-        - Explicit shell=False
-        - Controlled working directory
-
-        Args:
-            args: Git command arguments (without git executable itself).
-
-        Returns:
-            CompletedProcess with command results.
+    def _get_history(self) -> GitHistoryIndex:
+        """Return the git history index, loading it on first use."""
+        if self._history is None:
+            self._history = load_history_index(self._root)
+        return self._history
+
+    def _get_churn(self, code_maps: dict[str, CodeMap]) -> FunctionChurnIndex:
+        """Return the function churn index, building it for *code_maps* on first use."""
+        if self._churn is None:
+            self._churn = load_function_churn(self._root, code_maps)
+        return self._churn
+
+    def _get_function_recency(
+        self, file_path: str, func: FunctionInfo, file_recency: RecencyInfo
+    ) -> RecencyInfo:
+        """Get recency information for the lines of *func*.
+
+        Falls back to *file_recency* when the file has no line history
+        (untracked, outside git, or no churn index).
         """
-        return subprocess.run(
-            [self._git_path, *args],
-            cwd=self._root,
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=False,
-        )
+        churn = self._churn
+        if churn is None or not churn.has_file(file_path):
+            return file_recency
 
-    def _validate_file_path(self, file_path: str) -> bool:
-        """Validate that file path is safe for subprocess execution.
-
-        Args:
-            file_path: Path to validate.
+        history = churn.function_history(file_path, func.start_line, func.end_line)
+        if not history.timestamps:
+            # Unchanged for at least the whole scanned window
+            return RecencyInfo(
+                days_since_modified=max(file_recency.days_since_modified or 0, churn.max_age_days),
+            )
 
-        Returns:
-            True if path is safe, False otherwise.
-        """
-        # Reject paths with shell metacharacters or null bytes
-        dangerous_chars = [";", "&", "|", "`", "$", "(", ")", "<", ">", "\n", "\0"]
-        return not any(char in file_path for char in dangerous_chars)
+        now = datetime.now(UTC)
+        last_modified = datetime.fromtimestamp(history.timestamps[-1], tz=UTC)
+        cutoff = int((now - timedelta(days=RECENCY_WINDOW_DAYS)).timestamp())
+        return RecencyInfo(
+            last_modified=last_modified,
+            days_since_modified=(now - last_modified).days,
+            commit_count_90d=len(history.timestamps)
+            - bisect.bisect_left(history.timestamps, cutoff),
+            recent_authors=sorted(a for a, ts in history.authors.items() if ts >= cutoff),
+        )
 
     def _get_recency_info(self, file_path: str) -> RecencyInfo:
-        """Get recency information for a file from git log (task 1.21.3).
+        """Get recency information for a file from git history (task 1.21.3).
 
         Args:
             file_path: Path to the file.
@@ -589,46 +631,19 @@ class RiskAnalyzer(BaseAgent):
         Returns:
             RecencyInfo with git history data.
         """
-        # Validate file path for security
-        if not self._validate_file_path(file_path):
-            logger.warning("Invalid file path detected: %s", file_path)
+        history = self._get_history()
+        last_modified = history.last_modified(file_path)
+        if last_modified is None:
             return RecencyInfo()
 
-        try:
-            # Get last modification time
-            result = self._safe_git_run(["log", "-1", "--format=%at", "--", file_path])
-
-            if result.returncode == 0 and result.stdout.strip():
-                timestamp = int(result.stdout.strip())
-                last_modified = datetime.fromtimestamp(timestamp, tz=UTC)
-                now = datetime.now(UTC)
-                days_since = (now - last_modified).days
-            else:
-                last_modified = None
-                days_since = None
-
-            # Get commit count in last 90 days
-            result = self._safe_git_run(
-                ["log", "--since=90 days ago", "--format=%H", "--", file_path]
-            )
-            commit_count = len(result.stdout.strip().split("\n")) if result.stdout.strip() else 0
-
-            # Get recent authors
-            result = self._safe_git_run(
-                ["log", "--since=90 days ago", "--format=%an", "--", file_path]
-            )
-            authors = list(set(result.stdout.strip().split("\n"))) if result.stdout.strip() else []
-
-            return RecencyInfo(
-                last_modified=last_modified,
-                days_since_modified=days_since,
-                commit_count_90d=commit_count,
-                recent_authors=authors,
-            )
-
-        except (subprocess.TimeoutExpired, FileNotFoundError, ValueError) as exc:
-            logger.debug("Could not get git recency info for %s: %s", file_path, exc)
-            return RecencyInfo()
+        now = datetime.now(UTC)
+        since = now - timedelta(days=RECENCY_WINDOW_DAYS)
+        return RecencyInfo(
+            last_modified=last_modified,
+            days_since_modified=(now - last_modified).days,
+            commit_count_90d=history.commit_count(file_path, since=since),
+            recent_authors=history.authors(file_path, since=since),
+        )
 
     def _detect_criticality_domains(self, code_map: CodeMap) -> list[CriticalityDomain]:
         """Detect critical domains in code (task 1.21.2).
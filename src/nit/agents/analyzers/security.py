@@ -5,16 +5,20 @@ This agent:
 2. Validates medium-confidence findings via LLM to reduce false positives
 3. Reports precise, actionable security findings with CWE IDs and remediation
 4. Supports Python, JS/TS, Java, Go, Rust, C/C++, C#
+5. Reuses matches and LLM verdicts of unchanged files from a persisted cache
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import json
 import logging
 import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from nit.agents.analyzers.security_cache import SecurityScanCache
 from nit.agents.analyzers.security_patterns.base import get_patterns_for_language
 from nit.agents.analyzers.security_types import SecuritySeverity, VulnerabilityType
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
@@ -22,14 +26,22 @@ from nit.llm.engine import GenerationRequest
 from nit.llm.prompts.security_analysis import (
     SecurityAnalysisContext,
     SecurityAnalysisPrompt,
+    SecurityBatchContext,
+    SecurityBatchFinding,
 )
 from nit.parsing.treesitter import EXTENSION_TO_LANGUAGE
+from nit.utils.cache import content_hash
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from nit.agents.analyzers.security_cache import Verdict, VerdictKey
+    from nit.agents.analyzers.security_patterns.base import PatternMatch
     from nit.llm.engine import LLMEngine
 
+    # A verdict and whether the reply stated it (defaulted verdicts are not cached)
+    _Validation = tuple[Verdict, bool]
+
 logger = logging.getLogger(__name__)
 
 # Re-export enums that were extracted to security_types to break a circular
@@ -50,6 +62,21 @@ DEFAULT_CONFIDENCE_THRESHOLD = 0.7
 MAX_LLM_VALIDATIONS = 20
 """Cap on LLM calls per security scan for cost control."""
 
+_DEFAULT_LLM_CONFIDENCE = 0.75
+"""Confidence assumed when the LLM confirms a finding without a score."""
+
+
+# ── Batched validation ────────────────────────────────────────────
+
+MAX_BATCH_FINDINGS = 10
+"""Most findings validated by one batched LLM request."""
+
+MAX_CONCURRENT_VALIDATIONS = 4
+"""Batched LLM requests in flight at once."""
+
+BATCH_CONTEXT_LINES = 3
+"""Source lines shown before and after each finding of a batch."""
+
 
 # ── CWE + severity mappings ──────────────────────────────────────
 
@@ -164,6 +191,9 @@ class SecurityAnalysisTask(TaskInput):
     confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD
     """Minimum confidence to report."""
 
+    batch_validation: bool = False
+    """Validate the findings of one file with a single LLM request."""
+
 
 # ── SecurityAnalyzer ──────────────────────────────────────────────
 
@@ -191,11 +221,13 @@ class SecurityAnalyzer(BaseAgent):
         *,
         enable_llm_validation: bool = True,
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        use_cache: bool = True,
     ) -> None:
         self._project_root = project_root
         self._llm_engine = llm_engine
         self._enable_llm_validation = enable_llm_validation
         self._confidence_threshold = confidence_threshold
+        self._use_cache = use_cache
 
     @property
     def name(self) -> str:
@@ -221,35 +253,17 @@ class SecurityAnalyzer(BaseAgent):
             return TaskOutput(status=TaskStatus.FAILED, errors=[str(exc)])
 
     async def analyze(self, task: SecurityAnalysisTask) -> SecurityReport:
-        """Scan all code maps and produce a security report."""
-        all_findings: list[SecurityFinding] = []
-
-        for file_path, code_map in task.code_maps.items():
-            language: str = code_map.language
-            patterns = get_patterns_for_language(language)
-            if patterns is None:
-                continue
+        """Scan all code maps and produce a security report.
 
-            source_code = self._read_source(file_path)
-            if not source_code:
-                continue
+        Files whose content is unchanged since a previous run reuse the
+        cached pattern matches and LLM verdicts instead of being rescanned
+        and revalidated.
+        """
+        cache = SecurityScanCache.load(self._project_root) if self._use_cache else None
 
-            matches = patterns.scan(source_code, code_map)
-            for match in matches:
-                finding = SecurityFinding(
-                    vulnerability_type=match.vuln_type,
-                    severity=DEFAULT_SEVERITY.get(match.vuln_type, SecuritySeverity.MEDIUM),
-                    file_path=file_path,
-                    line_number=match.line_number,
-                    function_name=match.function_name,
-                    title=match.title,
-                    description=match.description,
-                    remediation=match.remediation,
-                    confidence=match.confidence,
-                    cwe_id=CWE_MAP.get(match.vuln_type),
-                    evidence=match.evidence,
-                )
-                all_findings.append(finding)
+        # Pattern scanning is CPU-bound; keep it off the event loop so other
+        # pipeline stages (LLM calls, coverage) progress meanwhile
+        all_findings = await asyncio.to_thread(self._scan_files, task.code_maps, cache)
 
         # Deduplicate (same file + line + vuln type)
         all_findings = _deduplicate(all_findings)
@@ -260,7 +274,13 @@ class SecurityAnalyzer(BaseAgent):
             and task.enable_llm_validation
             and self._llm_engine is not None
         ):
-            all_findings = await self._validate_with_llm(all_findings)
+            all_findings = await self._validate_with_llm(
+                all_findings, cache, batched=task.batch_validation
+            )
+
+        if cache is not None:
+            cache.prune(self._project_root)
+            cache.save(self._project_root)
 
         # Filter by confidence threshold
         threshold = task.confidence_threshold
@@ -274,6 +294,39 @@ class SecurityAnalyzer(BaseAgent):
             files_scanned=len(task.code_maps),
         )
 
+    def _scan_files(
+        self, code_maps: dict[str, Any], cache: SecurityScanCache | None = None
+    ) -> list[SecurityFinding]:
+        """Run the language patterns over every file with a pattern module."""
+        findings: list[SecurityFinding] = []
+        for file_path, code_map in code_maps.items():
+            findings.extend(self._scan_file(file_path, code_map, cache))
+        return findings
+
+    def _scan_file(
+        self, file_path: str, code_map: Any, cache: SecurityScanCache | None = None
+    ) -> list[SecurityFinding]:
+        """Heuristic findings for one file (empty if unsupported or unreadable)."""
+        language: str = code_map.language
+        patterns = get_patterns_for_language(language)
+        if patterns is None:
+            return []
+
+        source_code = self._read_source(file_path)
+        if not source_code:
+            return []
+
+        if cache is None:
+            matches = patterns.scan(source_code, code_map)
+        else:
+            digest = content_hash(source_code)
+            cached = cache.lookup(file_path, digest)
+            if cached is None:
+                cached = cache.store(file_path, digest, patterns.scan(source_code, code_map))
+            matches = cached.matches
+
+        return [_finding_from_match(file_path, match) for match in matches]
+
     def _read_source(self, file_path: str) -> str:
         """Read source file content."""
         try:
@@ -282,58 +335,202 @@ class SecurityAnalyzer(BaseAgent):
             logger.debug("Cannot read %s for security scan", file_path)
             return ""
 
-    async def _validate_with_llm(self, findings: list[SecurityFinding]) -> list[SecurityFinding]:
-        """Use LLM to validate medium-confidence findings."""
-        validated: list[SecurityFinding] = []
-        llm_calls = 0
-        prompt_template = SecurityAnalysisPrompt()
-
-        for finding in findings:
+    async def _validate_with_llm(
+        self,
+        findings: list[SecurityFinding],
+        cache: SecurityScanCache | None = None,
+        *,
+        batched: bool = False,
+    ) -> list[SecurityFinding]:
+        """Use LLM to validate medium-confidence findings.
+
+        Verdicts already in *cache* are applied without an LLM call (and do
+        not count towards ``MAX_LLM_VALIDATIONS``); new verdicts are added
+        to it unless the reply did not state one and the default was used.
+        Findings without a verdict (over the cap, or the LLM call failed)
+        are kept as they are.
+
+        Args:
+            findings: Deduplicated heuristic findings.
+            cache: Scan cache holding verdicts of earlier runs.
+            batched: Validate per-file batches concurrently instead of one
+                finding per request.
+        """
+        verdicts: dict[int, Verdict] = {}
+        pending: list[int] = []
+        for index, finding in enumerate(findings):
             # High-confidence findings pass through
             if finding.confidence >= HIGH_CONFIDENCE_THRESHOLD:
-                validated.append(finding)
                 continue
-
+            key = _verdict_key(finding)
+            cached = cache.verdict(finding.file_path, key) if cache is not None else None
+            if cached is not None:
+                verdicts[index] = cached
+            else:
+                pending.append(index)
+
+        if pending and self._llm_engine is None:
+            raise RuntimeError("LLM engine is unexpectedly None")
+        validate = self._validate_batched if batched else self._validate_each
+        fresh = await validate([findings[index] for index in pending]) if pending else []
+        for index, validation in zip(pending, fresh, strict=True):
+            if validation is None:
+                continue
+            verdict, parsed = validation
+            finding = findings[index]
+            if cache is not None and parsed:
+                cache.record_verdict(finding.file_path, _verdict_key(finding), verdict)
+            verdicts[index] = verdict
+
+        return [
+            finding
+            for index, finding in enumerate(findings)
+            if index not in verdicts or _apply_verdict(finding, verdicts[index])
+        ]
+
+    async def _validate_each(self, findings: list[SecurityFinding]) -> list[_Validation | None]:
+        """Validate findings one prompt at a time, up to ``MAX_LLM_VALIDATIONS`` calls."""
+        verdicts: list[_Validation | None] = []
+        llm_calls = 0
+        for finding in findings:
             # Cap LLM calls
             if llm_calls >= MAX_LLM_VALIDATIONS:
-                validated.append(finding)
+                verdicts.append(None)
                 continue
-
-            if self._llm_engine is None:
-                raise RuntimeError("LLM engine is unexpectedly None")
             try:
-                context = SecurityAnalysisContext(
+                verdicts.append(await self._validate_one(finding))
+                llm_calls += 1
+            except Exception as exc:
+                logger.debug("LLM validation failed for finding: %s", exc)
+                verdicts.append(None)
+        return verdicts
+
+    async def _validate_batched(self, findings: list[SecurityFinding]) -> list[_Validation | None]:
+        """Validate findings in per-file batches, several batches at a time.
+
+        At most ``MAX_LLM_VALIDATIONS`` batches are sent and at most
+        ``MAX_CONCURRENT_VALIDATIONS`` of them are in flight at once; the
+        engine's own rate limiter still applies to every call.
+        """
+        batches = _batch_findings(findings)
+        if len(batches) > MAX_LLM_VALIDATIONS:
+            logger.debug(
+                "Validating %d of %d security finding batches", MAX_LLM_VALIDATIONS, len(batches)
+            )
+            batches = batches[:MAX_LLM_VALIDATIONS]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+
+        async def run(batch: list[int]) -> list[_Validation | None]:
+            async with semaphore:
+                try:
+                    return await self._validate_batch([findings[index] for index in batch])
+                except Exception as exc:
+                    logger.debug(
+                        "LLM validation failed for %s: %s", findings[batch[0]].file_path, exc
+                    )
+                    return [None] * len(batch)
+
+        outcomes = await asyncio.gather(*(run(batch) for batch in batches))
+        verdicts: list[_Validation | None] = [None] * len(findings)
+        for batch, outcome in zip(batches, outcomes, strict=True):
+            for index, verdict in zip(batch, outcome, strict=True):
+                verdicts[index] = verdict
+        return verdicts
+
+    async def _validate_batch(self, batch: list[SecurityFinding]) -> list[_Validation | None]:
+        """Validate findings of one file with a single request."""
+        if len(batch) == 1:
+            return [await self._validate_one(batch[0])]
+        if self._llm_engine is None:
+            raise RuntimeError("LLM engine is unexpectedly None")
+
+        file_path = batch[0].file_path
+        excerpt = _code_excerpt(
+            self._read_source(file_path), [finding.line_number for finding in batch]
+        )
+        context = SecurityBatchContext(
+            file_path=file_path,
+            language=_language_from_path(file_path),
+            code_excerpt=excerpt or "\n".join(finding.evidence for finding in batch),
+            findings=[
+                SecurityBatchFinding(
+                    finding_id=finding_id,
                     vulnerability_type=finding.vulnerability_type.value,
+                    line_number=finding.line_number,
                     code_snippet=finding.evidence,
-                    file_path=finding.file_path,
-                    language=_language_from_path(finding.file_path),
                     heuristic_description=finding.description,
                 )
-                rendered = prompt_template.render_validation(context)
-                request = GenerationRequest(messages=rendered.messages)
-                response = await self._llm_engine.generate(request)
-                llm_calls += 1
+                for finding_id, finding in enumerate(batch, 1)
+            ],
+        )
+        rendered = SecurityAnalysisPrompt().render_batch_validation(context)
+        response = await self._llm_engine.generate(GenerationRequest(messages=rendered.messages))
+        verdicts = _parse_batch_validation(response.text)
+        return [
+            (verdicts[finding_id], True) if finding_id in verdicts else None
+            for finding_id in range(1, len(batch) + 1)
+        ]
+
+    async def _validate_one(self, finding: SecurityFinding) -> _Validation:
+        """Validate a single finding with its own prompt.
+
+        A reply without an ``IS_VALID`` field yields the default verdict,
+        flagged as not parsed.
+        """
+        if self._llm_engine is None:
+            raise RuntimeError("LLM engine is unexpectedly None")
+        context = SecurityAnalysisContext(
+            vulnerability_type=finding.vulnerability_type.value,
+            code_snippet=finding.evidence,
+            file_path=finding.file_path,
+            language=_language_from_path(finding.file_path),
+            heuristic_description=finding.description,
+        )
+        rendered = SecurityAnalysisPrompt().render_validation(context)
+        response = await self._llm_engine.generate(GenerationRequest(messages=rendered.messages))
+        parsed = _IS_VALID_PATTERN.search(response.text) is not None
+        return _parse_llm_validation(response.text), parsed
 
-                is_valid, new_confidence = _parse_llm_validation(response.text)
-                if is_valid:
-                    finding.confidence = new_confidence
-                    finding.detection_method = "llm_validated"
-                    validated.append(finding)
-                else:
-                    logger.debug(
-                        "LLM dismissed finding: %s at %s:%s",
-                        finding.vulnerability_type.value,
-                        finding.file_path,
-                        finding.line_number,
-                    )
-            except Exception as exc:
-                logger.debug("LLM validation failed for finding: %s", exc)
-                validated.append(finding)
 
-        return validated
+# ── Helpers ───────────────────────────────────────────────────────
 
 
-# ── Helpers ───────────────────────────────────────────────────────
+def _finding_from_match(file_path: str, match: PatternMatch) -> SecurityFinding:
+    """A report finding for a raw pattern match in *file_path*."""
+    return SecurityFinding(
+        vulnerability_type=match.vuln_type,
+        severity=DEFAULT_SEVERITY.get(match.vuln_type, SecuritySeverity.MEDIUM),
+        file_path=file_path,
+        line_number=match.line_number,
+        function_name=match.function_name,
+        title=match.title,
+        description=match.description,
+        remediation=match.remediation,
+        confidence=match.confidence,
+        cwe_id=CWE_MAP.get(match.vuln_type),
+        evidence=match.evidence,
+    )
+
+
+def _verdict_key(finding: SecurityFinding) -> VerdictKey:
+    """Identify a finding within its file for the verdict cache."""
+    return (finding.line_number, finding.vulnerability_type.value, finding.title)
+
+
+def _apply_verdict(finding: SecurityFinding, verdict: Verdict) -> bool:
+    """Apply an LLM verdict to *finding*; return whether it is kept."""
+    is_valid, confidence = verdict
+    if not is_valid:
+        logger.debug(
+            "LLM dismissed finding: %s at %s:%s",
+            finding.vulnerability_type.value,
+            finding.file_path,
+            finding.line_number,
+        )
+        return False
+    finding.confidence = confidence
+    finding.detection_method = "llm_validated"
+    return True
 
 
 def _deduplicate(findings: list[SecurityFinding]) -> list[SecurityFinding]:
@@ -357,7 +554,7 @@ def _language_from_path(file_path: str) -> str:
 def _parse_llm_validation(text: str) -> tuple[bool, float]:
     """Parse LLM validation response for IS_VALID and CONFIDENCE fields."""
     is_valid = True
-    confidence = 0.75
+    confidence = _DEFAULT_LLM_CONFIDENCE
 
     valid_match = _IS_VALID_PATTERN.search(text)
     if valid_match:
@@ -369,3 +566,76 @@ def _parse_llm_validation(text: str) -> tuple[bool, float]:
             confidence = min(1.0, max(0.0, float(conf_match.group(1))))
 
     return is_valid, confidence
+
+
+def _batch_findings(findings: list[SecurityFinding]) -> list[list[int]]:
+    """Group finding indices by file, in line order, at most ``MAX_BATCH_FINDINGS`` each."""
+    by_file: dict[str, list[int]] = {}
+    for index, finding in enumerate(findings):
+        by_file.setdefault(finding.file_path, []).append(index)
+
+    batches: list[list[int]] = []
+    for indices in by_file.values():
+        indices.sort(key=lambda i: (findings[i].line_number is None, findings[i].line_number or 0))
+        batches.extend(
+            indices[start : start + MAX_BATCH_FINDINGS]
+            for start in range(0, len(indices), MAX_BATCH_FINDINGS)
+        )
+    return batches
+
+
+def _code_excerpt(source: str, line_numbers: list[int | None]) -> str:
+    """Line-numbered source around *line_numbers*, overlapping windows merged."""
+    lines = source.splitlines()
+    windows = sorted(
+        (max(1, line - BATCH_CONTEXT_LINES), min(len(lines), line + BATCH_CONTEXT_LINES))
+        for line in line_numbers
+        if line is not None and 1 <= line <= len(lines)
+    )
+    merged: list[tuple[int, int]] = []
+    for first, last in windows:
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return "\n...\n".join(
+        "\n".join(f"{n:>5} | {lines[n - 1]}" for n in range(first, last + 1))
+        for first, last in merged
+    )
+
+
+def _parse_batch_validation(text: str) -> dict[int, tuple[bool, float]]:
+    """Parse a batched validation response: a JSON array of per-finding verdicts.
+
+    The array may be wrapped in prose or a code fence.  Entries without a
+    usable ``id`` or ``is_valid`` are skipped, so their findings get no
+    verdict; a missing confidence defaults as in ``_parse_llm_validation``.
+    """
+    start, end = text.find("["), text.rfind("]")
+    if start < 0 or end < start:
+        return {}
+    try:
+        items = json.loads(text[start : end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    verdicts: dict[int, tuple[bool, float]] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            finding_id = int(item["id"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        is_valid = item.get("is_valid")
+        if isinstance(is_valid, str) and is_valid.strip().lower() in {"true", "false"}:
+            is_valid = is_valid.strip().lower() == "true"
+        if not isinstance(is_valid, bool):
+            continue
+        confidence = _DEFAULT_LLM_CONFIDENCE
+        with contextlib.suppress(KeyError, TypeError, ValueError):
+            confidence = min(1.0, max(0.0, float(item["confidence"])))
+        verdicts[finding_id] = (is_valid, confidence)
+    return verdicts
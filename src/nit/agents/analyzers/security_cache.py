@@ -0,0 +1,131 @@
+"""Persisted security scan results, keyed by file content.
+
+``SecurityAnalyzer`` scans every file of a project on each ``nit pick`` and
+asks the LLM to validate medium-confidence findings.  ``SecurityScanCache``
+keeps, per file, the hash of the content that was scanned, the raw pattern
+matches and the LLM verdicts given for them.  A file whose content hash
+(and the pattern-set version) is unchanged reuses both, so a run on a pull
+request only scans and validates the files it touched.
+
+The cache is persisted to ``.nit/cache/security.json``.  A new
+``pattern_set_version()`` discards every entry, since the same content may
+then match differently.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from nit.agents.analyzers.security_patterns.base import PatternMatch, pattern_set_version
+from nit.agents.analyzers.security_types import VulnerabilityType
+from nit.utils.cache import CACHE_DIR, VersionedJsonCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SECURITY_CACHE_PATH = CACHE_DIR / "security.json"
+
+# (line number, vulnerability type value, title) of a finding within a file
+VerdictKey = tuple[int | None, str, str]
+
+# LLM validation result: (is valid, confidence)
+Verdict = tuple[bool, float]
+
+
+@dataclass
+class CachedScan:
+    """Scan results for one version of a file."""
+
+    content_hash: str
+    """``content_hash`` of the file text that was scanned."""
+
+    matches: list[PatternMatch]
+    """Raw pattern matches, in scan order."""
+
+    verdicts: dict[VerdictKey, Verdict] = field(default_factory=dict)
+    """LLM validation result per finding."""
+
+
+class SecurityScanCache(VersionedJsonCache):
+    """Per-file pattern matches and LLM verdicts for one pattern-set version."""
+
+    cache_path = SECURITY_CACHE_PATH
+    format_version = 2
+
+    def __init__(self, pattern_version: str | None = None) -> None:
+        super().__init__()
+        self.pattern_version = pattern_version or pattern_set_version()
+        self._files: dict[str, CachedScan] = {}
+
+    @property
+    def version(self) -> str:
+        """The pattern-set version the files were scanned with."""
+        return self.pattern_version
+
+    def lookup(self, file_path: str, content_hash: str) -> CachedScan | None:
+        """The cached scan of *file_path* if it was made for *content_hash*."""
+        entry = self._files.get(file_path)
+        if entry is None or entry.content_hash != content_hash:
+            return None
+        return entry
+
+    def store(self, file_path: str, content_hash: str, matches: list[PatternMatch]) -> CachedScan:
+        """Record a fresh scan of *file_path*, dropping verdicts of older content."""
+        entry = CachedScan(content_hash=content_hash, matches=matches)
+        self._files[file_path] = entry
+        self._dirty = True
+        return entry
+
+    def verdict(self, file_path: str, key: VerdictKey) -> Verdict | None:
+        """The LLM verdict recorded for a finding, if any."""
+        entry = self._files.get(file_path)
+        return entry.verdicts.get(key) if entry is not None else None
+
+    def record_verdict(self, file_path: str, key: VerdictKey, verdict: Verdict) -> None:
+        """Remember the LLM verdict for a finding of a cached file."""
+        entry = self._files.get(file_path)
+        if entry is not None:
+            entry.verdicts[key] = verdict
+            self._dirty = True
+
+    def prune(self, project_root: Path) -> None:
+        """Drop the entries of files that no longer exist."""
+        gone = [path for path in self._files if not (project_root / path).is_file()]
+        for path in gone:
+            del self._files[path]
+        self._dirty = self._dirty or bool(gone)
+
+    def _entries_to_json(self) -> dict[str, Any]:
+        return {
+            path: {
+                "hash": entry.content_hash,
+                "matches": [_match_to_dict(match) for match in entry.matches],
+                "verdicts": [
+                    [line, vuln, title, is_valid, confidence]
+                    for (line, vuln, title), (is_valid, confidence) in entry.verdicts.items()
+                ],
+            }
+            for path, entry in self._files.items()
+        }
+
+    def _entries_from_json(self, entries: dict[str, Any]) -> None:
+        for path, entry in entries.items():
+            self._files[path] = CachedScan(
+                content_hash=str(entry["hash"]),
+                matches=[_match_from_dict(match) for match in entry["matches"]],
+                verdicts={
+                    (line, str(vuln), str(title)): (bool(is_valid), float(confidence))
+                    for line, vuln, title, is_valid, confidence in entry["verdicts"]
+                },
+            )
+
+
+def _match_to_dict(match: PatternMatch) -> dict[str, Any]:
+    data = asdict(match)
+    data["vuln_type"] = match.vuln_type.value
+    return data
+
+
+def _match_from_dict(data: dict[str, Any]) -> PatternMatch:
+    return PatternMatch(**{**data, "vuln_type": VulnerabilityType(data["vuln_type"])})
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import hashlib
+import importlib
+import itertools
 import logging
 import math
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from nit import __version__
 from nit.agents.analyzers.security_types import VulnerabilityType
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import ModuleType
+
     from nit.agents.analyzers.code import CodeMap
+    from nit.parsing.treesitter import FunctionInfo
 
 logger = logging.getLogger(__name__)
 
@@ -125,63 +136,363 @@ def _shannon_entropy(s: str) -> float:
     return -sum((c / length) * math.log2(c / length) for c in freq.values())
 
 
+# Lines starting with these are comments in every supported language
+_COMMENT_PREFIXES = ("#", "//", "*", "/*")
+
+# Path fragments of test files and fixtures, which are not checked for secrets
+_NON_PRODUCTION_PATH_PARTS = ("test_", "_test.", ".test.", "spec.", "fixture", "mock", "fake")
+
+# Constructs whose meaning differs between a lone line and the same line
+# inside the whole file; patterns using them are tried on every line
+_LINE_ONLY_CONSTRUCTS = ("\\A", "\\Z", "(?>", "*+", "++", "?+", "}+")
+_NEGATIVE_LOOKAROUNDS = ("(?!", "(?<!")
+
+
+@functools.lru_cache(maxsize=256)
+def _file_pattern(pattern: re.Pattern[str]) -> re.Pattern[str] | None:
+    """A variant of *pattern* for locating candidate lines in a whole file.
+
+    Searched over the file's lines joined with ``"\\n"`` (in multi-line
+    mode, so ``^`` and ``$`` still match at line ends), it matches starting
+    at every position where *pattern* matches within a single line, and
+    possibly at more.  Negative lookarounds are dropped, since across line
+    ends they could reject a match that the line alone accepts.  Returns
+    ``None`` for patterns this cannot be guaranteed for.
+    """
+    source = pattern.pattern
+    if any(construct in source for construct in _LINE_ONLY_CONSTRUCTS):
+        return None
+    try:
+        return re.compile(_drop_negative_lookarounds(source), pattern.flags | re.MULTILINE)
+    except re.error:
+        return None
+
+
+def _drop_negative_lookarounds(source: str) -> str:
+    """Remove ``(?!...)`` and ``(?<!...)`` groups from a regex source."""
+    out: list[str] = []
+    depth = 0  # open parentheses of the group being dropped
+    i = 0
+    while i < len(source):
+        if depth == 0 and source.startswith(_NEGATIVE_LOOKAROUNDS, i):
+            depth = 1
+            i += 3 if source[i + 2] == "!" else 4
+            continue
+        end = _token_end(source, i)
+        if depth == 0:
+            out.append(source[i:end])
+        elif source[i] == "(":
+            depth += 1
+        elif source[i] == ")":
+            depth -= 1
+        i = end
+    return "".join(out)
+
+
+def _token_end(source: str, i: int) -> int:
+    """End of the token at *i*: an escape, a whole character class, or one character."""
+    if source[i] == "\\":
+        return i + 2
+    if source[i] != "[":
+        return i + 1
+    j = i + 1
+    if j < len(source) and source[j] == "^":
+        j += 1
+    if j < len(source) and source[j] == "]":
+        j += 1  # a leading ``]`` is literal
+    while j < len(source) and source[j] != "]":
+        j += 2 if source[j] == "\\" else 1
+    return j + 1
+
+
+@functools.cache
+def _regex_internals() -> tuple[ModuleType, ModuleType] | None:
+    """The parser and constants modules behind ``re``, if importable.
+
+    They are private to the standard library and may change between
+    Python versions, so without them ``_required_literals`` gives up and
+    every pattern is searched for.
+    """
+    try:
+        return importlib.import_module("re._parser"), importlib.import_module("re._constants")
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _required_literals(pattern: re.Pattern[str]) -> frozenset[str] | None:
+    """Strings at least one of which occurs in every match of *pattern*.
+
+    Derived from the parsed pattern: a run of literal characters, or a
+    group or alternation whose every branch has one.  ``None`` when no
+    such strings exist (or the pattern uses constructs this does not
+    follow), in which case the pattern must be searched for.  For
+    case-insensitive patterns the strings are lowercase.
+    """
+    internals = _regex_internals()
+    if internals is None or pattern.flags & ~(re.IGNORECASE | re.UNICODE):
+        return None
+    parser, constants = internals
+    try:
+        literals = _sequence_literals(constants, list(parser.parse(pattern.pattern, pattern.flags)))
+    except (re.error, AttributeError, TypeError, ValueError):
+        # An unexpected parse tree layout means no prefilter, not a failure
+        return None
+    if literals is None or not pattern.flags & re.IGNORECASE:
+        return literals
+    return frozenset(literal.lower() for literal in literals)
+
+
+def _sequence_literals(sre: ModuleType, items: list[tuple[Any, Any]]) -> frozenset[str] | None:
+    """The most selective required-literal set of a sequence of parsed items."""
+    choices: list[frozenset[str]] = []
+    run: list[str] = []
+    for op, arg in items:
+        if op is sre.LITERAL:
+            run.append(chr(arg))
+            continue
+        if run:
+            choices.append(frozenset({"".join(run)}))
+            run = []
+        literals = _item_literals(sre, op, arg)
+        if literals:
+            choices.append(literals)
+    if run:
+        choices.append(frozenset({"".join(run)}))
+    return max(choices, key=lambda choice: min(map(len, choice)), default=None)
+
+
+def _item_literals(sre: ModuleType, op: Any, arg: Any) -> frozenset[str] | None:
+    if op is sre.SUBPATTERN:
+        _, add_flags, del_flags, items = arg
+        return None if add_flags or del_flags else _sequence_literals(sre, list(items))
+    if op is sre.BRANCH:
+        branches: list[frozenset[str]] = []
+        for items in arg[1]:
+            branch = _sequence_literals(sre, list(items))
+            if not branch:
+                return None
+            branches.append(branch)
+        return frozenset[str]().union(*branches)
+    if op in {sre.MAX_REPEAT, sre.MIN_REPEAT} and arg[0] >= 1:
+        return _sequence_literals(sre, list(arg[2]))
+    return None
+
+
+class _FileLines:
+    """A file's lines, with whole-file searches that report line indexes."""
+
+    def __init__(self, source_code: str) -> None:
+        self.lines = source_code.splitlines()
+        self._text = "\n".join(self.lines)
+        self._lowered: str | None = None
+        self._starts: list[int] | None = None
+
+    def candidates(self, pattern: re.Pattern[str]) -> Iterable[int]:
+        """Indexes of the lines *pattern* may match (a superset of those it does)."""
+        if not self._may_contain(pattern):
+            return ()
+        searchable = _file_pattern(pattern)
+        if searchable is None:
+            return range(len(self.lines))
+        found: list[int] = []
+        match = searchable.search(self._text)
+        if match is None:
+            return found
+        starts = self._line_starts()
+        while match is not None:
+            index = bisect.bisect_right(starts, match.start()) - 1
+            found.append(index)
+            if index + 1 >= len(starts):
+                break
+            # Resume at the next line: a match here may overlap a later line's own
+            match = searchable.search(self._text, starts[index + 1])
+        return found
+
+    def _may_contain(self, pattern: re.Pattern[str]) -> bool:
+        """Whether the file contains one of the literals every match of *pattern* has."""
+        literals = _required_literals(pattern)
+        if literals is None:
+            return True
+        if not pattern.flags & re.IGNORECASE:
+            return any(literal in self._text for literal in literals)
+        # Lowercasing only mirrors case-insensitive matching for ASCII text
+        if not self._text.isascii():
+            return True
+        if self._lowered is None:
+            self._lowered = self._text.lower()
+        return any(literal in self._lowered for literal in literals)
+
+    def _line_starts(self) -> list[int]:
+        if self._starts is None:
+            self._starts = [0, *itertools.accumulate(len(line) + 1 for line in self.lines)][:-1]
+            if not self._starts:
+                self._starts = [0]
+        return self._starts
+
+
+def _secret_matches(line: str, line_idx: int) -> list[PatternMatch]:
+    """Hardcoded secrets on one (non-comment) line."""
+    findings: list[PatternMatch] = []
+    for name, pattern in _SECRET_PATTERNS:
+        match = pattern.search(line)
+        if not match:
+            continue
+
+        secret_value = match.group(1)
+
+        # Skip placeholders
+        if _PLACEHOLDER_RE.search(secret_value):
+            continue
+
+        # For generic secrets, require high entropy
+        if name == "Generic Secret Assignment" and _shannon_entropy(secret_value) < _MIN_ENTROPY:
+            continue
+
+        findings.append(
+            PatternMatch(
+                vuln_type=VulnerabilityType.CREDENTIAL_LEAK,
+                line_number=line_idx,
+                evidence=line.strip()[:200],
+                confidence=0.85 if name != "Generic Secret Assignment" else 0.7,
+                title=f"Hardcoded secret: {name}",
+                description=(
+                    f"A {name.lower()} appears to be hardcoded in source code. "
+                    "Secrets in source code can be leaked through version control."
+                ),
+                remediation=(
+                    "Move the secret to an environment variable or a secrets "
+                    "manager. Reference it via os.environ, process.env, or "
+                    "equivalent."
+                ),
+            )
+        )
+    return findings
+
+
+def _skips_secrets(file_path: str) -> bool:
+    """Whether *file_path* is a test file or fixture (not checked for secrets)."""
+    lower_path = file_path.lower()
+    return any(part in lower_path for part in _NON_PRODUCTION_PATH_PARTS)
+
+
 def detect_hardcoded_secrets(source_code: str, file_path: str) -> list[PatternMatch]:
     """Detect hardcoded secrets across any language."""
     # Skip test files and fixtures
-    lower_path = file_path.lower()
-    if any(
-        part in lower_path
-        for part in ("test_", "_test.", ".test.", "spec.", "fixture", "mock", "fake")
-    ):
+    if _skips_secrets(file_path):
         return []
+    return _LineScanner(source_code, None, [], secrets=True).run()[1]
 
-    findings: list[PatternMatch] = []
-    lines = source_code.splitlines()
 
-    for line_idx, line in enumerate(lines, 1):
-        # Skip comments
-        stripped = line.strip()
-        if stripped.startswith(("#", "//", "*", "/*")):
-            continue
+class _EnclosingFunctions:
+    """Line -> name of the enclosing function, built once per scanned file.
 
-        for name, pattern in _SECRET_PATTERNS:
-            match = pattern.search(line)
-            if not match:
-                continue
+    When functions overlap (methods listed after their class's functions,
+    nested definitions), the first function in list order wins.
+    """
 
-            secret_value = match.group(1)
+    def __init__(self, functions: list[FunctionInfo]) -> None:
+        self._names: dict[int, str] = {}
+        for func in reversed(functions):
+            for line in range(func.start_line, func.end_line + 1):
+                self._names[line] = func.name
 
-            # Skip placeholders
-            if _PLACEHOLDER_RE.search(secret_value):
-                continue
+    def at(self, line_number: int) -> str | None:
+        """Name of the function enclosing *line_number*, if any."""
+        return self._names.get(line_number)
+
+
+class _LineScanner:
+    """One pass over a file for dangerous sinks and hardcoded secrets.
 
-            # For generic secrets, require high entropy
-            if (
-                name == "Generic Secret Assignment"
-                and _shannon_entropy(secret_value) < _MIN_ENTROPY
-            ):
+    Each pattern is searched once over the whole file to find the lines it
+    may match; only those lines are then tested line by line, exactly as
+    a line-by-line scan would test them.  Files without matches (most of
+    them) cost one native regex search per pattern instead of one per
+    pattern and line, and the results are identical.
+    """
+
+    def __init__(
+        self,
+        source_code: str,
+        code_map: CodeMap | None,
+        sinks: list[DangerousSink],
+        *,
+        secrets: bool,
+    ) -> None:
+        self._file = _FileLines(source_code)
+        self._lines = self._file.lines
+        self._code_map = code_map
+        self._sinks = sinks
+        self._secrets = secrets
+        self._functions: _EnclosingFunctions | None = None
+
+    def run(self) -> tuple[list[PatternMatch], list[PatternMatch]]:
+        """Return the sink matches and the secret matches, each in line order."""
+        # Line index -> indexes of the sinks that may match it, in sink order
+        sink_lines: dict[int, list[int]] = {}
+        for sink_index, sink in enumerate(self._sinks):
+            for line_index in self._file.candidates(sink.pattern):
+                sink_lines.setdefault(line_index, []).append(sink_index)
+        secret_lines: set[int] = set()
+        if self._secrets:
+            for _, pattern in _SECRET_PATTERNS:
+                secret_lines.update(self._file.candidates(pattern))
+
+        sink_matches: list[PatternMatch] = []
+        secret_matches: list[PatternMatch] = []
+        for line_index in sorted(sink_lines.keys() | secret_lines):
+            line = self._lines[line_index]
+            stripped = line.strip()
+            # Skip comments
+            if stripped.startswith(_COMMENT_PREFIXES):
+                continue
+            line_idx = line_index + 1
+            if line_index in sink_lines:
+                sinks = [self._sinks[i] for i in sink_lines[line_index]]
+                sink_matches.extend(self._sink_matches(sinks, line, line_idx, stripped))
+            if line_index in secret_lines:
+                secret_matches.extend(_secret_matches(line, line_idx))
+        return sink_matches, secret_matches
+
+    def _sink_matches(
+        self, sinks: list[DangerousSink], line: str, line_idx: int, stripped: str
+    ) -> list[PatternMatch]:
+        matches: list[PatternMatch] = []
+        context_block: str | None = None
+        for sink in sinks:
+            if not sink.pattern.search(line):
                 continue
 
-            findings.append(
+            # Check safe guards — look at surrounding lines for mitigation
+            if sink.safe_guards:
+                if context_block is None:
+                    context_start = max(0, line_idx - 4)
+                    context_end = min(len(self._lines), line_idx + 2)
+                    context_block = "\n".join(self._lines[context_start:context_end])
+                if any(guard.search(context_block) for guard in sink.safe_guards):
+                    continue
+
+            matches.append(
                 PatternMatch(
-                    vuln_type=VulnerabilityType.CREDENTIAL_LEAK,
+                    vuln_type=sink.vuln_type,
                     line_number=line_idx,
-                    evidence=line.strip()[:200],
-                    confidence=0.85 if name != "Generic Secret Assignment" else 0.7,
-                    title=f"Hardcoded secret: {name}",
-                    description=(
-                        f"A {name.lower()} appears to be hardcoded in source code. "
-                        "Secrets in source code can be leaked through version control."
-                    ),
-                    remediation=(
-                        "Move the secret to an environment variable or a secrets "
-                        "manager. Reference it via os.environ, process.env, or "
-                        "equivalent."
-                    ),
+                    evidence=stripped[:200],
+                    confidence=sink.confidence,
+                    title=sink.title,
+                    description=sink.description,
+                    remediation=sink.remediation,
+                    function_name=self._enclosing_function(line_idx),
                 )
             )
+        return matches
 
-    return findings
+    def _enclosing_function(self, line_number: int) -> str | None:
+        if self._code_map is None:
+            return None
+        if self._functions is None:
+            self._functions = _EnclosingFunctions(self._code_map.functions)
+        return self._functions.at(line_number)
 
 
 # ── Base class for language patterns ─────────────────────────────
@@ -207,13 +518,6 @@ class LanguageSecurityPatterns(ABC):
             List of pattern matches found.
         """
 
-    def _find_enclosing_function(self, code_map: CodeMap, line_number: int) -> str | None:
-        """Find the function enclosing a given line number."""
-        for func in code_map.functions:
-            if func.start_line <= line_number <= func.end_line:
-                return func.name
-        return None
-
     def _scan_with_sinks(
         self,
         source_code: str,
@@ -221,44 +525,24 @@ class LanguageSecurityPatterns(ABC):
         sinks: list[DangerousSink],
     ) -> list[PatternMatch]:
         """Generic scan: match dangerous sinks against source lines."""
-        matches: list[PatternMatch] = []
-        lines = source_code.splitlines()
+        return _LineScanner(source_code, code_map, sinks, secrets=False).run()[0]
 
-        for line_idx, line in enumerate(lines, 1):
-            stripped = line.strip()
-            # Skip comments
-            if stripped.startswith(("#", "//", "*", "/*")):
-                continue
-
-            for sink in sinks:
-                if not sink.pattern.search(line):
-                    continue
-
-                # Check safe guards — look at surrounding lines for mitigation
-                context_start = max(0, line_idx - 4)
-                context_end = min(len(lines), line_idx + 2)
-                context_block = "\n".join(lines[context_start:context_end])
-
-                suppressed = any(guard.search(context_block) for guard in sink.safe_guards)
-                if suppressed:
-                    continue
-
-                func_name = self._find_enclosing_function(code_map, line_idx)
-
-                matches.append(
-                    PatternMatch(
-                        vuln_type=sink.vuln_type,
-                        line_number=line_idx,
-                        evidence=stripped[:200],
-                        confidence=sink.confidence,
-                        title=sink.title,
-                        description=sink.description,
-                        remediation=sink.remediation,
-                        function_name=func_name,
-                    )
-                )
+    def _scan_sinks_and_secrets(
+        self,
+        source_code: str,
+        code_map: CodeMap,
+        sinks: list[DangerousSink],
+    ) -> list[PatternMatch]:
+        """Sink matches followed by hardcoded secrets, from a single pass over the lines.
 
-        return matches
+        Same result as ``_scan_with_sinks`` followed by
+        ``detect_hardcoded_secrets``.
+        """
+        secrets = not _skips_secrets(code_map.file_path)
+        sink_matches, secret_matches = _LineScanner(
+            source_code, code_map, sinks, secrets=secrets
+        ).run()
+        return sink_matches + secret_matches
 
 
 # ── Registry ─────────────────────────────────────────────────────
@@ -278,3 +562,20 @@ def get_patterns_for_language(language: str) -> LanguageSecurityPatterns | None:
     is first imported (see ``__init__.py``).
     """
     return _LANGUAGE_PATTERNS.get(language)
+
+
+@functools.cache
+def pattern_set_version() -> str:
+    """Fingerprint of the pattern modules, for invalidating persisted scan results.
+
+    Hashes the source of every module in this package, so editing a sink,
+    a secret pattern or the scanner itself yields a new version.
+    """
+    digest = hashlib.sha256()
+    try:
+        for path in sorted(Path(__file__).parent.glob("*.py")):
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+    except OSError:
+        return f"nit-{__version__}"
+    return digest.hexdigest()[:16]
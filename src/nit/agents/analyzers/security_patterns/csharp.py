@@ -9,7 +9,6 @@ from nit.agents.analyzers.security_patterns.base import (
     DangerousSink,
     LanguageSecurityPatterns,
     PatternMatch,
-    detect_hardcoded_secrets,
 )
 from nit.agents.analyzers.security_types import VulnerabilityType
 
@@ -147,6 +146,4 @@ class CSharpSecurityPatterns(LanguageSecurityPatterns):
         return "csharp"
 
     def scan(self, source_code: str, code_map: CodeMap) -> list[PatternMatch]:
-        matches = self._scan_with_sinks(source_code, code_map, _CSHARP_SINKS)
-        matches.extend(detect_hardcoded_secrets(source_code, code_map.file_path))
-        return matches
+        return self._scan_sinks_and_secrets(source_code, code_map, _CSHARP_SINKS)
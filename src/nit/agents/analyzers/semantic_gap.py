@@ -14,6 +14,8 @@ that would catch real bugs.
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
 import re
 from dataclasses import dataclass, field
@@ -21,16 +23,19 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from nit.agents.analyzers.semantic_gap_cache import SemanticGapCache, function_key
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
 from nit.llm.engine import GenerationRequest
-from nit.llm.prompts.semantic_gap import SemanticGapContext, SemanticGapPrompt
+from nit.llm.prompts.semantic_gap import NO_GAPS_MARKER, SemanticGapContext, SemanticGapPrompt
 from nit.memory.global_memory import GlobalMemory
 from nit.memory.helpers import get_memory_context, inject_memory_into_messages, record_outcome
 
 if TYPE_CHECKING:
+    from nit.agents.analyzers.code import CodeMap
     from nit.agents.analyzers.coverage import CoverageGapReport, FunctionGap
     from nit.llm.context import ContextAssembler
     from nit.llm.engine import LLMEngine
+    from nit.parsing.treesitter import FunctionInfo
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +45,7 @@ MAX_FUNCTIONS_TO_ANALYZE = 10  # Limit LLM calls for cost control
 MIN_COMPLEXITY_FOR_ANALYSIS = 3  # Skip trivial functions
 MAX_COVERAGE_FOR_ANALYSIS = 90.0  # Skip well-tested functions
 MAX_FUNCTION_SNIPPET_LENGTH = 1000  # Maximum length for function code snippet
+DEFAULT_MAX_CONCURRENCY = 4  # Functions analyzed by the LLM at once
 
 
 class GapCategory(Enum):
@@ -95,6 +101,13 @@ class SemanticGapTask(TaskInput):
     function_gaps: list[FunctionGap] = field(default_factory=list)
     """Specific function gaps to analyze."""
 
+    code_maps: dict[str, CodeMap] = field(default_factory=dict)
+    """Code maps by file path; their parsed function bodies are analyzed
+    instead of re-reading and searching the source files."""
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    """Maximum number of functions analyzed by the LLM at once."""
+
 
 class SemanticGapDetector(BaseAgent):
     """Detects semantic test gaps using LLM analysis."""
@@ -166,33 +179,26 @@ class SemanticGapDetector(BaseAgent):
                 )
 
             # Prioritize and limit functions
-            prioritized = self._prioritize_gaps(function_gaps)
+            prioritized = self._prioritize_gaps(function_gaps, limit=self.max_functions)
 
-            # Analyze each function
-            for gap in prioritized[: self.max_functions]:
-                # Skip if already cached
+            # Skip functions already analyzed, trivial or well-tested
+            pending: dict[str, FunctionGap] = {}
+            for gap in prioritized:
                 cache_key = f"{gap.file_path}:{gap.function_name}"
                 if cache_key in self._cache:
-                    gaps.extend(self._cache[cache_key])
                     continue
-
-                # Skip trivial or well-tested functions
                 if gap.complexity < MIN_COMPLEXITY_FOR_ANALYSIS:
                     continue
                 if gap.coverage_percentage > MAX_COVERAGE_FOR_ANALYSIS:
                     continue
+                pending.setdefault(cache_key, gap)
 
-                # Analyze function for semantic gaps
-                function_gaps_found = await self._analyze_function(gap)
+            if pending:
+                await self._analyze_pending(pending, task)
 
-                # Filter by confidence
-                high_confidence = [
-                    g for g in function_gaps_found if g.confidence >= self.confidence_threshold
-                ]
-
-                # Cache results
-                self._cache[cache_key] = high_confidence
-                gaps.extend(high_confidence)
+            # Collect results in priority order
+            for gap in prioritized:
+                gaps.extend(self._cache.get(f"{gap.file_path}:{gap.function_name}", []))
 
             logger.info("Found %d semantic gaps", len(gaps))
 
@@ -207,7 +213,7 @@ class SemanticGapDetector(BaseAgent):
                 status=TaskStatus.COMPLETED,
                 result={
                     "semantic_gaps": gaps,
-                    "functions_analyzed": min(len(prioritized), self.max_functions),
+                    "functions_analyzed": min(len(function_gaps), self.max_functions),
                 },
             )
 
@@ -225,45 +231,126 @@ class SemanticGapDetector(BaseAgent):
                 errors=[str(e)],
             )
 
-    def _prioritize_gaps(self, function_gaps: list[FunctionGap]) -> list[FunctionGap]:
+    def _prioritize_gaps(
+        self, function_gaps: list[FunctionGap], limit: int | None = None
+    ) -> list[FunctionGap]:
         """Prioritize function gaps for analysis.
 
         Already prioritized by CoverageAnalyzer, so just return sorted.
 
         Args:
             function_gaps: List of function gaps.
+            limit: Return only this many of the highest-priority gaps,
+                selected without sorting the whole list.
 
         Returns:
             Sorted list with highest priority first.
         """
         priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        return sorted(
-            function_gaps,
-            key=lambda g: (
-                priority_order.get(g.priority.value, 3),
-                -g.complexity,
-                g.coverage_percentage,
-            ),
+
+        def key(g: FunctionGap) -> tuple[int, int, float]:
+            return (priority_order.get(g.priority.value, 3), -g.complexity, g.coverage_percentage)
+
+        if limit is not None:
+            return heapq.nsmallest(limit, function_gaps, key=key)
+        return sorted(function_gaps, key=key)
+
+    async def _analyze_pending(
+        self, pending: dict[str, FunctionGap], task: SemanticGapTask
+    ) -> None:
+        """Analyze *pending* gaps concurrently and cache their confident results.
+
+        Functions whose body was analyzed by an earlier run with the same
+        prompt version are answered from the persisted cache.
+
+        Args:
+            pending: Function gaps to analyze, keyed by ``file:function``.
+            task: The running task, for code maps and the concurrency limit.
+        """
+        cache = SemanticGapCache.load(self.project_root)
+        semaphore = asyncio.Semaphore(max(1, task.max_concurrency))
+
+        async def analyze(gap: FunctionGap) -> list[SemanticGap]:
+            async with semaphore:
+                function = self._find_function(gap, task.code_maps)
+                return await self._analyze_function(gap, function, cache)
+
+        found = await asyncio.gather(*(analyze(gap) for gap in pending.values()))
+        cache.save(self.project_root)
+
+        for cache_key, function_gaps_found in zip(pending, found, strict=True):
+            # Filter by confidence
+            self._cache[cache_key] = [
+                g for g in function_gaps_found if g.confidence >= self.confidence_threshold
+            ]
+
+    def _find_function(
+        self, gap: FunctionGap, code_maps: dict[str, CodeMap]
+    ) -> FunctionInfo | None:
+        """The parsed function or method of *gap* from its file's code map.
+
+        Args:
+            gap: Function gap to look up.
+            code_maps: Code maps by file path.
+
+        Returns:
+            The function with a body, preferring one starting on the gap's
+            line, or None if the file was not parsed.
+        """
+        code_map = code_maps.get(gap.file_path)
+        if code_map is None:
+            return None
+        named = [
+            function
+            for function in (
+                *code_map.functions,
+                *(method for cls in code_map.classes for method in cls.methods),
+            )
+            if function.name == gap.function_name and function.body_text
+        ]
+        return next(
+            (function for function in named if function.start_line == gap.line_number),
+            named[0] if named else None,
         )
 
-    async def _analyze_function(self, gap: FunctionGap) -> list[SemanticGap]:
+    async def _analyze_function(
+        self,
+        gap: FunctionGap,
+        function: FunctionInfo | None = None,
+        cache: SemanticGapCache | None = None,
+    ) -> list[SemanticGap]:
         """Analyze a function for semantic gaps.
 
         Args:
             gap: Function gap from coverage analysis.
+            function: Parsed function from the code map, if available.
+            cache: Persisted results of earlier runs, by function body.
 
         Returns:
             List of semantic gaps found.
         """
         try:
             # Assemble context for the function
-            context = await self._assemble_function_context(gap)
+            context = await self._assemble_function_context(gap, function)
+
+            # Reuse the analysis of an unchanged function body
+            key = None
+            if cache is not None and context["source_code"]:
+                key = function_key(context["language"], gap.function_name, context["source_code"])
+                cached = self._cached_gaps(cache, key, gap)
+                if cached is not None:
+                    return cached
 
             # Call LLM for semantic analysis
             response = await self._call_llm_analysis(context)
 
             # Parse LLM response into SemanticGap objects
-            return self._parse_llm_response(response, gap.function_name, gap.file_path)
+            found = self._parse_llm_response(response, gap.function_name, gap.file_path)
+            # An empty or malformed reply is not cached as "no gaps"
+            understood = bool(found) or NO_GAPS_MARKER in response
+            if cache is not None and key is not None and understood:
+                cache.store(key, [_gap_to_dict(g) for g in found])
+            return found
 
         except Exception as e:
             logger.warning(
@@ -271,23 +358,43 @@ class SemanticGapDetector(BaseAgent):
             )
             return []
 
-    async def _assemble_function_context(self, gap: FunctionGap) -> dict[str, Any]:
+    def _cached_gaps(
+        self, cache: SemanticGapCache, key: str, gap: FunctionGap
+    ) -> list[SemanticGap] | None:
+        """Gaps cached under *key*, attributed to *gap*'s function and file."""
+        entries = cache.lookup(key)
+        if entries is None:
+            return None
+        try:
+            return [_gap_from_dict(entry, gap.function_name, gap.file_path) for entry in entries]
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.debug("Ignoring unreadable cached gaps of %s: %s", gap.function_name, exc)
+            return None
+
+    async def _assemble_function_context(
+        self, gap: FunctionGap, function: FunctionInfo | None = None
+    ) -> dict[str, Any]:
         """Assemble context for function analysis.
 
         Args:
             gap: Function gap to analyze.
+            function: Parsed function from the code map; when missing the
+                function is searched for in the source file.
 
         Returns:
             Context dictionary with function details.
         """
-        # Read source file
-        source_path = self.project_root / gap.file_path
-        source_code = ""
-        if source_path.exists():
-            source_code = source_path.read_text(encoding="utf-8", errors="ignore")
-
-        # Extract function from source (simplified - would use AST in production)
-        function_code = self._extract_function_code(source_code, gap.function_name)
+        if function is not None:
+            function_code = self._function_source(function)
+        else:
+            # Read source file
+            source_path = self.project_root / gap.file_path
+            source_code = ""
+            if source_path.exists():
+                source_code = source_path.read_text(encoding="utf-8", errors="ignore")
+
+            # Extract function from source (simplified - would use AST in production)
+            function_code = self._extract_function_code(source_code, gap.function_name)
 
         # Build AST structure summary
         ast_structure = self._build_ast_structure(function_code)
@@ -307,6 +414,28 @@ class SemanticGapDetector(BaseAgent):
             "ast_structure": ast_structure,
         }
 
+    def _function_source(self, function: FunctionInfo) -> str:
+        """Signature line and body text of a parsed function.
+
+        Args:
+            function: Function extracted by tree-sitter.
+
+        Returns:
+            Function code snippet.
+        """
+        params = []
+        for param in function.parameters:
+            text = param.name
+            if param.type_annotation:
+                text += f": {param.type_annotation}"
+            if param.default_value:
+                text += f" = {param.default_value}"
+            params.append(text)
+        signature = f"{function.name}({', '.join(params)})"
+        if function.return_type:
+            signature += f" -> {function.return_type}"
+        return f"{signature}\n{function.body_text}"
+
     def _extract_function_code(self, source_code: str, function_name: str) -> str:
         """Extract function code from source.
 
@@ -520,3 +649,31 @@ class SemanticGapDetector(BaseAgent):
             confidence=confidence,
             reasoning=reasoning_match.group(1).strip() if reasoning_match else "",
         )
+
+
+def _gap_to_dict(gap: SemanticGap) -> dict[str, Any]:
+    """Persisted form of a gap, without the function it belongs to."""
+    return {
+        "category": gap.category.value,
+        "description": gap.description,
+        "line_number": gap.line_number,
+        "severity": gap.severity,
+        "suggested_test_cases": list(gap.suggested_test_cases),
+        "confidence": gap.confidence,
+        "reasoning": gap.reasoning,
+    }
+
+
+def _gap_from_dict(data: dict[str, Any], function_name: str, file_path: str) -> SemanticGap:
+    line_number = data["line_number"]
+    return SemanticGap(
+        category=GapCategory(data["category"]),
+        description=str(data["description"]),
+        function_name=function_name,
+        file_path=file_path,
+        line_number=int(line_number) if line_number is not None else None,
+        severity=str(data["severity"]),
+        suggested_test_cases=[str(case) for case in data["suggested_test_cases"]],
+        confidence=float(data["confidence"]),
+        reasoning=str(data["reasoning"]),
+    )
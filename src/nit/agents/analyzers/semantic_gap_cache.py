@@ -0,0 +1,73 @@
+"""Persisted semantic gap results, keyed by function body.
+
+``SemanticGapDetector`` asks the LLM to analyse every prioritised function
+gap on each ``nit pick``.  ``SemanticGapCache`` keeps the gaps found for a
+function under a hash of the prompt version, the language, the function
+name and its body, so a function that did not change is never sent to the
+LLM again.  Every gap the LLM reported is kept; the confidence threshold
+is applied when the entry is used.
+
+The cache is persisted to ``.nit/cache/semantic_gaps.json`` and holds at
+most ``MAX_CACHED_FUNCTIONS`` entries, dropping the least recently used.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from nit.llm.prompts.semantic_gap import SEMANTIC_GAP_PROMPT_VERSION
+from nit.utils.cache import CACHE_DIR, VersionedJsonCache, content_hash
+
+SEMANTIC_GAP_CACHE_PATH = CACHE_DIR / "semantic_gaps.json"
+
+MAX_CACHED_FUNCTIONS = 2000
+
+
+def function_key(language: str, function_name: str, source_code: str) -> str:
+    """Cache key of one function as sent to the LLM."""
+    return content_hash(
+        f"{SEMANTIC_GAP_PROMPT_VERSION}\0{language}\0{function_name}\0{source_code}"
+    )
+
+
+class SemanticGapCache(VersionedJsonCache):
+    """Semantic gaps found per function body, for one prompt version."""
+
+    cache_path = SEMANTIC_GAP_CACHE_PATH
+    format_version = 2
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._entries: dict[str, list[dict[str, Any]]] = {}
+
+    @property
+    def version(self) -> int:
+        """The prompt version the gaps were found with."""
+        return SEMANTIC_GAP_PROMPT_VERSION
+
+    def lookup(self, key: str) -> list[dict[str, Any]] | None:
+        """The serialised gaps cached under *key*, if any."""
+        entries = self._entries.pop(key, None)
+        if entries is None:
+            return None
+        # Re-insert so the entry counts as recently used (persisted with the
+        # next change; a hit alone does not make the cache worth rewriting)
+        self._entries[key] = entries
+        return entries
+
+    def store(self, key: str, entries: list[dict[str, Any]]) -> None:
+        """Record the serialised gaps the LLM reported for the function under *key*."""
+        self._entries.pop(key, None)
+        self._entries[key] = entries
+        while len(self._entries) > MAX_CACHED_FUNCTIONS:
+            del self._entries[next(iter(self._entries))]
+        self._dirty = True
+
+    def _entries_to_json(self) -> dict[str, Any]:
+        return dict(self._entries)
+
+    def _entries_from_json(self, entries: dict[str, Any]) -> None:
+        for key, gaps in entries.items():
+            if not isinstance(gaps, list) or not all(isinstance(g, dict) for g in gaps):
+                raise TypeError(f"malformed entry {key!r}")
+            self._entries[str(key)] = gaps
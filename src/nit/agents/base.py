@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from nit.telemetry.tracing import SPAN_AGENT, traced_async
+
 
 class TaskStatus(Enum):
     PENDING = "pending"
@@ -36,6 +38,15 @@ class TaskOutput:
 class BaseAgent(ABC):
     """Abstract base class for all nit agents."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record every ``run`` of a concrete agent as a trace span."""
+        super().__init_subclass__(**kwargs)
+        run = cls.__dict__.get("run")
+        if run is not None and not getattr(run, "__isabstractmethod__", False):
+            cls.run = traced_async(  # type: ignore[method-assign]
+                run, SPAN_AGENT, lambda agent: agent.name
+            )
+
     @property
     @abstractmethod
     def name(self) -> str:
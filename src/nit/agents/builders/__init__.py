@@ -13,13 +13,14 @@ from nit.agents.builders.migration import MigrationTestBuilder, MigrationTestCas
 from nit.agents.builders.mutation import MutationTestBuilder, MutationTestCase
 from nit.agents.builders.readme import ReadmeUpdater
 from nit.agents.builders.snapshot import SnapshotTestBuilder, SnapshotTestCase
-from nit.agents.builders.unit import BuildTask, UnitBuilder
+from nit.agents.builders.unit import BatchBuildTask, BuildTask, UnitBuilder
 
 __all__ = [
     "APITestBuilder",
     "APITestCase",
     "AccessibilityTestBuilder",
     "AccessibilityTestCase",
+    "BatchBuildTask",
     "BootstrapTask",
     "BuildTask",
     "ContractTestBuilder",
@@ -0,0 +1,157 @@
+"""Batching of small source files into shared test-generation requests.
+
+Prompts for small utility modules are mostly fixed template overhead: the
+system instruction, the framework conventions and the output rules are the
+same for every file in a package.  ``plan_batches`` groups small source
+files that share a package and a framework so one LLM request covers
+several of them, ``combine_prompts`` merges their rendered prompts under a
+single system instruction with a structured multi-file output format, and
+``split_batch_response`` splits the reply back into per-file test code.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from nit.llm.engine import LLMMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from nit.agents.builders.unit import BuildTask
+    from nit.llm.prompts.base import RenderedPrompt
+
+# Defaults for grouping files into one request
+DEFAULT_MAX_BATCH_FILES = 4
+DEFAULT_MAX_BATCH_TOKENS = 6000
+DEFAULT_SMALL_FILE_TOKENS = 1500
+
+FILE_MARKER = "=== FILE: {path} ==="
+_FILE_MARKER_RE = re.compile(r"^=== FILE: (?P<path>.+?) ===[ \t]*$", re.MULTILINE)
+_FENCE_RE = re.compile(r"^```[\w+-]*[ \t]*\n(?P<body>.*?)\n?```[ \t]*$", re.DOTALL)
+
+_BATCH_INSTRUCTIONS = """\
+You are generating tests for {count} source files in one response.
+Write one complete, self-contained test file per source file, following all of \
+the instructions above for each of them.
+Start each test file with a marker line naming its source file exactly as given, \
+then the test code, for example:
+
+{example}
+<test code for that source file>
+
+Emit the files in the order given and write nothing outside the marked files."""
+
+
+def plan_batches(
+    tasks: list[BuildTask],
+    size_of: Callable[[BuildTask], int],
+    *,
+    max_files: int = DEFAULT_MAX_BATCH_FILES,
+    max_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+    small_file_tokens: int = DEFAULT_SMALL_FILE_TOKENS,
+) -> list[list[BuildTask]]:
+    """Group *tasks* into batches that can share one generation request.
+
+    Only small files (at most *small_file_tokens*, as measured by
+    *size_of*) are batched, and only with files in the same directory
+    that use the same framework.  A batch holds at most *max_files* files
+    whose combined size stays within *max_tokens*.
+
+    Args:
+        tasks: Build tasks in priority order.
+        size_of: Token estimate of a task's source file.
+        max_files: Maximum files per batch; ``1`` disables batching.
+        max_tokens: Maximum combined source tokens per batch.
+        small_file_tokens: Largest file that is considered for batching.
+
+    Returns:
+        Batches in the order their first task appeared in *tasks*.  Tasks
+        that are not batched come back as single-task batches.
+    """
+    if max_files <= 1:
+        return [[task] for task in tasks]
+
+    batches: list[list[BuildTask]] = []
+    open_batches: dict[tuple[str, str], tuple[list[BuildTask], int]] = {}
+
+    for task in tasks:
+        size = size_of(task)
+        if size > small_file_tokens:
+            batches.append([task])
+            continue
+
+        key = (task.framework, str(Path(task.source_file).parent))
+        current = open_batches.get(key)
+        if current is not None:
+            batch, used = current
+            if len(batch) < max_files and used + size <= max_tokens:
+                batch.append(task)
+                open_batches[key] = (batch, used + size)
+                continue
+
+        batch = [task]
+        batches.append(batch)
+        open_batches[key] = (batch, size)
+
+    return batches
+
+
+def combine_prompts(prompts: list[tuple[str, RenderedPrompt]]) -> list[LLMMessage]:
+    """Merge per-file rendered prompts into one multi-file request.
+
+    The system instruction of the first prompt is shared by every file;
+    each file's user message is kept under a heading naming its source.
+
+    Args:
+        prompts: ``(source_file, rendered_prompt)`` pairs for one batch.
+
+    Returns:
+        Messages for a single generation request.
+    """
+    example = FILE_MARKER.format(path=prompts[0][0])
+    instructions = _BATCH_INSTRUCTIONS.format(count=len(prompts), example=example)
+    system = f"{prompts[0][1].system_message}\n\n{instructions}"
+
+    parts = [
+        f"# Source file {index}: {source_file}\n\n{prompt.user_message}"
+        for index, (source_file, prompt) in enumerate(prompts, start=1)
+    ]
+    return [
+        LLMMessage(role="system", content=system),
+        LLMMessage(role="user", content="\n\n======\n\n".join(parts)),
+    ]
+
+
+def split_batch_response(text: str, source_files: list[str]) -> dict[str, str]:
+    """Split a multi-file reply into test code per source file.
+
+    Args:
+        text: LLM response produced for a ``combine_prompts`` request.
+        source_files: Source files of the batch, as named in the request.
+
+    Returns:
+        Test code keyed by source file.  Files the reply does not mark, or
+        marks with empty content, are absent.
+    """
+    expected = set(source_files)
+    markers = list(_FILE_MARKER_RE.finditer(text))
+    results: dict[str, str] = {}
+
+    for index, marker in enumerate(markers):
+        path = marker.group("path").strip().strip("`")
+        if path not in expected or path in results:
+            continue
+        end = markers[index + 1].start() if index + 1 < len(markers) else len(text)
+        code = _strip_fence(text[marker.end() : end].strip())
+        if code:
+            results[path] = code
+
+    return results
+
+
+def _strip_fence(code: str) -> str:
+    match = _FENCE_RE.match(code)
+    return match.group("body").strip() if match else code
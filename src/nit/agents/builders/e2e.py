@@ -20,7 +20,7 @@ from typing import TYPE_CHECKING
 from nit.adapters.registry import get_registry
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
 from nit.agents.healers.self_healing import HealingResult, SelfHealingEngine
-from nit.llm.context import AssembledContext, ContextAssembler
+from nit.llm.context import AssembledContext, AssemblyCache, ContextAssembler
 from nit.llm.engine import GenerationRequest, LLMMessage
 from nit.memory.global_memory import GlobalMemory
 from nit.memory.helpers import get_memory_context, inject_memory_into_messages, record_outcome
@@ -120,7 +120,8 @@ class E2EBuilder(BaseAgent):
         self._context_assembler = ContextAssembler(
             root=project_root,
             max_context_tokens=max_context,
-            token_counter=llm_engine.count_tokens,
+            tokenizer=llm_engine.tokenizer,
+            cache=AssemblyCache(project_root=project_root),
         )
         self._registry = get_registry()
         self._enable_memory = bool(cfg.get("enable_memory", True))
@@ -160,6 +161,15 @@ class E2EBuilder(BaseAgent):
             TaskOutput with generated test code in result['test_code'],
             or errors if generation failed.
         """
+        if self._memory is None:
+            return await self._generate(task)
+
+        # Memory updates made while generating and validating are written once
+        with self._memory.deferred():
+            return await self._generate(task)
+
+    async def _generate(self, task: TaskInput) -> TaskOutput:
+        """Generate and validate a E2E test for *task*."""
         if not isinstance(task, E2ETask):
             return TaskOutput(
                 status=TaskStatus.FAILED,
@@ -291,6 +301,7 @@ class E2EBuilder(BaseAgent):
         # If we have a handler file, assemble context for it
         if task.handler_file:
             handler_path = self._resolve_path(task.handler_file)
+            await self._context_assembler.load_symbols()
             context = self._context_assembler.assemble(handler_path)
         else:
             # Create minimal context
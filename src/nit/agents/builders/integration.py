@@ -20,13 +20,15 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from nit.adapters.registry import get_registry
+from nit.adapters.worker_pool import get_worker_pool
 from nit.agents.analyzers.integration_deps import (
     IntegrationDependencyReport,
     detect_integration_dependencies,
 )
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
+from nit.agents.builders.sandbox import ValidationSandbox
 from nit.agents.builders.unit import BuildTask, FailureType, ValidationAttempt
-from nit.llm.context import ContextAssembler
+from nit.llm.context import AssemblyCache, ContextAssembler
 from nit.llm.engine import GenerationRequest, LLMError, LLMMessage
 from nit.llm.prompts.integration_test import (
     IntegrationTestTemplate,
@@ -35,6 +37,7 @@ from nit.llm.prompts.integration_test import (
     VitestIntegrationTemplate,
 )
 from nit.memory.global_memory import GlobalMemory
+from nit.memory.patterns import rank_patterns
 from nit.parsing.languages import extract_from_file
 from nit.parsing.treesitter import detect_language
 
@@ -44,6 +47,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum patterns of each kind to include in prompt context
+_MAX_MEMORY_PATTERNS = 10
+
 
 @dataclass
 class IntegrationBuildTask(TaskInput):
@@ -103,10 +109,12 @@ class IntegrationBuilder(BaseAgent):
         """
         self._llm = llm_engine
         self._root = project_root
+        self._sandbox = ValidationSandbox(project_root)
         self._context_assembler = ContextAssembler(
             root=project_root,
             max_context_tokens=max_context_tokens,
-            token_counter=llm_engine.count_tokens,
+            tokenizer=llm_engine.tokenizer,
+            cache=AssemblyCache(project_root=project_root),
         )
         self._registry = get_registry()
         self._enable_memory = enable_memory
@@ -137,6 +145,15 @@ class IntegrationBuilder(BaseAgent):
             TaskOutput with generated test code in result['test_code'],
             or errors if generation failed.
         """
+        if self._memory is None:
+            return await self._generate(task)
+
+        # Memory updates made while generating and validating are written once
+        with self._memory.deferred():
+            return await self._generate(task)
+
+    async def _generate(self, task: TaskInput) -> TaskOutput:
+        """Generate and validate a integration test for *task*."""
         if not isinstance(task, (IntegrationBuildTask, BuildTask)):
             return TaskOutput(
                 status=TaskStatus.FAILED,
@@ -189,6 +206,7 @@ class IntegrationBuilder(BaseAgent):
             )
 
             # Step 3: Assemble context
+            await self._context_assembler.load_symbols()
             context = self._context_assembler.assemble(source_path)
 
             # Step 4: Get the adapter for this framework
@@ -392,33 +410,41 @@ class IntegrationBuilder(BaseAgent):
         if not self._memory:
             return None
 
-        known_patterns = self._memory.get_known_patterns()
-        failed_patterns = self._memory.get_failed_patterns()
+        # Only patterns recorded for integration tests are relevant here
+        known_patterns = [
+            p
+            for p in self._memory.get_known_patterns()
+            if "integration" in p.get("context", {}).get("test_type", "").lower()
+        ]
+        failed_patterns = [
+            p
+            for p in self._memory.get_failed_patterns()
+            if "integration" in p.get("context", {}).get("test_type", "").lower()
+        ]
 
-        # Filter patterns relevant to this framework and integration tests
+        # Rank the ones relevant to this framework
         relevant_known = [
             p["pattern"]
-            for p in known_patterns
-            if (
-                framework.lower() in p.get("context", {}).get("language", "").lower()
-                or not p.get("context", {}).get("language")
+            for p in rank_patterns(
+                known_patterns,
+                filter_key="language",
+                filter_value=framework,
+                limit=_MAX_MEMORY_PATTERNS,
             )
-            and "integration" in p.get("context", {}).get("test_type", "").lower()
         ]
-
         relevant_failed = [
             f"{p['pattern']}: {p['reason']}"
-            for p in failed_patterns
-            if (
-                framework.lower() in p.get("context", {}).get("framework", "").lower()
-                or not p.get("context", {}).get("framework")
+            for p in rank_patterns(
+                failed_patterns,
+                filter_key="framework",
+                filter_value=framework,
+                limit=_MAX_MEMORY_PATTERNS,
             )
-            and "integration" in p.get("context", {}).get("test_type", "").lower()
         ]
 
         return {
-            "known_patterns": relevant_known[:10],
-            "failed_patterns": relevant_failed[:10],
+            "known_patterns": relevant_known,
+            "failed_patterns": relevant_failed,
         }
 
     def _add_memory_to_prompt(
@@ -475,9 +501,10 @@ class IntegrationBuilder(BaseAgent):
 
         validation_attempts: list[ValidationAttempt] = []
         current_code = test_code
-        test_file = self._determine_test_file_path(task, adapter)
+        # Validate at a private scratch path so concurrent builders never collide
+        target = self._determine_test_file_path(task, adapter)
 
-        try:
+        async with self._sandbox.reserve(target) as test_file:
             for attempt_num in range(1, self._max_retries + 1):
                 logger.debug("Validation attempt %d/%d", attempt_num, self._max_retries)
 
@@ -526,13 +553,6 @@ class IntegrationBuilder(BaseAgent):
                         logger.error("Error during retry: %s", exc)
                         break
 
-        finally:
-            try:
-                if test_file.exists():
-                    test_file.unlink()
-            except Exception as exc:
-                logger.warning("Could not remove temporary test file: %s", exc)
-
         return validation_attempts, current_code, validation_attempts[-1]
 
     async def _execute_test(
@@ -556,9 +576,10 @@ class IntegrationBuilder(BaseAgent):
             test_file.write_text(test_code, encoding="utf-8")
             logger.debug("Wrote integration test to %s", test_file)
 
-            test_result = await adapter.run_tests(
+            test_result = await get_worker_pool().run_tests(
+                adapter,
                 self._root,
-                test_files=[test_file],
+                [test_file],
                 timeout=120.0,
             )
 
@@ -0,0 +1,210 @@
+"""Static import checks for generated tests.
+
+Runs before a generated test is executed.  Imports of project modules
+are resolved against the project tree, and names imported from the source
+under test are checked against the ``ParseResult`` already held in the
+``AssembledContext``.  A wrong module path or a symbol that does not exist
+is reported in milliseconds instead of after a full test-runner round trip.
+
+Only imports that clearly point into the project are checked: third-party
+and standard-library imports, relative Python imports and non-relative
+JavaScript specifiers (packages, path aliases) are left to the runner.
+A failure is only reported when resolution is certain; namespace
+directories, star imports and module ``__getattr__`` are left to the
+runner as well.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from nit.parsing.languages import extract_from_source
+from nit.parsing.treesitter import detect_language
+
+if TYPE_CHECKING:
+    from nit.llm.context import AssembledContext
+    from nit.parsing.treesitter import ImportInfo
+
+_JS_LANGUAGES = frozenset({"javascript", "typescript", "tsx"})
+_JS_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs", ".mts", ".cts")
+_IDENTIFIER = re.compile(r"^[A-Za-z_]\w*$")
+# Star re-exports and module ``__getattr__`` can provide any name
+_MAY_DEFINE_ANY = re.compile(r"\bimport\s*\*|\bexport\s*\*|\b__getattr__\b")
+
+
+def check_imports(
+    test_code: str,
+    context: AssembledContext,
+    *,
+    test_file: Path,
+    project_root: Path,
+) -> list[str]:
+    """Find imports in *test_code* that cannot resolve.
+
+    Args:
+        test_code: Generated test code (already syntax-checked).
+        context: Assembled context of the source file under test.
+        test_file: Path the test will run from; relative imports resolve
+            against it.
+        project_root: Root of the project.
+
+    Returns:
+        One message per unresolved module or symbol; empty if none found.
+    """
+    language = detect_language(test_file) or context.language
+    if language != "python" and language not in _JS_LANGUAGES:
+        return []
+
+    imports = extract_from_source(test_code.encode("utf-8"), language).imports
+    checker = _ImportChecker(context, project_root)
+    errors: list[str] = []
+    for info in imports:
+        if language == "python":
+            errors.extend(checker.check_python(info))
+        else:
+            errors.extend(checker.check_js(info, test_file.parent))
+    return errors
+
+
+def available_symbols(context: AssembledContext) -> list[str]:
+    """Top-level functions and classes defined by the source under test."""
+    result = context.parse_result
+    return [f.name for f in result.functions if f.name] + [c.name for c in result.classes]
+
+
+class _ImportChecker:
+    """Resolves imports against the project tree, caching file reads."""
+
+    def __init__(self, context: AssembledContext, project_root: Path) -> None:
+        self._context = context
+        self._root = project_root
+        self._source_path = _resolve(Path(context.source_path), project_root)
+        self._source_symbols = set(available_symbols(context))
+        self._texts: dict[Path, str] = {}
+
+    # ── Python ───────────────────────────────────────────────────
+
+    def check_python(self, info: ImportInfo) -> list[str]:
+        module = info.module
+        if not module or module.startswith("."):
+            return []
+        parts = module.split(".")
+        # A directory without __init__.py may be data or a namespace package
+        # shared with installed distributions, so only regular packages and
+        # module files mark an import as pointing into the project
+        roots = [root for root in self._python_roots() if _python_module_exists(root, parts[0])]
+        if not roots:
+            return []  # Not a project module
+
+        for root in roots:
+            target = _resolve_python_module(root, parts)
+            if target is not None and target.is_dir():
+                return []  # Namespace package; its contents may live elsewhere
+            if target is not None:
+                return [
+                    f"ImportError: cannot import name '{name}' from '{module}' "
+                    f"(line {info.start_line})"
+                    for name in info.names
+                    if not self._python_name_exists(target, name)
+                ]
+        return [f"ModuleNotFoundError: No module named '{module}' (line {info.start_line})"]
+
+    def _python_roots(self) -> list[Path]:
+        """Directories Python imports of project modules may start from."""
+        roots = [self._root, self._root / "src"]
+        # The directory holding the source file's top-level package
+        package_parent = self._source_path.parent
+        while (package_parent / "__init__.py").is_file() and package_parent != self._root:
+            package_parent = package_parent.parent
+        roots.append(package_parent)
+        return [root for root in dict.fromkeys(roots) if root.is_dir()]
+
+    def _python_name_exists(self, target: Path, name: str) -> bool:
+        if target.name == "__init__.py" and _python_entry_exists(target.parent, name):
+            return True  # Submodule
+        return self._defines(target, name)
+
+    # ── JavaScript / TypeScript ──────────────────────────────────
+
+    def check_js(self, info: ImportInfo, base_dir: Path) -> list[str]:
+        module = info.module
+        if not module.startswith("."):
+            return []
+        target = _resolve_js_module(base_dir / module)
+        if target is None:
+            return [f"Cannot find module '{module}' (line {info.start_line})"]
+        return [
+            f"Module '{module}' has no exported member '{name}' (line {info.start_line})"
+            for name in info.names
+            if not self._defines(target, name)
+        ]
+
+    # ── Shared ───────────────────────────────────────────────────
+
+    def _defines(self, path: Path, name: str) -> bool:
+        """Whether *path* plausibly defines or re-exports *name*."""
+        if not _IDENTIFIER.match(name):
+            return True  # Cannot check reliably; leave it to the runner
+        if path == self._source_path:
+            if name in self._source_symbols:
+                return True
+            text = self._context.source_code
+        else:
+            text = self._read(path)
+        # Module-level constants and re-exports are not in the ParseResult;
+        # accept any whole-word occurrence to avoid false positives.
+        if re.search(rf"\b{re.escape(name)}\b", text) is not None:
+            return True
+        return _MAY_DEFINE_ANY.search(text) is not None
+
+    def _read(self, path: Path) -> str:
+        if path not in self._texts:
+            try:
+                self._texts[path] = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                self._texts[path] = ""
+        return self._texts[path]
+
+
+def _resolve(path: Path, project_root: Path) -> Path:
+    return (path if path.is_absolute() else project_root / path).resolve()
+
+
+def _python_entry_exists(directory: Path, name: str) -> bool:
+    return (directory / name).is_dir() or (directory / f"{name}.py").is_file()
+
+
+def _python_module_exists(directory: Path, name: str) -> bool:
+    """Whether *directory* holds a module file or regular package *name*."""
+    return (directory / name / "__init__.py").is_file() or (directory / f"{name}.py").is_file()
+
+
+def _resolve_python_module(root: Path, parts: list[str]) -> Path | None:
+    """Return the module file, package ``__init__.py`` or namespace dir."""
+    base = root.joinpath(*parts)
+    module_file = base.parent / f"{base.name}.py"
+    if module_file.is_file():
+        return module_file.resolve()
+    init_file = base / "__init__.py"
+    if init_file.is_file():
+        return init_file.resolve()
+    if base.is_dir():
+        return base.resolve()
+    return None
+
+
+def _resolve_js_module(base: Path) -> Path | None:
+    """Resolve a relative specifier the way Node and TypeScript bundlers do."""
+    candidates = [base]
+    # ESM-style TypeScript imports name the emitted ``.js`` file
+    if base.suffix in {".js", ".jsx", ".mjs", ".cjs"}:
+        stem = base.with_suffix("")
+        candidates.extend(stem.with_name(stem.name + ext) for ext in _JS_EXTENSIONS)
+    candidates.extend(base.with_name(base.name + ext) for ext in _JS_EXTENSIONS)
+    candidates.extend(base / f"index{ext}" for ext in _JS_EXTENSIONS)
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
@@ -0,0 +1,159 @@
+"""Scratch paths for validating candidate tests.
+
+Builders validate a generated test by writing it to disk and running it
+through the framework adapter.  ``ValidationSandbox`` hands every in-flight
+validation its own path so several builders can validate at once without
+touching each other's files or an existing test at the final output path.
+
+Scratch files live next to the final test file, with a unique prefix, so
+project imports, ``conftest.py`` files and test-runner include patterns
+resolve exactly as they would for the final file.  Languages whose test
+files in a directory share one namespace (Go packages, JVM and .NET
+classes) cannot hold two copies of the same test side by side; for those
+the final path itself is reserved exclusively and any existing file is
+backed up and restored afterwards.
+
+Every reservation leaves a small marker under ``.nit/tmp/sandbox`` until it
+is released, so files left behind by a crashed run are cleaned up the next
+time a sandbox is used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+SCRATCH_PREFIX = "nit_sandbox_"
+"""File name prefix marking scratch copies of candidate tests."""
+
+# Test files with these suffixes share a namespace with their siblings, so a
+# second copy next to the original would fail to compile.
+_EXCLUSIVE_SUFFIXES = frozenset({".go", ".java", ".kt", ".kts", ".scala", ".cs"})
+
+# Markers older than this belong to a run that died without cleaning up.
+_STALE_AFTER_SECONDS = 3600.0
+
+# Exclusive reservations are serialised per target across all sandboxes.
+_exclusive_locks: weakref.WeakValueDictionary[Path, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+class ValidationSandbox:
+    """Hands out isolated, self-cleaning paths for test validation."""
+
+    def __init__(self, project_root: Path) -> None:
+        """Initialize the sandbox.
+
+        Args:
+            project_root: Root of the project being tested.
+        """
+        self._state_dir = project_root / ".nit" / "tmp" / "sandbox"
+        self._swept = False
+
+    @asynccontextmanager
+    async def reserve(self, target: Path) -> AsyncIterator[Path]:
+        """Reserve a scratch path for validating a test bound for ``target``.
+
+        The scratch file (and, for exclusive reservations, the restored
+        original) is cleaned up when the context exits, even on error.
+
+        Args:
+            target: Final path of the test file being validated.
+
+        Yields:
+            Path the candidate test should be written to and run from.
+        """
+        if not self._swept:
+            self._swept = True
+            self.sweep()
+
+        if target.suffix not in _EXCLUSIVE_SUFFIXES:
+            scratch = target.with_name(f"{SCRATCH_PREFIX}{uuid.uuid4().hex[:8]}_{target.name}")
+            marker = self._write_marker(scratch, backup=None)
+            try:
+                yield scratch
+            finally:
+                _release(scratch, None, marker)
+            return
+
+        key = target.resolve()
+        lock = _exclusive_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            _exclusive_locks[key] = lock
+        async with lock:
+            backup: Path | None = None
+            if target.exists():
+                backup = target.with_name(f"{SCRATCH_PREFIX}{uuid.uuid4().hex[:8]}.bak")
+                target.replace(backup)
+            marker = self._write_marker(target, backup=backup)
+            try:
+                yield target
+            finally:
+                _release(target, backup, marker)
+
+    def sweep(self) -> int:
+        """Remove scratch files left behind by runs that did not clean up.
+
+        Returns:
+            Number of stale reservations cleaned up.
+        """
+        if not self._state_dir.is_dir():
+            return 0
+
+        cutoff = time.time() - _STALE_AFTER_SECONDS
+        cleaned = 0
+        for marker in self._state_dir.glob("*.json"):
+            try:
+                if marker.stat().st_mtime > cutoff:
+                    continue
+                data = json.loads(marker.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if not isinstance(data, dict) or not isinstance(data.get("scratch"), str):
+                marker.unlink(missing_ok=True)
+                continue
+            backup = data.get("backup")
+            _release(
+                Path(data["scratch"]), Path(backup) if isinstance(backup, str) else None, marker
+            )
+            cleaned += 1
+
+        if cleaned:
+            logger.info("Cleaned up %d stale validation sandbox(es)", cleaned)
+        return cleaned
+
+    def _write_marker(self, scratch: Path, *, backup: Path | None) -> Path:
+        """Record a live reservation so a crashed run can be cleaned up."""
+        self._state_dir.mkdir(parents=True, exist_ok=True)
+        marker = self._state_dir / f"{os.getpid()}-{uuid.uuid4().hex}.json"
+        payload = {"scratch": str(scratch), "backup": str(backup) if backup else None}
+        marker.write_text(json.dumps(payload), encoding="utf-8")
+        return marker
+
+
+def _release(scratch: Path, backup: Path | None, marker: Path) -> None:
+    """Delete a scratch file, restore any backed-up original and drop the marker."""
+    try:
+        if backup is not None and backup.exists():
+            backup.replace(scratch)
+        else:
+            scratch.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("Could not clean up validation file %s: %s", scratch, exc)
+        return
+    with contextlib.suppress(OSError):
+        marker.unlink(missing_ok=True)
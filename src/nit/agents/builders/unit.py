@@ -13,29 +13,48 @@ This agent:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from nit.adapters.registry import get_registry
+from nit.adapters.worker_pool import get_worker_pool
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
-from nit.llm.context import ContextAssembler
+from nit.agents.builders.batching import (
+    DEFAULT_MAX_BATCH_FILES,
+    combine_prompts,
+    plan_batches,
+    split_batch_response,
+)
+from nit.agents.builders.prevalidation import available_symbols, check_imports
+from nit.agents.builders.sandbox import ValidationSandbox
+from nit.llm.context import AssemblyCache, ContextAssembler
 from nit.llm.engine import GenerationRequest, LLMError, LLMMessage
 from nit.memory.global_memory import GlobalMemory
 from nit.memory.helpers import get_memory_context, inject_memory_into_messages
 
 if TYPE_CHECKING:
     from nit.adapters.base import RunResult, TestFrameworkAdapter, ValidationResult
-    from nit.llm.engine import LLMEngine
+    from nit.llm.context import AssembledContext
+    from nit.llm.engine import LLMEngine, LLMResponse
+    from nit.llm.prompts.base import RenderedPrompt
 
 logger = logging.getLogger(__name__)
 
 # Constants for failure classification
 TIMEOUT_THRESHOLD_MS = 50000  # 50 seconds
 
+# Symbols listed in import-error feedback
+_MAX_SYMBOLS_IN_FEEDBACK = 30
+
+if TYPE_CHECKING:
+    # Context, adapter, request and rendered prompt for one source file
+    _Prepared = tuple[AssembledContext, TestFrameworkAdapter, GenerationRequest, RenderedPrompt]
+
 
 class FailureType(Enum):
     """Classification of test generation failures (task 1.16.4)."""
@@ -52,6 +71,9 @@ class FailureType(Enum):
     TIMEOUT = "timeout"
     """Test execution timed out."""
 
+    IMPORT_ERROR = "import_error"
+    """Generated test imports a module or symbol that does not exist."""
+
     UNKNOWN = "unknown"
     """Unable to classify the failure."""
 
@@ -81,6 +103,13 @@ class ValidationAttempt:
     error_message: str
     """Error message to feed back to LLM for retry."""
 
+    @property
+    def passed(self) -> bool:
+        """Whether every validation stage that ran succeeded."""
+        if not self.syntax_valid or self.failure_type is FailureType.IMPORT_ERROR:
+            return False
+        return self.test_result is None or self.test_result.success
+
 
 @dataclass
 class BuildTask(TaskInput):
@@ -110,6 +139,29 @@ class BuildTask(TaskInput):
             self.target = self.source_file
 
 
+@dataclass
+class BatchBuildTask(TaskInput):
+    """Task input for generating tests for several small source files at once.
+
+    Created by ``UnitBuilder.plan_tasks``.  One LLM request covers every
+    file; each resulting test file is validated on its own.
+    """
+
+    task_type: str = "build_unit_test_batch"
+    """Type of task (defaults to 'build_unit_test_batch')."""
+
+    target: str = ""
+    """Target for the task (defaults to the batched source files)."""
+
+    tasks: list[BuildTask] = field(default_factory=list)
+    """Build tasks covered by the batch, in priority order."""
+
+    def __post_init__(self) -> None:
+        """Initialize base TaskInput fields if not already set."""
+        if not self.target and self.tasks:
+            self.target = ", ".join(task.source_file for task in self.tasks)
+
+
 class UnitBuilder(BaseAgent):
     """Agent that generates unit tests for source files.
 
@@ -140,10 +192,13 @@ class UnitBuilder(BaseAgent):
         """
         self._llm = llm_engine
         self._root = project_root
+        self._max_context_tokens = max_context_tokens
+        self._sandbox = ValidationSandbox(project_root)
         self._context_assembler = ContextAssembler(
             root=project_root,
             max_context_tokens=max_context_tokens,
-            token_counter=llm_engine.count_tokens,
+            tokenizer=llm_engine.tokenizer,
+            cache=AssemblyCache(project_root=project_root),
         )
         self._registry = get_registry()
         self._enable_memory = enable_memory
@@ -174,6 +229,57 @@ class UnitBuilder(BaseAgent):
             TaskOutput with generated test code in result['test_code'],
             or errors if generation failed.
         """
+        if self._memory is None:
+            return await self._dispatch(task)
+
+        # Memory updates made while generating and validating are written once
+        with self._memory.deferred():
+            return await self._dispatch(task)
+
+    def plan_tasks(
+        self,
+        tasks: list[BuildTask],
+        *,
+        max_files: int = DEFAULT_MAX_BATCH_FILES,
+    ) -> list[BuildTask | BatchBuildTask]:
+        """Group small source files into shared generation requests.
+
+        Small files in the same directory and framework are combined into
+        a ``BatchBuildTask`` of at most *max_files* files whose combined
+        source fits the context budget; every other task is returned as is.
+        The rendered prompts are checked against the budget again when the
+        batch is generated.
+
+        Args:
+            tasks: Build tasks in priority order.
+            max_files: Maximum files per request; ``1`` disables batching.
+
+        Returns:
+            ``BuildTask`` and ``BatchBuildTask`` items, in priority order.
+        """
+        batches = plan_batches(
+            tasks,
+            self._source_tokens,
+            max_files=max_files,
+            max_tokens=self._max_context_tokens,
+        )
+        return [batch[0] if len(batch) == 1 else BatchBuildTask(tasks=batch) for batch in batches]
+
+    def _source_tokens(self, task: BuildTask) -> int:
+        """Token count of *task*'s source file; unreadable files count as huge."""
+        try:
+            source = self._resolve_path(task.source_file).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return self._max_context_tokens + 1
+        return self._llm.count_tokens(source)
+
+    async def _dispatch(self, task: TaskInput) -> TaskOutput:
+        if isinstance(task, BatchBuildTask):
+            return await self._generate_batch(task)
+        return await self._generate(task)
+
+    async def _generate(self, task: TaskInput) -> TaskOutput:
+        """Generate and validate a test for *task*."""
         if not isinstance(task, BuildTask):
             return TaskOutput(
                 status=TaskStatus.FAILED,
@@ -187,59 +293,14 @@ class UnitBuilder(BaseAgent):
                 task.framework,
             )
 
-            # Step 1: Parse source and assemble context
-            source_path = self._resolve_path(task.source_file)
-            context = self._context_assembler.assemble(source_path)
-            logger.debug(
-                "Assembled context: %d tokens, %d functions, %d classes",
-                context.total_tokens,
-                len(context.parse_result.functions),
-                len(context.parse_result.classes),
-            )
-
-            # Step 2: Get the adapter for this framework
-            adapter = self._registry.get_test_adapter(task.framework)
-            if adapter is None:
-                return TaskOutput(
-                    status=TaskStatus.FAILED,
-                    errors=[f"No adapter found for framework: {task.framework}"],
-                )
-
-            # Verify the adapter detects the framework in this project
-            if not adapter.detect(self._root):
-                logger.warning(
-                    "Adapter %s does not detect framework in project root %s",
-                    task.framework,
-                    self._root,
-                )
-
-            # Step 3: Check memory for patterns (task 1.15.5)
-            memory_context = self._get_memory_context(task.framework)
-
-            # Step 4: Get the prompt template from the adapter
-            prompt_template = adapter.get_prompt_template()
-            rendered_prompt = prompt_template.render(context)
-
-            # Add memory context to the prompt if available
-            if memory_context:
-                self._add_memory_to_prompt(rendered_prompt, memory_context)
-
-            logger.debug(
-                "Rendered prompt with %d messages for template: %s",
-                len(rendered_prompt.messages),
-                prompt_template.name,
-            )
+            # Steps 1-4: Assemble context, pick the adapter and render the prompt
+            await self._context_assembler.load_symbols()
+            prepared = self._prepare(task)
+            if isinstance(prepared, TaskOutput):
+                return prepared
+            _, _, request, _ = prepared
 
             # Step 5: Call LLM to generate test code
-            request = GenerationRequest(
-                messages=rendered_prompt.messages,
-                metadata={
-                    "nit_source_file": task.source_file,
-                    "nit_template_name": prompt_template.name,
-                    "nit_builder_name": self.name,
-                    "nit_framework": task.framework,
-                },
-            )
             response = await self._llm.generate(request)
             test_code = response.text.strip()
 
@@ -249,63 +310,7 @@ class UnitBuilder(BaseAgent):
                 response.total_tokens,
             )
 
-            # Step 6: Validation pipeline with self-iteration (task 1.16.2, 1.16.3)
-            validation_attempts, final_test_code, final_attempt = (
-                await self._run_validation_pipeline(test_code, adapter, task, request)
-            )
-
-            # Step 7: Update memory on generation outcomes (task 1.16.5)
-            if self._memory:
-                if final_attempt:
-                    self._update_memory_from_validation(
-                        task.framework, validation_attempts, final_attempt
-                    )
-                elif not self._enable_validation:
-                    # Update memory for successful generation without validation
-                    self._memory.update_stats(
-                        successful=True,
-                        tests_generated=1,
-                    )
-
-            # Determine final status
-            tests_passing = (
-                final_attempt.test_result.passed
-                if final_attempt and final_attempt.test_result
-                else 0
-            )
-            validation_success = (
-                final_attempt.syntax_valid
-                and (final_attempt.test_result is None or final_attempt.test_result.success)
-                if final_attempt
-                else True  # No validation was run
-            )
-
-            return TaskOutput(
-                status=TaskStatus.COMPLETED if validation_success else TaskStatus.FAILED,
-                result={
-                    "test_code": final_test_code,
-                    "source_file": task.source_file,
-                    "framework": task.framework,
-                    "output_file": task.output_file,
-                    "tokens_used": response.total_tokens,
-                    "prompt_tokens": response.prompt_tokens,
-                    "completion_tokens": response.completion_tokens,
-                    "model": response.model,
-                    "validation_enabled": self._enable_validation,
-                    "validation_attempts": len(validation_attempts),
-                    "tests_passing": tests_passing,
-                    "final_failure_type": (
-                        final_attempt.failure_type.value
-                        if final_attempt and final_attempt.failure_type
-                        else None
-                    ),
-                },
-                errors=(
-                    [final_attempt.error_message]
-                    if final_attempt and not validation_success
-                    else []
-                ),
-            )
+            return await self._finish(task, prepared, test_code, response)
 
         except ValueError as exc:
             # Language detection or path resolution errors
@@ -333,6 +338,234 @@ class UnitBuilder(BaseAgent):
                 errors=[f"Unexpected error: {exc}"],
             )
 
+    async def _generate_batch(self, batch: BatchBuildTask) -> TaskOutput:
+        """Generate tests for every file in *batch* with one LLM request.
+
+        Each test file split from the response goes through the usual
+        validation pipeline; retries use that file's own prompt.  Files
+        that cannot be prepared together, whose rendered prompt would push
+        the combined request past the context budget, or that the response
+        leaves out, are generated individually.
+
+        Returns:
+            TaskOutput whose result['outputs'] holds one TaskOutput per
+            batched task, in the order of ``batch.tasks``.
+        """
+        logger.info("Generating tests for %d files in one request", len(batch.tasks))
+        outputs: dict[int, TaskOutput] = {}
+        prepared: dict[int, _Prepared] = {}
+        prompts: list[tuple[str, RenderedPrompt]] = []
+
+        await self._context_assembler.load_symbols()
+        for index, task in enumerate(batch.tasks):
+            try:
+                result = self._prepare(task)
+            except Exception as exc:
+                logger.debug("Could not batch %s: %s", task.source_file, exc)
+                continue
+            if isinstance(result, TaskOutput):
+                outputs[index] = result
+                continue
+            prepared[index] = result
+            candidate = (task.source_file, result[3])
+            if not prompts or self._fits_context([*prompts, candidate]):
+                prompts.append(candidate)
+
+        codes: dict[str, str] = {}
+        response: LLMResponse | None = None
+        if len(prompts) > 1:
+            first = prepared[next(iter(prepared))][2].metadata
+            request = GenerationRequest(
+                messages=combine_prompts(prompts),
+                metadata={
+                    **first,
+                    "nit_source_file": ", ".join(source for source, _ in prompts),
+                    "nit_batch_size": len(prompts),
+                },
+            )
+            try:
+                response = await self._llm.generate(request)
+            except LLMError as exc:
+                logger.warning("Batched generation failed, generating files individually: %s", exc)
+            else:
+                codes = split_batch_response(response.text, [source for source, _ in prompts])
+                logger.info(
+                    "Generated tests for %d/%d batched files (%d tokens used)",
+                    len(codes),
+                    len(prompts),
+                    response.total_tokens,
+                )
+
+        async def _complete(index: int, task: BuildTask) -> None:
+            code = codes.get(task.source_file)
+            if response is None or code is None or index not in prepared:
+                outputs[index] = await self._generate(task)
+                return
+            try:
+                outputs[index] = await self._finish(
+                    task, prepared[index], code, response, batch_size=len(prompts)
+                )
+            except Exception as exc:
+                logger.exception("Unexpected error validating batched test")
+                outputs[index] = TaskOutput(
+                    status=TaskStatus.FAILED,
+                    errors=[f"Unexpected error: {exc}"],
+                )
+
+        # Split files validate in their own scratch paths, so they can run together
+        await asyncio.gather(
+            *(
+                _complete(index, task)
+                for index, task in enumerate(batch.tasks)
+                if index not in outputs
+            )
+        )
+
+        ordered = [outputs[index] for index in range(len(batch.tasks))]
+        failed = [output for output in ordered if output.status != TaskStatus.COMPLETED]
+        return TaskOutput(
+            status=TaskStatus.FAILED if failed else TaskStatus.COMPLETED,
+            result={"outputs": ordered, "batch_size": len(batch.tasks)},
+            errors=[error for output in failed for error in output.errors],
+        )
+
+    def _fits_context(self, prompts: list[tuple[str, RenderedPrompt]]) -> bool:
+        """Whether the combined request for *prompts* fits the context budget."""
+        tokens = sum(self._llm.count_tokens(m.content) for m in combine_prompts(prompts))
+        return tokens <= self._max_context_tokens
+
+    def _prepare(self, task: BuildTask) -> TaskOutput | _Prepared:
+        """Assemble context and build the generation request for *task*.
+
+        Returns:
+            The context, adapter, request and rendered prompt, or a failed
+            TaskOutput if no adapter handles the task's framework.
+        """
+        # Step 1: Parse source and assemble context
+        source_path = self._resolve_path(task.source_file)
+        context = self._context_assembler.assemble(source_path)
+        logger.debug(
+            "Assembled context: %d tokens, %d functions, %d classes",
+            context.total_tokens,
+            len(context.parse_result.functions),
+            len(context.parse_result.classes),
+        )
+
+        # Step 2: Get the adapter for this framework
+        adapter = self._registry.get_test_adapter(task.framework)
+        if adapter is None:
+            return TaskOutput(
+                status=TaskStatus.FAILED,
+                errors=[f"No adapter found for framework: {task.framework}"],
+            )
+
+        # Verify the adapter detects the framework in this project
+        if not adapter.detect(self._root):
+            logger.warning(
+                "Adapter %s does not detect framework in project root %s",
+                task.framework,
+                self._root,
+            )
+
+        # Step 3: Check memory for patterns (task 1.15.5)
+        memory_context = self._get_memory_context(task.framework)
+
+        # Step 4: Get the prompt template from the adapter
+        prompt_template = adapter.get_prompt_template()
+        rendered_prompt = prompt_template.render(context)
+
+        # Add memory context to the prompt if available
+        if memory_context:
+            self._add_memory_to_prompt(rendered_prompt, memory_context)
+
+        logger.debug(
+            "Rendered prompt with %d messages for template: %s",
+            len(rendered_prompt.messages),
+            prompt_template.name,
+        )
+
+        request = GenerationRequest(
+            messages=rendered_prompt.messages,
+            metadata={
+                "nit_source_file": task.source_file,
+                "nit_template_name": prompt_template.name,
+                "nit_builder_name": self.name,
+                "nit_framework": task.framework,
+            },
+        )
+        return context, adapter, request, rendered_prompt
+
+    async def _finish(
+        self,
+        task: BuildTask,
+        prepared: _Prepared,
+        test_code: str,
+        response: LLMResponse,
+        *,
+        batch_size: int = 1,
+    ) -> TaskOutput:
+        """Validate generated *test_code*, update memory and build the output.
+
+        *prepared* is what ``_prepare`` returned for *task*.  With
+        *batch_size* above one, *response* was shared by that many files
+        and its token usage is divided between them.
+        """
+        context, adapter, request, _ = prepared
+        # Step 6: Validation pipeline with self-iteration (task 1.16.2, 1.16.3)
+        validation_attempts, final_test_code, final_attempt = await self._run_validation_pipeline(
+            test_code, adapter, task, request, context=context
+        )
+
+        # Step 7: Update memory on generation outcomes (task 1.16.5)
+        if self._memory:
+            if final_attempt:
+                self._update_memory_from_validation(
+                    task.framework, validation_attempts, final_attempt
+                )
+            elif not self._enable_validation:
+                # Update memory for successful generation without validation
+                self._memory.update_stats(
+                    successful=True,
+                    tests_generated=1,
+                )
+
+        # Determine final status
+        tests_passing = (
+            final_attempt.test_result.passed if final_attempt and final_attempt.test_result else 0
+        )
+        validation_success = (
+            final_attempt.passed if final_attempt else True  # No validation was run
+        )
+
+        result = {
+            "test_code": final_test_code,
+            "source_file": task.source_file,
+            "framework": task.framework,
+            "output_file": task.output_file,
+            "tokens_used": response.total_tokens // batch_size,
+            "prompt_tokens": response.prompt_tokens // batch_size,
+            "completion_tokens": response.completion_tokens // batch_size,
+            "model": response.model,
+            "validation_enabled": self._enable_validation,
+            "validation_attempts": len(validation_attempts),
+            "tests_passing": tests_passing,
+            "final_failure_type": (
+                final_attempt.failure_type.value
+                if final_attempt and final_attempt.failure_type
+                else None
+            ),
+        }
+        if batch_size > 1:
+            result["batch_size"] = batch_size
+
+        return TaskOutput(
+            status=TaskStatus.COMPLETED if validation_success else TaskStatus.FAILED,
+            result=result,
+            errors=(
+                [final_attempt.error_message] if final_attempt and not validation_success else []
+            ),
+        )
+
     def _resolve_path(self, path: str) -> Path:
         """Resolve a path string to an absolute Path relative to project root."""
         p = Path(path)
@@ -383,6 +616,7 @@ class UnitBuilder(BaseAgent):
         adapter: TestFrameworkAdapter,
         task: BuildTask,
         request: GenerationRequest,
+        context: AssembledContext | None = None,
     ) -> tuple[list[ValidationAttempt], str, ValidationAttempt | None]:
         """Run the validation pipeline with retry logic (task 1.16.2, 1.16.3).
 
@@ -391,6 +625,7 @@ class UnitBuilder(BaseAgent):
             adapter: Test framework adapter.
             task: Build task.
             request: Original generation request for retries.
+            context: Assembled source context, enabling the static import check.
 
         Returns:
             Tuple of (validation_attempts, final_test_code, final_attempt).
@@ -402,22 +637,20 @@ class UnitBuilder(BaseAgent):
         if not self._enable_validation:
             return validation_attempts, final_test_code, final_attempt
 
-        # Determine test file path
-        test_file = self._determine_test_file_path(task, adapter)
+        # Validate at a private scratch path so concurrent builders never collide
+        target = self._determine_test_file_path(task, adapter)
 
-        try:
+        async with self._sandbox.reserve(target) as test_file:
             # First attempt
             logger.info("Validating and running generated test")
-            attempt = await self._validate_and_run_test(test_code, adapter, test_file)
+            attempt = await self._validate_and_run_test(
+                test_code, adapter, test_file, context=context
+            )
             validation_attempts.append(attempt)
 
             # Self-iteration loop: retry up to max_retries times
             retry_count = 0
-            should_retry = (retry_count < self._max_retries and not attempt.syntax_valid) or (
-                attempt.test_result is not None and not attempt.test_result.success
-            )
-
-            while should_retry:
+            while retry_count < self._max_retries and not attempt.passed:
                 logger.info(
                     "Retry %d/%d: Previous attempt failed with %s",
                     retry_count + 1,
@@ -431,14 +664,14 @@ class UnitBuilder(BaseAgent):
                     retry_count += 1
 
                     # Validate the new attempt
-                    attempt = await self._validate_and_run_test(new_test_code, adapter, test_file)
+                    attempt = await self._validate_and_run_test(
+                        new_test_code, adapter, test_file, context=context
+                    )
                     attempt.attempt = retry_count + 1
                     validation_attempts.append(attempt)
 
                     # If successful, use this version
-                    if attempt.syntax_valid and (
-                        attempt.test_result is None or attempt.test_result.success
-                    ):
+                    if attempt.passed:
                         final_test_code = new_test_code
                         logger.info("Retry succeeded on attempt %d", retry_count + 1)
                         break
@@ -447,21 +680,8 @@ class UnitBuilder(BaseAgent):
                     logger.error("Error during retry: %s", exc)
                     break
 
-                # Update retry condition
-                should_retry = (retry_count < self._max_retries and not attempt.syntax_valid) or (
-                    attempt.test_result is not None and not attempt.test_result.success
-                )
-
             final_attempt = validation_attempts[-1] if validation_attempts else None
 
-        finally:
-            # Clean up temporary test file
-            try:
-                if test_file.exists():
-                    test_file.unlink()
-            except Exception as exc:
-                logger.warning("Could not remove temporary test file: %s", exc)
-
         return validation_attempts, final_test_code, final_attempt
 
     async def _validate_and_run_test(
@@ -469,6 +689,8 @@ class UnitBuilder(BaseAgent):
         test_code: str,
         adapter: TestFrameworkAdapter,
         test_file: Path,
+        *,
+        context: AssembledContext | None = None,
     ) -> ValidationAttempt:
         """Validate test syntax and execute the test (task 1.16.2).
 
@@ -476,6 +698,8 @@ class UnitBuilder(BaseAgent):
             test_code: Generated test code to validate.
             adapter: Test framework adapter for validation and execution.
             test_file: Path where test will be written temporarily.
+            context: Assembled source context; when given, imports are
+                checked statically before anything is executed.
 
         Returns:
             ValidationAttempt with validation and execution results.
@@ -506,18 +730,30 @@ class UnitBuilder(BaseAgent):
         attempt.syntax_valid = True
         logger.debug("Test syntax validation passed")
 
-        # Step 2: Write test to temporary file and execute
+        # Step 2: Check imports against the parsed source, skipping the run on failure
+        if context is not None:
+            import_errors = check_imports(
+                test_code, context, test_file=test_file, project_root=self._root
+            )
+            if import_errors:
+                logger.warning("Test import validation failed: %s", import_errors)
+                attempt.failure_type = FailureType.IMPORT_ERROR
+                attempt.error_message = _format_import_errors(import_errors, context)
+                return attempt
+
+        # Step 3: Write test to temporary file and execute
         try:
             # Ensure parent directory exists
             test_file.parent.mkdir(parents=True, exist_ok=True)
             test_file.write_text(test_code, encoding="utf-8")
             logger.debug("Wrote test to %s", test_file)
 
-            # Run the test via adapter
+            # Run the test on a warm worker when the adapter supports one
             logger.debug("Executing test via adapter")
-            test_result = await adapter.run_tests(
+            test_result = await get_worker_pool().run_tests(
+                adapter,
                 self._root,
-                test_files=[test_file],
+                [test_file],
                 timeout=60.0,
             )
             attempt.test_result = test_result
@@ -742,9 +978,7 @@ class UnitBuilder(BaseAgent):
         if not self._memory:
             return
 
-        success = final_attempt.syntax_valid and (
-            final_attempt.test_result is None or final_attempt.test_result.success
-        )
+        success = final_attempt.passed
 
         # Update generation stats
         self._memory.update_stats(
@@ -788,3 +1022,13 @@ class UnitBuilder(BaseAgent):
                         reason=attempt.error_message[:200],
                         context={"framework": framework, "attempt": idx + 1},
                     )
+
+
+def _format_import_errors(errors: list[str], context: AssembledContext) -> str:
+    """Build retry feedback for imports that do not resolve."""
+    lines = ["Import validation errors:", *errors]
+    symbols = available_symbols(context)
+    if symbols:
+        shown = ", ".join(symbols[:_MAX_SYMBOLS_IN_FEEDBACK])
+        lines.append(f"Functions and classes defined in {context.source_path}: {shown}")
+    return "\n".join(lines)
@@ -0,0 +1,216 @@
+"""Per-stage checkpoints for resumable pipeline runs.
+
+Each completed stage's contribution to the pipeline result (test results,
+gap report, code maps, risk report, bug reports, ...) is written to
+``.nit/runs/<run-id>/<stage>.pkl``.  The run ID is derived from the
+pipeline's inputs — a content hash of the tracked and untracked source
+files in the working tree (tool outputs such as coverage reports are left
+out), a hash of ``.nit.yml`` and the run options — so a run resumed on the same unchanged
+tree finds the outputs of earlier runs by recomputing the ID.  Outputs are
+only restored with ``nit pick --resume``; other runs overwrite them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import pickle
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from nit import __version__
+from nit.parsing.treesitter import EXTENSION_TO_LANGUAGE
+from nit.utils.cache import write_atomic
+from nit.utils.git import GitOperationError, get_worktree_content_hash
+
+logger = logging.getLogger(__name__)
+
+_RUNS_DIR = Path(".nit") / "runs"
+_MANIFEST_FILENAME = "manifest.json"
+_RUN_ID_LENGTH = 16
+
+# Files the pipeline itself (re)writes; they must not change the run ID
+_TOOL_OUTPUTS = (
+    ".nit",
+    "**/.coverage",
+    "**/.coverage.*",
+    "**/coverage.json",
+    "**/coverage.xml",
+    "**/coverage-final.json",
+    "**/coverage.info",
+    "**/lcov.info",
+    "**/htmlcov",
+)
+
+# Bumped when the pickled fragment layout changes
+_FORMAT_VERSION = 1
+
+# Run directories kept per project; older ones are pruned
+DEFAULT_MAX_RUNS = 10
+
+
+class RunCheckpoint:
+    """Checkpoint directory for one pipeline run.
+
+    Args:
+        run_dir: The run's directory (``.nit/runs/<run-id>``).
+        inputs: Hashes the run ID was derived from, recorded in the manifest.
+    """
+
+    def __init__(self, run_dir: Path, inputs: dict[str, str] | None = None) -> None:
+        self._dir = run_dir
+        self._inputs = inputs or {}
+
+    @property
+    def run_id(self) -> str:
+        """ID of the run (the directory name)."""
+        return self._dir.name
+
+    @property
+    def path(self) -> Path:
+        """Directory holding the run's checkpoints."""
+        return self._dir
+
+    def completed_stages(self) -> list[str]:
+        """Names of the stages with a saved checkpoint."""
+        manifest = self._read_manifest()
+        stages = manifest.get("stages", {})
+        return sorted(stages) if isinstance(stages, dict) else []
+
+    def load(self, stage: str) -> dict[str, Any] | None:
+        """Return the saved fragment of *stage*, or ``None`` if unavailable."""
+        path = self._stage_path(stage)
+        if not path.is_file():
+            return None
+        try:
+            # Written by this project's own earlier runs (see ``save``)
+            data = pickle.loads(path.read_bytes())  # noqa: S301
+        except Exception as exc:
+            logger.debug("Ignoring unreadable checkpoint %s: %s", path, exc)
+            return None
+        if not isinstance(data, dict) or data.get("format") != _FORMAT_VERSION:
+            return None
+        fragment = data.get("fragment")
+        return fragment if isinstance(fragment, dict) else None
+
+    def save(self, stage: str, fragment: dict[str, Any]) -> bool:
+        """Save *fragment* as the output of *stage*.
+
+        The file is written atomically so an interrupted run never leaves
+        a truncated checkpoint behind.
+
+        Returns:
+            ``True`` if the checkpoint was written.
+        """
+        try:
+            payload = pickle.dumps({"format": _FORMAT_VERSION, "fragment": fragment})
+            self._dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(self._stage_path(stage), payload)
+            self._record_stage(stage)
+        except Exception as exc:
+            logger.debug("Could not checkpoint stage %s: %s", stage, exc)
+            return False
+        return True
+
+    def _stage_path(self, stage: str) -> Path:
+        return self._dir / f"{stage}.pkl"
+
+    def _read_manifest(self) -> dict[str, Any]:
+        path = self._dir / _MANIFEST_FILENAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _record_stage(self, stage: str) -> None:
+        manifest = self._read_manifest()
+        if not manifest:
+            manifest = {
+                "run_id": self.run_id,
+                "nit_version": __version__,
+                "inputs": self._inputs,
+                "created_at": datetime.now(UTC).isoformat(),
+                "stages": {},
+            }
+        manifest.setdefault("stages", {})[stage] = {"saved_at": datetime.now(UTC).isoformat()}
+        text = json.dumps(manifest, indent=2) + "\n"
+        write_atomic(self._dir / _MANIFEST_FILENAME, text.encode("utf-8"))
+
+
+def open_run(
+    project_root: Path,
+    options: dict[str, Any],
+    *,
+    max_runs: int = DEFAULT_MAX_RUNS,
+) -> RunCheckpoint | None:
+    """Open the checkpoint directory for a run over *project_root*.
+
+    Args:
+        project_root: Project root directory.
+        options: Run options that change stage outputs (for example the
+            test type or target file); must be JSON-serialisable.
+        max_runs: Number of run directories to keep; older ones are removed.
+
+    Returns:
+        The run's checkpoint, or ``None`` when the project is not in a git
+        repository (without a content hash, outputs cannot be matched to
+        inputs).
+    """
+    try:
+        tree_hash = get_worktree_content_hash(
+            project_root,
+            exclude=_TOOL_OUTPUTS,
+            untracked_suffixes=frozenset(EXTENSION_TO_LANGUAGE),
+        )
+    except GitOperationError as exc:
+        logger.debug("Run checkpoints disabled: %s", exc)
+        return None
+
+    inputs = {
+        "tree_hash": tree_hash,
+        "config_hash": _config_hash(project_root, options),
+    }
+    key = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+    runs_dir = project_root / _RUNS_DIR
+    run_dir = runs_dir / key[:_RUN_ID_LENGTH]
+
+    _prune_runs(runs_dir, keep=max_runs, current=run_dir)
+    _ignore_runs_dir(runs_dir)
+    return RunCheckpoint(run_dir, inputs)
+
+
+def _config_hash(project_root: Path, options: dict[str, Any]) -> str:
+    digest = hashlib.sha256()
+    digest.update(__version__.encode("utf-8"))
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    with contextlib.suppress(OSError):
+        digest.update((project_root / ".nit.yml").read_bytes())
+    return digest.hexdigest()
+
+
+def _prune_runs(runs_dir: Path, *, keep: int, current: Path) -> None:
+    """Remove the oldest run directories beyond *keep* (never *current*)."""
+    try:
+        runs = [p for p in runs_dir.iterdir() if p.is_dir() and p != current]
+    except OSError:
+        return
+    runs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in runs[max(keep - 1, 0) :]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+def _ignore_runs_dir(runs_dir: Path) -> None:
+    """Keep checkpoints out of git (and out of commits made by ``nit pick``)."""
+    gitignore = runs_dir / ".gitignore"
+    if gitignore.is_file():
+        return
+    try:
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        gitignore.write_text("# Created by nit: local run checkpoints\n*\n", encoding="utf-8")
+    except OSError as exc:
+        logger.debug("Could not write %s: %s", gitignore, exc)
@@ -6,7 +6,8 @@ import asyncio
 import logging
 import subprocess
 import time
-from dataclasses import dataclass, field
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -47,6 +48,13 @@ from nit.agents.detectors.infra import detect_infra
 from nit.agents.detectors.llm_usage import LLMUsageDetector, LLMUsageProfile
 from nit.agents.detectors.stack import detect_languages
 from nit.agents.detectors.workspace import detect_workspace
+from nit.agents.pipelines.checkpoint import open_run
+from nit.agents.pipelines.stages import (
+    Stage,
+    StageScheduler,
+    StageTiming,
+    stage_dependencies,
+)
 from nit.agents.reporters import GenerationSummary, GitHubPRReporter
 from nit.agents.reporters.github_issue import BugIssueData, GitHubIssueReporter
 from nit.agents.reporters.terminal import reporter
@@ -59,14 +67,18 @@ from nit.memory.analytics_collector import get_analytics_collector
 from nit.models.analytics import BugSnapshot, TestExecutionSnapshot
 from nit.models.profile import ProjectProfile
 from nit.models.store import is_profile_stale, load_profile, save_profile
+from nit.parsing.symbol_index import load_symbol_index
 from nit.sharding.parallel_runner import ParallelRunConfig, run_tests_parallel
 from nit.telemetry.sentry_integration import (
     record_metric_count,
     record_metric_distribution,
     start_span,
 )
+from nit.telemetry.tracing import SPAN_STAGE, Tracer, trace_span
 from nit.utils.ci_context import CIContext, detect_ci_context, should_create_pr
 from nit.utils.git import get_default_branch
+from nit.utils.git_churn import load_function_churn
+from nit.utils.git_history import load_history_index
 
 if TYPE_CHECKING:
     from nit.adapters.base import RunResult
@@ -85,12 +97,61 @@ if TYPE_CHECKING:
     from nit.agents.analyzers.security import SecurityReport
     from nit.agents.analyzers.semantic_gap import SemanticGap
     from nit.agents.analyzers.snapshot import SnapshotAnalysisResult
+    from nit.agents.pipelines.checkpoint import RunCheckpoint
     from nit.models.route import RouteDiscoveryResult
 
 logger = logging.getLogger(__name__)
 
 _TOTAL_STEPS = 9
 
+# ``PickPipelineResult`` fields filled by ``_run_specialized_analyzers``
+_SPECIALIZED_REPORTS = (
+    "accessibility_report",
+    "openapi_report",
+    "graphql_report",
+    "contract_report",
+    "migration_report",
+    "snapshot_report",
+)
+
+# Checkpointed stages: step label shown when restored, and the result fields
+# (or, for ``test_result``, stage values) making up their saved output
+_CHECKPOINTED_STAGES: dict[str, tuple[str | None, tuple[str, ...]]] = {
+    "tests": (
+        "Running tests and analyzing coverage",
+        (
+            "test_result",
+            "tests_run",
+            "tests_passed",
+            "tests_failed",
+            "tests_errors",
+            "coverage_report",
+            "gap_report",
+        ),
+    ),
+    "bugs": ("Analyzing test failures for bugs", ("bugs_found",)),
+    "code_analysis": (
+        "Analyzing code patterns and conventions",
+        ("code_maps", "convention_profile", "route_discovery"),
+    ),
+    "risk_analysis": (
+        "Analyzing risk, security, and semantic gaps",
+        ("risk_report", "security_report", "integration_deps", "flow_mapping", "semantic_gaps"),
+    ),
+    "specialized": (None, _SPECIALIZED_REPORTS),
+}
+
+# Failures swallowed by the best-effort helpers of the stage that is running;
+# a stage that records any is not checkpointed (see ``_with_checkpoints``)
+_stage_failures: ContextVar[list[str] | None] = ContextVar("nit_stage_failures", default=None)
+
+
+def _note_stage_failure(what: str, exc: object) -> None:
+    """Record that part of the running stage failed, so its output is not reused."""
+    failures = _stage_failures.get()
+    if failures is not None:
+        failures.append(f"{what}: {exc}")
+
 
 class _StepTracker:
     """Track pipeline step progress for terminal display."""
@@ -156,6 +217,12 @@ class PickPipelineConfig:
     token_budget: int = 0
     """Total token budget for LLM usage (0 = unlimited)."""
 
+    resume: bool = False
+    """Reuse stage outputs checkpointed by an earlier run on the same inputs."""
+
+    trace_file: Path | None = None
+    """Write the run's trace spans to this file (Chrome trace event format)."""
+
 
 @dataclass
 class PickPipelineResult:
@@ -233,6 +300,18 @@ class PickPipelineResult:
     mutation_report: MutationAnalysisResult | None = None
     """Mutation testing analysis findings."""
 
+    stage_timings: list[StageTiming] = field(default_factory=list)
+    """Start offset, duration and status of each pipeline stage."""
+
+    run_id: str | None = None
+    """ID of the run's checkpoint directory under ``.nit/runs/``."""
+
+    resumed_stages: list[str] = field(default_factory=list)
+    """Stages whose output was restored from a checkpoint."""
+
+    trace: Tracer | None = None
+    """Spans (timings, tokens, peak RSS, subprocesses) recorded during the run."""
+
     success: bool = True
     errors: list[str] = field(default_factory=list)
 
@@ -275,6 +354,9 @@ class PickPipeline:
         # Populated during profile loading when LLM SDK usage is detected
         self._llm_usage_profile: LLMUsageProfile | None = None
 
+        # Stage checkpoints of the current run (None when unavailable)
+        self._checkpoint: RunCheckpoint | None = None
+
     def _token_budget_exceeded(self) -> bool:
         """Check if the session token budget has been exceeded."""
         if self.config.token_budget <= 0:
@@ -309,12 +391,21 @@ class PickPipeline:
 
         record_metric_count("nit.command.invoked", command="pick")
 
-        try:
-            await self._run_pipeline_steps(result, tracker, start_span, record_metric_count)
-        except Exception as e:
-            logger.exception("Pick pipeline failed: %s", e)
-            result.success = False
-            result.errors.append(str(e))
+        tracer = Tracer()
+        result.trace = tracer
+        with tracer.activate():
+            try:
+                await self._run_pipeline_steps(result, tracker, start_span, record_metric_count)
+            except Exception as e:
+                logger.exception("Pick pipeline failed: %s", e)
+                result.success = False
+                result.errors.append(str(e))
+
+        if self.config.trace_file is not None:
+            try:
+                tracer.write_chrome_trace(self.config.trace_file)
+            except OSError as exc:
+                logger.warning("Could not write trace file %s: %s", self.config.trace_file, exc)
 
         duration_ms = (time.monotonic() - pipeline_start) * 1000
         record_metric_distribution("nit.pipeline.duration_ms", duration_ms, unit="millisecond")
@@ -331,21 +422,28 @@ class PickPipeline:
         """Execute the core pipeline steps (extracted to stay within statement limits)."""
         # Step 1: Load project profile
         tracker.step("Loading project profile")
-        with start_span(op="step.profile", description="Load project profile"):
+        with (
+            start_span(op="step.profile", description="Load project profile"),
+            trace_span("profile", SPAN_STAGE),
+        ):
             profile = await self._load_profile()
             result.llm_usage_profile = self._llm_usage_profile
 
         # Step 2: Load test framework adapters
         tracker.step("Loading test framework adapters")
-        with start_span(op="step.adapters", description="Load test adapters"):
+        with (
+            start_span(op="step.adapters", description="Load test adapters"),
+            trace_span("adapters", SPAN_STAGE),
+        ):
             adapters = self._get_test_adapters(profile)
             primary_adapter = adapters[0]
             record_metric_count("nit.framework.detected", framework=primary_adapter.name)
 
         # Check prerequisites (part of step 2)
-        prereqs_ok = await check_and_install_prerequisites(
-            primary_adapter, self.config.project_root, ci_mode=self.config.ci_mode
-        )
+        with trace_span("prerequisites", SPAN_STAGE):
+            prereqs_ok = await check_and_install_prerequisites(
+                primary_adapter, self.config.project_root, ci_mode=self.config.ci_mode
+            )
         if not prereqs_ok:
             error_msg = "Prerequisites not satisfied. Please install required dependencies."
             result.success = False
@@ -354,69 +452,205 @@ class PickPipeline:
                 reporter.print_error(error_msg)
             return
 
-        # Step 3: Run tests and analyze coverage
-        tracker.step("Running tests and analyzing coverage")
-        with start_span(op="step.tests", description="Run tests"):
-            test_result = await self._run_tests(primary_adapter)
-            await self._collect_test_metrics(test_result, result)
-
-        record_metric_count("nit.tests.passed", value=result.tests_passed)
-        record_metric_count("nit.tests.failed", value=result.tests_failed)
-
-        # Step 4: Analyze test failures for bugs
-        failed_count = result.tests_failed + result.tests_errors
-        tracker.step(f"Analyzing {failed_count} test failures for bugs")
-        with start_span(op="step.bugs", description="Analyze bugs"):
-            bugs = await self._analyze_bugs(test_result)
-            result.bugs_found = bugs
-
-        record_metric_count("nit.bugs.found", value=len(bugs))
-
-        # Steps 5-6: Deep analysis (code patterns, risk, semantic gaps)
-        with start_span(op="step.analysis", description="Deep analysis"):
-            await self._run_deep_analysis_steps(tracker, profile, result)
-
-        # Run specialized domain analyzers (non-blocking, best-effort)
-        await self._run_specialized_analyzers(result)
-
-        # Steps 7-8: Fix generation and application
-        with start_span(op="step.fixes", description="Fix generation"):
-            await self._run_fix_steps(tracker, bugs, primary_adapter, result)
-
-        # Step 9: Post-loop actions (issues, PRs, commits)
-        if self._should_run_post_loop(result):
-            tracker.step("Creating GitHub pull request or commit")
-            with start_span(op="step.report", description="Post-loop actions"):
-                await self._post_loop(result)
-        else:
-            tracker.skip("Creating PR/commit")
+        self._checkpoint = await asyncio.to_thread(
+            open_run, self.config.project_root, self._checkpoint_options()
+        )
+        if self._checkpoint is not None:
+            result.run_id = self._checkpoint.run_id
+            if self.config.resume and not self.config.ci_mode:
+                completed = self._checkpoint.completed_stages()
+                reporter.print_info(
+                    f"Resuming run {result.run_id}: {len(completed)} checkpointed stage(s)"
+                )
 
-    # ------------------------------------------------------------------
-    # Step groups extracted from run()
-    # ------------------------------------------------------------------
+        # Steps 3-9 run as a stage graph, independent stages concurrently
+        scheduler = StageScheduler(self._pick_stages(tracker, profile, primary_adapter, result))
+        try:
+            await scheduler.run()
+        finally:
+            result.stage_timings = scheduler.timings
 
-    async def _run_deep_analysis_steps(
+    def _pick_stages(
         self,
         tracker: _StepTracker,
         profile: ProjectProfile,
+        adapter: TestFrameworkAdapter,
         result: PickPipelineResult,
-    ) -> None:
-        """Run steps 5-6: code patterns, conventions, risk, security, and semantic gaps."""
-        has_gaps = bool(result.gap_report and result.gap_report.function_gaps)
-
-        if has_gaps:
+    ) -> list[Stage]:
+        """Declare steps 3-9 as stages with the values they read and produce.
+
+        Stages write their outputs to *result*; ``test_result``, which the
+        result does not keep, is passed through *values*.  Bug analysis,
+        code analysis and the specialized analyzers only depend on test
+        results (or nothing), so they overlap.  Fixes rewrite source files
+        and therefore wait for every stage that reads them.  Analysis stages
+        are checkpointed (see ``_with_checkpoints``).  Step headers and
+        messages of stages that overlap may interleave on the console.
+        """
+        values: dict[str, Any] = {}
+
+        async def run_tests() -> None:
+            tracker.step("Running tests and analyzing coverage")
+            with start_span(op="step.tests", description="Run tests"):
+                values["test_result"] = await self._run_tests(adapter)
+                await self._collect_test_metrics(values["test_result"], result)
+            record_metric_count("nit.tests.passed", value=result.tests_passed)
+            record_metric_count("nit.tests.failed", value=result.tests_failed)
+
+        async def analyze_bugs() -> None:
+            failed_count = result.tests_failed + result.tests_errors
+            tracker.step(f"Analyzing {failed_count} test failures for bugs")
+            with start_span(op="step.bugs", description="Analyze bugs"):
+                result.bugs_found = await self._analyze_bugs(values["test_result"])
+            record_metric_count("nit.bugs.found", value=len(result.bugs_found))
+
+        async def analyze_code() -> None:
+            if not (result.gap_report and result.gap_report.function_gaps):
+                tracker.skip("Analyzing code patterns and conventions")
+                return
             tracker.step("Analyzing code patterns and conventions")
-            await self._run_deep_code_analysis(profile, result.gap_report, result)
-        else:
-            tracker.skip("Analyzing code patterns and conventions")
+            with start_span(op="step.analysis", description="Deep code analysis"):
+                await self._run_deep_code_analysis(profile, result.gap_report, result)
+
+        async def analyze_risk() -> None:
+            with start_span(op="step.risk", description="Risk and security analysis"):
+                if result.gap_report and result.gap_report.function_gaps:
+                    tracker.step("Analyzing risk, security, and semantic gaps")
+                    await self._run_risk_and_semantic_analysis(result.gap_report, result)
+                else:
+                    # Security analysis runs even without coverage gaps
+                    tracker.step("Analyzing security")
+                    await self._run_security_analysis(result)
+
+        async def analyze_specialized() -> None:
+            # Best-effort and CPU-bound, so it runs off the event loop
+            reports = await asyncio.to_thread(_run_specialized_analyzers, self.config.project_root)
+            self._apply_specialized_reports(reports, result)
+
+        async def fix() -> None:
+            with start_span(op="step.fixes", description="Fix generation"):
+                await self._run_fix_steps(tracker, result.bugs_found, adapter, result)
+
+        async def report() -> None:
+            if self._should_run_post_loop(result):
+                tracker.step("Creating GitHub pull request or commit")
+                with start_span(op="step.report", description="Post-loop actions"):
+                    await self._post_loop(result)
+            else:
+                tracker.skip("Creating PR/commit")
+
+        stages = [
+            Stage(
+                "tests",
+                run_tests,
+                inputs=("profile",),
+                outputs=("test_result", "coverage_report", "gap_report"),
+            ),
+            Stage("bugs", analyze_bugs, inputs=("test_result",), outputs=("bugs_found",)),
+            Stage(
+                "code_analysis",
+                analyze_code,
+                inputs=("profile", "gap_report"),
+                outputs=("code_maps", "convention_profile", "route_discovery"),
+            ),
+            Stage(
+                "risk_analysis",
+                analyze_risk,
+                inputs=("code_maps", "route_discovery", "gap_report"),
+                outputs=(
+                    "risk_report",
+                    "security_report",
+                    "integration_deps",
+                    "flow_mapping",
+                    "semantic_gaps",
+                ),
+            ),
+            Stage("specialized", analyze_specialized, outputs=_SPECIALIZED_REPORTS),
+            Stage(
+                "fixes",
+                fix,
+                inputs=("bugs_found",),
+                outputs=("fixes_generated", "fixes_applied"),
+                after=("code_analysis", "risk_analysis", "specialized"),
+            ),
+            Stage("report", report, inputs=("bugs_found", "fixes_generated"), outputs=("pr_url",)),
+        ]
+        return self._with_checkpoints(stages, tracker, result, values)
+
+    def _checkpoint_options(self) -> dict[str, Any]:
+        """Run options that change stage outputs, part of the checkpoint key."""
+        return {
+            "test_type": self.config.test_type,
+            "target_file": self.config.target_file,
+            "coverage_target": self.config.coverage_target,
+        }
+
+    def _with_checkpoints(
+        self,
+        stages: list[Stage],
+        tracker: _StepTracker,
+        result: PickPipelineResult,
+        values: dict[str, Any],
+    ) -> list[Stage]:
+        """Make checkpointed stages save their output and, on resume, restore it.
+
+        A stage is only restored when every stage it depends on was restored
+        too, so a re-run stage never feeds stale data to a restored one.  A
+        stage whose helpers swallowed a failure (``_note_stage_failure``) is
+        not saved, so a resumed run retries it instead of restoring its
+        partial output.
+        """
+        checkpoint = self._checkpoint
+        if checkpoint is None:
+            return stages
+
+        upstream = stage_dependencies(stages)
+        restored: set[str] = set()
+
+        def wrap(stage: Stage, label: str | None, fields: tuple[str, ...]) -> Stage:
+            inner = stage.run
+
+            async def run() -> None:
+                if self.config.resume and upstream[stage.name] <= restored:
+                    fragment = await asyncio.to_thread(checkpoint.load, stage.name)
+                    if fragment is not None:
+                        for name, value in fragment.items():
+                            if hasattr(result, name):
+                                setattr(result, name, value)
+                            else:
+                                values[name] = value
+                        restored.add(stage.name)
+                        result.resumed_stages.append(stage.name)
+                        if label:
+                            tracker.skip(f"{label} (restored from checkpoint)")
+                        return
+
+                failures: list[str] = []
+                token = _stage_failures.set(failures)
+                try:
+                    await inner()
+                finally:
+                    _stage_failures.reset(token)
+                if failures:
+                    logger.debug("Not checkpointing stage %s: %s", stage.name, "; ".join(failures))
+                    return
+                fragment = {
+                    name: getattr(result, name) if hasattr(result, name) else values.get(name)
+                    for name in fields
+                }
+                await asyncio.to_thread(checkpoint.save, stage.name, fragment)
+
+            return replace(stage, run=run)
+
+        wrapped: list[Stage] = []
+        for stage in stages:
+            spec = _CHECKPOINTED_STAGES.get(stage.name)
+            wrapped.append(wrap(stage, *spec) if spec else stage)
+        return wrapped
 
-        if has_gaps:
-            tracker.step("Analyzing risk, security, and semantic gaps")
-            await self._run_risk_and_semantic_analysis(result.gap_report, result)
-        else:
-            # Security analysis runs even without coverage gaps
-            tracker.step("Analyzing security")
-            await self._run_security_analysis(result)
+    # ------------------------------------------------------------------
+    # Step groups extracted from run()
+    # ------------------------------------------------------------------
 
     async def _run_fix_steps(
         self,
@@ -747,6 +981,7 @@ class PickPipeline:
 
             except Exception as e:
                 logger.warning("Bug analysis failed for test %s: %s", test_case.name, e)
+                _note_stage_failure(f"bug analysis of {test_case.name}", e)
 
             return None
 
@@ -757,6 +992,7 @@ class PickPipeline:
         for item in outcomes:
             if isinstance(item, BaseException):
                 logger.warning("Bug analysis raised exception: %s", item)
+                _note_stage_failure("bug analysis", item)
             elif item is not None:
                 bugs.append(item)
 
@@ -787,6 +1023,7 @@ class PickPipeline:
             task = CoverageAnalysisTask(
                 project_root=str(project_root),
                 coverage_threshold=coverage_config.line_threshold,
+                bounded_memory=coverage_config.bounded_memory,
             )
 
             # Run analysis
@@ -796,10 +1033,12 @@ class PickPipeline:
                 return output.result.get("gap_report")
 
             logger.warning("Coverage gap analysis failed: %s", output.errors)
+            _note_stage_failure("coverage gap analysis", output.errors)
             return None
 
         except Exception as e:
             logger.exception("Coverage gap analysis error: %s", e)
+            _note_stage_failure("coverage gap analysis", e)
             return None
 
     def _report_gap_analysis(self, gap_report: CoverageGapReport) -> None:
@@ -833,11 +1072,16 @@ class PickPipeline:
         """
         t0 = time.monotonic()
 
-        if gap_report:
-            await self._analyze_code_maps(gap_report, result)
+        async def code_maps() -> None:
+            if gap_report:
+                await self._analyze_code_maps(gap_report, result)
 
-        result.convention_profile = await self._analyze_patterns(profile)
-        result.route_discovery = self._discover_routes(profile)
+        # The three analyses are independent; route discovery is synchronous
+        _, result.convention_profile, result.route_discovery = await asyncio.gather(
+            code_maps(),
+            self._analyze_patterns(profile),
+            asyncio.to_thread(self._discover_routes, profile),
+        )
 
         elapsed = time.monotonic() - t0
         if not self.config.ci_mode:
@@ -856,11 +1100,21 @@ class PickPipeline:
         gap_report: CoverageGapReport,
         result: PickPipelineResult,
     ) -> None:
-        """Run CodeAnalyzer on files from gap report (parallelized)."""
+        """Run CodeAnalyzer on files from gap report (parallelized).
+
+        The project's symbol index lets the call graphs include calls into
+        the files each analyzed file imports.
+        """
         file_paths = {fg.file_path for fg in gap_report.function_gaps}
         file_paths.update(gap_report.untested_files)
 
-        code_analyzer = CodeAnalyzer(project_root=self.config.project_root)
+        try:
+            symbols = await asyncio.to_thread(load_symbol_index, self.config.project_root)
+        except Exception as exc:
+            logger.warning("Symbol index unavailable, call graphs stay per file: %s", exc)
+            _note_stage_failure("symbol index", exc)
+            symbols = None
+        code_analyzer = CodeAnalyzer(project_root=self.config.project_root, symbols=symbols)
         ci_mode = self.config.ci_mode
 
         async def _analyze_one(fp: str) -> tuple[str, Any]:
@@ -874,8 +1128,10 @@ class PickPipeline:
                 output = await code_analyzer.run(task)
                 if output.status == TaskStatus.COMPLETED:
                     return fp, output.result.get("code_map")
+                _note_stage_failure(f"code analysis of {fp}", output.errors)
             except Exception as exc:
                 logger.warning("Code analysis failed for %s: %s", fp, exc)
+                _note_stage_failure(f"code analysis of {fp}", exc)
                 if not ci_mode:
                     reporter.print_warning(f"Could not analyze {fp}: {exc}")
             return fp, None
@@ -885,6 +1141,7 @@ class PickPipeline:
         for item in outcomes:
             if isinstance(item, BaseException):
                 logger.warning("Code analysis raised exception: %s", item)
+                _note_stage_failure("code analysis", item)
                 continue
             fp, code_map = item
             if code_map:
@@ -902,8 +1159,10 @@ class PickPipeline:
             pattern_output = await pattern_analyzer.run(pattern_task)
             if pattern_output.status == TaskStatus.COMPLETED:
                 return pattern_output.result.get("convention_profile")
+            _note_stage_failure("pattern analysis", pattern_output.errors)
         except Exception as exc:
             logger.debug("Pattern analysis failed: %s", exc)
+            _note_stage_failure("pattern analysis", exc)
         return None
 
     def _discover_routes(self, profile: ProjectProfile) -> RouteDiscoveryResult | None:
@@ -915,6 +1174,7 @@ class PickPipeline:
                 return route_result
         except Exception as exc:
             logger.debug("Route discovery failed: %s", exc)
+            _note_stage_failure("route discovery", exc)
         return None
 
     async def _run_risk_and_semantic_analysis(
@@ -930,19 +1190,31 @@ class PickPipeline:
         """
         t0 = time.monotonic()
 
-        if result.code_maps and gap_report:
-            result.risk_report = await self._analyze_risk(result.code_maps, gap_report)
-
-        # Security analysis runs on all code maps (not gated on gaps)
-        await self._run_security_analysis(result)
+        async def risk() -> None:
+            if result.code_maps and gap_report:
+                result.risk_report = await self._analyze_risk(result.code_maps, gap_report)
 
-        self._detect_integration_deps(result)
+        async def flows() -> None:
+            if result.route_discovery and result.route_discovery.routes:
+                result.flow_mapping = await asyncio.to_thread(
+                    self._map_flows, result.route_discovery
+                )
 
-        if result.route_discovery and result.route_discovery.routes:
-            result.flow_mapping = self._map_flows(result.route_discovery)
+        async def semantic_gaps() -> None:
+            if gap_report and gap_report.function_gaps:
+                result.semantic_gaps = await self._detect_semantic_gaps(
+                    gap_report, result.code_maps
+                )
 
-        if gap_report and gap_report.function_gaps:
-            result.semantic_gaps = await self._detect_semantic_gaps(gap_report)
+        # Each analysis writes its own result field, so they run concurrently.
+        # Security analysis runs on all code maps (not gated on gaps).
+        await asyncio.gather(
+            risk(),
+            self._run_security_analysis(result),
+            asyncio.to_thread(self._detect_integration_deps, result),
+            flows(),
+            semantic_gaps(),
+        )
 
         elapsed = time.monotonic() - t0
         if not self.config.ci_mode:
@@ -977,6 +1249,7 @@ class PickPipeline:
                 code_maps=result.code_maps,
                 enable_llm_validation=config.security.llm_validation,
                 confidence_threshold=config.security.confidence_threshold,
+                batch_validation=config.security.batch_validation,
             )
 
             output = await analyzer.run(task)
@@ -984,115 +1257,38 @@ class PickPipeline:
                 result.security_report = output.result.get("security_report")
                 if not self.config.ci_mode and result.security_report:
                     reporter.print_security_summary(result.security_report)
+            else:
+                _note_stage_failure("security analysis", output.errors)
         except Exception as exc:
             logger.debug("Security analysis error: %s", exc)
+            _note_stage_failure("security analysis", exc)
 
-    async def _run_specialized_analyzers(self, result: PickPipelineResult) -> None:
-        """Run domain-specific analyzers (accessibility, API, GraphQL, etc.).
-
-        These are best-effort: failures are logged but don't block the pipeline.
-        """
-        root = self.config.project_root
-
-        try:
-            from nit.agents.analyzers.accessibility import (
-                analyze_accessibility,
-                detect_frontend_project,
-            )
-
-            if detect_frontend_project(root):
-                a11y = analyze_accessibility(root)
-                if a11y.routes:
-                    result.accessibility_report = a11y
-                    if not self.config.ci_mode:
-                        reporter.print_info(f"Accessibility: {len(a11y.routes)} route(s) found")
-        except Exception as exc:
-            logger.debug("Accessibility analysis skipped: %s", exc)
-
-        try:
-            from nit.agents.analyzers.openapi import (
-                analyze_openapi_spec,
-                detect_openapi_specs,
-            )
-
-            specs = detect_openapi_specs(root)
-            if specs:
-                api_result = analyze_openapi_spec(specs[0])
-                if api_result.total_endpoints > 0:
-                    result.openapi_report = api_result
-                    if not self.config.ci_mode:
-                        reporter.print_info(f"OpenAPI: {api_result.total_endpoints} endpoint(s)")
-        except Exception as exc:
-            logger.debug("OpenAPI analysis skipped: %s", exc)
-
-        try:
-            from nit.agents.analyzers.graphql import (
-                analyze_graphql_schema,
-                detect_graphql_schemas,
-            )
-
-            schemas = detect_graphql_schemas(root)
-            if schemas:
-                gql = analyze_graphql_schema(schemas[0])
-                if gql.queries or gql.mutations:
-                    result.graphql_report = gql
-                    if not self.config.ci_mode:
-                        reporter.print_info(
-                            f"GraphQL: {len(gql.queries)} queries, "
-                            f"{len(gql.mutations)} mutations"
-                        )
-        except Exception as exc:
-            logger.debug("GraphQL analysis skipped: %s", exc)
-
-        try:
-            from nit.agents.analyzers.contract import (
-                analyze_contracts,
-                detect_contract_files,
-            )
-
-            pacts = detect_contract_files(root)
-            if pacts:
-                contracts = analyze_contracts(root)
-                if contracts.contracts:
-                    result.contract_report = contracts
-                    if not self.config.ci_mode:
-                        reporter.print_info(f"Contracts: {len(contracts.contracts)} contract(s)")
-        except Exception as exc:
-            logger.debug("Contract analysis skipped: %s", exc)
-
-        try:
-            from nit.agents.analyzers.database import (
-                analyze_migrations,
-                detect_migration_framework,
-            )
-
-            framework = detect_migration_framework(root)
-            if framework:
-                migrations = analyze_migrations(root)
-                if migrations.migrations:
-                    result.migration_report = migrations
-                    if not self.config.ci_mode:
-                        reporter.print_info(
-                            f"Migrations: {len(migrations.migrations)} migration(s)"
-                        )
-        except Exception as exc:
-            logger.debug("Migration analysis skipped: %s", exc)
+    def _apply_specialized_reports(
+        self, reports: dict[str, Any], result: PickPipelineResult
+    ) -> None:
+        """Store specialized analyzer reports on *result* and summarize them."""
+        for name, report in reports.items():
+            setattr(result, name, report)
 
-        try:
-            from nit.agents.analyzers.snapshot import (
-                analyze_snapshots,
-                detect_snapshot_framework,
+        if self.config.ci_mode:
+            return
+        if result.accessibility_report:
+            routes = result.accessibility_report.routes
+            reporter.print_info(f"Accessibility: {len(routes)} route(s) found")
+        if result.openapi_report:
+            reporter.print_info(f"OpenAPI: {result.openapi_report.total_endpoints} endpoint(s)")
+        if result.graphql_report:
+            reporter.print_info(
+                f"GraphQL: {len(result.graphql_report.queries)} queries, "
+                f"{len(result.graphql_report.mutations)} mutations"
             )
-
-            snap_framework = detect_snapshot_framework(root)
-            if snap_framework:
-                snapshots = analyze_snapshots(root)
-                if snapshots.snapshot_files:
-                    result.snapshot_report = snapshots
-                    if not self.config.ci_mode:
-                        reporter.print_info(f"Snapshots: {snapshots.total_snapshots} snapshot(s)")
-        except Exception as exc:
-            logger.debug("Snapshot analysis skipped: %s", exc)
+        if result.contract_report:
+            reporter.print_info(f"Contracts: {len(result.contract_report.contracts)} contract(s)")
+        if result.migration_report:
+            migrations = result.migration_report.migrations
+            reporter.print_info(f"Migrations: {len(migrations)} migration(s)")
+        if result.snapshot_report:
+            reporter.print_info(f"Snapshots: {result.snapshot_report.total_snapshots} snapshot(s)")
 
     async def _analyze_risk(
         self,
@@ -1101,17 +1297,25 @@ class PickPipeline:
     ) -> RiskReport | None:
         """Run RiskAnalyzer on code maps and function gaps."""
         try:
-            risk_analyzer = RiskAnalyzer(project_root=self.config.project_root)
+            root = self.config.project_root
+            history, churn = await asyncio.gather(
+                asyncio.to_thread(load_history_index, root),
+                asyncio.to_thread(load_function_churn, root, list(code_maps)),
+            )
+            risk_analyzer = RiskAnalyzer(project_root=root, history=history, churn=churn)
             risk_task = RiskAnalysisTask(
                 project_root=str(self.config.project_root),
                 code_maps=code_maps,
                 function_gaps=gap_report.function_gaps,
+                gap_index=gap_report.gap_index,
             )
             risk_output = await risk_analyzer.run(risk_task)
             if risk_output.status == TaskStatus.COMPLETED:
                 return risk_output.result.get("risk_report")
+            _note_stage_failure("risk analysis", risk_output.errors)
         except Exception as exc:
             logger.debug("Risk analysis failed: %s", exc)
+            _note_stage_failure("risk analysis", exc)
         return None
 
     def _detect_integration_deps(self, result: PickPipelineResult) -> None:
@@ -1130,6 +1334,7 @@ class PickPipeline:
                     result.integration_deps.append(dep_report)
             except Exception as exc:
                 logger.debug("Integration deps detection failed for %s: %s", file_path, exc)
+                _note_stage_failure(f"integration deps of {file_path}", exc)
 
     def _map_flows(self, route_discovery: RouteDiscoveryResult) -> FlowMappingResult | None:
         """Map user flows from discovered routes."""
@@ -1138,9 +1343,12 @@ class PickPipeline:
             return mapper.map_flows(route_discovery)
         except Exception as exc:
             logger.debug("Flow mapping failed: %s", exc)
+            _note_stage_failure("flow mapping", exc)
         return None
 
-    async def _detect_semantic_gaps(self, gap_report: CoverageGapReport) -> list[SemanticGap]:
+    async def _detect_semantic_gaps(
+        self, gap_report: CoverageGapReport, code_maps: dict[str, CodeMap] | None = None
+    ) -> list[SemanticGap]:
         """Detect semantic test gaps using LLM analysis."""
         try:
             config = load_config(self.config.project_root)
@@ -1155,13 +1363,17 @@ class PickPipeline:
                     target=str(self.config.project_root),
                     coverage_gap_report=gap_report,
                     function_gaps=gap_report.function_gaps,
+                    code_maps=code_maps or {},
+                    max_concurrency=config.execution.analysis_concurrency,
                 )
                 sg_output = await detector.run(sg_task)
                 if sg_output.status == TaskStatus.COMPLETED:
                     gaps: list[SemanticGap] = sg_output.result.get("semantic_gaps", [])
                     return gaps
+                _note_stage_failure("semantic gap detection", sg_output.errors)
         except Exception as exc:
             logger.debug("Semantic gap detection skipped: %s", exc)
+            _note_stage_failure("semantic gap detection", exc)
         return []
 
     def _report_risk_summary(self, result: PickPipelineResult, elapsed: float) -> None:
@@ -1640,3 +1852,107 @@ class PickPipeline:
             if not self.config.ci_mode:
                 reporter.print_error(f"Failed to create PR: {e}")
             return {"created": False, "url": None, "error": str(e)}
+
+
+def _run_specialized_analyzers(root: Path) -> dict[str, Any]:
+    """Run domain-specific analyzers (accessibility, API, GraphQL, etc.).
+
+    These are best-effort: failures are logged but don't block the pipeline.
+    Runs on a worker thread, off the event loop (``asyncio.to_thread`` keeps
+    the stage's failure record, see ``_note_stage_failure``).
+
+    Returns:
+        Reports that found something, keyed by ``PickPipelineResult`` field.
+    """
+    reports: dict[str, Any] = {}
+
+    try:
+        from nit.agents.analyzers.accessibility import (
+            analyze_accessibility,
+            detect_frontend_project,
+        )
+
+        if detect_frontend_project(root):
+            a11y = analyze_accessibility(root)
+            if a11y.routes:
+                reports["accessibility_report"] = a11y
+    except Exception as exc:
+        logger.debug("Accessibility analysis skipped: %s", exc)
+        _note_stage_failure("accessibility analysis", exc)
+
+    try:
+        from nit.agents.analyzers.openapi import (
+            analyze_openapi_spec,
+            detect_openapi_specs,
+        )
+
+        specs = detect_openapi_specs(root)
+        if specs:
+            api_result = analyze_openapi_spec(specs[0])
+            if api_result.total_endpoints > 0:
+                reports["openapi_report"] = api_result
+    except Exception as exc:
+        logger.debug("OpenAPI analysis skipped: %s", exc)
+        _note_stage_failure("OpenAPI analysis", exc)
+
+    try:
+        from nit.agents.analyzers.graphql import (
+            analyze_graphql_schema,
+            detect_graphql_schemas,
+        )
+
+        schemas = detect_graphql_schemas(root)
+        if schemas:
+            gql = analyze_graphql_schema(schemas[0])
+            if gql.queries or gql.mutations:
+                reports["graphql_report"] = gql
+    except Exception as exc:
+        logger.debug("GraphQL analysis skipped: %s", exc)
+        _note_stage_failure("GraphQL analysis", exc)
+
+    try:
+        from nit.agents.analyzers.contract import (
+            analyze_contracts,
+            detect_contract_files,
+        )
+
+        pacts = detect_contract_files(root)
+        if pacts:
+            contracts = analyze_contracts(root)
+            if contracts.contracts:
+                reports["contract_report"] = contracts
+    except Exception as exc:
+        logger.debug("Contract analysis skipped: %s", exc)
+        _note_stage_failure("contract analysis", exc)
+
+    try:
+        from nit.agents.analyzers.database import (
+            analyze_migrations,
+            detect_migration_framework,
+        )
+
+        framework = detect_migration_framework(root)
+        if framework:
+            migrations = analyze_migrations(root)
+            if migrations.migrations:
+                reports["migration_report"] = migrations
+    except Exception as exc:
+        logger.debug("Migration analysis skipped: %s", exc)
+        _note_stage_failure("migration analysis", exc)
+
+    try:
+        from nit.agents.analyzers.snapshot import (
+            analyze_snapshots,
+            detect_snapshot_framework,
+        )
+
+        snap_framework = detect_snapshot_framework(root)
+        if snap_framework:
+            snapshots = analyze_snapshots(root)
+            if snapshots.snapshot_files:
+                reports["snapshot_report"] = snapshots
+    except Exception as exc:
+        logger.debug("Snapshot analysis skipped: %s", exc)
+        _note_stage_failure("snapshot analysis", exc)
+
+    return reports
@@ -0,0 +1,227 @@
+"""Dependency-ordered execution of pipeline stages.
+
+A pipeline is declared as a set of ``Stage`` objects, each naming the
+values it reads (``inputs``) and the values it produces (``outputs``).
+``StageScheduler`` derives the dependency DAG from those declarations and
+starts every stage as soon as the stages producing its inputs have
+finished, so independent stages run concurrently and the end-to-end
+latency approaches the critical path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from nit.telemetry.tracing import SPAN_STAGE, trace_span
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+STAGE_COMPLETED = "completed"
+STAGE_FAILED = "failed"
+STAGE_SKIPPED = "skipped"
+
+
+class StageGraphError(ValueError):
+    """Raised when stage declarations do not form a valid DAG."""
+
+
+@dataclass
+class Stage:
+    """A unit of pipeline work with declared inputs and outputs."""
+
+    name: str
+    """Unique stage name."""
+
+    run: Callable[[], Awaitable[None]]
+    """Coroutine function doing the stage's work."""
+
+    inputs: tuple[str, ...] = ()
+    """Values this stage reads; it waits for the stages that produce them."""
+
+    outputs: tuple[str, ...] = ()
+    """Values this stage produces."""
+
+    after: tuple[str, ...] = ()
+    """Stages that must finish first even though no value flows between them."""
+
+
+@dataclass
+class StageTiming:
+    """Timing of one stage within a scheduler run."""
+
+    name: str
+    """Stage name."""
+
+    start_ms: float
+    """Start time relative to the start of the run."""
+
+    duration_ms: float
+    """Wall-clock duration of the stage."""
+
+    status: str = STAGE_COMPLETED
+    """One of ``completed``, ``failed`` or ``skipped``."""
+
+    error: str = ""
+    """Error message when the stage failed."""
+
+
+@dataclass
+class _Node:
+    stage: Stage
+    depends_on: set[str] = field(default_factory=set)
+
+
+class StageScheduler:
+    """Run stages concurrently in dependency order.
+
+    Each stage runs inside a trace span (see ``nit.telemetry.tracing``).
+
+    A stage that raises is recorded as failed; stages depending on it
+    (directly or transitively) are skipped, while independent stages keep
+    running.  The first failure is re-raised once everything that could
+    run has finished.
+
+    Args:
+        stages: Stages to run.  Names must be unique, each output must have
+            a single producer, and the resulting graph must be acyclic.
+
+    Raises:
+        StageGraphError: If the declarations do not form a valid DAG.
+    """
+
+    def __init__(self, stages: list[Stage]) -> None:
+        self._nodes = _build_graph(stages)
+        # Timings of the last run; also available when the run raised
+        self.timings: list[StageTiming] = []
+
+    @property
+    def order(self) -> list[str]:
+        """A topological order of the stage names (declaration order on ties)."""
+        return _topological_order(self._nodes)
+
+    async def run(self) -> list[StageTiming]:
+        """Run every stage and return their timings in completion order."""
+        start = time.monotonic()
+        timings: list[StageTiming] = []
+        self.timings = timings
+        done: set[str] = set()
+        failed: set[str] = set()
+        pending = dict(self._nodes)
+        running: dict[asyncio.Task[None], str] = {}
+        first_error: BaseException | None = None
+
+        while pending or running:
+            for name, node in list(pending.items()):
+                if node.depends_on & failed:
+                    del pending[name]
+                    failed.add(name)
+                    timings.append(
+                        StageTiming(
+                            name=name,
+                            start_ms=(time.monotonic() - start) * 1000,
+                            duration_ms=0.0,
+                            status=STAGE_SKIPPED,
+                        )
+                    )
+                elif node.depends_on <= done:
+                    del pending[name]
+                    running[asyncio.create_task(self._timed(node.stage, start, timings))] = name
+
+            if not running:
+                break
+
+            try:
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                for task in running:
+                    task.cancel()
+                raise
+            for task in finished:
+                name = running.pop(task)
+                error = task.exception()
+                if error is None:
+                    done.add(name)
+                    continue
+                failed.add(name)
+                if first_error is None:
+                    first_error = error
+
+        if first_error is not None:
+            raise first_error
+        return timings
+
+    async def _timed(self, stage: Stage, start: float, timings: list[StageTiming]) -> None:
+        t0 = time.monotonic()
+        timing = StageTiming(name=stage.name, start_ms=(t0 - start) * 1000, duration_ms=0.0)
+        try:
+            with trace_span(stage.name, SPAN_STAGE):
+                await stage.run()
+        except Exception as exc:
+            timing.status = STAGE_FAILED
+            timing.error = str(exc)
+            logger.warning("Pipeline stage %s failed: %s", stage.name, exc)
+            raise
+        finally:
+            timing.duration_ms = (time.monotonic() - t0) * 1000
+            timings.append(timing)
+
+
+def stage_dependencies(stages: list[Stage]) -> dict[str, set[str]]:
+    """Return the names of the stages each stage directly waits for.
+
+    Raises:
+        StageGraphError: If the declarations do not form a valid DAG.
+    """
+    return {name: set(node.depends_on) for name, node in _build_graph(stages).items()}
+
+
+def _build_graph(stages: list[Stage]) -> dict[str, _Node]:
+    nodes: dict[str, _Node] = {}
+    producers: dict[str, str] = {}
+    for stage in stages:
+        if stage.name in nodes:
+            msg = f"Duplicate stage name: {stage.name}"
+            raise StageGraphError(msg)
+        nodes[stage.name] = _Node(stage)
+        for output in stage.outputs:
+            if output in producers:
+                msg = f"Output {output!r} is produced by both {producers[output]} and {stage.name}"
+                raise StageGraphError(msg)
+            producers[output] = stage.name
+
+    for node in nodes.values():
+        for value in node.stage.inputs:
+            producer = producers.get(value)
+            # Inputs nobody produces are provided before the run starts
+            if producer is not None and producer != node.stage.name:
+                node.depends_on.add(producer)
+        for name in node.stage.after:
+            if name not in nodes:
+                msg = f"Stage {node.stage.name} runs after unknown stage {name}"
+                raise StageGraphError(msg)
+            node.depends_on.add(name)
+
+    _topological_order(nodes)  # raises on cycles
+    return nodes
+
+
+def _topological_order(nodes: dict[str, _Node]) -> list[str]:
+    order: list[str] = []
+    placed: set[str] = set()
+    remaining = list(nodes)
+    while remaining:
+        ready = [name for name in remaining if nodes[name].depends_on <= placed]
+        if not ready:
+            msg = f"Stage dependencies form a cycle: {', '.join(sorted(remaining))}"
+            raise StageGraphError(msg)
+        order.extend(ready)
+        placed.update(ready)
+        remaining = [name for name in remaining if name not in placed]
+    return order
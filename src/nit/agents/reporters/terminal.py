@@ -11,6 +11,7 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeEl
 from rich.table import Table
 
 from nit.agents.analyzers.security import SecurityReport, SecuritySeverity
+from nit.telemetry.tracing import SPAN_AGENT, SPAN_LLM
 
 if TYPE_CHECKING:
     from rich.status import Status
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
     from nit.agents.analyzers.coverage import CoverageGapReport, FunctionGap
     from nit.models.coverage import CoverageReport
     from nit.models.test_result import TestResult
+    from nit.telemetry.tracing import Tracer
 
 console = Console()
 
@@ -993,6 +995,49 @@ class CLIReporter:
         if remaining > 0:
             self.console.print(f"  [dim]... and {remaining} more finding(s)[/dim]")
 
+    def print_trace_summary(self, tracer: Tracer) -> None:
+        """Print per-stage timing, token, memory and subprocess figures.
+
+        Args:
+            tracer: Tracer that recorded the pipeline run.
+        """
+        stages = tracer.stage_spans()
+        if not stages:
+            return
+
+        self.console.print()
+        self.console.print("[bold cyan]Stage Timings[/bold cyan]")
+
+        table = Table(show_header=True, show_lines=False, padding=(0, 1))
+        table.add_column("Stage", width=16)
+        table.add_column("Time", justify="right", width=7)
+        table.add_column("Tokens", justify="right", width=9)
+        table.add_column("RSS Δ", justify="right", width=9)
+        table.add_column("Procs", justify="right", width=5)
+
+        for span in stages:
+            name = span.name if span.status == "ok" else f"[red]{span.name}[/red]"
+            table.add_row(
+                name,
+                _format_duration(span.duration_ms / 1000),
+                f"{span.tokens:,}" if span.tokens else "[dim]-[/dim]",
+                f"{span.rss_delta_mb:+.0f} MB",
+                str(span.subprocesses),
+            )
+
+        self.console.print(table)
+
+        totals = tracer.totals()
+        llm = totals.get(SPAN_LLM)
+        agents = totals.get(SPAN_AGENT)
+        parts = []
+        if agents:
+            parts.append(f"{int(agents['count'])} agent run(s)")
+        if llm:
+            parts.append(f"{int(llm['count'])} LLM call(s), {int(llm['tokens']):,} tokens")
+        if parts:
+            self.console.print(f"  [dim]{', '.join(parts)}[/dim]")
+
 
 # Singleton instance for easy import
 reporter = CLIReporter()
@@ -13,7 +13,7 @@ import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, TypedDict, Unpack
+from typing import TYPE_CHECKING, Any, TypedDict, Unpack
 
 import click
 import yaml
@@ -25,7 +25,7 @@ from nit import __version__
 from nit.adapters.base import CaseStatus, RunResult, TestFrameworkAdapter
 from nit.adapters.registry import get_registry
 from nit.agents.analyzers.diff import DiffAnalysisResult, DiffAnalysisTask, DiffAnalyzer
-from nit.agents.base import TaskStatus
+from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
 from nit.agents.builders.docs import DocBuilder, DocBuildTask
 from nit.agents.builders.readme import ReadmeUpdater
 from nit.agents.detectors.dependency import DependencyProfile, detect_dependencies
@@ -36,7 +36,7 @@ from nit.agents.detectors.stack import detect_languages
 from nit.agents.detectors.workspace import detect_workspace
 from nit.agents.pipelines import PickPipeline, PickPipelineConfig, PickPipelineResult
 from nit.agents.reporters.terminal import reporter
-from nit.config import load_config, validate_config
+from nit.config import ExecutionConfig, load_config, validate_config
 from nit.llm.config import LLMConfig, load_llm_config
 from nit.llm.engine import LLMAuthError, LLMConnectionError, LLMEngine, LLMError
 from nit.llm.factory import create_engine
@@ -55,6 +55,12 @@ from nit.utils.platform_client import (
 )
 from nit.utils.readme import find_readme
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from nit.agents.builders.unit import BuildTask
+    from nit.memory.prompt_sync import PromptSyncer
+
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -258,6 +264,8 @@ def _build_pick_report_payload(
         full_report["bugsFound"] = len(result.bugs_found)
         full_report["fixesApplied"] = len(result.fixes_applied)
         full_report["errors"] = result.errors
+        if result.trace is not None:
+            full_report["trace"] = result.trace.summary()
 
     # Detect CI context (supports GitHub Actions, GitLab, CircleCI, etc.)
     ci_context = detect_ci_context()
@@ -445,7 +453,7 @@ def _try_pull_memory(config_obj: Any, project_root: Path, ci_mode: bool) -> None
         return
 
     try:
-        from nit.memory.sync import apply_pull_response, get_sync_version, set_sync_version
+        from nit.memory.sync import apply_pull_response, get_sync_version
         from nit.utils.platform_client import pull_platform_memory
 
         platform = PlatformRuntimeConfig(
@@ -455,19 +463,74 @@ def _try_pull_memory(config_obj: Any, project_root: Path, ci_mode: bool) -> None
             project_id=config_obj.platform.project_id,
             key_hash=config_obj.platform.key_hash,
         )
-        response = pull_platform_memory(platform, config_obj.platform.project_id)
-        remote_version = response.get("version", 0)
         local_version = get_sync_version(project_root)
+        response = pull_platform_memory(
+            platform, config_obj.platform.project_id, since_version=local_version
+        )
+        remote_version = response.get("version", 0)
 
         if isinstance(remote_version, int) and remote_version > local_version:
             apply_pull_response(project_root, response)
-            set_sync_version(project_root, remote_version)
             if not ci_mode:
                 reporter.print_info(f"Pulled memory from platform (version {remote_version})")
     except Exception as exc:
         logger.warning("Memory pull from platform skipped: %s", exc)
 
 
+def _start_prompt_sync(
+    config_obj: Any,
+    project_root: Path,
+) -> tuple[PromptSyncer, Future[int]] | None:
+    """Start uploading new prompt records in the background after a run.
+
+    No-op unless the platform is configured and ``prompts.sync_to_platform``
+    is enabled.
+    """
+    if config_obj.platform.normalized_mode != "byok" or not config_obj.prompts.sync_to_platform:
+        return None
+
+    try:
+        from nit.memory.prompt_store import get_prompt_recorder
+        from nit.memory.prompt_sync import PromptSyncer
+
+        platform = PlatformRuntimeConfig(
+            url=config_obj.platform.url,
+            api_key=config_obj.platform.api_key,
+            mode=config_obj.platform.mode,
+        )
+        syncer = PromptSyncer(
+            get_prompt_recorder(project_root),
+            platform,
+            redact_source=config_obj.prompts.redact_source,
+            batch_size=config_obj.prompts.sync_batch_size,
+        )
+        return syncer, syncer.start()
+    except Exception as exc:
+        logger.warning("Prompt sync to platform failed to start: %s", exc)
+        return None
+
+
+def _finish_prompt_sync(
+    pending: tuple[PromptSyncer, Future[int]] | None,
+    ci_mode: bool,
+) -> None:
+    """Wait for a background prompt sync started by ``_start_prompt_sync``."""
+    if pending is None:
+        return
+
+    syncer, future = pending
+    try:
+        synced = future.result()
+    except Exception as exc:
+        logger.warning("Prompt sync to platform failed: %s", exc)
+        return
+    finally:
+        syncer.close()
+
+    if synced and not ci_mode:
+        reporter.print_info(f"Synced {synced} prompt record(s) to platform")
+
+
 def _try_push_memory(
     config_obj: Any,
     project_root: Path,
@@ -480,7 +543,7 @@ def _try_push_memory(
         return
 
     try:
-        from nit.memory.sync import build_push_payload, set_sync_version
+        from nit.memory.sync import acknowledge_push, plan_push
         from nit.utils.platform_client import push_platform_memory
 
         platform = PlatformRuntimeConfig(
@@ -490,16 +553,21 @@ def _try_push_memory(
             project_id=config_obj.platform.project_id,
             key_hash=config_obj.platform.key_hash,
         )
-        payload = build_push_payload(
+        push = plan_push(
             project_root,
             source=source,
             project_id=config_obj.platform.project_id,
         )
-        result = push_platform_memory(platform, payload)
+        if push.empty:
+            logger.debug("Memory unchanged since last sync; skipping push")
+            return
+        result = push_platform_memory(platform, push.payload, compress=push.compress)
 
         new_version = result.get("version")
         if isinstance(new_version, int) and new_version > 0:
-            set_sync_version(project_root, new_version)
+            acknowledge_push(
+                project_root, push, new_version, capabilities=result.get("capabilities")
+            )
             if not ci_mode:
                 reporter.print_info(f"Synced memory to platform (version {new_version})")
     except Exception as exc:
@@ -2653,6 +2721,8 @@ def generate(
             target_file=target_file,
             coverage_target=coverage_target,
             ci_mode=ci_mode,
+            concurrency=config.execution.generation_concurrency,
+            batch_size=config.execution.generation_batch_size,
         )
     )
 
@@ -2662,12 +2732,17 @@ async def _run_generate(**kwargs: Any) -> None:
 
     Analyzes coverage gaps and generates tests using UnitBuilder,
     E2EBuilder, IntegrationBuilder, and specialized builder agents.
+    Up to ``concurrency`` files are generated at once, most urgent gaps
+    first, and each file is reported as soon as it is written.  Small
+    unit-test targets in the same package are batched up to ``batch_size``
+    files per LLM request.
     """
     from nit.agents.analyzers.coverage import CoverageAnalysisTask, CoverageAnalyzer
     from nit.agents.builders.e2e import E2EBuilder, E2ETask
     from nit.agents.builders.infra import BootstrapTask, InfraBuilder
     from nit.agents.builders.integration import IntegrationBuilder, IntegrationBuildTask
-    from nit.agents.builders.unit import BuildTask, UnitBuilder
+    from nit.agents.builders.unit import BatchBuildTask, UnitBuilder
+    from nit.orchestrator import Orchestrator
 
     path: str = kwargs["path"]
     profile: ProjectProfile = kwargs["profile"]
@@ -2675,6 +2750,8 @@ async def _run_generate(**kwargs: Any) -> None:
     target_file: str | None = kwargs.get("target_file")
     coverage_target: int | None = kwargs.get("coverage_target")
     ci_mode: bool = kwargs.get("ci_mode", False)
+    concurrency: int = kwargs.get("concurrency", ExecutionConfig().generation_concurrency)
+    batch_size: int = kwargs.get("batch_size", ExecutionConfig().generation_batch_size)
 
     project_root = Path(path).resolve()
 
@@ -2753,8 +2830,6 @@ async def _run_generate(**kwargs: Any) -> None:
         return
 
     # Generate tests
-    generated_files: list[str] = []
-    failed_count = 0
     unit_builder = UnitBuilder(engine, project_root, enable_memory=True)
 
     integration_builder: IntegrationBuilder | None = None
@@ -2774,12 +2849,20 @@ async def _run_generate(**kwargs: Any) -> None:
         output_path = _determine_test_output_path(task.source_file, primary_adapter, project_root)
         task.output_file = str(output_path)
 
+    build_tasks = _coalesce_build_tasks(build_tasks)
+
+    jobs: list[tuple[BaseAgent, TaskInput]] = []
+    # Build tasks covered by each job, keyed by the job's task
+    build_tasks_for: dict[int, list[BuildTask]] = {}
+    unit_tasks: list[BuildTask] = []
+    for task in build_tasks:
         if test_type == "e2e" and e2e_builder:
             e2e_task = E2ETask(
                 handler_file=task.source_file,
                 output_file=task.output_file,
             )
-            result = await e2e_builder.run(e2e_task)
+            jobs.append((e2e_builder, e2e_task))
+            build_tasks_for[id(e2e_task)] = [task]
         elif test_type == "integration" and integration_builder:
             # Run integration builder
             int_task = IntegrationBuildTask(
@@ -2787,12 +2870,24 @@ async def _run_generate(**kwargs: Any) -> None:
                 framework=task.framework,
                 output_file=task.output_file,
             )
-            result = await integration_builder.run(int_task)
-        elif test_type in ("unit", "all"):
-            result = await unit_builder.run(task)
+            jobs.append((integration_builder, int_task))
+            build_tasks_for[id(int_task)] = [task]
         else:
-            result = await unit_builder.run(task)
+            unit_tasks.append(task)
+
+    # Small files in one package share a single LLM request
+    for unit_job in unit_builder.plan_tasks(unit_tasks, max_files=batch_size):
+        jobs.append((unit_builder, unit_job))
+        build_tasks_for[id(unit_job)] = (
+            unit_job.tasks if isinstance(unit_job, BatchBuildTask) else [unit_job]
+        )
 
+    # Report each file as soon as its builder finishes rather than after the batch
+    generated_files: list[str] = []
+    failed_count = 0
+
+    def _report(task: BuildTask, result: TaskOutput) -> None:
+        nonlocal failed_count
         if result.status == TaskStatus.COMPLETED:
             test_code = result.result.get("test_code", "")
             if test_code:
@@ -2810,6 +2905,27 @@ async def _run_generate(**kwargs: Any) -> None:
                     f"Failed to generate test for {task.source_file}: {errors[0]}"
                 )
 
+    def _on_result(job_task: TaskInput, result: TaskOutput) -> None:
+        tasks = build_tasks_for[id(job_task)]
+        outputs = result.result.get("outputs")
+        if isinstance(job_task, BatchBuildTask) and outputs is not None:
+            for task, output in zip(tasks, outputs, strict=True):
+                _report(task, output)
+        else:
+            for task in tasks:
+                _report(task, result)
+
+    # LLM calls from concurrent builders share the engine and its rate limiter
+    orchestrator = Orchestrator(max_concurrency=max(1, min(concurrency, len(jobs))))
+    await orchestrator.run_all(
+        jobs,
+        priorities=[
+            min(_generation_priority(task) for task in build_tasks_for[id(job_task)])
+            for _, job_task in jobs
+        ],
+        on_result=_on_result,
+    )
+
     # Summary
     console.print()
     reporter.print_info(f"Generated {len(generated_files)} test file(s), {failed_count} failed")
@@ -2817,6 +2933,32 @@ async def _run_generate(**kwargs: Any) -> None:
         console.print(f"  [green]✓[/green] {f}")
 
 
+def _generation_priority(task: BuildTask) -> int:
+    """Rank a build task by the priority of the gap it covers (lower runs first)."""
+    from nit.agents.analyzers.coverage import GAP_PRIORITY_ORDER, GapPriority
+
+    try:
+        priority = GapPriority(task.context.get("priority", ""))
+    except ValueError:
+        return len(GAP_PRIORITY_ORDER)
+    return GAP_PRIORITY_ORDER[priority]
+
+
+def _coalesce_build_tasks(build_tasks: list[BuildTask]) -> list[BuildTask]:
+    """Keep one build task per output file.
+
+    Every gap in a source file maps to the same test file, so generating
+    each gap separately would only overwrite the file.  The task for the
+    most urgent gap stands in for the others.
+    """
+    by_output: dict[str, BuildTask] = {}
+    for task in build_tasks:
+        current = by_output.get(task.output_file)
+        if current is None or _generation_priority(task) < _generation_priority(current):
+            by_output[task.output_file] = task
+    return list(by_output.values())
+
+
 def _run_specialized_generate(test_type: str, project_root: Path, ci_mode: bool) -> None:
     """Run a specialized builder to generate a test plan for a specific test type."""
     builder_map: dict[str, tuple[str, str]] = {
@@ -3245,6 +3387,11 @@ def _display_pick_results(result: PickPipelineResult, fix_enabled: bool) -> None
             console.print("[dim]No fixes applied[/dim]")
             console.print()
 
+    # Per-stage timings, tokens and memory
+    if result.trace is not None and result.trace.stage_spans():
+        reporter.print_trace_summary(result.trace)
+        console.print()
+
     # PR result
     if result.pr_created and result.pr_url:
         console.print(f"[bold]Pull Request:[/bold] {result.pr_url}")
@@ -3425,6 +3572,19 @@ def _pick_result_to_extra(result: PickPipelineResult) -> dict[str, Any]:
     default=False,
     help="Skip memory sync with platform.",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Reuse stage outputs checkpointed by an earlier run on the same tree and config.",
+)
+@click.option(
+    "--trace-file",
+    "trace_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write per-stage timing spans to this file (Chrome trace format).",
+)
 def pick(**kwargs: Any) -> None:
     """Full pipeline: scan → run → analyze bugs → debug → report
 
@@ -3565,6 +3725,8 @@ def pick(**kwargs: Any) -> None:
         ci_mode=ci_mode,
         max_fix_loops=max_loops,
         token_budget=token_budget,
+        resume=kwargs.get("resume", False),
+        trace_file=kwargs.get("trace_file"),
     )
 
     # Track execution time
@@ -3573,62 +3735,68 @@ def pick(**kwargs: Any) -> None:
         _run_pick_pipeline_with_result(pipeline_config, output_format=output_format)
     )
 
-    if upload_report:
-        pick_options = _PickOptions(
-            test_type=test_type,
-            target_file=target_file,
-            coverage_target=coverage_target,
-            fix=fix,
-        )
-        report_payload = _build_pick_report_payload(
-            config,
-            pick_options,
-            result=result,
-            start_time=start_time,
-        )
-        try:
-            upload_result = _upload_pick_report(config, report_payload)
-        except PlatformClientError as exc:
-            reporter.print_error(str(exc))
-            raise click.Abort from exc
-
-        report_id = upload_result.get("reportId")
-        if isinstance(report_id, str) and report_id:
-            reporter.print_success(f"Uploaded pick report: {report_id}")
-        else:
-            reporter.print_success("Uploaded pick report.")
-
-        # Upload bugs to platform (if bugs were found and issues/PRs were created)
-        if result.bugs_found and upload_report:
+    # Prompt sync runs in the background while reports and memory upload
+    prompt_sync = _start_prompt_sync(config, Path(path).resolve()) if sync_enabled else None
+    try:
+        if upload_report:
+            pick_options = _PickOptions(
+                test_type=test_type,
+                target_file=target_file,
+                coverage_target=coverage_target,
+                fix=fix,
+            )
+            report_payload = _build_pick_report_payload(
+                config,
+                pick_options,
+                result=result,
+                start_time=start_time,
+            )
             try:
-                # Build mappings of bug titles to GitHub URLs
-                issue_map: dict[str, str] = {}
-                pr_map: dict[str, str] = {}
-
-                # Map issues (assumes same order as bugs_found)
-                for i, bug in enumerate(result.bugs_found):
-                    if i < len(result.created_issues):
-                        issue_map[bug.title] = result.created_issues[i]
-                    if i < len(result.created_fix_prs):
-                        pr_map[bug.title] = result.created_fix_prs[i]
-
-                bug_ids = _upload_bugs_to_platform(config, result, issue_map, pr_map)
-                if bug_ids and not ci_mode:
-                    reporter.print_success(f"Uploaded {len(bug_ids)} bugs to platform")
+                upload_result = _upload_pick_report(config, report_payload)
             except PlatformClientError as exc:
-                logger.warning("Failed to upload bugs to platform: %s", exc)
-                # Don't abort here, bugs upload is supplementary
-            except Exception as exc:
-                logger.warning("Unexpected error uploading bugs: %s", exc)
+                reporter.print_error(str(exc))
+                raise click.Abort from exc
 
-    # Memory sync: push to platform after report upload (non-fatal)
-    if sync_enabled:
-        _try_push_memory(
-            config,
-            Path(path).resolve(),
-            ci_mode,
-            source="ci" if ci_mode else "local",
-        )
+            report_id = upload_result.get("reportId")
+            if isinstance(report_id, str) and report_id:
+                reporter.print_success(f"Uploaded pick report: {report_id}")
+            else:
+                reporter.print_success("Uploaded pick report.")
+
+            # Upload bugs to platform (if bugs were found and issues/PRs were created)
+            if result.bugs_found and upload_report:
+                try:
+                    # Build mappings of bug titles to GitHub URLs
+                    issue_map: dict[str, str] = {}
+                    pr_map: dict[str, str] = {}
+
+                    # Map issues (assumes same order as bugs_found)
+                    for i, bug in enumerate(result.bugs_found):
+                        if i < len(result.created_issues):
+                            issue_map[bug.title] = result.created_issues[i]
+                        if i < len(result.created_fix_prs):
+                            pr_map[bug.title] = result.created_fix_prs[i]
+
+                    bug_ids = _upload_bugs_to_platform(config, result, issue_map, pr_map)
+                    if bug_ids and not ci_mode:
+                        reporter.print_success(f"Uploaded {len(bug_ids)} bugs to platform")
+                except PlatformClientError as exc:
+                    logger.warning("Failed to upload bugs to platform: %s", exc)
+                    # Don't abort here, bugs upload is supplementary
+                except Exception as exc:
+                    logger.warning("Unexpected error uploading bugs: %s", exc)
+
+        # Memory sync: push to platform after report upload (non-fatal)
+        if sync_enabled:
+            _try_push_memory(
+                config,
+                Path(path).resolve(),
+                ci_mode,
+                source="ci" if ci_mode else "local",
+            )
+    finally:
+        # Also joins the sync thread when an upload aborts the command
+        _finish_prompt_sync(prompt_sync, ci_mode)
 
     # Send Slack notification for bugs found
     if result.bugs_found:
@@ -5378,7 +5546,7 @@ def memory_pull(path: str) -> None:
         )
         raise SystemExit(1)
 
-    from nit.memory.sync import apply_pull_response, get_sync_version, set_sync_version
+    from nit.memory.sync import apply_pull_response, get_sync_version
     from nit.utils.platform_client import PlatformRuntimeConfig, pull_platform_memory
 
     platform = PlatformRuntimeConfig(
@@ -5390,9 +5558,15 @@ def memory_pull(path: str) -> None:
     )
 
     reporter.print_info("Pulling memory from platform...")
-    response = pull_platform_memory(platform, config.platform.project_id)
-    remote_version = response.get("version", 0)
     local_version = get_sync_version(root)
+    response = pull_platform_memory(
+        platform, config.platform.project_id, since_version=local_version
+    )
+    remote_version = response.get("version", 0)
+
+    if not response and local_version > 0:
+        reporter.print_info(f"Local memory is up to date (version {local_version}).")
+        return
 
     if not isinstance(remote_version, int) or remote_version <= 0:
         reporter.print_info("No memory on platform yet.")
@@ -5403,7 +5577,6 @@ def memory_pull(path: str) -> None:
         return
 
     apply_pull_response(root, response)
-    set_sync_version(root, remote_version)
     reporter.print_success(f"Pulled memory from platform (version {remote_version}).")
 
 
@@ -5414,15 +5587,23 @@ def memory_pull(path: str) -> None:
     type=click.Path(exists=True, file_okay=False, resolve_path=True),
     help="Project root directory.",
 )
-def memory_push(path: str) -> None:
+@click.option(
+    "--full",
+    is_flag=True,
+    default=False,
+    help="Send all local memory instead of only changes since the last sync.",
+)
+def memory_push(path: str, full: bool) -> None:
     """Push local memory to platform for merging.
 
     Uploads local memory to the platform where it is merged with
     existing memory from other sources (CI, other developers).
-    Requires platform configuration.
+    Only sections changed since the last acknowledged sync are sent
+    unless --full is given. Requires platform configuration.
 
     Examples:
         nit memory push
+        nit memory push --full
     """
     from pathlib import Path
 
@@ -5435,7 +5616,7 @@ def memory_push(path: str) -> None:
         )
         raise SystemExit(1)
 
-    from nit.memory.sync import build_push_payload, set_sync_version
+    from nit.memory.sync import acknowledge_push, plan_push
     from nit.utils.platform_client import PlatformRuntimeConfig, push_platform_memory
 
     platform = PlatformRuntimeConfig(
@@ -5446,17 +5627,22 @@ def memory_push(path: str) -> None:
         key_hash=config.platform.key_hash,
     )
 
-    reporter.print_info("Pushing memory to platform...")
-    payload = build_push_payload(
+    push = plan_push(
         root,
         source="local",
         project_id=config.platform.project_id,
+        full=full,
     )
-    result = push_platform_memory(platform, payload)
+    if push.empty:
+        reporter.print_info("Local memory is unchanged since the last sync.")
+        return
+
+    reporter.print_info("Pushing memory to platform...")
+    result = push_platform_memory(platform, push.payload, compress=push.compress)
 
     new_version = result.get("version")
     if isinstance(new_version, int) and new_version > 0:
-        set_sync_version(root, new_version)
+        acknowledge_push(root, push, new_version, capabilities=result.get("capabilities"))
         merged = result.get("merged", False)
         status = "merged with existing" if merged else "uploaded"
         reporter.print_success(f"Memory {status} (version {new_version}).")
@@ -6143,7 +6329,7 @@ def prompts_analytics(path: str, days: int, *, as_json: bool) -> None:
     type=click.Path(exists=True, file_okay=False, resolve_path=True),
     help="Project root directory.",
 )
-@click.option("--limit", default=0, type=int, help="Maximum records to sync (0=default batch).")
+@click.option("--limit", default=0, type=int, help="Maximum records to sync (0=all pending).")
 @click.option(
     "--redact/--no-redact",
     default=False,
@@ -6188,9 +6374,13 @@ def prompts_sync(path: str, limit: int, *, redact: bool) -> None:
         recorder,
         platform_config,
         redact_source=redact,
+        batch_size=config.prompts.sync_batch_size,
     )
 
-    synced = syncer.sync(limit=limit)
+    try:
+        synced = syncer.sync(limit=limit)
+    finally:
+        syncer.close()
     if synced:
         reporter.print_success(f"Synced {synced} prompt record(s) to platform")
     else:
@@ -198,6 +198,9 @@ class CoverageConfig:
     undertested_threshold: float = 50.0
     """Coverage % below which functions are considered undertested (default: 50%)."""
 
+    bounded_memory: bool = False
+    """Stream existing coverage reports file by file during gap analysis (default: off)."""
+
 
 @dataclass
 class PlatformConfig:
@@ -334,6 +337,9 @@ class SecurityConfig:
     llm_validation: bool = True
     """Use LLM to validate heuristic findings and reduce false positives."""
 
+    batch_validation: bool = True
+    """Validate the findings of one file with a single LLM request."""
+
     confidence_threshold: float = 0.7
     """Minimum confidence (0.0-1.0) to report a security finding."""
 
@@ -360,6 +366,9 @@ class PromptsConfig:
     redact_source: bool = False
     """Hash message content instead of storing full text (for privacy)."""
 
+    sync_batch_size: int = 50
+    """Number of prompt records uploaded per platform request."""
+
 
 @dataclass
 class PipelineConfig:
@@ -379,6 +388,15 @@ class ExecutionConfig:
     min_files_for_sharding: int = 8
     """Minimum test files required to enable automatic sharding."""
 
+    generation_concurrency: int = 4
+    """Maximum number of files ``nit generate`` works on at the same time."""
+
+    generation_batch_size: int = 4
+    """Maximum small source files combined into one LLM request (1 disables batching)."""
+
+    analysis_concurrency: int = 4
+    """Maximum number of functions ``nit pick`` analyzes for semantic gaps at the same time."""
+
 
 @dataclass
 class DocsConfig:
@@ -533,6 +551,7 @@ def _parse_coverage_config(raw: dict[str, Any]) -> CoverageConfig:
         function_threshold=float(coverage_raw.get("function_threshold", 85.0)),
         complexity_threshold=int(coverage_raw.get("complexity_threshold", 10)),
         undertested_threshold=float(coverage_raw.get("undertested_threshold", 50.0)),
+        bounded_memory=bool(coverage_raw.get("bounded_memory", False)),
     )
 
 
@@ -577,6 +596,9 @@ def _parse_execution_config(raw: dict[str, Any]) -> ExecutionConfig:
     return ExecutionConfig(
         parallel_shards=int(exec_raw.get("parallel_shards", 4)),
         min_files_for_sharding=int(exec_raw.get("min_files_for_sharding", 8)),
+        generation_concurrency=int(exec_raw.get("generation_concurrency", 4)),
+        generation_batch_size=int(exec_raw.get("generation_batch_size", 4)),
+        analysis_concurrency=int(exec_raw.get("analysis_concurrency", 4)),
     )
 
 
@@ -626,6 +648,7 @@ def _parse_security_config(raw: dict[str, Any]) -> SecurityConfig:
     return SecurityConfig(
         enabled=bool(security_raw.get("enabled", True)),
         llm_validation=bool(security_raw.get("llm_validation", True)),
+        batch_validation=bool(security_raw.get("batch_validation", True)),
         confidence_threshold=float(security_raw.get("confidence_threshold", 0.7)),
         severity_threshold=str(security_raw.get("severity_threshold", "medium")),
         exclude_patterns=exclude_patterns,
@@ -659,6 +682,7 @@ def _parse_prompts_config(raw: dict[str, Any]) -> PromptsConfig:
         sync_to_platform=bool(prompts_raw.get("sync_to_platform", False)),
         max_history_days=int(prompts_raw.get("max_history_days", 90)),
         redact_source=bool(prompts_raw.get("redact_source", False)),
+        sync_batch_size=int(prompts_raw.get("sync_batch_size", 50)),
     )
 
 
@@ -975,6 +999,43 @@ def _validate_pipeline_config(pipeline: PipelineConfig) -> list[str]:
     return errors
 
 
+def _validate_execution_config(execution: ExecutionConfig) -> list[str]:
+    """Validate test execution settings."""
+    errors: list[str] = []
+
+    if execution.generation_concurrency < 1:
+        errors.append(
+            f"execution.generation_concurrency must be at least 1 "
+            f"(got: {execution.generation_concurrency})"
+        )
+
+    if execution.generation_batch_size < 1:
+        errors.append(
+            f"execution.generation_batch_size must be at least 1 "
+            f"(got: {execution.generation_batch_size})"
+        )
+
+    if execution.analysis_concurrency < 1:
+        errors.append(
+            f"execution.analysis_concurrency must be at least 1 "
+            f"(got: {execution.analysis_concurrency})"
+        )
+
+    return errors
+
+
+def _validate_prompts_config(prompts: PromptsConfig) -> list[str]:
+    """Validate prompt tracking settings."""
+    errors: list[str] = []
+
+    if prompts.sync_batch_size < 1:
+        errors.append(
+            f"prompts.sync_batch_size must be at least 1 (got: {prompts.sync_batch_size})"
+        )
+
+    return errors
+
+
 def _validate_sentry_config(sentry: SentryConfig) -> list[str]:
     """Validate Sentry configuration."""
     errors: list[str] = []
@@ -1032,6 +1093,8 @@ def validate_config(config: NitConfig) -> list[str]:
     errors.extend(_validate_platform_config(config.platform))
     errors.extend(_validate_coverage_config(config.coverage))
     errors.extend(_validate_pipeline_config(config.pipeline))
+    errors.extend(_validate_execution_config(config.execution))
+    errors.extend(_validate_prompts_config(config.prompts))
     errors.extend(_validate_sentry_config(config.sentry))
     errors.extend(_validate_security_config(config.security))
 
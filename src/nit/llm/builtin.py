@@ -6,7 +6,7 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import litellm
 from litellm.exceptions import (
@@ -32,6 +32,7 @@ from nit.llm.engine import (
     LLMRateLimitError,
     LLMResponse,
 )
+from nit.llm.tokenizer import get_tokenizer
 from nit.llm.usage_callback import (
     MetadataParams,
     build_litellm_metadata,
@@ -39,6 +40,9 @@ from nit.llm.usage_callback import (
 )
 from nit.utils.cache import MemoryCache, content_hash
 
+if TYPE_CHECKING:
+    from nit.llm.tokenizer import Tokenizer
+
 logger = logging.getLogger(__name__)
 
 # Suppress litellm's noisy default logging
@@ -235,14 +239,13 @@ class BuiltinLLM(LLMEngine):
 
     # ── Token counting ────────────────────────────────────────────
 
+    @property
+    def tokenizer(self) -> Tokenizer:
+        return get_tokenizer(self._model)
+
     def count_tokens(self, text: str) -> int:
-        """Estimate the token count for *text* using LiteLLM's tokeniser."""
-        try:
-            count: int = litellm.token_counter(model=self._model, text=text)
-            return count
-        except Exception:
-            # Rough fallback: ~4 chars per token
-            return max(1, len(text) // 4)
+        """Count the tokens in *text* with the model's local tokenizer."""
+        return self.tokenizer.count(text)
 
     # ── Internal helpers ──────────────────────────────────────────
 
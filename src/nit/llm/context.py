@@ -7,12 +7,16 @@ into a structured context suitable for LLM prompts.
 
 from __future__ import annotations
 
+import asyncio
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from nit.llm.tokenizer import TRUNCATION_MARKER
 from nit.parsing.languages import extract_from_file
+from nit.parsing.symbol_index import load_symbol_index
 from nit.parsing.treesitter import (
     ClassInfo,
     FunctionInfo,
@@ -25,7 +29,9 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from nit.config import AuthConfig
+    from nit.llm.tokenizer import Tokenizer
     from nit.models.route import RouteInfo
+    from nit.parsing.symbol_index import SymbolIndex
 
 # ── Constants ────────────────────────────────────────────────────
 
@@ -139,6 +145,173 @@ class AssembledContext:
         return [_format_class_sig(c) for c in self.parse_result.classes]
 
 
+# ── Assembly cache ───────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class _Listing:
+    """Names of the regular files and sub-directories of one directory."""
+
+    files: frozenset[str]
+    dirs: frozenset[str]
+
+
+_EMPTY_LISTING = _Listing(frozenset(), frozenset())
+
+# Path names that never appear in a directory listing
+_SPECIAL_NAMES = frozenset({"", ".", ".."})
+
+
+class AssemblyCache:
+    """In-memory lookups shared by repeated ``ContextAssembler.assemble`` calls.
+
+    Generating tests for many files in one package resolves the same
+    imports, probes the same test directories and reads the same related
+    files over and over.  This cache holds, for the lifetime of one run:
+
+    - directory listings, so existence probes become set lookups;
+    - resolved imports, keyed by importing directory and module;
+    - related-file snippets, keyed by path and revalidated by mtime;
+    - test files found per source and per language, and the test patterns
+      extracted from each set of test files.
+
+    Directory listings are snapshots: files created after a directory was
+    first listed are not seen until ``clear()`` is called.
+
+    Args:
+        symbols: Symbol index of the project being assembled.  When it
+            covers a source file, that file's imports are taken from the
+            index (for every language) instead of being resolved on disk.
+        project_root: Load the symbol index of this project (see
+            ``load_symbol_index``) the first time it is needed, and
+            refresh it on ``clear()``.  Ignored when *symbols* is given.
+            Async callers should ``await load_symbols()`` first so the
+            project is not indexed on the event loop.
+    """
+
+    def __init__(
+        self, symbols: SymbolIndex | None = None, *, project_root: Path | None = None
+    ) -> None:
+        self._symbols = symbols
+        self._symbol_root = project_root if symbols is None else None
+        self._symbols_lock = asyncio.Lock()
+        self._listings: dict[Path, _Listing] = {}
+        self._imports: dict[tuple[str, Path, str], Path | None] = {}
+        self._snippets: dict[Path, tuple[int, str]] = {}
+        self._test_files: dict[tuple[Path, str], list[Path]] = {}
+        self._any_test_files: dict[tuple[Path, str], list[Path]] = {}
+        self._patterns: dict[tuple[str, tuple[Path, ...]], DetectedTestPattern] = {}
+
+    @property
+    def symbols(self) -> SymbolIndex | None:
+        """Symbol index of the project, loaded on first use when configured."""
+        if self._symbols is None and self._symbol_root is not None:
+            self._symbols = load_symbol_index(self._symbol_root)
+        return self._symbols
+
+    async def load_symbols(self) -> None:
+        """Load the configured symbol index on a worker thread.
+
+        Concurrent callers wait for a single load; nothing happens when
+        the index is already loaded or no project root was configured.
+        """
+        if self._symbols is not None or self._symbol_root is None:
+            return
+        async with self._symbols_lock:
+            if self._symbols is None:
+                self._symbols = await asyncio.to_thread(load_symbol_index, self._symbol_root)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        if self._symbol_root is not None:
+            self._symbols = None
+        self._listings.clear()
+        self._imports.clear()
+        self._snippets.clear()
+        self._test_files.clear()
+        self._any_test_files.clear()
+        self._patterns.clear()
+
+    def is_file(self, path: Path) -> bool:
+        """Whether *path* is a regular file (symlinks followed)."""
+        if path.name in _SPECIAL_NAMES:
+            return path.is_file()
+        return path.name in self._listing(path.parent).files
+
+    def is_dir(self, path: Path) -> bool:
+        """Whether *path* is a directory (symlinks followed)."""
+        if path.name in _SPECIAL_NAMES:
+            return path.is_dir()
+        return path.name in self._listing(path.parent).dirs
+
+    def resolve_import(
+        self, key: tuple[str, Path, str], resolve: Callable[[], Path | None]
+    ) -> Path | None:
+        """Return the cached resolution for *key*, calling *resolve* on a miss."""
+        if key not in self._imports:
+            self._imports[key] = resolve()
+        return self._imports[key]
+
+    def test_files_for(self, source: Path, root: Path, language: str) -> list[Path]:
+        """``_find_test_files_for`` memoised per source and language."""
+        key = (source, language)
+        if key not in self._test_files:
+            self._test_files[key] = _find_test_files_for(source, root, language, cache=self)
+        return self._test_files[key]
+
+    def any_test_files(self, root: Path, language: str) -> list[Path]:
+        """``_find_any_test_files`` memoised per project root and language."""
+        key = (root, language)
+        if key not in self._any_test_files:
+            self._any_test_files[key] = _find_any_test_files(root, language, limit=5)
+        return self._any_test_files[key]
+
+    def test_patterns(self, test_files: list[Path], language: str) -> DetectedTestPattern:
+        """``extract_test_patterns`` memoised per set of test files."""
+        key = (language, tuple(test_files))
+        if key not in self._patterns:
+            self._patterns[key] = extract_test_patterns(test_files, language)
+        return self._patterns[key]
+
+    def read_snippet(self, path: Path) -> str:
+        """``_read_snippet`` for *path*, re-read only when its mtime changes."""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return ""
+        cached = self._snippets.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        snippet = _read_snippet(path)
+        self._snippets[path] = (mtime, snippet)
+        return snippet
+
+    def _listing(self, directory: Path) -> _Listing:
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = _list_directory(directory)
+            self._listings[directory] = listing
+        return listing
+
+
+def _list_directory(directory: Path) -> _Listing:
+    files: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        files.add(entry.name)
+                    elif entry.is_dir():
+                        dirs.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        return _EMPTY_LISTING
+    return _Listing(frozenset(files), frozenset(dirs))
+
+
 # ── ContextAssembler ─────────────────────────────────────────────
 
 
@@ -159,10 +332,20 @@ class ContextAssembler:
         *,
         max_context_tokens: int = DEFAULT_MAX_CONTEXT_TOKENS,
         token_counter: Callable[[str], int] | None = None,
+        tokenizer: Tokenizer | None = None,
+        cache: AssemblyCache | None = None,
     ) -> None:
         self._root = root
         self._max_tokens = max_context_tokens
-        self._count_tokens = token_counter or _default_token_count
+        self._tokenizer = tokenizer
+        self._count_tokens: Callable[[str], int] = (
+            tokenizer.count if tokenizer is not None else token_counter or _default_token_count
+        )
+        self._cache = cache if cache is not None else AssemblyCache()
+
+    async def load_symbols(self) -> None:
+        """Load the cache's symbol index off the event loop (see ``AssemblyCache``)."""
+        await self._cache.load_symbols()
 
     def assemble(self, source_path: Path) -> AssembledContext:
         """Assemble full context for *source_path*.
@@ -208,10 +391,9 @@ class ContextAssembler:
         related: list[RelatedFile] = []
 
         # 1. Resolve imports to real files
-        for imp in parse_result.imports:
-            resolved = self._resolve_import(source, imp, language)
-            if resolved is not None and resolved != source:
-                snippet = _read_snippet(resolved)
+        for resolved in self._imported_files(source, parse_result, language):
+            if resolved != source:
+                snippet = self._cache.read_snippet(resolved)
                 related.append(
                     RelatedFile(
                         path=str(resolved.relative_to(self._root)),
@@ -221,9 +403,9 @@ class ContextAssembler:
                 )
 
         # 2. Find existing test files for this source
-        test_files = _find_test_files_for(source, self._root, language)
+        test_files = self._cache.test_files_for(source, self._root, language)
         for tf in test_files:
-            snippet = _read_snippet(tf)
+            snippet = self._cache.read_snippet(tf)
             related.append(
                 RelatedFile(
                     path=str(tf.relative_to(self._root)),
@@ -234,6 +416,14 @@ class ContextAssembler:
 
         return related
 
+    def _imported_files(self, source: Path, parse_result: ParseResult, language: str) -> list[Path]:
+        """Project files imported by *source*, from the symbol index when it has them."""
+        symbols = self._cache.symbols
+        if symbols is not None and symbols.has_file(source):
+            return [self._root / path for path in symbols.dependencies(source)]
+        resolved = (self._resolve_import(source, imp, language) for imp in parse_result.imports)
+        return [path for path in resolved if path is not None]
+
     def _resolve_import(
         self,
         source: Path,
@@ -246,10 +436,16 @@ class ContextAssembler:
             return None
 
         if language == "python":
-            return self._resolve_python_import(source, module)
-        if language in {"javascript", "typescript", "tsx"}:
-            return self._resolve_js_import(source, module)
-        return None
+            resolver = self._resolve_python_import
+        elif language in {"javascript", "typescript", "tsx"}:
+            resolver = self._resolve_js_import
+        else:
+            return None
+
+        # Resolution depends only on the importing directory and the module
+        return self._cache.resolve_import(
+            (language, source.parent, module), lambda: resolver(source, module)
+        )
 
     def _resolve_python_import(self, source: Path, module: str) -> Path | None:
         """Resolve a Python dotted import to a file."""
@@ -259,18 +455,18 @@ class ContextAssembler:
             candidate = base / Path(*parts)
             # Check package (dir/__init__.py)
             init = candidate / "__init__.py"
-            if init.is_file():
+            if self._cache.is_file(init):
                 return init
             # Check module file
             py_file = candidate.with_suffix(".py")
-            if py_file.is_file():
+            if self._cache.is_file(py_file):
                 return py_file
 
         # Try relative to source file's parent
         parent = source.parent
         candidate = parent / Path(*parts)
         py_file = candidate.with_suffix(".py")
-        if py_file.is_file():
+        if self._cache.is_file(py_file):
             return py_file
 
         return None
@@ -284,20 +480,20 @@ class ContextAssembler:
         candidate = parent / module
 
         # Try direct file first
-        if candidate.is_file():
+        if self._cache.is_file(candidate):
             return candidate
 
         # Try with common extensions
         for ext in [".ts", ".tsx", ".js", ".jsx", ".mjs"]:
             with_ext = candidate.with_suffix(ext)
-            if with_ext.is_file():
+            if self._cache.is_file(with_ext):
                 return with_ext
 
         # Try index files in directory
-        if candidate.is_dir():
+        if self._cache.is_dir(candidate):
             for idx in ["index.ts", "index.tsx", "index.js", "index.jsx"]:
                 idx_path = candidate / idx
-                if idx_path.is_file():
+                if self._cache.is_file(idx_path):
                     return idx_path
 
         return None
@@ -310,15 +506,15 @@ class ContextAssembler:
         language: str,
     ) -> DetectedTestPattern | None:
         """Find existing test files and extract conventions from them."""
-        test_files = _find_test_files_for(source, self._root, language)
+        test_files = self._cache.test_files_for(source, self._root, language)
         if not test_files:
             # Fall back to scanning any test file in the project
-            test_files = _find_any_test_files(self._root, language, limit=5)
+            test_files = self._cache.any_test_files(self._root, language)
 
         if not test_files:
             return None
 
-        return extract_test_patterns(test_files, language)
+        return self._cache.test_patterns(test_files, language)
 
     # ── Context windowing ────────────────────────────────────────
 
@@ -340,9 +536,7 @@ class ContextAssembler:
                 # Partially include by truncating content
                 if budget > 0 and section.name == "source":
                     # Always include at least partial source
-                    ctx.source_code = _truncate_to_tokens(
-                        ctx.source_code, budget, self._count_tokens
-                    )
+                    ctx.source_code = self._truncate(ctx.source_code, budget)
                     budget = 0
                     kept_names.add(section.name)
                 break
@@ -361,6 +555,12 @@ class ContextAssembler:
 
         ctx.total_tokens = self._max_tokens - budget
 
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        """Truncate *text* to *max_tokens*, in one pass when a tokenizer is set."""
+        if self._tokenizer is not None:
+            return self._tokenizer.truncate(text, max_tokens)
+        return _truncate_to_tokens(text, max_tokens, self._count_tokens)
+
     def _build_sections(self, ctx: AssembledContext) -> list[ContextSection]:
         """Break an AssembledContext into prioritized sections for windowing."""
         sections: list[ContextSection] = []
@@ -589,8 +789,19 @@ def _extract_sample_test(content: str, language: str) -> str:
 # ── File discovery helpers ───────────────────────────────────────
 
 
-def _find_test_files_for(source: Path, root: Path, language: str) -> list[Path]:
-    """Find test files that likely correspond to *source*."""
+def _find_test_files_for(
+    source: Path,
+    root: Path,
+    language: str,
+    *,
+    cache: AssemblyCache | None = None,
+) -> list[Path]:
+    """Find test files that likely correspond to *source*.
+
+    With a *cache*, existence checks use its directory listings.
+    """
+    is_file: Callable[[Path], bool] = cache.is_file if cache is not None else Path.is_file
+    is_dir: Callable[[Path], bool] = cache.is_dir if cache is not None else Path.is_dir
     stem = source.stem
     patterns = _TEST_FILE_PATTERNS.get(language, [])
     results: list[Path] = []
@@ -601,18 +812,18 @@ def _find_test_files_for(source: Path, root: Path, language: str) -> list[Path]:
         # Replace wildcard with source stem
         specific = p.replace("*", stem)
         candidate = parent / specific
-        if candidate.is_file() and candidate != source:
+        if is_file(candidate) and candidate != source:
             results.append(candidate)
 
     # 2. Check common test directories relative to source
     for test_dir_name in ["tests", "test", "__tests__", "spec"]:
         # Sibling test directory
         test_dir = parent / test_dir_name
-        if test_dir.is_dir():
+        if is_dir(test_dir):
             for p in patterns:
                 specific = p.replace("*", stem)
                 candidate = test_dir / specific
-                if candidate.is_file():
+                if is_file(candidate):
                     results.append(candidate)
 
         # Project-root test directory mirroring source structure
@@ -624,11 +835,11 @@ def _find_test_files_for(source: Path, root: Path, language: str) -> list[Path]:
             except ValueError:
                 continue
         test_mirror = root / test_dir_name / rel.parent
-        if test_mirror.is_dir():
+        if is_dir(test_mirror):
             for p in patterns:
                 specific = p.replace("*", stem)
                 candidate = test_mirror / specific
-                if candidate.is_file():
+                if is_file(candidate):
                     results.append(candidate)
 
     return list(dict.fromkeys(results))  # dedupe, preserve order
@@ -711,24 +922,28 @@ def _truncate_to_tokens(
     max_tokens: int,
     counter: Callable[[str], int],
 ) -> str:
-    """Truncate *text* to fit within *max_tokens*, keeping complete lines."""
+    """Truncate *text* to fit within *max_tokens*, keeping complete lines.
+
+    Binary-searches the longest line-aligned prefix that fits, so *counter*
+    is called O(log lines) times rather than once per line.
+    """
     if counter(text) <= max_tokens:
         return text
 
-    lines = text.splitlines(keepends=True)
-    result: list[str] = []
-    used = 0
-    for line in lines:
-        line_tokens = counter(line)
-        if used + line_tokens > max_tokens:
-            break
-        result.append(line)
-        used += line_tokens
-
-    truncated = "".join(result)
-    if truncated != text:
-        truncated += "\n# ... (truncated)\n"
-    return truncated
+    # Offsets just past each line break; prefix text[:ends[i]] has i + 1 lines
+    ends = [i + 1 for i, ch in enumerate(text) if ch == "\n"]
+    if not ends or ends[-1] != len(text):
+        ends.append(len(text))
+
+    lo, hi = 0, len(ends)  # number of lines known to fit / upper bound
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if counter(text[: ends[mid - 1]]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+
+    return text[: ends[lo - 1] if lo else 0] + TRUNCATION_MARKER
 
 
 def _read_snippet(path: Path, max_lines: int = 50) -> str:
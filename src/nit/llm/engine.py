@@ -4,6 +4,13 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from nit.llm.tokenizer import heuristic_tokenizer
+from nit.telemetry.tracing import SPAN_LLM, traced_async
+
+if TYPE_CHECKING:
+    from nit.llm.tokenizer import Tokenizer
 
 
 @dataclass
@@ -69,6 +76,15 @@ class LLMEngine(ABC):
     must implement this interface.
     """
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Record every ``generate`` call as a trace span with its token usage."""
+        super().__init_subclass__(**kwargs)
+        generate = cls.__dict__.get("generate")
+        if generate is not None and not getattr(generate, "__isabstractmethod__", False):
+            cls.generate = traced_async(  # type: ignore[method-assign]
+                generate, SPAN_LLM, lambda engine: f"llm:{engine.model_name}"
+            )
+
     @abstractmethod
     async def generate(self, request: GenerationRequest) -> LLMResponse:
         """Send a generation request and return the response.
@@ -100,6 +116,15 @@ class LLMEngine(ABC):
     def model_name(self) -> str:
         """Return the default model identifier for this engine."""
 
+    @property
+    def tokenizer(self) -> Tokenizer:
+        """Return the tokenizer for this engine's model.
+
+        The default is the character heuristic; engines with a known
+        tokeniser should override this together with ``count_tokens``.
+        """
+        return heuristic_tokenizer()
+
     def count_tokens(self, text: str) -> int:
         """Estimate the token count for *text*.
 
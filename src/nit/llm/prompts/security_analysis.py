@@ -1,4 +1,9 @@
-"""Security analysis prompt template for validating heuristic findings."""
+"""Security analysis prompt template for validating heuristic findings.
+
+Findings are validated one per prompt (``render_validation``) or several
+findings of one file per prompt (``render_batch_validation``), in which
+case the model answers with a JSON array of per-finding verdicts.
+"""
 
 from __future__ import annotations
 
@@ -35,6 +40,43 @@ class SecurityAnalysisContext:
     """Optional taint flow trace."""
 
 
+@dataclass
+class SecurityBatchFinding:
+    """One finding of a batched validation request."""
+
+    finding_id: int
+    """Identifier the model echoes back in its verdict."""
+
+    vulnerability_type: str
+    """Vulnerability type identifier (e.g., 'sql_injection')."""
+
+    line_number: int | None
+    """Line of the finding in the file."""
+
+    code_snippet: str
+    """Code snippet showing the potential vulnerability."""
+
+    heuristic_description: str
+    """Description from the heuristic detector."""
+
+
+@dataclass
+class SecurityBatchContext:
+    """Context for validating several findings of one file in one request."""
+
+    file_path: str
+    """Path to the source file."""
+
+    language: str
+    """Programming language."""
+
+    code_excerpt: str
+    """Line-numbered source around all findings, shared by the batch."""
+
+    findings: list[SecurityBatchFinding] = field(default_factory=list)
+    """Findings to validate."""
+
+
 class SecurityAnalysisPrompt(PromptTemplate):
     """Prompt for LLM validation of heuristic security findings."""
 
@@ -42,7 +84,9 @@ class SecurityAnalysisPrompt(PromptTemplate):
     def name(self) -> str:
         return "security_analysis"
 
-    def _system_instruction(self, _context: AssembledContext | SecurityAnalysisContext) -> str:
+    def _system_instruction(
+        self, _context: AssembledContext | SecurityAnalysisContext | SecurityBatchContext
+    ) -> str:
         return (
             "You are a security expert validating potential vulnerabilities "
             "flagged by static analysis.\n\n"
@@ -131,3 +175,66 @@ Be concise."""
                 LLMMessage(role="user", content=user_prompt),
             ]
         )
+
+    def render_batch_validation(self, context: SecurityBatchContext) -> RenderedPrompt:
+        """Render one prompt validating every finding of a batch.
+
+        The source around the findings is included once; the model is asked
+        for a JSON array with one verdict per finding id.
+
+        Args:
+            context: Batched security analysis context.
+
+        Returns:
+            Rendered prompt with system and user messages.
+        """
+        findings = "\n\n".join(
+            f"### Finding {f.finding_id}\n\n"
+            f"**Type**: {f.vulnerability_type}\n"
+            f"**Line**: {f.line_number if f.line_number is not None else 'unknown'}\n"
+            f"**Code**: `{f.code_snippet.strip()}`\n\n"
+            f"**Heuristic analysis**:\n{f.heuristic_description}"
+            for f in context.findings
+        )
+
+        user_prompt = f"""## File
+
+**File**: {context.file_path}
+**Language**: {context.language}
+
+---
+
+## Code
+
+```{context.language}
+{context.code_excerpt}
+```
+
+---
+
+## Findings
+
+{findings}
+
+---
+
+## Validation Request
+
+For each finding, decide whether it is a real, exploitable vulnerability.
+
+Respond with only a JSON array, one object per finding:
+
+```json
+[{{"id": 1, "is_valid": true, "confidence": 0.8, "reasoning": "One sentence."}}]
+```
+
+- **id**: the finding number
+- **is_valid**: true or false
+- **confidence**: 0.0-1.0"""
+
+        return RenderedPrompt(
+            messages=[
+                LLMMessage(role="system", content=self._system_instruction(context)),
+                LLMMessage(role="user", content=user_prompt),
+            ]
+        )
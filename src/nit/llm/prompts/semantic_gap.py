@@ -11,6 +11,13 @@ from nit.llm.prompts.base import PromptSection, PromptTemplate, RenderedPrompt
 if TYPE_CHECKING:
     from nit.llm.context import AssembledContext
 
+# Bumped whenever the rendered prompt or the expected response format
+# changes, so gaps cached for the previous prompt are analysed again
+SEMANTIC_GAP_PROMPT_VERSION = 2
+
+NO_GAPS_MARKER = "NO_GAPS"
+"""Reply requested when a function has no meaningful test gaps."""
+
 
 @dataclass
 class SemanticGapContext:
@@ -183,7 +190,8 @@ Identify semantic test gaps for this function. For each gap, provide:
 ---
 
 Separate multiple gaps with "---" delimiter. Focus on high-value gaps that would catch \
-real bugs, not just increase coverage numbers."""
+real bugs, not just increase coverage numbers. If there are no such gaps, reply with \
+{NO_GAPS_MARKER} only."""
 
         return RenderedPrompt(
             messages=[
@@ -0,0 +1,200 @@
+"""Local tokenizer service for token counting and context windowing.
+
+Loads the BPE encoding that matches a model once per process and serves
+token counts from a content-hash cache, so repeated counting of the same
+sources during context assembly is an in-memory lookup.
+
+Vocab files are only ever read from disk: from ``TIKTOKEN_CACHE_DIR`` when
+it is set, otherwise from the copies bundled with LiteLLM (the same files
+``litellm.token_counter`` uses offline).  An encoding whose vocab file is
+not available locally is never downloaded; the tokenizer falls back to a
+~4 characters per token heuristic and logs a warning instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from nit.utils.cache import MemoryCache, content_hash
+
+try:
+    import tiktoken
+
+    _tiktoken_available = True
+except ImportError:
+    _tiktoken_available = False
+
+logger = logging.getLogger(__name__)
+
+# Encoding used for models tiktoken does not know (matches LiteLLM's default)
+DEFAULT_ENCODING = "cl100k_base"
+
+# Where tiktoken downloads vocab files from; its cache names each file by the
+# SHA-1 of this URL, which is also how LiteLLM's bundled copies are named
+_VOCAB_URL = "https://openaipublic.blob.core.windows.net/encodings/{name}.tiktoken"
+
+# LiteLLM's bundled vocab files, relative to the package directory
+_LITELLM_TOKENIZERS = Path("litellm_core_utils") / "tokenizers"
+
+# Characters per token for the heuristic fallback
+_CHARS_PER_TOKEN = 4
+
+# Texts shorter than this are counted directly; hashing them costs as much
+_MIN_CACHED_LENGTH = 256
+
+TRUNCATION_MARKER = "\n# ... (truncated)\n"
+
+
+class Tokenizer:
+    """Token counter and truncator backed by a BPE encoding or a heuristic.
+
+    Args:
+        name: Encoding name, or ``"heuristic"`` for the fallback.
+        encoding: A loaded ``tiktoken.Encoding``; ``None`` selects the heuristic.
+        cache_size: Maximum number of cached token counts.
+    """
+
+    def __init__(self, name: str, encoding: Any = None, *, cache_size: int = 4096) -> None:
+        self._name = name
+        self._encoding = encoding
+        self._counts: MemoryCache[int] = MemoryCache(max_size=cache_size)
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """Name of the underlying encoding."""
+        return self._name
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether counts come from a real BPE encoding rather than the heuristic."""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in *text*."""
+        if self._encoding is None:
+            return len(text) // _CHARS_PER_TOKEN
+        if len(text) < _MIN_CACHED_LENGTH:
+            return len(self._encode(text))
+
+        key = content_hash(text)
+        with self._lock:
+            cached = self._counts.get(key)
+        if cached is not None:
+            return cached
+        count = len(self._encode(text))
+        with self._lock:
+            self._counts.put(key, count)
+        return count
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Truncate *text* to at most *max_tokens*, keeping complete lines.
+
+        The text is encoded once and cut at the last line break inside the
+        first *max_tokens* tokens.  A marker is appended when anything was
+        dropped.
+        """
+        if self._encoding is None:
+            if len(text) // _CHARS_PER_TOKEN <= max_tokens:
+                return text
+            prefix = text[: max(max_tokens, 0) * _CHARS_PER_TOKEN]
+        else:
+            tokens = self._encode(text)
+            if len(tokens) <= max_tokens:
+                return text
+            head = self._encoding.decode_bytes(tokens[: max(max_tokens, 0)])
+            # A token boundary may split a multi-byte character
+            prefix = head.decode("utf-8", errors="ignore")
+
+        return text[: prefix.rfind("\n") + 1] + TRUNCATION_MARKER
+
+    def _encode(self, text: str) -> list[int]:
+        tokens: list[int] = self._encoding.encode(text, disallowed_special=())
+        return tokens
+
+
+_HEURISTIC = Tokenizer("heuristic")
+
+_tokenizers: dict[str, Tokenizer] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def heuristic_tokenizer() -> Tokenizer:
+    """Return the shared ~4 characters per token tokenizer."""
+    return _HEURISTIC
+
+
+def get_tokenizer(model: str) -> Tokenizer:
+    """Return the shared tokenizer for *model*, loading its encoding once.
+
+    Provider prefixes such as ``openai/`` are ignored.  Models tiktoken
+    does not know use ``DEFAULT_ENCODING``; if no encoding can be loaded
+    (tiktoken missing or no local vocab file) the heuristic tokenizer is
+    returned and a warning is logged.
+    """
+    encoding_name = _encoding_name_for(model)
+    with _tokenizers_lock:
+        tokenizer = _tokenizers.get(encoding_name)
+        if tokenizer is None:
+            tokenizer = _load(encoding_name)
+            _tokenizers[encoding_name] = tokenizer
+    return tokenizer
+
+
+def _encoding_name_for(model: str) -> str:
+    if not _tiktoken_available:
+        return _HEURISTIC.name
+    bare = model.rsplit("/", 1)[-1]
+    try:
+        name: str = tiktoken.encoding_name_for_model(bare)
+    except KeyError:
+        return DEFAULT_ENCODING
+    return name
+
+
+def _load(encoding_name: str) -> Tokenizer:
+    if encoding_name == _HEURISTIC.name:
+        logger.warning("tiktoken is not installed; token counts are estimated")
+        return _HEURISTIC
+    vocab_dir = _vocab_dir()
+    url = _VOCAB_URL.format(name=encoding_name).encode("utf-8")
+    vocab_name = hashlib.sha1(url, usedforsecurity=False).hexdigest()
+    if vocab_dir is None or not (vocab_dir / vocab_name).is_file():
+        logger.warning(
+            "No local vocab file for the %s encoding; token counts are estimated", encoding_name
+        )
+        return _HEURISTIC
+    try:
+        # The vocab file is cached locally, so tiktoken does not download it
+        encoding = tiktoken.get_encoding(encoding_name)
+    except Exception as exc:
+        logger.warning(
+            "Could not load the %s encoding; token counts are estimated: %s", encoding_name, exc
+        )
+        return _HEURISTIC
+    return Tokenizer(encoding_name, encoding)
+
+
+def _vocab_dir() -> Path | None:
+    """The directory tiktoken reads vocab files from.
+
+    Unless ``TIKTOKEN_CACHE_DIR`` is set it is pointed at LiteLLM's bundled
+    tokenizers directory, as LiteLLM itself does when it is imported.
+    """
+    configured = os.environ.get("TIKTOKEN_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    spec = importlib.util.find_spec("litellm")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    bundled = Path(next(iter(spec.submodule_search_locations))) / _LITELLM_TOKENIZERS
+    if not bundled.is_dir():
+        return None
+    os.environ["TIKTOKEN_CACHE_DIR"] = str(bundled)
+    return bundled
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 from nit.llm.engine import GenerationRequest, LLMEngine, LLMMessage, LLMResponse
 
 if TYPE_CHECKING:
+    from nit.llm.tokenizer import Tokenizer
     from nit.memory.prompt_store import PromptRecorder
 
 logger = logging.getLogger(__name__)
@@ -68,6 +69,11 @@ class TrackedLLMEngine(LLMEngine):
         response = await self.generate(GenerationRequest(messages=messages))
         return response.text
 
+    @property
+    def tokenizer(self) -> Tokenizer:
+        """Delegate to the wrapped engine's tokenizer."""
+        return self._inner.tokenizer
+
     def count_tokens(self, text: str) -> int:
         """Delegate token counting to the wrapped engine."""
         return self._inner.count_tokens(text)
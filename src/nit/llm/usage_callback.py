@@ -1,21 +1,26 @@
 """Usage tracking via LiteLLM callbacks and CLI wrapper reporting.
 
 This module batches usage events and ships them to the platform ingest API.
-It is intentionally resilient: failures are logged and dropped after retries,
-never raising into generation flow.
+It is intentionally resilient: events are handed to a bounded queue and
+uploaded by a background thread, so a slow or unreachable platform never
+blocks generation.  Batches that still fail after retries are spilled to
+disk and replayed by a later upload (possibly from another process).
 """
 
 from __future__ import annotations
 
 import asyncio
 import atexit
+import json
 import logging
 import os
+import queue
 import threading
 import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import litellm
@@ -25,11 +30,16 @@ from litellm.integrations.custom_logger import CustomLogger
 from nit.memory.analytics_collector import get_analytics_collector
 from nit.models.analytics import LLMUsage
 from nit.telemetry.sentry_integration import record_metric_count, record_metric_distribution
-from nit.utils.platform_client import build_usage_url, get_platform_api_key
+from nit.utils.cache import content_hash
+from nit.utils.platform_client import (
+    build_usage_url,
+    create_platform_session,
+    encode_json_body,
+    get_platform_api_key,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
-    from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +47,15 @@ _DEFAULT_BATCH_SIZE = 20
 _DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
 _DEFAULT_MAX_RETRIES = 3
 _DEFAULT_REQUEST_TIMEOUT_SECONDS = 8.0
+_DEFAULT_MAX_QUEUE_SIZE = 1000
+_MAX_SPILL_FILES = 100
+# A claimed spill file older than this belongs to a process that died mid-replay
+_STALE_REPLAY_SECONDS = 3600
+_WORKER_JOIN_TIMEOUT_SECONDS = 30.0
+_SPILL_SUFFIX = ".jsonl"
+_REPLAY_SUFFIX = ".replay"
+# Dot-separated fields of a claimed spill file name: stem, claim time, nonce
+_REPLAY_NAME_FIELDS = 3
 _HTTP_SUCCESS_MIN = 200
 _HTTP_SUCCESS_MAX = 300
 
@@ -56,6 +75,13 @@ class UsageReporterConfig:
     flush_interval_seconds: float
     max_retries: int
     request_timeout_seconds: float
+    max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE
+    spill_dir: Path | None = None
+    """Directory for batches that could not be delivered (None disables spilling).
+
+    Batches are kept in a subdirectory per ingest endpoint and token, so a
+    batch is only ever replayed to the destination it was meant for.
+    """
 
     @property
     def enabled(self) -> bool:
@@ -85,6 +111,11 @@ class UsageReporterConfig:
             _DEFAULT_REQUEST_TIMEOUT_SECONDS,
             minimum=1.0,
         )
+        max_queue_size = _parse_int_env(
+            "NIT_USAGE_MAX_QUEUE_SIZE", _DEFAULT_MAX_QUEUE_SIZE, minimum=1
+        )
+        spill_raw = os.environ.get("NIT_USAGE_SPILL_DIR", "").strip()
+        spill_dir = Path(spill_raw).expanduser() if spill_raw else _default_spill_dir()
 
         return cls(
             platform_url=platform_url,
@@ -96,9 +127,18 @@ class UsageReporterConfig:
             flush_interval_seconds=flush_interval,
             max_retries=max_retries,
             request_timeout_seconds=request_timeout,
+            max_queue_size=max_queue_size,
+            spill_dir=spill_dir,
         )
 
 
+def _default_spill_dir() -> Path:
+    """Per-user directory for undelivered usage batches."""
+    cache_home = os.environ.get("XDG_CACHE_HOME", "").strip()
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "nit" / "usage"
+
+
 def _parse_int_env(name: str, default: int, *, minimum: int) -> int:
     raw = os.environ.get(name)
     if raw is None or not raw.strip():
@@ -292,23 +332,52 @@ class CLIUsageEvent:
     """Optional ISO timestamp."""
 
 
+@dataclass
+class _FlushRequest:
+    """Queue marker asking the worker to upload everything queued before it."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    stop: bool = False
+
+
 class BatchedUsageReporter:
-    """Buffers usage events and POSTs them in batches to the platform."""
+    """Buffers usage events and POSTs them in batches to the platform.
+
+    ``enqueue`` only puts the event on a bounded queue.  A daemon worker
+    thread collects batches (by size or flush interval) and uploads them
+    gzip-compressed over a keep-alive session.  When the queue is full the
+    event is set aside in memory and the worker spills such events to disk
+    in batches; if that is not possible they are dropped and counted.
+    Batches that fail after retries are spilled too and are replayed after
+    the next successful upload.  Spill files claimed by a process that died
+    while replaying them are returned to the spill directory when the
+    worker starts.
+    """
 
     def __init__(self, config: UsageReporterConfig) -> None:
         self._config = config
         self._session_id = os.environ.get("NIT_SESSION_ID", "").strip() or str(uuid.uuid4())
         self._lock = threading.Lock()
-        self._buffer: list[dict[str, Any]] = []
-        self._last_flush = time.monotonic()
+        self._queue: queue.Queue[dict[str, Any] | _FlushRequest] = queue.Queue(
+            maxsize=max(config.max_queue_size, 1)
+        )
+        self._worker: threading.Thread | None = None
+        self._http: requests.Session | None = None
+        self._overflow: list[dict[str, Any]] = []
+        self._dropped = 0
 
         if self._config.enabled:
-            atexit.register(self.flush)
+            atexit.register(self.close)
 
     @property
     def session_id(self) -> str:
         return self._session_id
 
+    @property
+    def dropped_events(self) -> int:
+        """Number of events discarded because the queue was full and spilling failed."""
+        return self._dropped
+
     def build_metadata(
         self,
         params: MetadataParams,
@@ -344,61 +413,119 @@ class BatchedUsageReporter:
         return metadata
 
     def enqueue(self, event: dict[str, Any]) -> None:
+        """Queue an event for upload without blocking the caller."""
         if not self._config.enabled:
             return
 
-        batch: list[dict[str, Any]] = []
-        with self._lock:
-            self._buffer.append(event)
-            should_flush = (
-                len(self._buffer) >= self._config.batch_size
-                or (time.monotonic() - self._last_flush) >= self._config.flush_interval_seconds
-            )
-            if should_flush:
-                batch = self._drain_unlocked()
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # Set aside for the worker to spill in one batch; no file I/O here
+            with self._lock:
+                if self._config.spill_dir is not None and len(self._overflow) < self._queue.maxsize:
+                    self._overflow.append(event)
+                    return
+                self._dropped += 1
+            logger.debug("Usage queue full; dropped event (%d so far)", self._dropped)
 
-        if batch:
-            self._post_batch(batch)
+    def flush(self, timeout: float = _WORKER_JOIN_TIMEOUT_SECONDS) -> None:
+        """Upload everything queued so far and wait for it to finish."""
+        self._signal_worker(_FlushRequest(), timeout)
 
-    def flush(self) -> None:
-        if not self._config.enabled:
+    def close(self, timeout: float = _WORKER_JOIN_TIMEOUT_SECONDS) -> None:
+        """Flush, stop the worker thread and release the HTTP session."""
+        self._signal_worker(_FlushRequest(stop=True), timeout)
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None:
+            worker.join(timeout)
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _signal_worker(self, request: _FlushRequest, timeout: float) -> None:
+        with self._lock:
+            worker = self._worker
+        if worker is None or not worker.is_alive():
             return
+        try:
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            logger.warning("Usage reporter did not accept a flush request in time")
+            return
+        request.done.wait(timeout)
 
+    def _ensure_worker(self) -> None:
         with self._lock:
-            batch = self._drain_unlocked()
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run,
+                name="nit-usage-reporter",
+                daemon=True,
+            )
+            self._worker.start()
 
-        if batch:
-            self._post_batch(batch)
+    def _run(self) -> None:
+        """Worker loop: collect batches by size or interval and upload them."""
+        self._reclaim_stale_replays()
+        batch: list[dict[str, Any]] = []
+        deadline = time.monotonic() + self._config.flush_interval_seconds
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+            except queue.Empty:
+                item = None
 
-    def _drain_unlocked(self) -> list[dict[str, Any]]:
-        if not self._buffer:
-            self._last_flush = time.monotonic()
-            return []
+            if isinstance(item, dict):
+                batch.append(item)
+                if len(batch) < self._config.batch_size:
+                    continue
 
-        drained = self._buffer
-        self._buffer = []
-        self._last_flush = time.monotonic()
-        return drained
+            if batch:
+                try:
+                    self._deliver(batch)
+                except Exception:
+                    logger.exception("Usage reporter failed to deliver %d events", len(batch))
+                batch = []
+            self._spill_overflow()
+            deadline = time.monotonic() + self._config.flush_interval_seconds
+
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+                if item.stop:
+                    return
+
+    def _deliver(self, events: list[dict[str, Any]]) -> None:
+        """Upload a batch, spilling it on failure and replaying old spills on success."""
+        if self._post_batch(events):
+            self._replay_spilled()
+        elif not self._spill(events):
+            logger.warning("Dropping %d usage events", len(events))
 
-    def _post_batch(self, events: list[dict[str, Any]]) -> None:
+    def _post_batch(self, events: list[dict[str, Any]]) -> bool:
         endpoint = build_usage_url(self._config.platform_url)
+        body, content_headers = encode_json_body({"events": events})
         headers = {
             "Authorization": f"Bearer {self._config.ingest_token}",
-            "Content-Type": "application/json",
+            **content_headers,
         }
-        payload = {"events": events}
+        if self._http is None:
+            self._http = create_platform_session()
 
         last_error: str | None = None
         for attempt in range(self._config.max_retries):
             try:
-                response = requests.post(
+                response = self._http.post(
                     endpoint,
                     headers=headers,
-                    json=payload,
+                    data=body,
                     timeout=self._config.request_timeout_seconds,
                 )
                 if _HTTP_SUCCESS_MIN <= response.status_code < _HTTP_SUCCESS_MAX:
-                    return
+                    return True
 
                 last_error = f"HTTP {response.status_code}: {response.text[:200]}"
             except requests.RequestException as exc:
@@ -409,11 +536,133 @@ class BatchedUsageReporter:
                 time.sleep(backoff)
 
         logger.warning(
-            "Dropping %d usage events after %d attempts: %s",
+            "Failed to upload %d usage events after %d attempts: %s",
             len(events),
             self._config.max_retries,
             last_error or "unknown error",
         )
+        return False
+
+    def _spill_dir(self) -> Path | None:
+        """Spill directory of the configured endpoint and token, if spilling is enabled."""
+        if self._config.spill_dir is None:
+            return None
+        destination = f"{build_usage_url(self._config.platform_url)}\0{self._config.ingest_token}"
+        return self._config.spill_dir / content_hash(destination)
+
+    def _spill_overflow(self) -> None:
+        """Spill the events ``enqueue`` set aside while the queue was full."""
+        with self._lock:
+            events, self._overflow = self._overflow, []
+        if events and not self._spill(events):
+            with self._lock:
+                self._dropped += len(events)
+            logger.warning("Dropping %d usage events", len(events))
+
+    def _spill(self, events: list[dict[str, Any]]) -> bool:
+        """Write undelivered events to the spill directory.
+
+        Returns:
+            True if the events were persisted.
+        """
+        spill_dir = self._spill_dir()
+        if spill_dir is None:
+            return False
+
+        try:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            existing = sorted(spill_dir.glob(f"*{_SPILL_SUFFIX}"))
+            # Bound the spill directory by discarding the oldest batches
+            for stale in existing[: max(len(existing) - _MAX_SPILL_FILES + 1, 0)]:
+                stale.unlink(missing_ok=True)
+
+            name = f"{time.time_ns()}-{uuid.uuid4().hex}"
+            _write_spill_file(spill_dir / f"{name}{_SPILL_SUFFIX}", events)
+        except OSError as exc:
+            logger.warning("Failed to spill usage events to %s: %s", spill_dir, exc)
+            return False
+
+        logger.info("Spilled %d usage events to %s", len(events), spill_dir)
+        return True
+
+    def _replay_spilled(self) -> None:
+        """Upload batches spilled for this destination by this or an earlier process."""
+        spill_dir = self._spill_dir()
+        if spill_dir is None or not spill_dir.is_dir():
+            return
+
+        for path in sorted(spill_dir.glob(f"*{_SPILL_SUFFIX}")):
+            # Claim the file so concurrent processes don't replay it twice; the
+            # claim time in the name lets a dead claimer's file be reclaimed
+            claimed = path.with_name(
+                f".{path.stem}.{time.time_ns()}.{uuid.uuid4().hex}{_REPLAY_SUFFIX}"
+            )
+            try:
+                path.replace(claimed)
+                lines = claimed.read_text(encoding="utf-8").splitlines()
+            except OSError:
+                continue
+
+            events = _parse_spilled(lines)
+            size = self._config.batch_size
+            for start in range(0, len(events), size):
+                if not self._post_batch(events[start : start + size]):
+                    # Platform unreachable again; put back what was not delivered and stop
+                    _restore_spilled(claimed, path, events[start:])
+                    return
+            claimed.unlink(missing_ok=True)
+            logger.info("Replayed %d spilled usage events", len(events))
+
+    def _reclaim_stale_replays(self) -> None:
+        """Return spill files whose replay was abandoned to the spill directory."""
+        spill_dir = self._spill_dir()
+        if spill_dir is None or not spill_dir.is_dir():
+            return
+
+        cutoff = time.time_ns() - _STALE_REPLAY_SECONDS * 1_000_000_000
+        for claimed in spill_dir.glob(f".*{_REPLAY_SUFFIX}"):
+            # ".<stem>.<claimed-at ns>.<nonce>.replay"
+            parts = claimed.name[1 : -len(_REPLAY_SUFFIX)].split(".")
+            try:
+                if len(parts) == _REPLAY_NAME_FIELDS:
+                    claimed_at = int(parts[1])
+                else:
+                    claimed_at = claimed.stat().st_mtime_ns
+                if claimed_at > cutoff:
+                    continue
+                claimed.replace(spill_dir / f"{parts[0]}{_SPILL_SUFFIX}")
+            except (OSError, ValueError):
+                continue
+            logger.info("Reclaimed abandoned usage spill file %s", claimed.name)
+
+
+def _write_spill_file(path: Path, events: list[dict[str, Any]]) -> None:
+    """Atomically write *events* to *path*, one JSON object per line."""
+    tmp_path = path.with_name(f".{path.stem}.tmp")
+    tmp_path.write_text("".join(json.dumps(event) + "\n" for event in events), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _restore_spilled(claimed: Path, path: Path, remaining: list[dict[str, Any]]) -> None:
+    """Return the undelivered *remaining* events of a claimed spill file to *path*."""
+    try:
+        _write_spill_file(path, remaining)
+        claimed.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("Failed to restore spilled usage events to %s: %s", path, exc)
+
+
+def _parse_spilled(lines: list[str]) -> list[dict[str, Any]]:
+    """Parse the events of a spill file, skipping corrupt lines."""
+    events: list[dict[str, Any]] = []
+    for line in lines:
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict):
+            events.append(event)
+    return events
 
 
 _REPORTER_LOCK = threading.Lock()
@@ -566,7 +815,7 @@ class NitUsageCallback(CustomLogger):
     ) -> None:
         event = self._build_event(kwargs, response_obj, start_time, end_time)
         if event is not None:
-            await asyncio.to_thread(self._reporter.enqueue, event)
+            self._reporter.enqueue(event)
             # Track session stats
             with _REPORTER_LOCK:
                 _SINGLETONS.session_stats.add_usage(
@@ -808,7 +1057,7 @@ def teardown_usage_singletons() -> None:
     """
     with _REPORTER_LOCK:
         if _SINGLETONS.reporter is not None:
-            _SINGLETONS.reporter.flush()
+            _SINGLETONS.reporter.close()
 
         # Remove callback from litellm if registered
         if _SINGLETONS.callback is not None:
@@ -14,7 +14,14 @@ from typing import TYPE_CHECKING, Any, cast
 if TYPE_CHECKING:
     from pathlib import Path
 
-from nit.memory.store import MemoryStore
+from nit.memory.patterns import (
+    DEFAULT_PATTERN_CAPACITY,
+    entry_key,
+    evict_patterns,
+    pattern_key,
+    rank_patterns,
+)
+from nit.memory.store import MemoryDocument, MemoryStore
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,8 @@ class FailedPattern:
     reason: str
     timestamp: str
     context: dict[str, Any] = field(default_factory=dict)
+    count: int = 1
+    key: str = ""
 
 
 @dataclass
@@ -43,6 +52,7 @@ class KnownPattern:
     success_count: int = 0
     last_used: str = ""
     context: dict[str, Any] = field(default_factory=dict)
+    key: str = ""
 
 
 @dataclass
@@ -57,7 +67,7 @@ class GenerationStats:
     last_run: str = ""
 
 
-class GlobalMemory:
+class GlobalMemory(MemoryDocument):
     """Project-wide memory for conventions, patterns, and statistics.
 
     Stores:
@@ -65,42 +75,50 @@ class GlobalMemory:
     - Known patterns that work well
     - Failed patterns to avoid
     - Generation statistics
+
+    Known and failed patterns are deduplicated by normalised text and
+    bounded to ``pattern_capacity`` entries each; the lowest-scoring
+    entries (by frequency and recency) are evicted first.
     """
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        *,
+        auto_flush: bool = True,
+        locking: bool = True,
+        pattern_capacity: int = DEFAULT_PATTERN_CAPACITY,
+    ) -> None:
         """Initialize global memory.
 
         Args:
             project_root: Root directory of the project.
+            auto_flush: Write to disk after every mutation outside ``deferred()``.
+                Pass False to batch writes and call ``flush()`` explicitly.
+            locking: Merge with concurrent writers under a file lock when flushing.
+            pattern_capacity: Maximum number of known and of failed patterns kept.
         """
-        self._store: MemoryStore[dict[str, Any]] = MemoryStore(project_root, _GLOBAL_MEMORY_FILE)
-        self._data: dict[str, Any] = {}
-        self._load()
-
-    def _load(self) -> None:
-        """Load data from disk into memory."""
-        data = self._store.load()
-        if data:
-            self._data = data
-        else:
-            # Initialize with empty structure
-            self._data = {
-                "conventions": {},
-                "known_patterns": [],
-                "failed_patterns": [],
-                "generation_stats": {
-                    "total_runs": 0,
-                    "successful_generations": 0,
-                    "failed_generations": 0,
-                    "total_tests_generated": 0,
-                    "total_tests_passing": 0,
-                    "last_run": "",
-                },
-            }
-
-    def _save(self) -> None:
-        """Save current data to disk."""
-        self._store.save(self._data)
+        self._pattern_capacity = pattern_capacity
+        super().__init__(
+            MemoryStore(project_root, _GLOBAL_MEMORY_FILE, locking=locking),
+            auto_flush=auto_flush,
+        )
+
+    def _empty(self) -> dict[str, Any]:
+        """Return the initial global memory structure."""
+        return {
+            "conventions": {},
+            "known_patterns": [],
+            "failed_patterns": [],
+            "generation_stats": {
+                "total_runs": 0,
+                "successful_generations": 0,
+                "failed_generations": 0,
+                "total_tests_generated": 0,
+                "total_tests_passing": 0,
+                "last_run": "",
+            },
+        }
 
     def get_conventions(self) -> dict[str, Any]:
         """Get project-wide conventions.
@@ -116,62 +134,94 @@ class GlobalMemory:
         Args:
             conventions: Dictionary of conventions to store.
         """
-        self._data["conventions"] = conventions
-        self._save()
+
+        def _op(data: dict[str, Any]) -> None:
+            data["conventions"] = conventions
+
+        self._apply(_op)
 
     def add_known_pattern(self, pattern: str, context: dict[str, Any] | None = None) -> None:
         """Add or update a known successful pattern.
 
-        If pattern already exists, increments success count and updates timestamp.
+        If an equivalent pattern (same normalised text) already exists,
+        increments its success count and updates its timestamp.
 
         Args:
             pattern: The pattern that worked.
             context: Additional context about the pattern.
         """
-        known_patterns = self._data.get("known_patterns", [])
-
-        # Check if pattern already exists
-        for p in known_patterns:
-            if p.get("pattern") == pattern:
-                p["success_count"] = p.get("success_count", 0) + 1
-                p["last_used"] = datetime.now(UTC).isoformat()
-                if context:
-                    p["context"] = context
-                self._save()
-                return
-
-        # Add new pattern
-        new_pattern = {
-            "pattern": pattern,
-            "success_count": 1,
-            "last_used": datetime.now(UTC).isoformat(),
-            "context": context or {},
-        }
-        known_patterns.append(new_pattern)
-        self._data["known_patterns"] = known_patterns
-        self._save()
+        now = datetime.now(UTC).isoformat()
+        key = pattern_key(pattern)
+
+        def _op(data: dict[str, Any]) -> None:
+            known_patterns = data.setdefault("known_patterns", [])
+
+            # Check if pattern already exists
+            for p in known_patterns:
+                if entry_key(p) == key:
+                    p["key"] = key
+                    p["success_count"] = p.get("success_count", 0) + 1
+                    p["last_used"] = now
+                    if context:
+                        p["context"] = context
+                    return
+
+            # Add new pattern
+            known_patterns.append(
+                {
+                    "pattern": pattern,
+                    "success_count": 1,
+                    "last_used": now,
+                    "context": context or {},
+                    "key": key,
+                }
+            )
+            data["known_patterns"] = evict_patterns(known_patterns, self._pattern_capacity)
+
+        self._apply(_op)
 
     def add_failed_pattern(
         self, pattern: str, reason: str, context: dict[str, Any] | None = None
     ) -> None:
         """Add a failed pattern to avoid in the future.
 
+        If an equivalent pattern (same normalised text) already exists, its
+        count is incremented and its reason and timestamp refreshed.
+
         Args:
             pattern: The pattern that failed.
             reason: Why it failed.
             context: Additional context about the failure.
         """
-        failed_patterns = self._data.get("failed_patterns", [])
+        now = datetime.now(UTC).isoformat()
+        key = pattern_key(pattern)
+
+        def _op(data: dict[str, Any]) -> None:
+            failed_patterns = data.setdefault("failed_patterns", [])
+
+            for p in failed_patterns:
+                if entry_key(p) == key:
+                    p["key"] = key
+                    p["count"] = p.get("count", 1) + 1
+                    p["reason"] = reason
+                    p["timestamp"] = now
+                    if context:
+                        p["context"] = context
+                    return
+
+            failed_patterns.append(
+                {
+                    "pattern": pattern,
+                    "reason": reason,
+                    "timestamp": now,
+                    "context": context or {},
+                    "count": 1,
+                    "key": key,
+                }
+            )
+            data["failed_patterns"] = evict_patterns(failed_patterns, self._pattern_capacity)
 
-        failed_pattern = {
-            "pattern": pattern,
-            "reason": reason,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "context": context or {},
-        }
-        failed_patterns.append(failed_pattern)
-        self._data["failed_patterns"] = failed_patterns
-        self._save()
+        self._apply(_op)
 
     def get_known_patterns(self) -> list[dict[str, Any]]:
         """Get all known successful patterns.
@@ -189,6 +239,54 @@ class GlobalMemory:
         """
         return cast("list[dict[str, Any]]", self._data.get("failed_patterns", []))
 
+    def top_known_patterns(
+        self,
+        limit: int,
+        *,
+        filter_key: str = "framework",
+        filter_value: str = "",
+    ) -> list[dict[str, Any]]:
+        """Get the highest-value known patterns relevant to a filter.
+
+        Args:
+            limit: Maximum number of patterns to return.
+            filter_key: Context key to filter on (e.g. ``"framework"``, ``"file"``).
+            filter_value: Value to match against the filter key (case-insensitive).
+
+        Returns:
+            Up to *limit* pattern dictionaries, best first.
+        """
+        return rank_patterns(
+            self.get_known_patterns(),
+            filter_key=filter_key,
+            filter_value=filter_value,
+            limit=limit,
+        )
+
+    def top_failed_patterns(
+        self,
+        limit: int,
+        *,
+        filter_key: str = "framework",
+        filter_value: str = "",
+    ) -> list[dict[str, Any]]:
+        """Get the highest-value failed patterns relevant to a filter.
+
+        Args:
+            limit: Maximum number of patterns to return.
+            filter_key: Context key to filter on (e.g. ``"framework"``, ``"file"``).
+            filter_value: Value to match against the filter key (case-insensitive).
+
+        Returns:
+            Up to *limit* pattern dictionaries, best first.
+        """
+        return rank_patterns(
+            self.get_failed_patterns(),
+            filter_key=filter_key,
+            filter_value=filter_value,
+            limit=limit,
+        )
+
     def update_stats(
         self,
         *,
@@ -203,20 +301,22 @@ class GlobalMemory:
             tests_generated: Number of tests generated.
             tests_passing: Number of tests passing.
         """
-        stats = self._data.get("generation_stats", {})
+        now = datetime.now(UTC).isoformat()
 
-        stats["total_runs"] = stats.get("total_runs", 0) + 1
-        if successful:
-            stats["successful_generations"] = stats.get("successful_generations", 0) + 1
-        else:
-            stats["failed_generations"] = stats.get("failed_generations", 0) + 1
+        def _op(data: dict[str, Any]) -> None:
+            stats = data.setdefault("generation_stats", {})
+
+            stats["total_runs"] = stats.get("total_runs", 0) + 1
+            if successful:
+                stats["successful_generations"] = stats.get("successful_generations", 0) + 1
+            else:
+                stats["failed_generations"] = stats.get("failed_generations", 0) + 1
 
-        stats["total_tests_generated"] = stats.get("total_tests_generated", 0) + tests_generated
-        stats["total_tests_passing"] = stats.get("total_tests_passing", 0) + tests_passing
-        stats["last_run"] = datetime.now(UTC).isoformat()
+            stats["total_tests_generated"] = stats.get("total_tests_generated", 0) + tests_generated
+            stats["total_tests_passing"] = stats.get("total_tests_passing", 0) + tests_passing
+            stats["last_run"] = now
 
-        self._data["generation_stats"] = stats
-        self._save()
+        self._apply(_op)
 
     def get_stats(self) -> dict[str, Any]:
         """Get generation statistics.
@@ -228,8 +328,9 @@ class GlobalMemory:
 
     def clear(self) -> None:
         """Clear all global memory."""
-        self._store.clear()
-        self._load()
+        with self._store.lock():
+            self._store.clear()
+            self._load()
 
     def to_dict(self) -> dict[str, Any]:
         """Export memory as a dictionary for display or serialization.
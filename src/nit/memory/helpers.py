@@ -13,6 +13,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from nit.llm.engine import LLMMessage
+from nit.memory.patterns import rank_patterns
 
 if TYPE_CHECKING:
     from nit.memory.global_memory import GlobalMemory
@@ -30,7 +31,10 @@ def get_memory_context(
     failed_filter_key: str = "domain",
     filter_value: str = "",
 ) -> dict[str, list[str]] | None:
-    """Retrieve and filter memory patterns for LLM prompt injection.
+    """Retrieve the top-ranked relevant memory patterns for LLM prompt injection.
+
+    Patterns scoped to *filter_value* rank ahead of unscoped ones, and each
+    group is ordered by frequency and recency (see ``nit.memory.patterns``).
 
     Args:
         memory: GlobalMemory instance, or None if memory is disabled.
@@ -48,20 +52,24 @@ def get_memory_context(
     known_patterns = memory.get_known_patterns()
     failed_patterns = memory.get_failed_patterns()
 
-    lv = filter_value.lower()
-
     relevant_known = [
         p["pattern"]
-        for p in known_patterns
-        if lv in p.get("context", {}).get(known_filter_key, "").lower()
-        or not p.get("context", {}).get(known_filter_key)
+        for p in rank_patterns(
+            known_patterns,
+            filter_key=known_filter_key,
+            filter_value=filter_value,
+            limit=_MAX_PATTERNS,
+        )
     ]
 
     relevant_failed = [
         f"{p['pattern']}: {p['reason']}"
-        for p in failed_patterns
-        if lv in p.get("context", {}).get(failed_filter_key, "").lower()
-        or not p.get("context", {}).get(failed_filter_key)
+        for p in rank_patterns(
+            failed_patterns,
+            filter_key=failed_filter_key,
+            filter_value=filter_value,
+            limit=_MAX_PATTERNS,
+        )
     ]
 
     logger.debug(
@@ -71,8 +79,8 @@ def get_memory_context(
     )
 
     return {
-        "known_patterns": relevant_known[:_MAX_PATTERNS],
-        "failed_patterns": relevant_failed[:_MAX_PATTERNS],
+        "known_patterns": relevant_known,
+        "failed_patterns": relevant_failed,
     }
 
 
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any, cast
 if TYPE_CHECKING:
     from pathlib import Path
 
-from nit.memory.store import MemoryStore
+from nit.memory.store import MemoryDocument, MemoryStore
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 _MAX_COVERAGE_SNAPSHOTS = 5
 
 
-class PackageMemory:
+class PackageMemory(MemoryDocument):
     """Per-package memory for test patterns, issues, and coverage history.
 
     Stores:
@@ -31,40 +31,42 @@ class PackageMemory:
     - LLM feedback and improvements
     """
 
-    def __init__(self, project_root: Path, package_name: str) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        package_name: str,
+        *,
+        auto_flush: bool = True,
+        locking: bool = True,
+    ) -> None:
         """Initialize package memory.
 
         Args:
             project_root: Root directory of the project.
             package_name: Name of the package (used in filename).
+            auto_flush: Write to disk after every mutation outside ``deferred()``.
+                Pass False to batch writes and call ``flush()`` explicitly.
+            locking: Merge with concurrent writers under a file lock when flushing.
         """
         # Sanitize package name for filename
         safe_name = package_name.replace("/", "_").replace("\\", "_")
         filename = f"packages/package_{safe_name}.json"
 
-        self._store: MemoryStore[dict[str, Any]] = MemoryStore(project_root, filename)
         self._package_name = package_name
-        self._data: dict[str, Any] = {}
-        self._load()
-
-    def _load(self) -> None:
-        """Load data from disk into memory."""
-        data = self._store.load()
-        if data:
-            self._data = data
-        else:
-            # Initialize with empty structure
-            self._data = {
-                "package_name": self._package_name,
-                "test_patterns": {},
-                "known_issues": [],
-                "coverage_history": [],
-                "llm_feedback": [],
-            }
-
-    def _save(self) -> None:
-        """Save current data to disk."""
-        self._store.save(self._data)
+        super().__init__(
+            MemoryStore(project_root, filename, locking=locking),
+            auto_flush=auto_flush,
+        )
+
+    def _empty(self) -> dict[str, Any]:
+        """Return the initial package memory structure."""
+        return {
+            "package_name": self._package_name,
+            "test_patterns": {},
+            "known_issues": [],
+            "coverage_history": [],
+            "llm_feedback": [],
+        }
 
     def get_test_patterns(self) -> dict[str, Any]:
         """Get test patterns for this package.
@@ -80,8 +82,11 @@ class PackageMemory:
         Args:
             patterns: Dictionary of test patterns to store.
         """
-        self._data["test_patterns"] = patterns
-        self._save()
+
+        def _op(data: dict[str, Any]) -> None:
+            data["test_patterns"] = patterns
+
+        self._apply(_op)
 
     def add_known_issue(
         self,
@@ -96,17 +101,17 @@ class PackageMemory:
             workaround: Optional workaround or solution.
             context: Additional context about the issue.
         """
-        known_issues = self._data.get("known_issues", [])
-
         issue_entry = {
             "issue": issue,
             "workaround": workaround,
             "timestamp": datetime.now(UTC).isoformat(),
             "context": context or {},
         }
-        known_issues.append(issue_entry)
-        self._data["known_issues"] = known_issues
-        self._save()
+
+        def _op(data: dict[str, Any]) -> None:
+            data.setdefault("known_issues", []).append(dict(issue_entry))
+
+        self._apply(_op)
 
     def get_known_issues(self) -> list[dict[str, Any]]:
         """Get all known issues for this package.
@@ -129,17 +134,17 @@ class PackageMemory:
             line_coverage: Optional line coverage details.
             branch_coverage: Optional branch coverage details.
         """
-        coverage_history = self._data.get("coverage_history", [])
-
         snapshot = {
             "timestamp": datetime.now(UTC).isoformat(),
             "coverage_percent": coverage_percent,
             "line_coverage": line_coverage or {},
             "branch_coverage": branch_coverage or {},
         }
-        coverage_history.append(snapshot)
-        self._data["coverage_history"] = coverage_history
-        self._save()
+
+        def _op(data: dict[str, Any]) -> None:
+            data.setdefault("coverage_history", []).append(dict(snapshot))
+
+        self._apply(_op)
 
     def get_coverage_history(self) -> list[dict[str, Any]]:
         """Get coverage history for this package.
@@ -173,17 +178,17 @@ class PackageMemory:
             content: The feedback content.
             metadata: Additional metadata about the feedback.
         """
-        llm_feedback = self._data.get("llm_feedback", [])
-
         feedback_entry = {
             "type": feedback_type,
             "content": content,
             "timestamp": datetime.now(UTC).isoformat(),
             "metadata": metadata or {},
         }
-        llm_feedback.append(feedback_entry)
-        self._data["llm_feedback"] = llm_feedback
-        self._save()
+
+        def _op(data: dict[str, Any]) -> None:
+            data.setdefault("llm_feedback", []).append(dict(feedback_entry))
+
+        self._apply(_op)
 
     def get_llm_feedback(self) -> list[dict[str, Any]]:
         """Get all LLM feedback for this package.
@@ -195,8 +200,9 @@ class PackageMemory:
 
     def clear(self) -> None:
         """Clear all package memory."""
-        self._store.clear()
-        self._load()
+        with self._store.lock():
+            self._store.clear()
+            self._load()
 
     def to_dict(self) -> dict[str, Any]:
         """Export memory as a dictionary for display or serialization.
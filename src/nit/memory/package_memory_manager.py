@@ -67,6 +67,14 @@ class PackageMemoryManager:
 
         return packages
 
+    def flush_all(self) -> int:
+        """Write pending changes of every loaded package memory to disk.
+
+        Returns:
+            Number of package memory files that were written.
+        """
+        return sum(1 for memory in self._package_memories.values() if memory.flush())
+
     def clear_package_memory(self, package_name: str) -> None:
         """Clear memory for a specific package.
 
@@ -0,0 +1,188 @@
+"""Scoring, deduplication and retrieval for memory patterns.
+
+Known and failed patterns accumulate across runs.  These helpers keep that
+list bounded and cheap to inject into prompts:
+
+- patterns are deduplicated by a hash of their normalised text,
+- each pattern is scored by how often it occurred, decayed by how long ago
+  it was last seen,
+- low-value patterns are evicted once a capacity is exceeded,
+- retrieval returns only the top-K patterns relevant to a filter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import re
+from datetime import UTC, datetime
+from typing import Any
+
+# Default number of known/failed patterns kept in global memory
+DEFAULT_PATTERN_CAPACITY = 200
+
+# Days after which a pattern's frequency weight is halved
+RECENCY_HALF_LIFE_DAYS = 30.0
+
+_SECONDS_PER_DAY = 86400.0
+
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_QUOTED_RE = re.compile(r"(['\"`]).*?\1")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_pattern(text: str) -> str:
+    """Normalise pattern text so trivially different variants compare equal.
+
+    Lower-cases, replaces quoted literals and standalone numbers with
+    placeholders, and collapses whitespace.  ``"Expected 3 but got '4'"`` and
+    ``"expected 5  but got 'x'"`` normalise to the same string.
+
+    Args:
+        text: Raw pattern text.
+
+    Returns:
+        Normalised pattern text.
+    """
+    normalized = _QUOTED_RE.sub("<str>", text.lower())
+    normalized = _NUMBER_RE.sub("<n>", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def pattern_key(text: str) -> str:
+    """Return the deduplication key for a pattern.
+
+    Args:
+        text: Raw pattern text.
+
+    Returns:
+        Short hex digest of the normalised pattern text.
+    """
+    digest = hashlib.sha1(normalize_pattern(text).encode("utf-8"), usedforsecurity=False)
+    return digest.hexdigest()[:16]
+
+
+def entry_key(entry: dict[str, Any]) -> str:
+    """Return the deduplication key of a stored pattern entry.
+
+    Entries written before keys were introduced are keyed on the fly.
+    """
+    key = entry.get("key")
+    if isinstance(key, str) and key:
+        return key
+    return pattern_key(str(entry.get("pattern", "")))
+
+
+def _parse_timestamp(value: object) -> datetime | None:
+    """Parse an ISO timestamp stored on a pattern entry."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def pattern_score(entry: dict[str, Any], *, now: datetime | None = None) -> float:
+    """Score a pattern by frequency decayed by recency.
+
+    Known patterns count ``success_count`` occurrences, failed patterns
+    ``count`` (defaulting to one).  The count is halved for every
+    ``RECENCY_HALF_LIFE_DAYS`` since the pattern was last seen.
+
+    Args:
+        entry: Stored known or failed pattern entry.
+        now: Reference time (defaults to the current time).
+
+    Returns:
+        Non-negative score; higher is more valuable.
+    """
+    count = entry.get("success_count", entry.get("count", 1))
+    frequency = float(count) if isinstance(count, (int, float)) and count > 0 else 1.0
+
+    seen = _parse_timestamp(entry.get("last_used") or entry.get("timestamp"))
+    if seen is None:
+        return frequency
+
+    reference = now or datetime.now(UTC)
+    age_days = max((reference - seen).total_seconds(), 0.0) / _SECONDS_PER_DAY
+    decay: float = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+    return frequency * decay
+
+
+def evict_patterns(
+    patterns: list[dict[str, Any]],
+    capacity: int,
+    *,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Drop the lowest-scoring patterns so at most *capacity* remain.
+
+    Surviving entries keep their original order.
+
+    Args:
+        patterns: Stored pattern entries.
+        capacity: Maximum number of entries to keep.
+        now: Reference time for recency scoring.
+
+    Returns:
+        The bounded list (the input list itself if already within capacity).
+    """
+    if capacity <= 0:
+        return []
+    if len(patterns) <= capacity:
+        return patterns
+
+    reference = now or datetime.now(UTC)
+    keep = set(
+        heapq.nlargest(
+            capacity,
+            range(len(patterns)),
+            key=lambda idx: pattern_score(patterns[idx], now=reference),
+        )
+    )
+    return [entry for idx, entry in enumerate(patterns) if idx in keep]
+
+
+def rank_patterns(
+    patterns: list[dict[str, Any]],
+    *,
+    filter_key: str,
+    filter_value: str,
+    limit: int,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Return the top-*limit* patterns relevant to *filter_value*.
+
+    A pattern is relevant when its ``context[filter_key]`` contains
+    *filter_value* (case-insensitive) or when it has no value for that key.
+    Patterns that match explicitly rank ahead of unscoped ones; within each
+    group patterns are ordered by ``pattern_score``.
+
+    Args:
+        patterns: Stored pattern entries.
+        filter_key: Context key to filter on (e.g. ``"framework"``).
+        filter_value: Value to match against the filter key.
+        limit: Maximum number of patterns to return.
+        now: Reference time for recency scoring.
+
+    Returns:
+        Ranked list of at most *limit* pattern entries.
+    """
+    if limit <= 0:
+        return []
+
+    reference = now or datetime.now(UTC)
+    lv = filter_value.lower()
+    candidates: list[tuple[int, float, int, dict[str, Any]]] = []
+    for idx, entry in enumerate(patterns):
+        scoped = str(entry.get("context", {}).get(filter_key, "") or "")
+        if scoped and lv not in scoped.lower():
+            continue
+        specific = 1 if scoped else 0
+        # Negative index keeps insertion order stable among equal scores
+        candidates.append((specific, pattern_score(entry, now=reference), -idx, entry))
+
+    top = heapq.nlargest(limit, candidates, key=lambda item: item[:3])
+    return [entry for *_, entry in top]
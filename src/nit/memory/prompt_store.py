@@ -11,6 +11,7 @@ import logging
 import os
 import threading
 import uuid
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from nit.models.prompt_record import OutcomeUpdate, PromptLineage, PromptRecord
@@ -25,6 +26,20 @@ logger = logging.getLogger(__name__)
 _PROMPTS_FILE = "prompts.jsonl"
 
 
+@dataclass
+class PromptChunk:
+    """Prompt records appended to the prompts file after a byte offset."""
+
+    records: list[PromptRecord] = field(default_factory=list)
+    """Records in file order, with outcome updates from the chunk applied."""
+
+    updates: list[OutcomeUpdate] = field(default_factory=list)
+    """Outcome updates for records that are not part of this chunk."""
+
+    offset: int = 0
+    """Byte offset just past the last line consumed."""
+
+
 class PromptRecorder:
     """Thread-safe, append-only JSONL recorder for prompt records.
 
@@ -34,12 +49,18 @@ class PromptRecorder:
     """
 
     def __init__(self, project_root: Path) -> None:
+        self._project_root = project_root
         self._history_dir = project_root / ".nit" / "history"
         self._history_dir.mkdir(parents=True, exist_ok=True)
         self._file_path = self._history_dir / _PROMPTS_FILE
         self._lock = threading.Lock()
         self._session_id = os.environ.get("NIT_SESSION_ID", "").strip() or str(uuid.uuid4())
 
+    @property
+    def project_root(self) -> Path:
+        """Project root the recorder writes under."""
+        return self._project_root
+
     @property
     def session_id(self) -> str:
         """Session identifier for grouping prompts from one CLI invocation."""
@@ -158,9 +179,7 @@ class PromptRecorder:
             record_id = update.record_id
             for rec in records:
                 if rec.id == record_id:
-                    rec.outcome = update.outcome
-                    rec.validation_attempts = update.validation_attempts
-                    rec.error_message = update.error_message
+                    _apply_update(rec, update)
                     break
 
         # Apply filters
@@ -204,12 +223,63 @@ class PromptRecorder:
         # Apply any outcome updates
         for update in updates:
             if update.record_id == target.id:
-                target.outcome = update.outcome
-                target.validation_attempts = update.validation_attempts
-                target.error_message = update.error_message
+                _apply_update(target, update)
 
         return target
 
+    def read_since(self, offset: int = 0, *, limit: int = 0) -> PromptChunk:
+        """Read records appended after byte *offset*, in file order.
+
+        Only complete lines are consumed, so a line that is still being
+        appended is picked up by the next call.  Outcome updates that follow
+        a record in the same chunk are merged into it; updates for earlier
+        records are returned separately.  If the file is now shorter than
+        *offset* (it was pruned or replaced), reading restarts from the top.
+
+        Args:
+            offset: Offset returned by a previous call (0 = start of file).
+            limit: Stop before the record after this many (0 = unlimited).
+
+        Returns:
+            The chunk read, including the offset to resume from.
+        """
+        chunk = PromptChunk(offset=offset)
+        try:
+            if self._file_path.stat().st_size < offset:
+                chunk.offset = 0
+        except FileNotFoundError:
+            chunk.offset = 0
+            return chunk
+        except OSError as exc:
+            logger.error("Failed to stat %s: %s", self._file_path, exc)
+            return chunk
+
+        by_id: dict[str, PromptRecord] = {}
+        try:
+            with self._file_path.open("rb") as f:
+                f.seek(chunk.offset)
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    try:
+                        data: dict[str, Any] = json.loads(raw_line)
+                    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                        logger.warning("Skipping malformed line in %s: %s", _PROMPTS_FILE, exc)
+                        chunk.offset += len(raw_line)
+                        continue
+
+                    if data.get("type") != "outcome_update" and 0 < limit <= len(chunk.records):
+                        break
+                    chunk.offset += len(raw_line)
+                    try:
+                        _add_to_chunk(chunk, by_id, data)
+                    except (KeyError, TypeError, ValueError) as exc:
+                        logger.warning("Skipping malformed line in %s: %s", _PROMPTS_FILE, exc)
+        except OSError as exc:
+            logger.error("Failed to read %s: %s", self._file_path, exc)
+
+        return chunk
+
     def _read_raw(self) -> tuple[list[PromptRecord], list[OutcomeUpdate]]:
         """Read all JSONL lines, separating records from updates."""
         records: list[PromptRecord] = []
@@ -271,6 +341,34 @@ def get_prompt_recorder(project_root: Path) -> PromptRecorder:
 
 # ── Helpers ─────────────────────────────────────────────────────
 
+
+def _apply_update(record: PromptRecord, update: OutcomeUpdate) -> None:
+    """Copy an outcome update onto its parent record."""
+    record.outcome = update.outcome
+    record.validation_attempts = update.validation_attempts
+    record.error_message = update.error_message
+
+
+def _add_to_chunk(
+    chunk: PromptChunk,
+    by_id: dict[str, PromptRecord],
+    data: dict[str, Any],
+) -> None:
+    """Add a parsed JSONL line to *chunk*, merging updates into their records."""
+    if data.get("type") == "outcome_update":
+        update = OutcomeUpdate.from_dict(data)
+        parent = by_id.get(update.record_id)
+        if parent is None:
+            chunk.updates.append(update)
+        else:
+            _apply_update(parent, update)
+        return
+
+    record = PromptRecord.from_dict(data)
+    by_id[record.id] = record
+    chunk.records.append(record)
+
+
 _LINEAGE_PREFIX = "nit_"
 _LINEAGE_KEYS = {
     "nit_source_file": "source_file",
@@ -1,8 +1,13 @@
 """Batched prompt sync to the platform.
 
-Buffers prompt records and periodically flushes them to the platform API.
-Only syncs when ``prompts.sync_to_platform`` is enabled in config.
-Supports ``redact_source`` mode to hash message content for privacy.
+Reads prompt records incrementally from the prompts file and uploads them
+to the platform API in gzip-compressed batches.  Only syncs when
+``prompts.sync_to_platform`` is enabled in config.  Supports
+``redact_source`` mode to hash message content for privacy.
+
+A high-water mark (the byte offset in ``prompts.jsonl`` up to which records
+were accepted by the platform) is persisted in ``.nit/memory/prompt_sync.json``
+so records that were already synced are never re-read.
 """
 
 from __future__ import annotations
@@ -10,24 +15,38 @@ from __future__ import annotations
 import hashlib
 import logging
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from nit.utils.platform_client import PlatformClientError, post_platform_prompts
+import requests
+
+from nit.memory.store import MemoryStore
+from nit.utils.platform_client import (
+    PlatformClientError,
+    create_platform_session,
+    post_platform_prompts,
+)
 
 if TYPE_CHECKING:
-    from nit.memory.prompt_store import PromptRecorder
+    from nit.memory.prompt_store import PromptChunk, PromptRecorder
     from nit.models.prompt_record import PromptRecord
     from nit.utils.platform_client import PlatformRuntimeConfig
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_BATCH_SIZE = 50
+_STATE_FILE = "prompt_sync.json"
 
 
 class PromptSyncer:
     """Batched uploader for prompt records to the platform API.
 
-    Records are buffered locally and flushed in batches.
+    Each ``sync()`` resumes from the persisted high-water mark, uploads the
+    new records in batches over a pooled HTTP session and advances the mark
+    after every batch the platform accepts.  The next batch is read and
+    prepared while the previous one is in flight.  ``start()`` runs a sync
+    on a background thread so callers can overlap it with other work.
     """
 
     def __init__(
@@ -37,47 +56,133 @@ class PromptSyncer:
         *,
         redact_source: bool = False,
         batch_size: int = _DEFAULT_BATCH_SIZE,
+        session: requests.Session | None = None,
     ) -> None:
         self._recorder = recorder
         self._platform_config = platform_config
         self._redact_source = redact_source
-        self._batch_size = batch_size
+        self._batch_size = max(batch_size, 1)
+        self._session = session
+        self._owns_session = session is None
         self._lock = threading.Lock()
-        self._last_synced_id: str = ""
+        self._state = MemoryStore[dict[str, Any]](recorder.project_root, _STATE_FILE, locking=True)
+
+    @property
+    def offset(self) -> int:
+        """Byte offset in the prompts file up to which records are synced."""
+        state = self._state.load() or {}
+        offset = state.get("offset", 0)
+        return offset if isinstance(offset, int) and offset > 0 else 0
 
     def sync(self, *, limit: int = 0) -> int:
-        """Push unsynced prompt records to the platform.
+        """Push prompt records recorded since the last successful sync.
+
+        Stops at the first failed batch; the high-water mark only covers
+        batches the platform accepted, so the rest are retried next time.
+
+        Args:
+            limit: Maximum number of records to upload (0 = all pending).
 
         Returns:
             Number of records synced.
         """
-        records = self._recorder.read_all(limit=limit or self._batch_size)
-        if not records:
-            return 0
-
-        # Filter to records after last synced ID
-        if self._last_synced_id:
-            idx = _find_record_index(records, self._last_synced_id)
-            if idx is not None:
-                records = records[:idx]
-
-        if not records:
-            return 0
-
-        payloads = [self._record_to_payload(r) for r in records]
-
-        with self._lock:
-            try:
-                post_platform_prompts(
-                    self._platform_config,
-                    payloads,
-                )
-                self._last_synced_id = records[0].id
-                logger.info("Synced %d prompt records to platform", len(payloads))
-                return len(payloads)
-            except PlatformClientError:
-                logger.exception("Failed to sync prompts to platform")
-                return 0
+        with self._lock, self._state.lock():
+            return self._sync_batches(limit)
+
+    def start(self, *, limit: int = 0) -> Future[int]:
+        """Run ``sync()`` on a background thread.
+
+        Args:
+            limit: Maximum number of records to upload (0 = all pending).
+
+        Returns:
+            Future resolving to the number of records synced.
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nit-prompt-sync")
+        future = executor.submit(self.sync, limit=limit)
+        executor.shutdown(wait=False)
+        return future
+
+    def close(self) -> None:
+        """Close the HTTP session if this syncer created it."""
+        if self._owns_session and self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _sync_batches(self, limit: int) -> int:
+        """Upload pending batches, pipelining reads with uploads."""
+        committed = self.offset
+        read_offset = committed
+        queued = 0
+        synced = 0
+        last_synced_id = ""
+        in_flight: tuple[Future[dict[str, Any]], PromptChunk] | None = None
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="nit-prompt-upload") as uploader:
+            while True:
+                size = self._batch_size if limit <= 0 else min(self._batch_size, limit - queued)
+                chunk = self._recorder.read_since(read_offset, limit=size) if size > 0 else None
+                payloads = self._chunk_to_payloads(chunk) if chunk is not None else []
+
+                if in_flight is not None:
+                    future, sent = in_flight
+                    in_flight = None
+                    try:
+                        future.result()
+                    except (PlatformClientError, requests.RequestException):
+                        logger.exception("Failed to sync prompts to platform")
+                        break
+                    committed = sent.offset
+                    synced += len(sent.records)
+                    if sent.records:
+                        last_synced_id = sent.records[-1].id
+                    self._save_offset(committed, last_synced_id)
+
+                if chunk is None:
+                    break
+                if not payloads:
+                    # Only blank or malformed lines were consumed
+                    if chunk.offset != committed:
+                        committed = chunk.offset
+                        self._save_offset(committed, last_synced_id)
+                    break
+
+                in_flight = (uploader.submit(self._post, payloads), chunk)
+                queued += len(chunk.records)
+                read_offset = chunk.offset
+
+        if synced:
+            logger.info("Synced %d prompt records to platform", synced)
+        return synced
+
+    def _chunk_to_payloads(self, chunk: PromptChunk) -> list[dict[str, Any]]:
+        """Build the upload payloads for a chunk.
+
+        Outcome updates whose record was synced in an earlier batch are sent
+        as ``type: outcome_update`` entries for the platform to apply.
+        """
+        payloads = [self._record_to_payload(r) for r in chunk.records]
+        payloads.extend(update.to_dict() for update in chunk.updates)
+        return payloads
+
+    def _post(self, payloads: list[dict[str, Any]]) -> dict[str, Any]:
+        """Upload one batch over the pooled session."""
+        if self._session is None:
+            self._session = create_platform_session()
+        return post_platform_prompts(
+            self._platform_config,
+            payloads,
+            session=self._session,
+        )
+
+    def _save_offset(self, offset: int, last_synced_id: str) -> None:
+        """Persist the high-water mark."""
+        state = self._state.load() or {}
+        state["offset"] = offset
+        if last_synced_id:
+            state["last_synced_id"] = last_synced_id
+        state["last_sync"] = datetime.now(UTC).isoformat()
+        self._state.save(state)
 
     def _record_to_payload(self, record: PromptRecord) -> dict[str, Any]:
         """Convert a PromptRecord to a platform API payload."""
@@ -97,11 +202,3 @@ class PromptSyncer:
 def _sha256(text: str) -> str:
     """Hash text with SHA-256 for redaction."""
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
-def _find_record_index(records: list[PromptRecord], record_id: str) -> int | None:
-    """Find the index of a record by ID in a list sorted most-recent-first."""
-    for i, r in enumerate(records):
-        if r.id == record_id:
-            return i
-    return None
@@ -2,16 +2,31 @@
 
 Provides a generic JSON-based storage system for different memory types.
 All memory data is stored in `.nit/memory/` directory.
+
+Writes are atomic (temp file plus rename) and can optionally be guarded
+by an advisory file lock so concurrent nit processes don't clobber each
+other.  ``MemoryDocument`` adds dirty tracking on top of the store so
+that many small mutations are coalesced into a single write.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +35,23 @@ DEFAULT_MEMORY_DIR = ".nit/memory"
 
 _T = TypeVar("_T")
 
+# Suffix of the sidecar file used for cross-process locking
+_LOCK_SUFFIX = ".lock"
+
+# In-process locks, one per memory file, shared by all stores for that path
+_PATH_LOCKS: dict[Path, threading.RLock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.RLock:
+    """Return the process-wide lock guarding *path*."""
+    with _PATH_LOCKS_GUARD:
+        lock = _PATH_LOCKS.get(path)
+        if lock is None:
+            lock = threading.RLock()
+            _PATH_LOCKS[path] = lock
+        return lock
+
 
 class MemoryStore(Generic[_T]):
     """Generic JSON-based storage for memory data.
@@ -28,31 +60,71 @@ class MemoryStore(Generic[_T]):
     Subclasses should provide serialization/deserialization logic.
     """
 
-    def __init__(self, project_root: Path, filename: str) -> None:
+    def __init__(self, project_root: Path, filename: str, *, locking: bool = False) -> None:
         """Initialize the memory store.
 
         Args:
             project_root: Root directory of the project.
             filename: Name of the JSON file (e.g., "global.json", "package_foo.json").
+            locking: Whether ``lock()`` should also take a cross-process file lock.
         """
         self._root = project_root
         self._memory_dir = project_root / DEFAULT_MEMORY_DIR
         self._file_path = self._memory_dir / filename
+        self._locking = locking
+
+    @property
+    def locking(self) -> bool:
+        """Whether this store takes a cross-process lock around writes."""
+        return self._locking and fcntl is not None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold exclusive access to the memory file.
+
+        Always serialises threads within this process.  When the store was
+        created with ``locking=True`` an advisory ``flock`` on a sidecar
+        ``.lock`` file also serialises concurrent nit processes.
+        """
+        with _path_lock(self._file_path):
+            if not self.locking:
+                yield
+                return
+
+            lock_path = self._file_path.with_name(self._file_path.name + _LOCK_SUFFIX)
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with lock_path.open("a") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
 
     def save(self, data: dict[str, Any]) -> None:
         """Save data to disk as JSON.
 
+        The document is written to a temporary file in the same directory
+        and renamed over the target, so readers never observe a partial file.
+
         Args:
             data: Dictionary to save.
         """
         # Ensure memory directory and any subdirectories exist
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to file
-        self._file_path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self._file_path.parent,
+            prefix=f".{self._file_path.name}.",
+            suffix=".tmp",
         )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, indent=2, ensure_ascii=False)
+            tmp_path.replace(self._file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         logger.info("Saved memory to %s", self._file_path)
 
     def load(self) -> dict[str, Any] | None:
@@ -96,14 +168,15 @@ class MemoryStore(Generic[_T]):
         Args:
             updates: Dictionary of updates to merge into existing data.
         """
-        # Load existing data or start with empty dict
-        data = self.load() or {}
+        with self.lock():
+            # Load existing data or start with empty dict
+            data = self.load() or {}
 
-        # Merge updates (deep merge for nested dicts)
-        data.update(updates)
+            # Merge updates (deep merge for nested dicts)
+            data.update(updates)
 
-        # Save back
-        self.save(data)
+            # Save back
+            self.save(data)
 
     @property
     def file_path(self) -> Path:
@@ -113,3 +186,119 @@ class MemoryStore(Generic[_T]):
             Path to the JSON file.
         """
         return self._file_path
+
+
+class MemoryDocument:
+    """In-memory JSON document with dirty tracking and coalesced saves.
+
+    Mutations are applied to the in-memory copy immediately and recorded
+    as pending operations.  ``flush()`` writes them out in one atomic save.
+    When the store is locking, the flush re-reads the file under the lock
+    and replays the pending operations on top of it, so updates made by
+    other processes since we loaded are preserved.
+
+    With ``auto_flush=True`` (the default) every mutation is flushed
+    immediately unless it happens inside a ``deferred()`` block.
+    """
+
+    def __init__(self, store: MemoryStore[dict[str, Any]], *, auto_flush: bool = True) -> None:
+        """Initialize the document and load it from *store*.
+
+        Args:
+            store: Backing JSON store.
+            auto_flush: Whether to flush after every mutation outside ``deferred()``.
+        """
+        self._store = store
+        self._auto_flush = auto_flush
+        self._defer_depth = 0
+        self._pending: list[Callable[[dict[str, Any]], None]] = []
+        self._lock = threading.RLock()
+        self._data: dict[str, Any] = {}
+        self._load()
+
+    def _empty(self) -> dict[str, Any]:
+        """Return the initial structure for a document that doesn't exist yet."""
+        return {}
+
+    def _load(self) -> None:
+        """Load data from disk into memory, discarding pending changes."""
+        with self._lock:
+            data = self._store.load()
+            self._data = data if data else self._empty()
+            self._pending = []
+
+    def _apply(self, op: Callable[[dict[str, Any]], None]) -> None:
+        """Apply *op* to the in-memory document and schedule it for saving."""
+        with self._lock:
+            op(self._data)
+            self._pending.append(op)
+            if self._auto_flush and self._defer_depth == 0:
+                self.flush()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes that have not been written to disk."""
+        return bool(self._pending)
+
+    def flush(self) -> bool:
+        """Write pending changes to disk.
+
+        Returns:
+            True if anything was written, False if the document was clean.
+        """
+        with self._lock:
+            if not self._pending:
+                return False
+
+            with self._store.lock():
+                if self._store.locking:
+                    merged = self._store.load() or self._empty()
+                    for op in self._pending:
+                        op(merged)
+                    self._data = merged
+                self._store.save(self._data)
+
+            self._pending = []
+            return True
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Coalesce all mutations inside the block into a single save.
+
+        Blocks may be nested; the write happens when the outermost one exits.
+        """
+        with self._lock:
+            self._defer_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._defer_depth -= 1
+                if self._defer_depth == 0:
+                    self.flush()
+
+    def apply_changes(self, op: Callable[[dict[str, Any]], None]) -> None:
+        """Apply *op* to the raw document as one mutation.
+
+        Used for changes that come from outside the typed accessors, such
+        as sections pulled from the platform.  Like every mutation, *op*
+        is replayed on a freshly loaded copy of the file when flushing a
+        locking store, so it should only depend on its argument.
+
+        Args:
+            op: Function that updates the document dict in place.
+        """
+        self._apply(op)
+
+    def replace(self, data: dict[str, Any]) -> None:
+        """Replace the whole document with *data*.
+
+        Args:
+            data: New document contents.
+        """
+
+        def _op(doc: dict[str, Any]) -> None:
+            doc.clear()
+            doc.update(json.loads(json.dumps(data)))
+
+        self._apply(_op)
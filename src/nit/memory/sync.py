@@ -1,15 +1,32 @@
-"""Memory synchronization between local storage and platform."""
+"""Memory synchronization between local storage and platform.
+
+Pushes and pulls are incremental.  ``sync_meta.json`` records, next to the
+last acknowledged platform version, a fingerprint of every memory section
+as it was when the platform acknowledged it: one hash per dict section
+(conventions, stats, test patterns) and one hash per entry for list
+sections (patterns, issues, coverage history, feedback).  A push then only
+carries sections and entries whose fingerprints changed, plus the
+fingerprints of acknowledged list entries that were removed or evicted
+locally, and a pull asks the platform for changes since the local version.
+
+Delta pushes and gzip request bodies are only used once the platform has
+advertised them in the ``capabilities`` list of a memory response; until
+then every push is a full, uncompressed payload.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from nit.memory.global_memory import GlobalMemory
 from nit.memory.package_memory import PackageMemory
 from nit.memory.package_memory_manager import PackageMemoryManager
+from nit.memory.patterns import entry_key
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -18,57 +35,317 @@ logger = logging.getLogger(__name__)
 
 _SYNC_META_FILE = "sync_meta.json"
 
+# Wire name -> local key for global memory sections
+_GLOBAL_SECTIONS = {
+    "conventions": "conventions",
+    "knownPatterns": "known_patterns",
+    "failedPatterns": "failed_patterns",
+    "generationStats": "generation_stats",
+}
 
-def build_push_payload(
+# Wire name -> local key for package memory sections
+_PACKAGE_SECTIONS = {
+    "testPatterns": "test_patterns",
+    "knownIssues": "known_issues",
+    "coverageHistory": "coverage_history",
+    "llmFeedback": "llm_feedback",
+}
+
+# List sections whose entries are identified by pattern key rather than content
+_PATTERN_SECTIONS = frozenset({"knownPatterns", "failedPatterns"})
+
+_DELTA_MODE = "delta"
+
+# Protocol features the platform advertises in memory responses
+CAPABILITY_DELTA = "delta"
+CAPABILITY_GZIP = "gzip"
+
+
+@dataclass
+class MemoryPush:
+    """A planned memory push: the payload and the state it was built from."""
+
+    payload: dict[str, Any]
+    """Body to POST to ``/api/v1/memory``."""
+
+    fingerprints: dict[str, Any] = field(default_factory=dict)
+    """Section fingerprints of the local memory the payload was built from."""
+
+    compress: bool = False
+    """Whether the platform accepts a gzip-compressed body."""
+
+    changed: bool = True
+    """Whether the payload carries anything the platform does not have yet."""
+
+    @property
+    def is_delta(self) -> bool:
+        """Whether the payload only carries changes since the last sync."""
+        return self.payload.get("mode") == _DELTA_MODE
+
+    @property
+    def empty(self) -> bool:
+        """Whether the push has nothing to send."""
+        return not self.changed
+
+
+def _fingerprint(value: Any) -> str:
+    """Return a short stable hash of a JSON-serialisable value."""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _section_fingerprint(value: Any) -> str | list[str]:
+    """Fingerprint a section: one hash for dicts, one per entry for lists."""
+    if isinstance(value, list):
+        return [_fingerprint(entry) for entry in value]
+    return _fingerprint(value)
+
+
+def _collect_sections(project_root: Path) -> dict[str, Any]:
+    """Read local memory into wire-format sections.
+
+    Returns:
+        ``{"global": {...}, "packages": {name: {...}}}`` keyed by wire names.
+    """
+    global_data = GlobalMemory(project_root).to_dict()
+    sections: dict[str, Any] = {
+        "global": {
+            "conventions": global_data.get("conventions", {}),
+            "knownPatterns": global_data.get("known_patterns", []),
+            "failedPatterns": global_data.get("failed_patterns", []),
+            "generationStats": global_data.get("generation_stats", {}),
+        },
+        "packages": {},
+    }
+
+    manager = PackageMemoryManager(project_root)
+    for name in manager.list_packages():
+        pkg_data = manager.get_package_memory(name).to_dict()
+        sections["packages"][name] = {
+            "testPatterns": pkg_data.get("test_patterns", {}),
+            "knownIssues": pkg_data.get("known_issues", []),
+            "coverageHistory": pkg_data.get("coverage_history", []),
+            "llmFeedback": pkg_data.get("llm_feedback", []),
+        }
+
+    return sections
+
+
+def _fingerprint_sections(sections: dict[str, Any]) -> dict[str, Any]:
+    """Flatten wire-format sections into ``"scope/section" -> fingerprint``."""
+    fingerprints: dict[str, Any] = {
+        f"global/{wire}": _section_fingerprint(value)
+        for wire, value in sections.get("global", {}).items()
+    }
+    for name, pkg_sections in sections.get("packages", {}).items():
+        for wire, value in pkg_sections.items():
+            fingerprints[f"packages/{name}/{wire}"] = _section_fingerprint(value)
+    return fingerprints
+
+
+def _section_delta(value: Any, acked: Any) -> Any | None:
+    """Return the part of a section that changed since *acked*, or None."""
+    if isinstance(value, list):
+        seen = set(acked) if isinstance(acked, list) else set()
+        changed = [entry for entry in value if _fingerprint(entry) not in seen]
+        return changed or None
+    if acked == _fingerprint(value) or (acked is None and not value):
+        return None
+    return value
+
+
+def _removed_entries(acked: dict[str, Any], fingerprints: dict[str, Any]) -> dict[str, Any]:
+    """Return fingerprints of acknowledged list entries no longer present locally.
+
+    Returns:
+        ``{"global": {wire: [...]}, "packages": {name: {wire: [...]}}}``,
+        with empty scopes left out.
+    """
+    removed: dict[str, Any] = {}
+    for key, known in acked.items():
+        if not isinstance(known, list):
+            continue
+        current = fingerprints.get(key)
+        present = set(current) if isinstance(current, list) else set()
+        gone = [fp for fp in dict.fromkeys(known) if fp not in present]
+        if not gone:
+            continue
+        scope, _, wire = key.rpartition("/")
+        if scope == "global":
+            removed.setdefault("global", {})[wire] = gone
+        elif scope.startswith("packages/"):
+            name = scope.removeprefix("packages/")
+            removed.setdefault("packages", {}).setdefault(name, {})[wire] = gone
+    return removed
+
+
+def _capabilities(value: Any) -> list[str] | None:
+    """Return the capability names in a platform response field, or None."""
+    if not isinstance(value, list):
+        return None
+    return [item for item in value if isinstance(item, str)]
+
+
+def plan_push(
     project_root: Path,
     *,
     source: str = "local",
     project_id: str | None = None,
-) -> dict[str, Any]:
-    """Build the memory push payload from local files.
+    full: bool = False,
+) -> MemoryPush:
+    """Plan a memory push against the last acknowledged sync state.
+
+    The first push (or any push with ``full=True``) sends every section, as
+    does every push to a platform that has not advertised delta support.
+    Otherwise the push is a ``mode: "delta"`` payload containing only dict
+    sections whose content changed, list entries that are new or changed,
+    and under ``removed`` the fingerprints of acknowledged list entries that
+    are gone locally.  The platform applies removals before changed entries,
+    so a modified entry replaces its previous version.
 
     Args:
         project_root: Root directory of the project.
         source: Source identifier (``"local"`` or ``"ci"``).
         project_id: Platform project ID (optional, resolved by API key).
+        full: Send the complete memory regardless of sync state.
 
     Returns:
-        Dictionary payload ready to POST to ``/api/v1/memory``.
+        The planned push.
     """
-    global_memory = GlobalMemory(project_root)
-    global_data = global_memory.to_dict()
+    sections = _collect_sections(project_root)
+    fingerprints = _fingerprint_sections(sections)
+    meta = _read_sync_meta(project_root)
+    acked = meta.get("sections")
+    capabilities = _capabilities(meta.get("capabilities")) or []
+    compress = CAPABILITY_GZIP in capabilities
 
     payload: dict[str, Any] = {
         "baseVersion": get_sync_version(project_root),
         "source": source,
-        "global": {
-            "conventions": global_data.get("conventions", {}),
-            "knownPatterns": global_data.get("known_patterns", []),
-            "failedPatterns": global_data.get("failed_patterns", []),
-            "generationStats": global_data.get("generation_stats", {}),
-        },
     }
-
     if project_id:
         payload["projectId"] = project_id
 
-    # Collect package memories
-    manager = PackageMemoryManager(project_root)
-    package_names = manager.list_packages()
-    if package_names:
-        packages: dict[str, Any] = {}
-        for name in package_names:
-            pkg = manager.get_package_memory(name)
-            pkg_data = pkg.to_dict()
-            packages[name] = {
-                "testPatterns": pkg_data.get("test_patterns", {}),
-                "knownIssues": pkg_data.get("known_issues", []),
-                "coverageHistory": pkg_data.get("coverage_history", []),
-                "llmFeedback": pkg_data.get("llm_feedback", []),
-            }
-        payload["packages"] = packages
-
-    return payload
+    if full or CAPABILITY_DELTA not in capabilities or not isinstance(acked, dict) or not acked:
+        payload["global"] = sections["global"]
+        if sections["packages"]:
+            payload["packages"] = sections["packages"]
+        return MemoryPush(
+            payload=payload,
+            fingerprints=fingerprints,
+            compress=compress,
+            changed=full or fingerprints != acked,
+        )
+
+    payload["mode"] = _DELTA_MODE
+    global_delta: dict[str, Any] = {}
+    for wire, value in sections["global"].items():
+        changed = _section_delta(value, acked.get(f"global/{wire}"))
+        if changed is not None:
+            global_delta[wire] = changed
+    if global_delta:
+        payload["global"] = global_delta
+
+    packages_delta: dict[str, Any] = {}
+    for name, pkg_sections in sections["packages"].items():
+        pkg_delta: dict[str, Any] = {}
+        for wire, value in pkg_sections.items():
+            changed = _section_delta(value, acked.get(f"packages/{name}/{wire}"))
+            if changed is not None:
+                pkg_delta[wire] = changed
+        if pkg_delta:
+            packages_delta[name] = pkg_delta
+    if packages_delta:
+        payload["packages"] = packages_delta
+
+    removed = _removed_entries(acked, fingerprints)
+    if removed:
+        payload["removed"] = removed
+
+    return MemoryPush(
+        payload=payload,
+        fingerprints=fingerprints,
+        compress=compress,
+        changed=bool(global_delta or packages_delta or removed),
+    )
+
+
+def build_push_payload(
+    project_root: Path,
+    *,
+    source: str = "local",
+    project_id: str | None = None,
+    full: bool = True,
+) -> dict[str, Any]:
+    """Build the memory push payload from local files.
+
+    Args:
+        project_root: Root directory of the project.
+        source: Source identifier (``"local"`` or ``"ci"``).
+        project_id: Platform project ID (optional, resolved by API key).
+        full: Send the complete memory (default) instead of a delta.
+
+    Returns:
+        Dictionary payload ready to POST to ``/api/v1/memory``.
+    """
+    return plan_push(project_root, source=source, project_id=project_id, full=full).payload
+
+
+def acknowledge_push(
+    project_root: Path,
+    push: MemoryPush,
+    version: int,
+    *,
+    capabilities: Any = None,
+) -> None:
+    """Record that the platform accepted *push* as *version*.
+
+    Args:
+        project_root: Root directory of the project.
+        push: The push that was sent.
+        version: Version number returned by the platform.
+        capabilities: The ``capabilities`` field of the platform response.
+    """
+    set_sync_version(
+        project_root,
+        version,
+        sections=push.fingerprints,
+        capabilities=_capabilities(capabilities),
+    )
+
+
+def _merge_list(local: list[Any], incoming: list[Any], *, by_pattern: bool) -> list[Any]:
+    """Merge incoming list entries into *local*, replacing matching entries."""
+    if by_pattern:
+        merged = {entry_key(e): e for e in local if isinstance(e, dict)}
+        for entry in incoming:
+            if isinstance(entry, dict):
+                merged[entry_key(entry)] = entry
+        return list(merged.values())
+
+    seen = {_fingerprint(e) for e in local}
+    return local + [e for e in incoming if _fingerprint(e) not in seen]
+
+
+def _merge_sections(
+    data: dict[str, Any],
+    incoming: dict[str, Any],
+    mapping: dict[str, str],
+) -> None:
+    """Merge wire-format *incoming* delta sections into local *data* in place."""
+    for wire, local in mapping.items():
+        if wire not in incoming:
+            continue
+        value = incoming[wire]
+        current = data.get(local)
+        if isinstance(value, list):
+            data[local] = _merge_list(
+                current if isinstance(current, list) else [],
+                value,
+                by_pattern=wire in _PATTERN_SECTIONS,
+            )
+        elif isinstance(value, dict):
+            data[local] = {**(current if isinstance(current, dict) else {}), **value}
 
 
 def apply_pull_response(
@@ -77,7 +354,9 @@ def apply_pull_response(
 ) -> None:
     """Apply pulled memory data to local files.
 
-    Overwrites local memory with the merged state from the platform.
+    A full response overwrites local memory with the merged state from the
+    platform.  A ``mode: "delta"`` response only carries sections changed
+    since the requested version; those are merged into local memory.
 
     Args:
         project_root: Root directory of the project.
@@ -87,16 +366,30 @@ def apply_pull_response(
     if not isinstance(version, int) or version <= 0:
         return
 
+    delta = response.get("mode") == _DELTA_MODE
+    meta = _read_sync_meta(project_root)
+    previous = meta.get("sections")
+    acked: dict[str, Any] = dict(previous) if delta and isinstance(previous, dict) else {}
+
     global_data = response.get("global")
     if isinstance(global_data, dict):
         memory = GlobalMemory(project_root)
-        memory._data = {
-            "conventions": global_data.get("conventions", {}),
-            "known_patterns": global_data.get("knownPatterns", []),
-            "failed_patterns": global_data.get("failedPatterns", []),
-            "generation_stats": global_data.get("generationStats", {}),
-        }
-        memory._save()
+        if delta:
+
+            def _merge_global(data: dict[str, Any]) -> None:
+                _merge_sections(data, global_data, _GLOBAL_SECTIONS)
+
+            memory.apply_changes(_merge_global)
+        else:
+            memory.replace(
+                {
+                    "conventions": global_data.get("conventions", {}),
+                    "known_patterns": global_data.get("knownPatterns", []),
+                    "failed_patterns": global_data.get("failedPatterns", []),
+                    "generation_stats": global_data.get("generationStats", {}),
+                }
+            )
+        _acknowledge_received(acked, "global", global_data)
 
     packages = response.get("packages")
     if isinstance(packages, dict):
@@ -104,44 +397,101 @@ def apply_pull_response(
             if not isinstance(pkg_data, dict):
                 continue
             pkg = PackageMemory(project_root, name)
-            pkg._data = {
-                "package_name": name,
-                "test_patterns": pkg_data.get("testPatterns", {}),
-                "known_issues": pkg_data.get("knownIssues", []),
-                "coverage_history": pkg_data.get("coverageHistory", []),
-                "llm_feedback": pkg_data.get("llmFeedback", []),
-            }
-            pkg._save()
+            if delta:
 
-    set_sync_version(project_root, version)
+                def _merge_package(
+                    data: dict[str, Any], incoming: dict[str, Any] = pkg_data
+                ) -> None:
+                    _merge_sections(data, incoming, _PACKAGE_SECTIONS)
 
+                pkg.apply_changes(_merge_package)
+            else:
+                pkg.replace(
+                    {
+                        "package_name": name,
+                        "test_patterns": pkg_data.get("testPatterns", {}),
+                        "known_issues": pkg_data.get("knownIssues", []),
+                        "coverage_history": pkg_data.get("coverageHistory", []),
+                        "llm_feedback": pkg_data.get("llmFeedback", []),
+                    }
+                )
+            _acknowledge_received(acked, f"packages/{name}", pkg_data)
 
-def get_sync_version(project_root: Path) -> int:
-    """Read the last-synced version from ``.nit/memory/sync_meta.json``.
+    set_sync_version(
+        project_root,
+        version,
+        sections=acked,
+        capabilities=_capabilities(response.get("capabilities")),
+    )
 
-    Returns:
-        The version number, or ``0`` if no sync has occurred.
-    """
+
+def _acknowledge_received(acked: dict[str, Any], scope: str, sections: dict[str, Any]) -> None:
+    """Mark sections received from the platform as already known to it."""
+    for wire, value in sections.items():
+        key = f"{scope}/{wire}"
+        if isinstance(value, list):
+            previous = acked.get(key)
+            known = list(previous) if isinstance(previous, list) else []
+            known.extend(_fingerprint(entry) for entry in value)
+            acked[key] = list(dict.fromkeys(known))
+        else:
+            acked[key] = _fingerprint(value)
+
+
+def _read_sync_meta(project_root: Path) -> dict[str, Any]:
+    """Read ``.nit/memory/sync_meta.json``, returning ``{}`` if missing or invalid."""
     meta_path = project_root / ".nit" / "memory" / _SYNC_META_FILE
     if not meta_path.exists():
-        return 0
+        return {}
 
     try:
         data = json.loads(meta_path.read_text(encoding="utf-8"))
-        version = data.get("version", 0)
-        return version if isinstance(version, int) else 0
     except (json.JSONDecodeError, OSError):
-        return 0
+        return {}
+    return data if isinstance(data, dict) else {}
+
 
+def get_sync_version(project_root: Path) -> int:
+    """Read the last-synced version from ``.nit/memory/sync_meta.json``.
 
-def set_sync_version(project_root: Path, version: int) -> None:
-    """Write the last-synced version to ``.nit/memory/sync_meta.json``."""
+    Returns:
+        The version number, or ``0`` if no sync has occurred.
+    """
+    version = _read_sync_meta(project_root).get("version", 0)
+    return version if isinstance(version, int) else 0
+
+
+def set_sync_version(
+    project_root: Path,
+    version: int,
+    *,
+    sections: dict[str, Any] | None = None,
+    capabilities: list[str] | None = None,
+) -> None:
+    """Write the last-synced version to ``.nit/memory/sync_meta.json``.
+
+    Args:
+        project_root: Root directory of the project.
+        version: Version acknowledged by the platform.
+        sections: Section fingerprints acknowledged with this version.  When
+            omitted, previously recorded fingerprints are kept.
+        capabilities: Protocol features the platform advertised.  When
+            omitted, previously recorded capabilities are kept.
+    """
     meta_path = project_root / ".nit" / "memory" / _SYNC_META_FILE
     meta_path.parent.mkdir(parents=True, exist_ok=True)
-    meta_path.write_text(
-        json.dumps(
-            {"version": version, "last_sync": datetime.now(UTC).isoformat()},
-            indent=2,
-        ),
-        encoding="utf-8",
-    )
+
+    previous_meta = _read_sync_meta(project_root)
+    if sections is None:
+        previous = previous_meta.get("sections")
+        sections = previous if isinstance(previous, dict) else None
+    if capabilities is None:
+        capabilities = _capabilities(previous_meta.get("capabilities"))
+
+    meta: dict[str, Any] = {"version": version, "last_sync": datetime.now(UTC).isoformat()}
+    if sections:
+        meta["sections"] = sections
+    if capabilities:
+        meta["capabilities"] = capabilities
+
+    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
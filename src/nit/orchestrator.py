@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+ResultCallback = Callable[[TaskInput, TaskOutput], None]
+"""Called with each task and its output as soon as the task finishes."""
+
 
 @dataclass
 class WorkItem:
@@ -17,6 +22,7 @@ class WorkItem:
 
     agent: BaseAgent
     task: TaskInput
+    priority: int = 0
     future: asyncio.Future[TaskOutput] = field(init=False)
 
     def __post_init__(self) -> None:
@@ -25,11 +31,16 @@ class WorkItem:
 
 
 class Orchestrator:
-    """Async orchestrator with in-memory work queue and parallel execution."""
+    """Async orchestrator with in-memory work queue and parallel execution.
+
+    Queued work is picked up lowest ``priority`` first; items with equal
+    priority run in submission order.
+    """
 
     def __init__(self, max_concurrency: int = 4) -> None:
         self._agents: dict[str, BaseAgent] = {}
-        self._queue: asyncio.Queue[WorkItem] = asyncio.Queue()
+        self._queue: asyncio.PriorityQueue[tuple[int, int, WorkItem]] = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
         self._max_concurrency = max_concurrency
         self._running = False
 
@@ -42,17 +53,21 @@ class Orchestrator:
         """Look up a registered agent by name."""
         return self._agents.get(name)
 
-    async def submit(self, agent: BaseAgent, task: TaskInput) -> TaskOutput:
+    async def submit(self, agent: BaseAgent, task: TaskInput, *, priority: int = 0) -> TaskOutput:
         """Submit a task to an agent and wait for the result."""
-        item = WorkItem(agent=agent, task=task)
-        await self._queue.put(item)
+        item = self._enqueue(agent, task, priority)
         return await item.future
 
+    def _enqueue(self, agent: BaseAgent, task: TaskInput, priority: int) -> WorkItem:
+        item = WorkItem(agent=agent, task=task, priority=priority)
+        self._queue.put_nowait((priority, next(self._sequence), item))
+        return item
+
     async def _worker(self) -> None:
         """Worker coroutine that pulls tasks from the queue and executes them."""
         while self._running:
             try:
-                item = await asyncio.wait_for(self._queue.get(), timeout=0.5)
+                _, _, item = await asyncio.wait_for(self._queue.get(), timeout=0.5)
             except TimeoutError:
                 continue
 
@@ -88,14 +103,44 @@ class Orchestrator:
         await asyncio.gather(*workers, return_exceptions=True)
         logger.info("Orchestrator stopped")
 
-    async def run_all(self, tasks: list[tuple[BaseAgent, TaskInput]]) -> list[TaskOutput]:
+    async def run_all(
+        self,
+        tasks: list[tuple[BaseAgent, TaskInput]],
+        *,
+        priorities: Sequence[int] | None = None,
+        on_result: ResultCallback | None = None,
+    ) -> list[TaskOutput]:
         """Submit a batch of tasks and wait for all results.
 
-        Convenience method that starts workers, submits all tasks,
-        waits for results, and shuts down.
+        Convenience method that queues all tasks, starts workers, waits
+        for results, and shuts down.  Tasks are queued before any worker
+        starts, so ``priorities`` decide the order in which they run.
+
+        Args:
+            tasks: ``(agent, task)`` pairs to run.
+            priorities: Optional per-task priority (lower runs first),
+                parallel to ``tasks``.
+            on_result: Optional callback invoked with each task's output as
+                soon as it completes, in completion order.
+
+        Returns:
+            Task outputs in the same order as ``tasks``.
         """
+        if priorities is not None and len(priorities) != len(tasks):
+            raise ValueError("priorities must have one entry per task")
+
+        items = [
+            self._enqueue(agent, task, priorities[index] if priorities is not None else 0)
+            for index, (agent, task) in enumerate(tasks)
+        ]
+
+        async def _collect(item: WorkItem) -> TaskOutput:
+            result = await item.future
+            if on_result is not None:
+                on_result(item.task, result)
+            return result
+
         workers = await self.start()
-        futures = [asyncio.ensure_future(self.submit(agent, task)) for agent, task in tasks]
-        results = await asyncio.gather(*futures)
+        results = await asyncio.gather(*(_collect(item) for item in items))
         await self.stop(workers)
         return list(results)
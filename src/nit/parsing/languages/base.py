@@ -11,8 +11,8 @@ from nit.parsing.treesitter import (
     ImportInfo,
     ParseResult,
     collect_error_ranges,
-    get_parser,
     has_parse_errors,
+    parse_code,
 )
 
 if TYPE_CHECKING:
@@ -36,9 +36,7 @@ class LanguageExtractor(ABC):
 
     def extract(self, source: bytes) -> ParseResult:
         """Parse source and extract all code structures."""
-        parser = get_parser(self.language)
-        tree = parser.parse(source)
-        root = tree.root_node
+        root = parse_code(source, self.language).root_node
 
         return ParseResult(
             language=self.language,
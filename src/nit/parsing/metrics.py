@@ -0,0 +1,323 @@
+"""Per-function complexity, call sites and identifier uses from one AST walk.
+
+``collect_function_facts`` walks a parsed file once and, for each function
+body it is given, counts decision points (cyclomatic complexity), records
+every call site with its exact line, and notes the first use of selected
+identifiers (names bound by imports).  The node types that count as
+decisions and calls differ per grammar and are listed in
+``LANGUAGE_NODES`` for every supported language.
+
+Nodes are attributed to the innermost listed function whose body contains
+them, so the bodies of nested, unlisted functions (closures, lambdas)
+count towards the function that defines them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import tree_sitter
+
+# Decision kinds; ``else`` is recorded but does not add complexity
+DECISION_IF = "if"
+DECISION_ELSE = "else"
+DECISION_FOR = "for"
+DECISION_WHILE = "while"
+DECISION_CASE = "case"
+DECISION_CATCH = "catch"
+DECISION_AND = "and"
+DECISION_OR = "or"
+DECISION_TERNARY = "ternary"
+
+NON_BRANCHING_DECISIONS = frozenset({DECISION_ELSE})
+
+# Marks binary operator nodes whose kind depends on the operator
+_OPERATOR = "operator"
+
+_BOOLEAN_OPERATORS = {
+    "&&": DECISION_AND,
+    "and": DECISION_AND,
+    "||": DECISION_OR,
+    "or": DECISION_OR,
+    "??": DECISION_OR,
+}
+
+# Fields followed from a call's callee expression down to the called name
+_CALLEE_FIELDS = ("name", "attribute", "property", "field", "function")
+_NAME_TYPES = frozenset({"identifier", "field_identifier", "property_identifier"})
+_MAX_CALLEE_DEPTH = 8
+
+
+@dataclass(frozen=True)
+class LanguageNodes:
+    """Node types of one grammar that matter for function metrics."""
+
+    decisions: dict[str, str]
+    """Node type -> decision kind."""
+
+    calls: dict[str, str]
+    """Call node type -> field holding the callee expression."""
+
+    identifiers: frozenset[str] = frozenset({"identifier"})
+    """Node types of plain identifiers."""
+
+
+_C_DECISIONS = {
+    "if_statement": DECISION_IF,
+    "else_clause": DECISION_ELSE,
+    "for_statement": DECISION_FOR,
+    "while_statement": DECISION_WHILE,
+    "do_statement": DECISION_WHILE,
+    "case_statement": DECISION_CASE,
+    "conditional_expression": DECISION_TERNARY,
+    "binary_expression": _OPERATOR,
+}
+
+_JS_NODES = LanguageNodes(
+    decisions={
+        "if_statement": DECISION_IF,
+        "else_clause": DECISION_ELSE,
+        "for_statement": DECISION_FOR,
+        "for_in_statement": DECISION_FOR,
+        "while_statement": DECISION_WHILE,
+        "do_statement": DECISION_WHILE,
+        "switch_case": DECISION_CASE,
+        "catch_clause": DECISION_CATCH,
+        "ternary_expression": DECISION_TERNARY,
+        "binary_expression": _OPERATOR,
+    },
+    calls={"call_expression": "function"},
+)
+
+LANGUAGE_NODES: dict[str, LanguageNodes] = {
+    "python": LanguageNodes(
+        decisions={
+            "if_statement": DECISION_IF,
+            "elif_clause": DECISION_IF,
+            "if_clause": DECISION_IF,
+            "else_clause": DECISION_ELSE,
+            "for_statement": DECISION_FOR,
+            "for_in_clause": DECISION_FOR,
+            "while_statement": DECISION_WHILE,
+            "case_clause": DECISION_CASE,
+            "except_clause": DECISION_CATCH,
+            "conditional_expression": DECISION_TERNARY,
+            "boolean_operator": _OPERATOR,
+        },
+        calls={"call": "function"},
+    ),
+    "javascript": _JS_NODES,
+    "typescript": _JS_NODES,
+    "tsx": _JS_NODES,
+    "c": LanguageNodes(decisions=_C_DECISIONS, calls={"call_expression": "function"}),
+    "cpp": LanguageNodes(
+        decisions={
+            **_C_DECISIONS,
+            "for_range_loop": DECISION_FOR,
+            "catch_clause": DECISION_CATCH,
+        },
+        calls={"call_expression": "function"},
+    ),
+    "java": LanguageNodes(
+        decisions={
+            "if_statement": DECISION_IF,
+            "for_statement": DECISION_FOR,
+            "enhanced_for_statement": DECISION_FOR,
+            "while_statement": DECISION_WHILE,
+            "do_statement": DECISION_WHILE,
+            "switch_label": DECISION_CASE,
+            "catch_clause": DECISION_CATCH,
+            "ternary_expression": DECISION_TERNARY,
+            "binary_expression": _OPERATOR,
+        },
+        calls={"method_invocation": "name"},
+    ),
+    "go": LanguageNodes(
+        decisions={
+            "if_statement": DECISION_IF,
+            "for_statement": DECISION_FOR,
+            "expression_case": DECISION_CASE,
+            "type_case": DECISION_CASE,
+            "communication_case": DECISION_CASE,
+            "binary_expression": _OPERATOR,
+        },
+        calls={"call_expression": "function"},
+    ),
+    "rust": LanguageNodes(
+        decisions={
+            "if_expression": DECISION_IF,
+            "else_clause": DECISION_ELSE,
+            "for_expression": DECISION_FOR,
+            "while_expression": DECISION_WHILE,
+            "match_arm": DECISION_CASE,
+            "binary_expression": _OPERATOR,
+        },
+        calls={"call_expression": "function"},
+    ),
+    "csharp": LanguageNodes(
+        decisions={
+            "if_statement": DECISION_IF,
+            "for_statement": DECISION_FOR,
+            "foreach_statement": DECISION_FOR,
+            "while_statement": DECISION_WHILE,
+            "do_statement": DECISION_WHILE,
+            "switch_section": DECISION_CASE,
+            "switch_expression_arm": DECISION_CASE,
+            "catch_clause": DECISION_CATCH,
+            "conditional_expression": DECISION_TERNARY,
+            "binary_expression": _OPERATOR,
+        },
+        calls={"invocation_expression": "function"},
+    ),
+}
+
+
+@dataclass
+class FunctionFacts:
+    """What one walk of a function body found."""
+
+    decision_points: dict[str, int] = field(default_factory=dict)
+    """Count of each decision kind (``if``, ``for``, ``and``, ...)."""
+
+    calls: list[tuple[str, int]] = field(default_factory=list)
+    """Called names with the line of each call, in source order."""
+
+    identifiers: dict[str, int] = field(default_factory=dict)
+    """First line on which each watched identifier is used."""
+
+    @property
+    def cyclomatic(self) -> int:
+        """Cyclomatic complexity: 1 + branching decision points."""
+        return 1 + sum(
+            count
+            for kind, count in self.decision_points.items()
+            if kind not in NON_BRANCHING_DECISIONS
+        )
+
+
+def collect_function_facts(
+    root: tree_sitter.Node,
+    language: str,
+    bodies: Sequence[str],
+    *,
+    watch: Iterable[str] = (),
+) -> list[FunctionFacts | None]:
+    """Walk *root* once and collect facts for each function body in *bodies*.
+
+    Args:
+        root: Root node of the parsed file.
+        language: Tree-sitter language name of the file.
+        bodies: Body texts of the functions of interest, as extracted
+            (``FunctionInfo.body_text``).
+        watch: Identifiers whose first use per function is recorded.
+
+    Returns:
+        Facts aligned with *bodies*; ``None`` for bodies that were not
+        found in the tree (empty bodies or an unsupported language).
+    """
+    nodes = LANGUAGE_NODES.get(language)
+    results: list[FunctionFacts | None] = [None] * len(bodies)
+    if nodes is None:
+        return results
+
+    # Function bodies are ``body`` fields; their byte length is a cheap
+    # first filter before comparing text
+    by_length: dict[int, list[int]] = {}
+    for index, body in enumerate(bodies):
+        if body:
+            by_length.setdefault(len(body.encode("utf-8")), []).append(index)
+    watched = {name.encode("utf-8") for name in watch}
+
+    scopes: list[tuple[int, FunctionFacts]] = []  # (end byte, facts) of open bodies
+    cursor = root.walk()
+    while (node := cursor.node) is not None:
+        while scopes and node.start_byte >= scopes[-1][0]:
+            scopes.pop()
+        if cursor.field_name == "body":
+            facts = _claim(node, by_length, bodies, results)
+            if facts is not None:
+                scopes.append((node.end_byte, facts))
+        if scopes:
+            _record(node, nodes, scopes[-1][1], watched)
+
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return results
+    return results
+
+
+def _claim(
+    node: tree_sitter.Node,
+    by_length: dict[int, list[int]],
+    bodies: Sequence[str],
+    results: list[FunctionFacts | None],
+) -> FunctionFacts | None:
+    """Match *node* to the first unclaimed body with the same text."""
+    candidates = by_length.get(node.end_byte - node.start_byte)
+    if not candidates:
+        return None
+    text = node.text.decode("utf-8", errors="replace") if node.text else ""
+    for index in candidates:
+        if results[index] is None and bodies[index] == text:
+            facts = FunctionFacts()
+            results[index] = facts
+            return facts
+    return None
+
+
+def _record(
+    node: tree_sitter.Node,
+    nodes: LanguageNodes,
+    facts: FunctionFacts,
+    watched: set[bytes],
+) -> None:
+    node_type = node.type
+    kind = nodes.decisions.get(node_type)
+    if kind == _OPERATOR:
+        operator = node.child_by_field_name("operator")
+        kind = _BOOLEAN_OPERATORS.get(operator.type) if operator is not None else None
+    elif kind == DECISION_CASE:
+        first = node.child(0)
+        if first is not None and first.type == "default":
+            kind = None
+    if kind is not None:
+        facts.decision_points[kind] = facts.decision_points.get(kind, 0) + 1
+        return
+
+    callee_field = nodes.calls.get(node_type)
+    if callee_field is not None:
+        name = _callee_name(node.child_by_field_name(callee_field))
+        if name:
+            facts.calls.append((name, node.start_point.row + 1))
+        return
+
+    if watched and node_type in nodes.identifiers:
+        text = node.text
+        if text in watched:
+            name = text.decode("utf-8")
+            if name not in facts.identifiers:
+                facts.identifiers[name] = node.start_point.row + 1
+
+
+def _callee_name(target: tree_sitter.Node | None) -> str | None:
+    """The called name of a callee expression (``b`` in ``a.b(...)``)."""
+    for _ in range(_MAX_CALLEE_DEPTH):
+        if target is None:
+            return None
+        if target.type in _NAME_TYPES:
+            return target.text.decode("utf-8", errors="replace") if target.text else None
+        target = next(
+            (
+                child
+                for name in _CALLEE_FIELDS
+                if (child := target.child_by_field_name(name)) is not None
+            ),
+            None,
+        )
+    return None
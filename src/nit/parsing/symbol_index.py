@@ -0,0 +1,588 @@
+"""Project-wide symbol index: definitions, call sites and import edges.
+
+``CodeAnalyzer`` sees one file at a time, so its call graph stops at the
+file boundary.  ``SymbolIndex`` records, for every source file of a
+project, the functions, methods and classes it defines, the calls made
+inside each function body and the project files it imports, and answers
+cross-file questions from memory:
+
+- ``definitions("name")`` — where a symbol is defined;
+- ``callers("name")`` — every call site of a function or method;
+- ``dependencies(path)`` / ``dependents(path)`` — import edges, with
+  transitive reverse reachability for impact analysis.
+
+The index is persisted to ``.nit/cache/symbol_index.json``.  Each file's
+entry carries the file's modification time and size; ``update`` (and
+``load_symbol_index``) re-extract only the files whose signature changed
+and drop the files that are gone.  Without an explicit file list,
+``load_symbol_index`` indexes every source file of the project outside
+dependency, build and VCS directories.  Imports are stored as written and
+resolved against the indexed files whenever the file set changes, so a
+newly added module is picked up by the files that already import it.
+
+Import resolution is by path: Python modules (an absolute import only
+when exactly one source root provides the module), relative JavaScript and
+TypeScript specifiers, Java packages, Go package directories, quoted
+C/C++ includes and ``crate``/``self``/``super`` Rust paths.  C# ``using``
+directives name namespaces, which do not map to files, and add no edges.
+Call sites are matched by name (``obj.save()`` is a call of ``save``);
+``callers(name, path=...)`` narrows them to the files that can reach the
+definition.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import posixpath
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from nit.parsing.languages import extract_from_source
+from nit.parsing.metrics import collect_function_facts
+from nit.parsing.treesitter import EXTENSION_TO_LANGUAGE, detect_language, parse_code
+from nit.utils.cache import CACHE_DIR, MemoryCache, load_json_cache, save_json_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+SYMBOL_INDEX_CACHE_PATH = CACHE_DIR / "symbol_index.json"
+
+# Layout of SymbolIndex.to_dict(); an index saved in another layout is rebuilt
+_FORMAT_VERSION = 1
+
+KIND_FUNCTION = "function"
+KIND_METHOD = "method"
+KIND_CLASS = "class"
+
+_JS_LANGUAGES = frozenset({"javascript", "typescript", "tsx"})
+_JS_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+_RUST_PREFIXES = frozenset({"crate", "self", "super"})
+_RUST_GROUP = re.compile(r"::\{.*$|::\*$")
+
+# Directories never indexed when the whole project is walked
+_SKIP_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".nit",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        "dist",
+        "build",
+        ".next",
+        "target",
+        "vendor",
+    }
+)
+
+# Indexes shared by every caller in the process, keyed by project root
+_index_cache: MemoryCache[SymbolIndex] = MemoryCache(max_size=8)
+
+# One lock per project root: builders load the shared index from worker threads
+_index_locks: dict[str, threading.Lock] = {}
+_index_locks_guard = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A function, method or class definition."""
+
+    name: str
+    """Qualified name (``Class.method`` for methods)."""
+
+    kind: str
+    """``function``, ``method`` or ``class``."""
+
+    path: str
+    """Project-relative POSIX path of the defining file."""
+
+    start_line: int
+    end_line: int
+
+
+@dataclass(frozen=True)
+class CallSite:
+    """A call made inside a function body."""
+
+    path: str
+    """Project-relative POSIX path of the calling file."""
+
+    caller: str
+    """Qualified name of the calling function."""
+
+    callee: str
+    """Called name, without receiver or module (``save`` for ``obj.save()``)."""
+
+    line: int
+
+
+@dataclass
+class _FileEntry:
+    """What one source file contributes to the index."""
+
+    signature: tuple[int, int]
+    """Modification time (ns) and size the entry was built from."""
+
+    language: str
+    symbols: list[Symbol] = field(default_factory=list)
+    calls: list[CallSite] = field(default_factory=list)
+    imports: list[tuple[str, list[str]]] = field(default_factory=list)
+    """Imported module and names, as written."""
+
+
+class SymbolIndex:
+    """Definitions, call sites and import edges of a project's source files.
+
+    Lookups take absolute paths or paths relative to *root*; results use
+    project-relative POSIX paths.
+
+    Args:
+        root: Project root directory.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root.resolve()
+        self._files: dict[str, _FileEntry] = {}
+        # Derived lookups, rebuilt lazily after the file set changes
+        self._definitions: dict[str, list[Symbol]] | None = None
+        self._callers: dict[str, list[CallSite]] = {}
+        self._imports: dict[str, list[str]] = {}
+        self._importers: dict[str, list[str]] = {}
+
+    @property
+    def root(self) -> Path:
+        """Project root the index paths are relative to."""
+        return self._root
+
+    @property
+    def file_count(self) -> int:
+        """Number of indexed files."""
+        return len(self._files)
+
+    def has_file(self, path: str | Path) -> bool:
+        """Whether *path* is indexed."""
+        return self.relative_path(path) in self._files
+
+    def update(self, paths: Iterable[str | Path]) -> int:
+        """Bring the index in line with *paths* (the project's source files).
+
+        Files whose modification time or size changed are re-extracted;
+        files not in *paths* or no longer on disk are dropped.
+
+        Returns:
+            Number of files added, re-extracted or dropped.
+        """
+        wanted: dict[str, Path] = {}
+        for path in paths:
+            relative = self.relative_path(path)
+            wanted[relative] = self._root / relative
+        changed = 0
+        for relative in [p for p in self._files if p not in wanted]:
+            del self._files[relative]
+            changed += 1
+        for relative, absolute in wanted.items():
+            try:
+                stat = absolute.stat()
+            except OSError:
+                if self._files.pop(relative, None) is not None:
+                    changed += 1
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            entry = self._files.get(relative)
+            if entry is not None and entry.signature == signature:
+                continue
+            entry = _index_file(absolute, relative, signature)
+            if entry is None:
+                if self._files.pop(relative, None) is not None:
+                    changed += 1
+                continue
+            self._files[relative] = entry
+            changed += 1
+        if changed:
+            self._definitions = None
+        return changed
+
+    def defined_in(self, path: str | Path) -> list[Symbol]:
+        """Functions, methods and classes defined in *path*."""
+        entry = self._files.get(self.relative_path(path))
+        return list(entry.symbols) if entry is not None else []
+
+    def definitions(self, name: str) -> list[Symbol]:
+        """Definitions of *name* (a bare or ``Class.method`` name)."""
+        return list(self._lookups().get(name, ()))
+
+    def callers(self, name: str, *, path: str | Path | None = None) -> list[CallSite]:
+        """Call sites of the function or method *name*.
+
+        Args:
+            name: Function name; for ``Class.method`` the method name is used.
+            path: File defining the callee.  When given, only calls made in
+                that file or in files importing it are returned.
+        """
+        self._lookups()
+        sites = self._callers.get(name.rpartition(".")[2], [])
+        if path is None:
+            return list(sites)
+        target = self.relative_path(path)
+        return [
+            site
+            for site in sites
+            if site.path == target or target in self._imports.get(site.path, ())
+        ]
+
+    def dependencies(self, path: str | Path) -> list[str]:
+        """Project files imported by *path*, in import order."""
+        self._lookups()
+        return list(self._imports.get(self.relative_path(path), ()))
+
+    def dependents(self, path: str | Path, *, transitive: bool = True) -> list[str]:
+        """Files importing *path*, directly or (by default) through other files."""
+        self._lookups()
+        start = self.relative_path(path)
+        if not transitive:
+            return sorted(self._importers.get(start, ()))
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for importer in self._importers.get(queue.popleft(), ()):
+                if importer not in seen:
+                    seen.add(importer)
+                    queue.append(importer)
+        seen.discard(start)
+        return sorted(seen)
+
+    def relative_path(self, path: str | Path) -> str:
+        """Return *path* relative to the project root, in POSIX form."""
+        candidate = Path(path)
+        if not candidate.is_absolute():
+            return posixpath.normpath(candidate.as_posix())
+        try:
+            return candidate.resolve().relative_to(self._root).as_posix()
+        except ValueError:
+            return candidate.as_posix()
+
+    def _lookups(self) -> dict[str, list[Symbol]]:
+        """Definitions by name, rebuilding every derived lookup if stale."""
+        if self._definitions is None:
+            self._definitions = self._build_lookups()
+        return self._definitions
+
+    def _build_lookups(self) -> dict[str, list[Symbol]]:
+        definitions: dict[str, list[Symbol]] = {}
+        callers: dict[str, list[CallSite]] = {}
+        imports: dict[str, list[str]] = {}
+        importers: dict[str, list[str]] = {}
+        resolver = _ImportResolver(self._files)
+        for path in sorted(self._files):
+            entry = self._files[path]
+            for symbol in entry.symbols:
+                definitions.setdefault(symbol.name, []).append(symbol)
+                if symbol.kind == KIND_METHOD:
+                    definitions.setdefault(symbol.name.rpartition(".")[2], []).append(symbol)
+            for site in entry.calls:
+                callers.setdefault(site.callee, []).append(site)
+            resolved: list[str] = []
+            for module, names in entry.imports:
+                for target in resolver.resolve(path, entry.language, module, names):
+                    if target != path and target not in resolved:
+                        resolved.append(target)
+                        importers.setdefault(target, []).append(path)
+            if resolved:
+                imports[path] = resolved
+        self._callers = callers
+        self._imports = imports
+        self._importers = importers
+        return definitions
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON-serialisable form of the index."""
+        return {
+            "format": _FORMAT_VERSION,
+            "files": {
+                path: {
+                    "sig": list(entry.signature),
+                    "lang": entry.language,
+                    "defs": [[s.name, s.kind, s.start_line, s.end_line] for s in entry.symbols],
+                    "calls": [[c.caller, c.callee, c.line] for c in entry.calls],
+                    "imports": [[module, names] for module, names in entry.imports],
+                }
+                for path, entry in self._files.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, root: Path, data: dict[str, object]) -> SymbolIndex | None:
+        """Rebuild an index saved with ``to_dict``; ``None`` if unusable."""
+        files_data = data.get("files")
+        if data.get("format") != _FORMAT_VERSION or not isinstance(files_data, dict):
+            return None
+        index = cls(root)
+        for path, entry in files_data.items():
+            mtime, size = entry["sig"]
+            index._files[path] = _FileEntry(
+                signature=(int(mtime), int(size)),
+                language=str(entry["lang"]),
+                symbols=[
+                    Symbol(str(name), str(kind), path, int(start), int(end))
+                    for name, kind, start, end in entry["defs"]
+                ],
+                calls=[
+                    CallSite(path, str(caller), str(callee), int(line))
+                    for caller, callee, line in entry["calls"]
+                ],
+                imports=[
+                    (str(module), [str(n) for n in names]) for module, names in entry["imports"]
+                ],
+            )
+        return index
+
+
+def load_symbol_index(
+    project_root: Path,
+    paths: Iterable[str | Path] | None = None,
+    *,
+    persist: bool = True,
+) -> SymbolIndex:
+    """Return the symbol index of *project_root*, updated for *paths*.
+
+    The index is shared by every caller in the process; otherwise it is
+    read from the persisted cache.  Either way only the files that changed
+    since are re-extracted, and the cache is rewritten when anything did.
+
+    Args:
+        project_root: Project root directory.
+        paths: The project's source files (absolute or root-relative);
+            by default every source file under *project_root*.
+        persist: Whether to read and write ``.nit/cache/symbol_index.json``.
+
+    Returns:
+        The up-to-date index.
+    """
+    root = project_root.resolve()
+    key = str(root)
+    with _index_lock(key):
+        index = _index_cache.get(key)
+        if index is None and persist:
+            index = _read_cache(root, project_root)
+        if index is None:
+            index = SymbolIndex(root)
+        changed = index.update(_source_files(root) if paths is None else paths)
+        if changed:
+            logger.debug("Re-indexed symbols of %d files in %s", changed, root)
+            if persist:
+                save_json_cache(project_root, SYMBOL_INDEX_CACHE_PATH, index.to_dict())
+        _index_cache.put(key, index)
+    return index
+
+
+def _index_lock(key: str) -> threading.Lock:
+    """Lock serialising updates of the shared index of project root *key*."""
+    with _index_locks_guard:
+        return _index_locks.setdefault(key, threading.Lock())
+
+
+def _source_files(root: Path) -> list[Path]:
+    """Source files under *root*, skipping dependency, build and VCS directories."""
+    files: list[Path] = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+        base = Path(directory)
+        files.extend(
+            base / name
+            for name in sorted(filenames)
+            if Path(name).suffix.lower() in EXTENSION_TO_LANGUAGE
+        )
+    return files
+
+
+def _index_file(path: Path, relative: str, signature: tuple[int, int]) -> _FileEntry | None:
+    """Extract the entry of one file; ``None`` for unsupported or unreadable files."""
+    language = detect_language(path)
+    if language is None:
+        return None
+    try:
+        source = path.read_bytes()
+        result = extract_from_source(source, language)
+        tree = parse_code(source, language)
+    except (OSError, ValueError) as exc:
+        logger.debug("Could not index symbols of %s: %s", path, exc)
+        return None
+
+    entry = _FileEntry(signature=signature, language=language)
+    functions = [(func.name, KIND_FUNCTION, func) for func in result.functions]
+    functions.extend(
+        (f"{cls.name}.{method.name}", KIND_METHOD, method)
+        for cls in result.classes
+        for method in cls.methods
+    )
+    entry.symbols = [
+        Symbol(name, kind, relative, func.start_line, func.end_line)
+        for name, kind, func in functions
+    ]
+    entry.symbols.extend(
+        Symbol(cls.name, KIND_CLASS, relative, cls.start_line, cls.end_line)
+        for cls in result.classes
+    )
+    all_facts = collect_function_facts(
+        tree.root_node, language, [func.body_text for _, _, func in functions]
+    )
+    for (name, _, _), facts in zip(functions, all_facts, strict=True):
+        if facts is not None:
+            entry.calls.extend(
+                CallSite(relative, name, callee, line) for callee, line in facts.calls
+            )
+    entry.imports = [(imp.module, list(imp.names)) for imp in result.imports if imp.module]
+    return entry
+
+
+class _ImportResolver:
+    """Resolves written imports to indexed files by path."""
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        self._paths = set(paths)
+        # Every trailing run of path components -> files (or files in the directory)
+        self._by_suffix: dict[str, list[str]] = {}
+        self._by_dir_suffix: dict[str, list[str]] = {}
+        for path in sorted(self._paths):
+            parts = path.split("/")
+            for start in range(len(parts)):
+                self._by_suffix.setdefault("/".join(parts[start:]), []).append(path)
+                if start < len(parts) - 1:
+                    self._by_dir_suffix.setdefault("/".join(parts[start:-1]), []).append(path)
+
+    def resolve(self, path: str, language: str, module: str, names: list[str]) -> list[str]:
+        """Indexed files the import *module* (importing *names*) in *path* refers to."""
+        directory = posixpath.dirname(path)
+        if language == "python":
+            return self._python(directory, module, names)
+        if language in _JS_LANGUAGES:
+            return self._javascript(directory, module)
+        if language in {"c", "cpp"}:
+            return self._include(directory, module)
+        by_module = {"java": self._java, "go": self._go, "rust": self._rust}.get(language)
+        return by_module(module) if by_module else []  # C# namespaces name no files
+
+    def _python(self, directory: str, module: str, names: list[str]) -> list[str]:
+        level = len(module) - len(module.lstrip("."))
+        parts = [part for part in module[level:].split(".") if part]
+        stem = "/".join(parts)
+        lookup = self._module
+        if level:
+            base = directory
+            for _ in range(level - 1):
+                base = posixpath.dirname(base)
+            stem = _join(base, stem)
+            lookup = self._exact
+        package = (lookup(f"{stem}.py") if parts else None) or lookup(
+            f"{_join(stem, '__init__')}.py"
+        )
+        # ``from pkg import mod`` imports the package and the submodule
+        submodules = [target for name in names if (target := lookup(f"{_join(stem, name)}.py"))]
+        return list(dict.fromkeys([*([package] if package else []), *submodules]))
+
+    def _javascript(self, directory: str, module: str) -> list[str]:
+        if not module.startswith("."):
+            return []  # packages from node_modules
+        target = _join(directory, module)
+        stem, ext = posixpath.splitext(target)
+        candidates = [target, *(target + e for e in _JS_EXTENSIONS)]
+        if ext in _JS_EXTENSIONS:
+            # ``./util.js`` may name the TypeScript source ``./util.ts``
+            candidates.extend(stem + e for e in _JS_EXTENSIONS)
+        candidates.extend(f"{target}/index{e}" for e in _JS_EXTENSIONS)
+        found = next((c for c in candidates if c in self._paths), None)
+        return [found] if found else []
+
+    def _java(self, module: str) -> list[str]:
+        parts = module.split(".")
+        found = self._suffix("/".join(parts) + ".java")
+        if found:
+            return [found]
+        package = [p for p in self._by_dir_suffix.get("/".join(parts), []) if p.endswith(".java")]
+        if package:
+            return package  # wildcard import
+        found = self._suffix("/".join(parts[:-1]) + ".java") if len(parts) > 1 else None
+        return [found] if found else []  # static member import
+
+    def _go(self, module: str) -> list[str]:
+        parts = module.split("/")
+        for start in range(len(parts)):
+            files = [
+                p for p in self._by_dir_suffix.get("/".join(parts[start:]), []) if p.endswith(".go")
+            ]
+            if files:
+                return files
+        return []
+
+    def _include(self, directory: str, module: str) -> list[str]:
+        found = self._exact(_join(directory, module)) or self._suffix(module)
+        return [found] if found else []
+
+    def _rust(self, module: str) -> list[str]:
+        parts = [part for part in _RUST_GROUP.sub("", module).split("::") if part]
+        if not parts or parts[0] not in _RUST_PREFIXES:
+            return []  # external crates
+        parts = [part for part in parts if part not in _RUST_PREFIXES]
+        # ``a::b::Item`` may live in a/b.rs, a/b/mod.rs, or a.rs for ``a::Item``
+        for end in range(len(parts), 0, -1):
+            stem = "/".join(parts[:end])
+            found = self._suffix(f"{stem}.rs") or self._suffix(f"{stem}/mod.rs")
+            if found:
+                return [found]
+        return []
+
+    def _exact(self, candidate: str) -> str | None:
+        return candidate if candidate in self._paths else None
+
+    def _module(self, candidate: str) -> str | None:
+        """The indexed file an absolute Python import names, if unambiguous.
+
+        *candidate* can only be imported from a source root, so matches
+        nested inside another package are skipped; of the rest, a single
+        match is trusted and several (``utils.py`` in two roots) give none.
+        """
+        matches = []
+        for path in self._by_suffix.get(candidate, ()):
+            prefix = path[: -len(candidate)].rstrip("/")
+            if not prefix or f"{prefix}/__init__.py" not in self._paths:
+                matches.append(path)
+        return matches[0] if len(matches) == 1 else None
+
+    def _suffix(self, candidate: str) -> str | None:
+        """The shortest indexed path ending in *candidate* (whole components)."""
+        matches = self._by_suffix.get(candidate)
+        if not matches:
+            return None
+        return min(matches, key=lambda p: (p.count("/"), p))
+
+
+def _join(directory: str, relative: str) -> str:
+    """Join and normalise POSIX paths, keeping the result root-relative."""
+    joined = posixpath.normpath(posixpath.join(directory, relative)) if relative else directory
+    return "" if joined == "." else joined
+
+
+def _read_cache(root: Path, project_root: Path) -> SymbolIndex | None:
+    data = load_json_cache(project_root, SYMBOL_INDEX_CACHE_PATH)
+    if data is None:
+        return None
+    try:
+        return SymbolIndex.from_dict(root, data)
+    except (KeyError, TypeError, ValueError, AttributeError) as exc:
+        logger.debug("Ignoring unreadable symbol index cache: %s", exc)
+        return None
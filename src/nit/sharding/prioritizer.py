@@ -8,17 +8,22 @@ that each shard receives a balanced mix of high/medium/low risk tests.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from nit.agents.analyzers.test_mapper import TestMapper
+    from nit.utils.git_history import GitHistoryIndex
 
 # ── Constants ─────────────────────────────────────────────────────
 
 DEFAULT_RISK_SCORE = 0.5
 """Score assigned to test files that cannot be mapped to any source file."""
 
+CHURN_WINDOW_DAYS = 90
+"""Window for the recent-commit counts used to order equally risky tests."""
+
 # ── Data models ───────────────────────────────────────────────────
 
 
@@ -35,6 +40,9 @@ class RiskScore:
     reasons: list[str] = field(default_factory=list)
     """Human-readable explanations for the score."""
 
+    recent_commits: int = 0
+    """Recent commits to the test's source files (or the test itself if unmapped)."""
+
 
 @dataclass
 class PrioritizedTestPlan:
@@ -54,6 +62,7 @@ def prioritize_test_files_by_risk(
     test_files: list[Path],
     risk_report: dict[str, float] | None = None,
     test_mapper: TestMapper | None = None,
+    history: GitHistoryIndex | None = None,
 ) -> PrioritizedTestPlan:
     """Sort test files by descending risk score.
 
@@ -61,18 +70,22 @@ def prioritize_test_files_by_risk(
     2. If *risk_report* is provided (source_file -> score), look up the max
        risk score across each test's source files.
     3. Unmapped tests receive ``DEFAULT_RISK_SCORE``.
-    4. Return a ``PrioritizedTestPlan`` sorted highest-risk first.
+    4. If *history* is provided, tests with equal scores are ordered by the
+       recent churn of their source files (busiest first).
+    5. Return a ``PrioritizedTestPlan`` sorted highest-risk first.
 
     Args:
         test_files: Test files to prioritize.
         risk_report: Mapping of source file path to risk score (0.0-1.0).
         test_mapper: Optional TestMapper for resolving test-to-source links.
+        history: Optional git history index (see ``nit.utils.git_history``).
 
     Returns:
         PrioritizedTestPlan with sorted files and scores.
     """
     scored: list[RiskScore] = []
     risk_map = risk_report or {}
+    sources_by_test: dict[str, list[str]] = {}
 
     for tf in test_files:
         tf_str = str(tf)
@@ -82,6 +95,7 @@ def prioritize_test_files_by_risk(
         if test_mapper is not None:
             mapping = test_mapper.map_test_to_sources(tf)
             source_files = mapping.source_files
+            sources_by_test[tf_str] = source_files
 
         # Step 2: look up risk for mapped sources
         source_scores = [risk_map[sf] for sf in source_files if sf in risk_map]
@@ -99,8 +113,15 @@ def prioritize_test_files_by_risk(
                 )
             )
 
-    # Step 4: sort descending by score (stable sort keeps original order for ties)
-    scored.sort(key=lambda rs: rs.score, reverse=True)
+    # Step 4: recent churn of the sources (or of the test itself if unmapped)
+    if history is not None:
+        since = datetime.now(UTC) - timedelta(days=CHURN_WINDOW_DAYS)
+        for rs in scored:
+            paths = sources_by_test.get(rs.file_path) or [rs.file_path]
+            rs.recent_commits = max(history.commit_count(p, since=since) for p in paths)
+
+    # Step 5: sort descending by score, then churn (stable sort keeps original order for ties)
+    scored.sort(key=lambda rs: (rs.score, rs.recent_commits), reverse=True)
 
     return PrioritizedTestPlan(
         test_files=[Path(rs.file_path) for rs in scored],
@@ -0,0 +1,360 @@
+"""Local tracing of pipeline stages, agent runs and LLM calls.
+
+A ``Tracer`` records ``Span`` objects (name, start, duration, tokens,
+resident memory at start and end, subprocesses started) while it is
+active.  Spans nest through a context variable, so spans opened in
+concurrently running asyncio tasks or worker threads attach to the span
+that started them.  Tokens and subprocess counts roll up into every
+enclosing span.  Memory is process-wide, so the RSS delta of a span also
+includes allocations of spans running concurrently with it.
+
+Subprocesses are counted with an audit hook (``sys.addaudithook``), which
+sees child processes started anywhere in the process, not only through
+nit's helpers.  Audit hooks cannot be removed: once a tracer has been
+activated the hook stays installed for the life of the process and adds
+roughly half a microsecond to every audit event (file opens, imports,
+...), even after tracing ends.
+
+Unlike the Sentry helpers, tracing never leaves the machine: spans are
+kept on the tracer for the terminal summary and the run report, and can
+be written to a Chrome trace file (``chrome://tracing`` or Perfetto).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+try:
+    import resource
+
+    _resource_available = True
+except ImportError:  # Windows
+    _resource_available = False
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+
+_T = TypeVar("_T")
+
+SPAN_STAGE = "stage"
+SPAN_AGENT = "agent"
+SPAN_LLM = "llm"
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+_BYTES_PER_MB = 1024 * 1024
+
+# Current resident set size in pages (second field), Linux only
+_STATM_PATH = Path("/proc/self/statm")
+
+# Audit events raised when a child process is started (``subprocess`` and
+# asyncio subprocesses both raise ``subprocess.Popen``)
+_SUBPROCESS_EVENTS = frozenset({"subprocess.Popen", "os.system"})
+
+
+@dataclass
+class Span:
+    """One timed unit of work."""
+
+    name: str
+    """Span name (stage, agent or model name)."""
+
+    category: str
+    """Kind of work: ``stage``, ``agent`` or ``llm``."""
+
+    start_ms: float
+    """Start time relative to the start of the trace."""
+
+    duration_ms: float = 0.0
+    """Wall-clock duration."""
+
+    tokens: int = 0
+    """LLM tokens used in the span, including nested spans."""
+
+    rss_start_mb: float = 0.0
+    """Resident set size of the process when the span started."""
+
+    rss_end_mb: float = 0.0
+    """Resident set size of the process when the span ended."""
+
+    peak_rss_mb: float = 0.0
+    """Peak resident set size of the process when the span ended."""
+
+    subprocesses: int = 0
+    """Child processes started in the span, including nested spans."""
+
+    status: str = "ok"
+    """``ok`` or ``error``."""
+
+    attributes: dict[str, Any] = field(default_factory=dict)
+    """Extra key/value data (model name, error message, ...)."""
+
+    span_id: int = 0
+    parent_id: int | None = None
+    owner_id: int | None = None
+
+    @property
+    def rss_delta_mb(self) -> float:
+        """Change in resident set size over the span."""
+        return self.rss_end_mb - self.rss_start_mb
+
+    def add_tokens(self, count: int) -> None:
+        """Attribute *count* LLM tokens to this span."""
+        self.tokens += count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary of the span."""
+        return {
+            "name": self.name,
+            "category": self.category,
+            "startMs": round(self.start_ms, 3),
+            "durationMs": round(self.duration_ms, 3),
+            "tokens": self.tokens,
+            "rssStartMb": round(self.rss_start_mb, 1),
+            "rssDeltaMb": round(self.rss_delta_mb, 1),
+            "peakRssMb": round(self.peak_rss_mb, 1),
+            "subprocesses": self.subprocesses,
+            "status": self.status,
+        }
+
+
+class Tracer:
+    """Collects spans for one traced run."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._epoch_us = time.time() * 1_000_000
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.spans: list[Span] = []
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[Tracer]:
+        """Make this the tracer that ``trace_span`` records into.
+
+        The first activation installs the process-wide subprocess audit
+        hook (see the module docstring).
+        """
+        _install_audit_hook()
+        token = _active_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _active_tracer.reset(token)
+
+    def stage_spans(self) -> list[Span]:
+        """Spans of pipeline stages, in start order."""
+        return sorted((s for s in self.spans if s.category == SPAN_STAGE), key=lambda s: s.start_ms)
+
+    def totals(self) -> dict[str, dict[str, float]]:
+        """Count, total duration and tokens of the spans of each category."""
+        totals: dict[str, dict[str, float]] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.category, {"count": 0, "durationMs": 0.0, "tokens": 0})
+            entry["count"] += 1
+            entry["durationMs"] = round(entry["durationMs"] + span.duration_ms, 3)
+            if span.category == SPAN_LLM:
+                entry["tokens"] += span.tokens
+        return totals
+
+    def summary(self) -> dict[str, Any]:
+        """JSON-serialisable summary for run reports."""
+        return {
+            "stages": [span.to_dict() for span in self.stage_spans()],
+            "totals": self.totals(),
+            "peakRssMb": round(max((s.peak_rss_mb for s in self.spans), default=0.0), 1),
+        }
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """Write the spans as a Chrome trace event file.
+
+        Concurrent spans are spread over lanes (``tid``) so that spans in
+        one lane always nest, which trace viewers require.
+        """
+        events: list[dict[str, Any]] = []
+        for span, lane in _assign_lanes(self.spans):
+            args = {
+                "tokens": span.tokens,
+                "rssStartMb": round(span.rss_start_mb, 1),
+                "rssDeltaMb": round(span.rss_delta_mb, 1),
+                "peakRssMb": round(span.peak_rss_mb, 1),
+                "subprocesses": span.subprocesses,
+                "status": span.status,
+                **span.attributes,
+            }
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(self._epoch_us + span.start_ms * 1000, 3),
+                    "dur": round(span.duration_ms * 1000, 3),
+                    "pid": os.getpid(),
+                    "tid": lane,
+                    "args": args,
+                }
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, default=str),
+            encoding="utf-8",
+        )
+        return path
+
+    def _open(self, name: str, category: str, attributes: dict[str, Any]) -> Span:
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            category=category,
+            start_ms=(time.perf_counter() - self._origin) * 1000,
+            rss_start_mb=_current_rss_mb(),
+            attributes=attributes,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None else None,
+        )
+
+    def _close(self, span: Span, parent: Span | None) -> None:
+        span.duration_ms = (time.perf_counter() - self._origin) * 1000 - span.start_ms
+        span.rss_end_mb = _current_rss_mb()
+        span.peak_rss_mb = _peak_rss_mb()
+        with self._lock:
+            self.spans.append(span)
+            if parent is not None:
+                parent.tokens += span.tokens
+                parent.subprocesses += span.subprocesses
+
+
+_active_tracer: ContextVar[Tracer | None] = ContextVar("nit_tracer", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("nit_trace_span", default=None)
+
+_audit_hook_lock = threading.Lock()
+_audit_hook_installed = {"value": False}
+
+
+@contextlib.contextmanager
+def trace_span(name: str, category: str, **attributes: Any) -> Iterator[Span | None]:
+    """Record the enclosed block as a span of the active tracer.
+
+    Yields the span (to attach tokens or attributes), or ``None`` when no
+    tracer is active, in which case nothing is recorded.
+    """
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    span = tracer._open(name, category, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.status = "error"
+        span.attributes["error"] = str(exc) or type(exc).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        tracer._close(span, parent)
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span, if any."""
+    return _current_span.get()
+
+
+def traced_async(
+    func: Callable[..., Coroutine[Any, Any, _T]],
+    category: str,
+    name_of: Callable[[Any], str],
+) -> Callable[..., Coroutine[Any, Any, _T]]:
+    """Wrap the async method *func* so that each call is recorded as a span.
+
+    *name_of* maps the instance to the span name.  If the result has an
+    integer ``total_tokens`` (an ``LLMResponse``) it is added to the span.
+    Calls made inside a span of the same *category* for the same instance
+    (``super()`` calls), or any LLM call inside an LLM span (engines
+    wrapping engines), are not traced again.
+    """
+    if getattr(func, "__nit_traced__", False):
+        return func
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> _T:
+        current = _current_span.get()
+        if _active_tracer.get() is None or (
+            current is not None
+            and current.category == category
+            and (current.owner_id == id(self) or category == SPAN_LLM)
+        ):
+            return await func(self, *args, **kwargs)
+        with trace_span(name_of(self), category) as span:
+            if span is not None:
+                span.owner_id = id(self)
+            result = await func(self, *args, **kwargs)
+            tokens = getattr(result, "total_tokens", None)
+            if span is not None and isinstance(tokens, int):
+                span.add_tokens(tokens)
+            return result
+
+    wrapper.__nit_traced__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _install_audit_hook() -> None:
+    with _audit_hook_lock:
+        if _audit_hook_installed["value"]:
+            return
+        sys.addaudithook(_count_subprocess)
+        _audit_hook_installed["value"] = True
+
+
+def _count_subprocess(event: str, _args: tuple[Any, ...]) -> None:
+    if event in _SUBPROCESS_EVENTS:
+        span = _current_span.get()
+        if span is not None:
+            span.subprocesses += 1
+
+
+def _peak_rss_mb() -> float:
+    if not _resource_available:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT / _BYTES_PER_MB
+
+
+def _current_rss_mb() -> float:
+    """Current resident set size; the peak where it cannot be read (macOS)."""
+    try:
+        pages = int(_STATM_PATH.read_text(encoding="ascii").split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / _BYTES_PER_MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        return _peak_rss_mb()
+
+
+def _assign_lanes(spans: list[Span]) -> list[tuple[Span, int]]:
+    """Place spans in lanes in which every pair of spans nests or is disjoint."""
+    lanes: list[list[float]] = []  # per lane: end times of the open spans
+    placed: list[tuple[Span, int]] = []
+    for span in sorted(spans, key=lambda s: (s.start_ms, -s.duration_ms)):
+        end = span.start_ms + span.duration_ms
+        for index, stack in enumerate(lanes):
+            while stack and stack[-1] <= span.start_ms:
+                stack.pop()
+            if not stack or end <= stack[-1]:
+                stack.append(end)
+                placed.append((span, index))
+                break
+        else:
+            lanes.append([end])
+            placed.append((span, len(lanes) - 1))
+    return placed
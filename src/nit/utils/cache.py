@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import os
+import tempfile
 import time
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, TypeVar
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from pathlib import Path
+from typing import Any, ClassVar, Generic, Self, TypeVar
 
 logger = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 
+CACHE_DIR = Path(".nit") / "cache"
+"""Directory (relative to the project root) for caches persisted across runs."""
+
 
 @dataclass(slots=True)
 class _Entry(Generic[_T]):
@@ -121,3 +126,162 @@ class FileContentCache(Generic[_T]):
 def content_hash(text: str) -> str:
     """Compute a stable 16-char hex hash for *text*."""
     return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def project_cache_dir(project_root: Path) -> Path:
+    """Return the project's persistent cache directory, creating it if needed.
+
+    The directory gets a ``.gitignore`` so cached data never shows up as
+    untracked files or in commits made by nit.
+    """
+    cache_dir = project_root / CACHE_DIR
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.is_file():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        gitignore.write_text("# Created by nit: local caches\n*\n", encoding="utf-8")
+    return cache_dir
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to *path* so readers never observe a partial file.
+
+    The data goes to a uniquely named temporary file in the same directory
+    which is then renamed over *path*, so concurrent writers (other
+    threads or processes) never clobber each other's temporary file.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_json_cache(project_root: Path, cache_path: Path) -> dict[str, Any] | None:
+    """Read a JSON object persisted with ``save_json_cache``.
+
+    Args:
+        project_root: Project root directory.
+        cache_path: Location of the cache file relative to *project_root*
+            (usually below ``CACHE_DIR``).
+
+    Returns:
+        The decoded object, or ``None`` if the file is missing, unreadable
+        or does not hold a JSON object.
+    """
+    try:
+        data = json.loads((project_root / cache_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def save_json_cache(project_root: Path, cache_path: Path, data: dict[str, Any]) -> None:
+    """Atomically persist *data* as compact JSON; failures are logged and ignored.
+
+    Args:
+        project_root: Project root directory.
+        cache_path: Location of the cache file relative to *project_root*
+            (usually below ``CACHE_DIR``).
+        data: JSON-serialisable object to store.
+    """
+    target = project_root / cache_path
+    try:
+        project_cache_dir(project_root)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(target, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+    except (OSError, TypeError, ValueError) as exc:
+        logger.debug("Could not write cache %s: %s", target, exc)
+
+
+class VersionedJsonCache(ABC):
+    """Base for caches persisted as one JSON object with ``save_json_cache``.
+
+    The object records a layout version (``format_version``) and the
+    version of whatever produced the entries (``version``, such as a prompt
+    or pattern-set version).  A file saved for another format or version
+    loads as an empty cache, and ``save`` only writes after a change.
+
+    Subclasses set ``cache_path`` and ``format_version``, override
+    ``version`` when entries depend on more than the layout, and implement
+    ``_entries_to_json`` and ``_entries_from_json``.
+    """
+
+    cache_path: ClassVar[Path]
+    """Location of the cache file relative to the project root."""
+
+    format_version: ClassVar[int] = 1
+    """Layout of the saved entries; bump it when ``_entries_to_json`` changes."""
+
+    def __init__(self) -> None:
+        self._dirty = False
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the cache changed since it was loaded."""
+        return self._dirty
+
+    @property
+    def version(self) -> str | int:
+        """Version of what produced the entries; entries of other versions are dropped."""
+        return self.format_version
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serialisable form of the cache."""
+        return {
+            "format": self.format_version,
+            "version": self.version,
+            "entries": self._entries_to_json(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Rebuild a cache from ``to_dict`` output.
+
+        Entries written for another format or version are dropped, leaving
+        an empty cache.
+
+        Raises:
+            KeyError, TypeError, ValueError, AttributeError: If the entries
+                are malformed.
+        """
+        cache = cls()
+        entries = data.get("entries")
+        if (
+            data.get("format") == cls.format_version
+            and data.get("version") == cache.version
+            and isinstance(entries, dict)
+        ):
+            cache._entries_from_json(entries)
+        return cache
+
+    @classmethod
+    def load(cls, project_root: Path) -> Self:
+        """The persisted cache of *project_root* (empty if missing, stale or unreadable)."""
+        data = load_json_cache(project_root, cls.cache_path)
+        if data is None:
+            return cls()
+        try:
+            return cls.from_dict(data)
+        except (KeyError, TypeError, ValueError, AttributeError) as exc:
+            logger.debug("Ignoring unreadable cache %s: %s", cls.cache_path, exc)
+            return cls()
+
+    def save(self, project_root: Path) -> None:
+        """Persist the cache if it changed; failures are logged and ignored."""
+        if not self._dirty:
+            return
+        save_json_cache(project_root, self.cache_path, self.to_dict())
+
+    @abstractmethod
+    def _entries_to_json(self) -> dict[str, Any]:
+        """JSON-serialisable form of the entries."""
+
+    @abstractmethod
+    def _entries_from_json(self, entries: dict[str, Any]) -> None:
+        """Load entries saved by ``_entries_to_json``; raise if malformed."""
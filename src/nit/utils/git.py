@@ -961,3 +961,80 @@ def get_remote_url(repo_path: Path) -> str:
         return result.stdout.strip()
     except subprocess.CalledProcessError as exc:
         raise GitOperationError(f"Failed to get remote URL: {exc}") from exc
+
+
+def get_worktree_content_hash(
+    repo_path: Path,
+    *,
+    exclude: tuple[str, ...] = (),
+    untracked_suffixes: frozenset[str] | None = None,
+) -> str:
+    """Hash the contents of the working tree under *repo_path*.
+
+    Tracked files contribute their index blob IDs; files modified since
+    they were staged are re-hashed with ``git hash-object`` (without
+    ``-w``, so nothing is written to the object database) and deleted
+    files are recorded as such.  Untracked, non-ignored files are hashed
+    too, optionally only those whose suffix is in *untracked_suffixes*,
+    so uncommitted edits change the hash while stray tool outputs do not.
+
+    Args:
+        repo_path: Directory inside a git repository.  Only files below it
+            are hashed.
+        exclude: Glob pathspecs (relative to *repo_path*) to leave out,
+            such as ``.nit`` or ``**/coverage.json``.
+        untracked_suffixes: Lower-case suffixes (``".py"``, ...) of the
+            untracked files to include; ``None`` includes all of them.
+
+    Returns:
+        A hex digest of the hashed paths and contents.
+
+    Raises:
+        GitOperationError: If *repo_path* is not in a git repository or a
+            git command fails.
+    """
+    git = _git_executable()
+    pathspec = ["--", ".", *(f":(exclude,glob){path}" for path in exclude)]
+
+    def _ls_files(*args: str) -> list[str]:
+        result = subprocess.run(
+            [git, "ls-files", "-z", *args, *pathspec],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return [entry for entry in result.stdout.split("\0") if entry]
+
+    try:
+        blobs: dict[str, str] = {}
+        for entry in _ls_files("--stage"):
+            info, _, path = entry.partition("\t")
+            blobs[path] = info.split()[1]
+
+        untracked = [
+            path
+            for path in _ls_files("--others", "--exclude-standard")
+            if untracked_suffixes is None or Path(path).suffix.lower() in untracked_suffixes
+        ]
+        stale = [*_ls_files("--modified"), *untracked]
+        existing = [path for path in stale if (repo_path / path).is_file()]
+        for path in stale:
+            blobs[path] = "deleted"
+        if existing:
+            hashed = subprocess.run(
+                [git, "hash-object", "--no-filters", "--stdin-paths"],
+                cwd=repo_path,
+                input="\n".join(existing) + "\n",
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            blobs.update(zip(existing, hashed, strict=True))
+    except (subprocess.CalledProcessError, OSError, ValueError) as exc:
+        raise GitOperationError(f"Failed to hash working tree: {exc}") from exc
+
+    digest = hashlib.sha256()
+    for path in sorted(blobs):
+        digest.update(f"{blobs[path]} {path}\0".encode())
+    return digest.hexdigest()
@@ -0,0 +1,425 @@
+"""Function-level churn from batched ``git log -p --unified=0`` hunks.
+
+``FunctionChurnIndex`` answers the question ``git log -L <start>,<end>:<file>``
+answers — which commits changed these lines — for every function of
+every file at once, without running one ``git log -L`` or ``git blame``
+per function.
+
+For each file, the commits touching it are read newest first from one
+batched ``git log -p --unified=0``.  Only first-parent history is walked,
+with each merge diffed against its first parent, so every hunk is
+relative to the commit before it on that line of history; changes made
+on a merged side branch are attributed to the merge.  While walking back
+in time a line map
+from each commit's post-image to the lines at ``HEAD`` is maintained, so
+every hunk can be placed on ``HEAD`` lines; lines that a later commit
+rewrote drop out of the map, and the walk stops once no line of ``HEAD``
+is left.  A final ``git diff HEAD`` maps ``HEAD`` lines onto the working
+tree, which is where function line ranges come from.
+
+Per-file results are persisted to ``.nit/cache/function_churn.json`` keyed
+by the file's blob at ``HEAD`` and the first day of the history window, so
+later runs only read the history of files that changed since (or of every
+file once a day, as the window moves forward).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import shutil
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from nit.utils.cache import CACHE_DIR, MemoryCache, load_json_cache, save_json_cache
+from nit.utils.git_history import (
+    _FIELD_SEP,
+    _HEADER_FIELDS,
+    _LOG_FORMAT,
+    _RECORD_SEP,
+    FileHistory,
+    git_output,
+    repo_relative_path,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+CHURN_CACHE_PATH = CACHE_DIR / "function_churn.json"
+
+# How far back commits are read
+DEFAULT_MAX_AGE_DAYS = 365
+
+# Layout of the entries in CHURN_CACHE_PATH; caches of other layouts are rebuilt
+_FORMAT_VERSION = 2
+
+# Paths passed to one git invocation (keeps command lines short)
+_PATHS_PER_CALL = 400
+
+_DIFF_HEADER = "diff --git a/"
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_LS_TREE_FIELDS = 3
+
+_MAX_LINE = 1 << 62
+
+# (start, end, shift): lines start..end map to line + shift
+_Segment = tuple[int, int, int]
+# (old_start, old_len, new_start, new_len) of a unified diff hunk
+_Hunk = tuple[int, int, int, int]
+
+_IDENTITY: list[_Segment] = [(1, _MAX_LINE, 0)]
+
+# Per-file changes (in HEAD line numbers) keyed by repository, path, blob and window start
+_changes_cache: MemoryCache[list[_Change]] = MemoryCache(max_size=65536)
+
+
+@dataclass(slots=True)
+class _Change:
+    """One commit's changes to a file, as line ranges."""
+
+    timestamp: int
+    author: str
+    ranges: list[tuple[int, int]]
+
+
+class FunctionChurnIndex:
+    """Which commits changed each line range of a set of files.
+
+    Args:
+        repo_root: Top-level directory of the git repository.
+        changes: Changes per repository-relative path, in working-tree
+            line numbers, newest first.
+        project_root: Directory relative paths are resolved against
+            (defaults to *repo_root*).
+        max_age_days: How far back commits were read.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        changes: dict[str, list[_Change]] | None = None,
+        *,
+        project_root: Path | None = None,
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+    ) -> None:
+        self._repo_root = repo_root.resolve()
+        self._project_root = project_root.resolve() if project_root else self._repo_root
+        self._changes = changes if changes is not None else {}
+        self.max_age_days = max_age_days
+
+    def has_file(self, path: str | Path) -> bool:
+        """Whether the history of *path* was read.
+
+        ``False`` for files not tracked at ``HEAD`` and for files whose
+        ``git log`` failed, so callers can fall back to file-level history.
+        """
+        return self._relative(path) in self._changes
+
+    def function_history(self, path: str | Path, start_line: int, end_line: int) -> FileHistory:
+        """Commits that changed lines *start_line*..*end_line* (1-based, inclusive).
+
+        Only commits within ``max_age_days`` are included.
+        """
+        history = FileHistory()
+        for change in self._changes.get(self._relative(path), []):
+            if any(lo <= end_line and hi >= start_line for lo, hi in change.ranges):
+                history.add(change.timestamp, change.author)
+        history.timestamps.sort()
+        return history
+
+    def _relative(self, path: str | Path) -> str:
+        return repo_relative_path(path, self._repo_root, self._project_root)
+
+
+def load_function_churn(
+    project_root: Path,
+    paths: Iterable[str | Path],
+    *,
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+    persist: bool = True,
+) -> FunctionChurnIndex:
+    """Build the churn index of *paths*.
+
+    Args:
+        project_root: Project root directory (inside a git repository).
+        paths: Files to index, absolute or relative to *project_root*.
+        max_age_days: How far back to read commits.
+        persist: Whether to read and write ``.nit/cache/function_churn.json``.
+
+    Returns:
+        The index.  Outside a git repository it is empty.
+    """
+    git = shutil.which("git") or "git"
+    top = git_output(git, project_root, ["rev-parse", "--show-toplevel"])
+    if top is None:
+        return FunctionChurnIndex(project_root, max_age_days=max_age_days)
+    repo_root = Path(top).resolve()
+    resolved_root = project_root.resolve()
+    rel_paths = sorted({repo_relative_path(p, repo_root, resolved_root) for p in paths})
+
+    since = (datetime.now(UTC) - timedelta(days=max_age_days)).date().isoformat()
+    blobs = _head_blobs(git, repo_root, rel_paths)
+    cache = _read_cache(project_root) if persist else {}
+    head_changes: dict[str, list[_Change]] = {}
+    stale: list[str] = []
+    read = 0
+    for path, blob in blobs.items():
+        key = f"{repo_root}:{path}:{blob}:{since}"
+        cached = _changes_cache.get(key)
+        if cached is None:
+            cached = _cached_changes(cache.get(path), blob, since)
+        if cached is None:
+            stale.append(path)
+        else:
+            head_changes[path] = cached
+            _changes_cache.put(key, cached)
+
+    for batch in _chunks(stale):
+        output = git_output(
+            git,
+            repo_root,
+            [
+                "log",
+                "-p",
+                "--unified=0",
+                "--first-parent",
+                "--diff-merges=first-parent",
+                "--no-renames",
+                "--no-color",
+                "--no-ext-diff",
+                f"--since={since}T00:00:00Z",
+                _LOG_FORMAT,
+                "HEAD",
+                "--",
+                *batch,
+            ],
+        )
+        if output is None:
+            # No history is better than an empty one cached as "never changed"
+            logger.debug("Could not read line history of %d file(s)", len(batch))
+            continue
+        commits = _parse_patch_log(output)
+        read += len(batch)
+        for path in batch:
+            path_changes = _file_changes(commits.get(path, []))
+            head_changes[path] = path_changes
+            _changes_cache.put(f"{repo_root}:{path}:{blobs[path]}:{since}", path_changes)
+            cache[path] = {
+                "blob": blobs[path],
+                "since": since,
+                "changes": [[c.timestamp, c.author, c.ranges] for c in path_changes],
+            }
+
+    if persist and read:
+        data = {"format": _FORMAT_VERSION, "files": cache}
+        save_json_cache(project_root, CHURN_CACHE_PATH, data)
+    if read:
+        logger.debug("Read line history of %d file(s)", read)
+
+    worktree = _worktree_hunks(git, repo_root, list(blobs))
+    changes = {
+        path: _to_worktree(file_changes, worktree.get(path))
+        for path, file_changes in head_changes.items()
+    }
+    return FunctionChurnIndex(
+        repo_root, changes, project_root=resolved_root, max_age_days=max_age_days
+    )
+
+
+# ── Line maps ────────────────────────────────────────────────────
+
+
+def _unchanged_runs(hunks: list[_Hunk]) -> list[_Segment]:
+    """Runs of old-side lines a diff leaves unchanged, with their shift to the new side."""
+    runs: list[_Segment] = []
+    line = 1
+    delta = 0
+    for old_start, old_len, _new_start, new_len in sorted(hunks):
+        # A pure insertion (old_len 0) goes after line old_start
+        if old_len:
+            end, resume = old_start - 1, old_start + old_len
+        else:
+            end, resume = old_start, old_start + 1
+        if end >= line:
+            runs.append((line, end, delta))
+        line = max(line, resume)
+        delta += new_len - old_len
+    runs.append((line, _MAX_LINE, delta))
+    return runs
+
+
+def _compose(runs: list[_Segment], mapping: list[_Segment]) -> list[_Segment]:
+    """Chain *runs* (old side -> new side) with *mapping* (new side -> target)."""
+    result: list[_Segment] = []
+    j = 0
+    for start, end, delta in runs:
+        lo, hi = start + delta, end + delta
+        while j < len(mapping) and mapping[j][1] < lo:
+            j += 1
+        k = j
+        while k < len(mapping) and mapping[k][0] <= hi:
+            seg_start, seg_end, shift = mapping[k]
+            a, b = max(lo, seg_start), min(hi, seg_end)
+            if a <= b:
+                result.append((a - delta, b - delta, shift + delta))
+            k += 1
+    return result
+
+
+def _map_range(lo: int, hi: int, mapping: list[_Segment]) -> list[tuple[int, int]]:
+    """Map lines *lo*..*hi* through *mapping*; unmapped lines are dropped."""
+    mapped: list[tuple[int, int]] = []
+    for start, end, shift in mapping:
+        if start > hi:
+            break
+        a, b = max(lo, start), min(hi, end)
+        if a <= b:
+            mapped.append((a + shift, b + shift))
+    return mapped
+
+
+def _file_changes(commits: list[tuple[int, str, list[_Hunk]]]) -> list[_Change]:
+    """Place the hunks of *commits* (newest first) on ``HEAD`` line numbers."""
+    mapping = _IDENTITY
+    changes: list[_Change] = []
+    for timestamp, author, hunks in commits:
+        ranges: list[tuple[int, int]] = []
+        for _old_start, _old_len, new_start, new_len in hunks:
+            if new_len:
+                ranges.extend(_map_range(new_start, new_start + new_len - 1, mapping))
+            else:
+                # Pure deletion: attribute it to the lines around the gap
+                ranges.extend(_map_range(max(new_start, 1), new_start + 1, mapping))
+        if ranges:
+            changes.append(_Change(timestamp, author, ranges))
+        mapping = _compose(_unchanged_runs(hunks), mapping)
+        if not mapping:
+            break  # every line at HEAD was written after this commit
+    return changes
+
+
+def _to_worktree(changes: list[_Change], hunks: list[_Hunk] | None) -> list[_Change]:
+    """Move *changes* from ``HEAD`` line numbers to working-tree line numbers."""
+    if not hunks:
+        return changes
+    runs = _unchanged_runs(hunks)
+    moved: list[_Change] = []
+    for change in changes:
+        ranges = [r for lo, hi in change.ranges for r in _map_range(lo, hi, runs)]
+        if ranges:
+            moved.append(_Change(change.timestamp, change.author, ranges))
+    return moved
+
+
+# ── git output ───────────────────────────────────────────────────
+
+
+def _parse_diff(text: str) -> dict[str, list[_Hunk]]:
+    """Hunks per file of ``--unified=0`` diff output (unquoted paths only)."""
+    files: dict[str, list[_Hunk]] = {}
+    current: list[_Hunk] | None = None
+    for line in text.splitlines():
+        if line.startswith(_DIFF_HEADER):
+            # "a/<path> b/<path>" with identical paths (renames are disabled)
+            rest = line[len(_DIFF_HEADER) :]
+            current = files.setdefault(rest[: (len(rest) - 3) // 2], [])
+        elif line.startswith("diff "):
+            current = None
+        elif current is not None and line.startswith("@@"):
+            match = _HUNK_RE.match(line)
+            if match:
+                old_start, old_len, new_start, new_len = match.groups()
+                current.append(
+                    (
+                        int(old_start),
+                        int(old_len) if old_len is not None else 1,
+                        int(new_start),
+                        int(new_len) if new_len is not None else 1,
+                    )
+                )
+    return files
+
+
+def _parse_patch_log(output: str) -> dict[str, list[tuple[int, str, list[_Hunk]]]]:
+    """Commits per file (newest first) of ``git log -p`` output in ``_LOG_FORMAT``."""
+    per_file: dict[str, list[tuple[int, str, list[_Hunk]]]] = {}
+    for record in output.split(_RECORD_SEP):
+        header, _, body = record.partition("\n")
+        fields = header.split(_FIELD_SEP)
+        if len(fields) != _HEADER_FIELDS:
+            continue
+        try:
+            timestamp = int(fields[1])
+        except ValueError:
+            continue
+        for path, hunks in _parse_diff(body).items():
+            if hunks:
+                per_file.setdefault(path, []).append((timestamp, fields[2], hunks))
+    return per_file
+
+
+def _head_blobs(git: str, repo_root: Path, paths: list[str]) -> dict[str, str]:
+    """Blob IDs at ``HEAD`` of the tracked files among *paths*."""
+    blobs: dict[str, str] = {}
+    for batch in _chunks(paths):
+        output = git_output(git, repo_root, ["ls-tree", "-r", "--full-tree", "HEAD", "--", *batch])
+        for line in (output or "").splitlines():
+            meta, _, path = line.partition("\t")
+            parts = meta.split()
+            if len(parts) == _LS_TREE_FIELDS and parts[1] == "blob":
+                blobs[path] = parts[2]
+    return blobs
+
+
+def _worktree_hunks(git: str, repo_root: Path, paths: list[str]) -> dict[str, list[_Hunk]]:
+    hunks: dict[str, list[_Hunk]] = {}
+    for batch in _chunks(paths):
+        output = git_output(
+            git,
+            repo_root,
+            [
+                "diff",
+                "--unified=0",
+                "--no-renames",
+                "--no-color",
+                "--no-ext-diff",
+                "HEAD",
+                "--",
+                *batch,
+            ],
+        )
+        hunks.update(_parse_diff(output or ""))
+    return hunks
+
+
+def _chunks(paths: list[str]) -> list[list[str]]:
+    return [paths[i : i + _PATHS_PER_CALL] for i in range(0, len(paths), _PATHS_PER_CALL)]
+
+
+# ── Persistence ──────────────────────────────────────────────────
+
+
+def _cached_changes(entry: object, blob: str, since: str) -> list[_Change] | None:
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("blob") != blob or entry.get("since") != since:
+        return None
+    try:
+        return [
+            _Change(int(ts), str(author), [(int(lo), int(hi)) for lo, hi in ranges])
+            for ts, author, ranges in entry.get("changes", [])
+        ]
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_cache(project_root: Path) -> dict[str, object]:
+    data = load_json_cache(project_root, CHURN_CACHE_PATH)
+    if data is None or data.get("format") != _FORMAT_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
@@ -0,0 +1,311 @@
+"""Per-file git history index built from a single ``git log`` pass.
+
+Risk scoring, diff analysis and test prioritisation all need the same
+per-file history: when a file last changed, how often it changed within
+a window, and who changed it.  Asking git once per file and question
+costs several processes per file; ``GitHistoryIndex`` instead reads the
+whole history with one ``git log --name-only`` and answers those
+questions from memory.
+
+The index is persisted to ``.nit/cache/git_history.json`` together with
+the commit it was built at.  The next build only reads the commits added
+since then, and rebuilds from scratch when that commit is no longer an
+ancestor of ``HEAD`` (after a rebase or a branch switch).
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from nit.utils.cache import CACHE_DIR, MemoryCache, load_json_cache, save_json_cache
+
+logger = logging.getLogger(__name__)
+
+HISTORY_CACHE_PATH = CACHE_DIR / "git_history.json"
+
+# Bumped when the persisted layout changes
+_FORMAT_VERSION = 1
+
+_RECORD_SEP = "\x1e"
+_FIELD_SEP = "\x1f"
+_LOG_FORMAT = f"--format={_RECORD_SEP}%H{_FIELD_SEP}%at{_FIELD_SEP}%an"
+_HEADER_FIELDS = 3
+
+_GIT_TIMEOUT = 300
+
+# Indexes shared by every analyzer in the process, keyed by repository and HEAD
+_index_cache: MemoryCache[GitHistoryIndex] = MemoryCache(max_size=8)
+
+
+@dataclass
+class FileHistory:
+    """Change history of a file (or of a line range within it)."""
+
+    timestamps: list[int] = field(default_factory=list)
+    """Author timestamps of the commits touching it, ascending."""
+
+    authors: dict[str, int] = field(default_factory=dict)
+    """Latest commit timestamp of each author who touched it."""
+
+    def add(self, timestamp: int, author: str) -> None:
+        """Record a commit touching the file (call ``timestamps.sort()`` after adding)."""
+        self.timestamps.append(timestamp)
+        if timestamp > self.authors.get(author, -1):
+            self.authors[author] = timestamp
+
+
+class GitHistoryIndex:
+    """Last change, churn and authors of every file in a repository.
+
+    Lookups take absolute paths or paths relative to *project_root*.
+    Window queries are a binary search over the file's commit times, so
+    they are cheap for any window.
+
+    Args:
+        repo_root: Top-level directory of the git repository.
+        head: Commit the index was built at (``None`` outside git).
+        files: History per repository-relative POSIX path.
+        project_root: Directory relative paths are resolved against
+            (defaults to *repo_root*).
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        head: str | None = None,
+        files: dict[str, FileHistory] | None = None,
+        *,
+        project_root: Path | None = None,
+    ) -> None:
+        self._repo_root = repo_root.resolve()
+        self._project_root = project_root.resolve() if project_root else self._repo_root
+        self._head = head
+        self._files = files if files is not None else {}
+
+    @property
+    def head(self) -> str | None:
+        """Commit the index was built at, or ``None`` when not in git."""
+        return self._head
+
+    @property
+    def file_count(self) -> int:
+        """Number of files with recorded history."""
+        return len(self._files)
+
+    def last_modified(self, path: str | Path) -> datetime | None:
+        """Time of the last commit touching *path*."""
+        history = self._lookup(path)
+        if history is None or not history.timestamps:
+            return None
+        return datetime.fromtimestamp(history.timestamps[-1], tz=UTC)
+
+    def commit_count(self, path: str | Path, *, since: datetime | None = None) -> int:
+        """Number of commits touching *path*, optionally only those after *since*."""
+        history = self._lookup(path)
+        if history is None:
+            return 0
+        if since is None:
+            return len(history.timestamps)
+        return len(history.timestamps) - bisect.bisect_left(
+            history.timestamps, int(since.timestamp())
+        )
+
+    def authors(self, path: str | Path, *, since: datetime | None = None) -> list[str]:
+        """Authors of the commits touching *path*, optionally only after *since*."""
+        history = self._lookup(path)
+        if history is None:
+            return []
+        if since is None:
+            return sorted(history.authors)
+        cutoff = int(since.timestamp())
+        return sorted(author for author, ts in history.authors.items() if ts >= cutoff)
+
+    def changed_since(self, since: datetime) -> list[str]:
+        """Repository-relative paths of the files changed after *since*."""
+        cutoff = int(since.timestamp())
+        return sorted(
+            path
+            for path, history in self._files.items()
+            if history.timestamps and history.timestamps[-1] >= cutoff
+        )
+
+    def relative_path(self, path: str | Path) -> str:
+        """Return *path* relative to the repository root, in POSIX form."""
+        return repo_relative_path(path, self._repo_root, self._project_root)
+
+    def _lookup(self, path: str | Path) -> FileHistory | None:
+        return self._files.get(self.relative_path(path))
+
+    def _apply_log(self, output: str) -> None:
+        """Add the commits of ``git log`` output in ``_LOG_FORMAT``."""
+        touched: set[str] = set()
+        for record in output.split(_RECORD_SEP):
+            header, _, names = record.partition("\n")
+            fields = header.split(_FIELD_SEP)
+            if len(fields) != _HEADER_FIELDS:
+                continue
+            try:
+                timestamp = int(fields[1])
+            except ValueError:
+                continue
+            author = fields[2]
+            for line in names.splitlines():
+                name = line.strip()
+                if name:
+                    self._files.setdefault(name, FileHistory()).add(timestamp, author)
+                    touched.add(name)
+        for name in touched:
+            self._files[name].timestamps.sort()
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON-serialisable form of the index."""
+        return {
+            "format": _FORMAT_VERSION,
+            "head": self._head,
+            "files": {
+                path: {"timestamps": history.timestamps, "authors": history.authors}
+                for path, history in self._files.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(
+        cls, repo_root: Path, data: dict[str, object], *, project_root: Path | None = None
+    ) -> GitHistoryIndex | None:
+        """Rebuild an index saved with ``to_dict``; ``None`` if unusable."""
+        files_data = data.get("files")
+        head = data.get("head")
+        if data.get("format") != _FORMAT_VERSION or not isinstance(files_data, dict):
+            return None
+        files: dict[str, FileHistory] = {}
+        for path, entry in files_data.items():
+            if not isinstance(entry, dict):
+                return None
+            files[path] = FileHistory(
+                timestamps=sorted(int(ts) for ts in entry.get("timestamps", [])),
+                authors={str(a): int(ts) for a, ts in entry.get("authors", {}).items()},
+            )
+        return cls(
+            repo_root, head if isinstance(head, str) else None, files, project_root=project_root
+        )
+
+
+def load_history_index(project_root: Path, *, persist: bool = True) -> GitHistoryIndex:
+    """Return the history index of the repository containing *project_root*.
+
+    The index is shared by every caller in the process for as long as
+    ``HEAD`` does not move.  Otherwise it is read from the persisted
+    cache, brought up to date with the commits since it was saved, and
+    saved again.
+
+    Args:
+        project_root: Project root directory (inside a git repository).
+        persist: Whether to read and write ``.nit/cache/git_history.json``.
+
+    Returns:
+        The index.  Outside a git repository, or when git fails, an empty
+        index is returned.
+    """
+    git = shutil.which("git") or "git"
+    repo_root = git_output(git, project_root, ["rev-parse", "--show-toplevel"])
+    head = git_output(git, project_root, ["rev-parse", "HEAD"])
+    if repo_root is None or head is None:
+        return GitHistoryIndex(project_root)
+
+    key = f"{project_root.resolve()}:{head}"
+    cached = _index_cache.get(key)
+    if cached is not None:
+        return cached
+
+    index = _read_cache(Path(repo_root), project_root) if persist else None
+    if index is not None and index.head != head:
+        index = _update(git, project_root, index, head)
+    if index is None:
+        index = _build(git, project_root, Path(repo_root), head)
+        if index is None:
+            return GitHistoryIndex(Path(repo_root), project_root=project_root)
+    if persist:
+        save_json_cache(project_root, HISTORY_CACHE_PATH, index.to_dict())
+
+    _index_cache.put(key, index)
+    return index
+
+
+def repo_relative_path(path: str | Path, repo_root: Path, project_root: Path) -> str:
+    """Return *path* (absolute, or relative to *project_root*) relative to *repo_root*.
+
+    Both roots must be resolved.  Paths outside the repository are
+    returned unchanged, in POSIX form.
+    """
+    candidate = Path(path)
+    if not candidate.is_absolute():
+        if project_root == repo_root:
+            return candidate.as_posix()
+        candidate = project_root / candidate
+    try:
+        return candidate.resolve().relative_to(repo_root).as_posix()
+    except ValueError:
+        return candidate.as_posix()
+
+
+def git_output(git: str, cwd: Path, args: list[str]) -> str | None:
+    """Run ``git args`` in *cwd* and return its stripped stdout, or ``None`` on failure."""
+    try:
+        result = subprocess.run(
+            [git, "-c", "core.quotePath=false", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=_GIT_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logger.debug("git %s failed: %s", " ".join(args[:2]), exc)
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _build(git: str, cwd: Path, repo_root: Path, head: str) -> GitHistoryIndex | None:
+    output = git_output(git, cwd, ["log", "--no-renames", "--name-only", _LOG_FORMAT, head])
+    if output is None:
+        return None
+    index = GitHistoryIndex(repo_root, head, project_root=cwd)
+    index._apply_log(output)
+    logger.debug("Indexed git history of %d files at %s", index.file_count, head[:12])
+    return index
+
+
+def _update(git: str, cwd: Path, index: GitHistoryIndex, head: str) -> GitHistoryIndex | None:
+    """Add the commits between the index's commit and *head*, if it is an ancestor."""
+    base = index.head
+    if base is None or git_output(git, cwd, ["merge-base", "--is-ancestor", base, head]) is None:
+        return None
+    output = git_output(
+        git, cwd, ["log", "--no-renames", "--name-only", _LOG_FORMAT, f"{base}..{head}"]
+    )
+    if output is None:
+        return None
+    index._apply_log(output)
+    index._head = head
+    return index
+
+
+def _read_cache(repo_root: Path, project_root: Path) -> GitHistoryIndex | None:
+    data = load_json_cache(project_root, HISTORY_CACHE_PATH)
+    if data is None:
+        return None
+    try:
+        return GitHistoryIndex.from_dict(repo_root, data, project_root=project_root)
+    except (TypeError, ValueError, AttributeError) as exc:
+        logger.debug("Ignoring unreadable git history cache: %s", exc)
+        return None
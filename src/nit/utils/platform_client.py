@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import gzip
+import json
 import os
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -27,6 +30,8 @@ _PROMPTS_PATH = "/api/v1/prompts"
 _VALID_PLATFORM_MODES = {"byok", "disabled"}
 _HTTP_SUCCESS_MIN = 200
 _HTTP_SUCCESS_MAX = 300
+_HTTP_NOT_MODIFIED = 304
+_SESSION_POOL_SIZE = 4
 
 # Module-level store for platform config — avoids leaking API keys via os.environ.
 _platform_config_store: dict[str, str] = {}
@@ -157,6 +162,37 @@ def configure_platform_environment(config: PlatformRuntimeConfig) -> None:
         _platform_config_store["NIT_PLATFORM_API_KEY"] = api_key
 
 
+def encode_json_body(
+    payload: Any,
+    *,
+    compress: bool = True,
+) -> tuple[bytes, dict[str, str]]:
+    """Serialise *payload* as a compact JSON request body, gzip-compressed by default.
+
+    Returns:
+        Tuple of (body bytes, content headers to send with it).
+    """
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if compress:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+
+def create_platform_session(*, pool_size: int = _SESSION_POOL_SIZE) -> requests.Session:
+    """Create an HTTP session that keeps platform connections alive between requests.
+
+    Callers that upload repeatedly (batched syncs, background reporters)
+    should hold on to one session and close it when done.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def get_platform_api_key() -> str:
     """Retrieve the platform API key from the in-process store (preferred) or env."""
     return (
@@ -275,20 +311,26 @@ def push_platform_memory(
     payload: Mapping[str, Any],
     *,
     timeout_seconds: float = 15.0,
+    compress: bool = False,
 ) -> dict[str, Any]:
-    """Push memory payload to the platform API for server-side merge."""
+    """Push memory payload to the platform API for server-side merge.
+
+    The body is gzip-compressed only when ``compress`` is True, which callers
+    set once the platform has advertised gzip support.
+    """
     platform_url = normalize_platform_url(config.url)
     api_key = config.api_key.strip()
     if not platform_url or not api_key:
         raise PlatformClientError("Platform URL and API key are required for memory sync.")
 
+    body, content_headers = encode_json_body(dict(payload), compress=compress)
     response = requests.post(
         build_memory_url(platform_url),
         headers={
             "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
+            **content_headers,
         },
-        json=dict(payload),
+        data=body,
         timeout=timeout_seconds,
     )
     if response.status_code < _HTTP_SUCCESS_MIN or response.status_code >= _HTTP_SUCCESS_MAX:
@@ -298,34 +340,46 @@ def push_platform_memory(
         )
 
     try:
-        body = response.json()
+        body_json = response.json()
     except ValueError:
         return {}
 
-    return body if isinstance(body, dict) else {}
+    return body_json if isinstance(body_json, dict) else {}
 
 
 def pull_platform_memory(
     config: PlatformRuntimeConfig,
     project_id: str,
     *,
+    since_version: int = 0,
     timeout_seconds: float = 15.0,
 ) -> dict[str, Any]:
-    """Pull merged memory from the platform API."""
+    """Pull merged memory from the platform API.
+
+    When ``since_version`` is set, the platform may answer with only the
+    sections changed since that version (``mode: "delta"``), or with
+    HTTP 304 if nothing changed, in which case an empty dict is returned.
+    """
     platform_url = normalize_platform_url(config.url)
     api_key = config.api_key.strip()
     if not platform_url or not api_key:
         raise PlatformClientError("Platform URL and API key are required for memory sync.")
 
+    params: dict[str, str | int] = {"projectId": project_id}
+    if since_version > 0:
+        params["sinceVersion"] = since_version
+
     url = build_memory_url(platform_url)
     response = requests.get(
         url,
         headers={
             "Authorization": f"Bearer {api_key}",
         },
-        params={"projectId": project_id},
+        params=params,
         timeout=timeout_seconds,
     )
+    if response.status_code == _HTTP_NOT_MODIFIED:
+        return {}
     if response.status_code < _HTTP_SUCCESS_MIN or response.status_code >= _HTTP_SUCCESS_MAX:
         message = response.text.strip()[:300]
         raise PlatformClientError(
@@ -560,20 +614,29 @@ def post_platform_prompts(
     records: list[dict[str, Any]],
     *,
     timeout_seconds: float = 15.0,
+    session: requests.Session | None = None,
+    compress: bool = True,
 ) -> dict[str, Any]:
-    """Upload prompt records to the platform API."""
+    """Upload prompt records to the platform API.
+
+    The body is gzip-compressed unless ``compress`` is False.  Pass a
+    ``session`` (see ``create_platform_session``) to reuse connections
+    across batches.
+    """
     platform_url = normalize_platform_url(config.url)
     api_key = config.api_key.strip()
     if not platform_url or not api_key:
         raise PlatformClientError("Platform URL and API key are required for prompts upload.")
 
-    response = requests.post(
+    body, content_headers = encode_json_body({"records": records}, compress=compress)
+    post = session.post if session is not None else requests.post
+    response = post(
         build_prompts_url(platform_url),
         headers={
             "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
+            **content_headers,
         },
-        json={"records": records},
+        data=body,
         timeout=timeout_seconds,
     )
     if response.status_code < _HTTP_SUCCESS_MIN or response.status_code >= _HTTP_SUCCESS_MAX:
@@ -583,11 +646,11 @@ def post_platform_prompts(
         )
 
     try:
-        body = response.json()
+        body_json = response.json()
     except ValueError:
         return {}
 
-    return body if isinstance(body, dict) else {}
+    return body_json if isinstance(body_json, dict) else {}
 
 
 def get_platform_prompts(
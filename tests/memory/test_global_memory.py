@@ -124,3 +124,158 @@ def test_memory_persistence(temp_project: Path) -> None:
     memory2 = GlobalMemory(temp_project)
     assert memory2.get_conventions()["language"] == "python"
     assert len(memory2.get_known_patterns()) == 1
+
+
+def test_deferred_coalesces_writes(temp_project: Path) -> None:
+    """Mutations inside deferred() are written in a single save."""
+    memory = GlobalMemory(temp_project)
+    saves: list[dict[str, object]] = []
+    original_save = memory._store.save
+
+    def _counting_save(data: dict[str, object]) -> None:
+        saves.append(data)
+        original_save(data)
+
+    memory._store.save = _counting_save  # type: ignore[method-assign]
+
+    with memory.deferred():
+        memory.add_known_pattern("a")
+        memory.add_failed_pattern("b", reason="boom")
+        memory.update_stats(successful=True, tests_generated=2)
+        pending = memory.dirty
+        assert not memory._store.exists()
+
+    assert pending
+    assert len(saves) == 1
+    assert not memory.dirty
+
+    reloaded = GlobalMemory(temp_project)
+    assert [p["pattern"] for p in reloaded.get_known_patterns()] == ["a"]
+    assert reloaded.get_stats()["total_tests_generated"] == 2
+
+
+def test_manual_flush(temp_project: Path) -> None:
+    """With auto_flush disabled nothing is written until flush()."""
+    memory = GlobalMemory(temp_project, auto_flush=False)
+    memory.add_known_pattern("a")
+
+    assert memory.dirty
+    assert GlobalMemory(temp_project).get_known_patterns() == []
+
+    assert memory.flush() is True
+    assert memory.flush() is False
+    assert len(GlobalMemory(temp_project).get_known_patterns()) == 1
+
+
+def test_flush_merges_concurrent_writers(temp_project: Path) -> None:
+    """Two deferred writers flushing in turn don't lose each other's updates."""
+    first = GlobalMemory(temp_project, auto_flush=False)
+    second = GlobalMemory(temp_project, auto_flush=False)
+
+    first.add_known_pattern("shared")
+    first.update_stats(successful=True, tests_generated=1)
+    second.add_known_pattern("shared")
+    second.add_failed_pattern("only-second", reason="x")
+    second.update_stats(successful=False)
+
+    first.flush()
+    second.flush()
+
+    merged = GlobalMemory(temp_project)
+    known = merged.get_known_patterns()
+    assert len(known) == 1
+    assert known[0]["success_count"] == 2
+    assert [p["pattern"] for p in merged.get_failed_patterns()] == ["only-second"]
+    stats = merged.get_stats()
+    assert stats["total_runs"] == 2
+    assert stats["successful_generations"] == 1
+    assert stats["failed_generations"] == 1
+    assert second.get_stats()["total_runs"] == 2
+
+
+def test_flush_without_locking_overwrites(temp_project: Path) -> None:
+    """Without locking, the last writer's in-memory view wins."""
+    first = GlobalMemory(temp_project, auto_flush=False, locking=False)
+    second = GlobalMemory(temp_project, auto_flush=False, locking=False)
+
+    first.add_known_pattern("from-first")
+    second.add_known_pattern("from-second")
+    first.flush()
+    second.flush()
+
+    patterns = [p["pattern"] for p in GlobalMemory(temp_project).get_known_patterns()]
+    assert patterns == ["from-second"]
+
+
+def test_replace(temp_project: Path) -> None:
+    """replace() swaps the whole document."""
+    memory = GlobalMemory(temp_project)
+    memory.add_known_pattern("old")
+    memory.replace({"conventions": {"language": "go"}, "known_patterns": []})
+
+    reloaded = GlobalMemory(temp_project)
+    assert reloaded.get_conventions() == {"language": "go"}
+    assert reloaded.get_known_patterns() == []
+
+
+def test_apply_changes_merges_with_concurrent_writer(temp_project: Path) -> None:
+    """apply_changes() is saved like any other mutation."""
+    memory = GlobalMemory(temp_project, auto_flush=False)
+    GlobalMemory(temp_project).add_known_pattern("from-other")
+
+    memory.apply_changes(lambda doc: doc.setdefault("conventions", {}).update(language="go"))
+    assert memory.dirty
+    memory.flush()
+
+    reloaded = GlobalMemory(temp_project)
+    assert reloaded.get_conventions() == {"language": "go"}
+    assert [p["pattern"] for p in reloaded.get_known_patterns()] == ["from-other"]
+
+
+def test_known_patterns_deduplicated_by_normalised_text(memory: GlobalMemory) -> None:
+    """Equivalent pattern text is merged into a single entry."""
+    memory.add_known_pattern("Test generated for pytest after 1 attempt(s)")
+    memory.add_known_pattern("test generated for pytest after 3 attempt(s)")
+
+    patterns = memory.get_known_patterns()
+    assert len(patterns) == 1
+    assert patterns[0]["success_count"] == 2
+    assert patterns[0]["key"]
+
+
+def test_failed_patterns_deduplicated(memory: GlobalMemory) -> None:
+    """Repeated failures bump a counter instead of growing the list."""
+    memory.add_failed_pattern("Attempt 1 failed with test_bug", reason="first")
+    memory.add_failed_pattern("Attempt 2 failed with test_bug", reason="second")
+
+    patterns = memory.get_failed_patterns()
+    assert len(patterns) == 1
+    assert patterns[0]["count"] == 2
+    assert patterns[0]["reason"] == "second"
+
+
+def test_pattern_capacity_evicts_low_value(temp_project: Path) -> None:
+    """Patterns beyond capacity are evicted, keeping frequently used ones."""
+    memory = GlobalMemory(temp_project, pattern_capacity=3)
+    memory.add_known_pattern("keep me")
+    memory.add_known_pattern("keep me")
+    for name in ("alpha", "beta", "gamma"):
+        memory.add_known_pattern(name)
+        memory.add_failed_pattern(name, reason="r")
+
+    known = [p["pattern"] for p in memory.get_known_patterns()]
+    assert len(known) == 3
+    assert "keep me" in known
+    assert len(memory.get_failed_patterns()) == 3
+
+
+def test_top_patterns_filtered_and_limited(memory: GlobalMemory) -> None:
+    """Top-K retrieval returns only relevant patterns, best first."""
+    memory.add_known_pattern("generic")
+    memory.add_known_pattern("vitest specific", context={"framework": "vitest"})
+    memory.add_known_pattern("pytest specific", context={"framework": "pytest"})
+    memory.add_failed_pattern("pytest failure", reason="r", context={"framework": "pytest"})
+
+    top = memory.top_known_patterns(2, filter_value="pytest")
+    assert [p["pattern"] for p in top] == ["pytest specific", "generic"]
+    assert [p["pattern"] for p in memory.top_failed_patterns(5, filter_value="vitest")] == []
@@ -155,3 +155,19 @@ def test_package_memory_persistence(temp_project: Path) -> None:
     memory2 = PackageMemory(temp_project, "my-package")
     assert memory2.get_test_patterns()["naming"] == "function"
     assert len(memory2.get_known_issues()) == 1
+
+
+def test_package_memory_deferred(temp_project: Path) -> None:
+    """Package mutations inside deferred() are persisted on exit."""
+    memory = PackageMemory(temp_project, "my-package")
+
+    with memory.deferred():
+        memory.add_known_issue("Issue")
+        memory.add_coverage_snapshot(75.0)
+        memory.add_llm_feedback("suggestion", "Use fixtures")
+        assert PackageMemory(temp_project, "my-package").get_known_issues() == []
+
+    reloaded = PackageMemory(temp_project, "my-package")
+    assert len(reloaded.get_known_issues()) == 1
+    assert reloaded.get_latest_coverage() is not None
+    assert len(reloaded.get_llm_feedback()) == 1
@@ -0,0 +1,102 @@
+"""Tests for memory pattern scoring, eviction and ranking."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from nit.memory.patterns import (
+    RECENCY_HALF_LIFE_DAYS,
+    entry_key,
+    evict_patterns,
+    normalize_pattern,
+    pattern_key,
+    pattern_score,
+    rank_patterns,
+)
+
+_NOW = datetime(2026, 1, 31, tzinfo=UTC)
+
+
+def _known(pattern: str, count: int, days_ago: float, **context: str) -> dict[str, Any]:
+    return {
+        "pattern": pattern,
+        "success_count": count,
+        "last_used": (_NOW - timedelta(days=days_ago)).isoformat(),
+        "context": context,
+    }
+
+
+def test_normalize_pattern_ignores_literals_and_whitespace() -> None:
+    assert normalize_pattern("Expected 3 but got '4'") == normalize_pattern(
+        "expected 5   but got 'x'"
+    )
+    assert normalize_pattern("use fixtures") != normalize_pattern("use mocks")
+
+
+def test_pattern_key_is_stable_and_short() -> None:
+    assert pattern_key("Attempt 1 failed") == pattern_key("attempt 2 failed")
+    assert len(pattern_key("anything")) == 16
+
+
+def test_entry_key_falls_back_to_pattern_text() -> None:
+    assert entry_key({"pattern": "Use Fixtures"}) == pattern_key("use fixtures")
+    assert entry_key({"pattern": "x", "key": "abc"}) == "abc"
+
+
+def test_pattern_score_decays_with_age() -> None:
+    fresh = _known("p", 4, 0)
+    old = _known("p", 4, RECENCY_HALF_LIFE_DAYS)
+
+    assert pattern_score(fresh, now=_NOW) == 4.0
+    assert pattern_score(old, now=_NOW) == 2.0
+
+
+def test_pattern_score_handles_missing_fields() -> None:
+    assert pattern_score({"pattern": "p"}, now=_NOW) == 1.0
+    assert pattern_score({"pattern": "p", "count": 3, "timestamp": "bad"}, now=_NOW) == 3.0
+
+
+def test_evict_patterns_keeps_highest_scores_in_order() -> None:
+    patterns = [
+        _known("stale", 1, 365),
+        _known("popular", 10, 1),
+        _known("recent", 2, 0),
+    ]
+
+    kept = evict_patterns(patterns, 2, now=_NOW)
+
+    assert [p["pattern"] for p in kept] == ["popular", "recent"]
+
+
+def test_evict_patterns_within_capacity_is_noop() -> None:
+    patterns = [_known("a", 1, 0)]
+    assert evict_patterns(patterns, 5, now=_NOW) is patterns
+    assert evict_patterns(patterns, 0, now=_NOW) == []
+
+
+def test_rank_patterns_prefers_scoped_then_score() -> None:
+    patterns = [
+        _known("universal-hot", 50, 0),
+        _known("pytest-cold", 1, 10, framework="pytest"),
+        _known("jest-only", 100, 0, framework="jest"),
+        _known("pytest-hot", 5, 0, framework="pytest"),
+    ]
+
+    ranked = rank_patterns(
+        patterns, filter_key="framework", filter_value="pytest", limit=3, now=_NOW
+    )
+
+    assert [p["pattern"] for p in ranked] == ["pytest-hot", "pytest-cold", "universal-hot"]
+
+
+def test_rank_patterns_limit() -> None:
+    patterns = [_known(f"p{i}", 1, 0) for i in range(20)]
+
+    ranked = rank_patterns(patterns, filter_key="framework", filter_value="", limit=5, now=_NOW)
+
+    assert [p["pattern"] for p in ranked] == ["p0", "p1", "p2", "p3", "p4"]
+    assert rank_patterns(patterns, filter_key="x", filter_value="", limit=0) == []
+
+
+def test_normalize_pattern_keeps_numbers_inside_identifiers() -> None:
+    assert normalize_pattern("pattern1") != normalize_pattern("pattern2")
+    assert normalize_pattern("timeout after 1.5 s") == normalize_pattern("timeout after 30 s")
@@ -91,3 +91,48 @@ def test_memory_store_file_path(temp_project: Path) -> None:
     store: MemoryStore[dict[str, Any]] = MemoryStore(temp_project, "test.json")
     expected = temp_project / ".nit" / "memory" / "test.json"
     assert store.file_path == expected
+
+
+def test_memory_store_save_is_atomic(temp_project: Path) -> None:
+    """Saving leaves no temporary files behind and replaces the target."""
+    store: MemoryStore[dict[str, Any]] = MemoryStore(temp_project, "test.json")
+    store.save({"v": 1})
+    store.save({"v": 2})
+
+    assert store.load() == {"v": 2}
+    leftovers = [p.name for p in store.file_path.parent.iterdir() if p.suffix == ".tmp"]
+    assert leftovers == []
+
+
+def test_memory_store_save_failure_keeps_previous_file(temp_project: Path) -> None:
+    """A failed serialisation must not truncate the existing file."""
+    store: MemoryStore[dict[str, Any]] = MemoryStore(temp_project, "test.json")
+    store.save({"v": 1})
+
+    with pytest.raises(TypeError):
+        store.save({"bad": object()})
+
+    assert store.load() == {"v": 1}
+    assert not any(p.suffix == ".tmp" for p in store.file_path.parent.iterdir())
+
+
+def test_memory_store_lock_creates_sidecar(temp_project: Path) -> None:
+    """A locking store takes its file lock on a sidecar file."""
+    store: MemoryStore[dict[str, Any]] = MemoryStore(temp_project, "test.json", locking=True)
+
+    with store.lock():
+        store.save({"v": 1})
+
+    assert store.file_path.with_name("test.json.lock").exists()
+    assert store.load() == {"v": 1}
+
+
+def test_memory_store_lock_without_locking_is_reentrant(temp_project: Path) -> None:
+    """Non-locking stores only serialise threads and can be nested."""
+    store: MemoryStore[dict[str, Any]] = MemoryStore(temp_project, "test.json")
+
+    with store.lock(), store.lock():
+        store.update({"k": "v"})
+
+    assert store.load() == {"k": "v"}
+    assert not store.file_path.with_name("test.json.lock").exists()
@@ -2,6 +2,8 @@
 
 from typing import cast
 
+import pytest
+
 from nit.agents.base import BaseAgent, TaskInput, TaskOutput, TaskStatus
 from nit.orchestrator import Orchestrator
 
@@ -83,6 +85,50 @@ async def test_orchestrator_handles_failure() -> None:
     assert "intentional failure" in results[0].errors[0]
 
 
+async def test_orchestrator_runs_by_priority() -> None:
+    orchestrator = Orchestrator(max_concurrency=1)
+    agent = EchoAgent()
+    started: list[str] = []
+
+    tasks: list[tuple[BaseAgent, TaskInput]] = [
+        (agent, TaskInput(task_type="test", target=target)) for target in ("low", "high", "mid")
+    ]
+    results = await orchestrator.run_all(
+        tasks,
+        priorities=[3, 0, 1],
+        on_result=lambda task, _output: started.append(task.target),
+    )
+
+    assert started == ["high", "mid", "low"]
+    # Results still line up with the submitted tasks
+    assert [r.result["echoed"] for r in results] == ["low", "high", "mid"]
+
+
+async def test_orchestrator_streams_failures() -> None:
+    orchestrator = Orchestrator(max_concurrency=2)
+    seen: list[TaskStatus] = []
+
+    tasks: list[tuple[BaseAgent, TaskInput]] = [
+        (EchoAgent(), TaskInput(task_type="test", target="ok")),
+        (FailAgent(), TaskInput(task_type="test", target="boom")),
+    ]
+    await orchestrator.run_all(tasks, on_result=lambda _task, output: seen.append(output.status))
+
+    assert sorted(seen, key=lambda s: s.value) == sorted(
+        [TaskStatus.COMPLETED, TaskStatus.FAILED], key=lambda s: s.value
+    )
+
+
+async def test_orchestrator_rejects_mismatched_priorities() -> None:
+    orchestrator = Orchestrator()
+    agent = EchoAgent()
+
+    with pytest.raises(ValueError, match="priorities"):
+        await orchestrator.run_all(
+            [(agent, TaskInput(task_type="test", target="x"))], priorities=[0, 1]
+        )
+
+
 def test_orchestrator_register_and_get() -> None:
     orchestrator = Orchestrator()
     agent = EchoAgent()
@@ -0,0 +1,114 @@
+"""Tests for batching small source files into shared generation requests."""
+
+from __future__ import annotations
+
+from nit.agents.builders.batching import (
+    FILE_MARKER,
+    combine_prompts,
+    plan_batches,
+    split_batch_response,
+)
+from nit.agents.builders.unit import BuildTask
+from nit.llm.engine import LLMMessage
+from nit.llm.prompts.base import RenderedPrompt
+
+
+def _task(source_file: str, framework: str = "pytest") -> BuildTask:
+    return BuildTask(source_file=source_file, framework=framework)
+
+
+def _prompt(system: str, user: str) -> RenderedPrompt:
+    return RenderedPrompt(
+        messages=[
+            LLMMessage(role="system", content=system),
+            LLMMessage(role="user", content=user),
+        ]
+    )
+
+
+# ── plan_batches ─────────────────────────────────────────────────
+
+
+def test_plan_groups_small_files_by_package_and_framework() -> None:
+    tasks = [
+        _task("pkg/a.py"),
+        _task("other/b.py"),
+        _task("pkg/c.py"),
+        _task("pkg/d.ts", framework="vitest"),
+    ]
+
+    batches = plan_batches(tasks, lambda _: 100)
+
+    assert [[t.source_file for t in b] for b in batches] == [
+        ["pkg/a.py", "pkg/c.py"],
+        ["other/b.py"],
+        ["pkg/d.ts"],
+    ]
+
+
+def test_plan_keeps_large_files_alone() -> None:
+    sizes = {"pkg/a.py": 100, "pkg/big.py": 5000, "pkg/c.py": 100}
+    tasks = [_task(path) for path in sizes]
+
+    batches = plan_batches(tasks, lambda t: sizes[t.source_file], small_file_tokens=1500)
+
+    assert [[t.source_file for t in b] for b in batches] == [
+        ["pkg/a.py", "pkg/c.py"],
+        ["pkg/big.py"],
+    ]
+
+
+def test_plan_respects_file_and_token_limits() -> None:
+    tasks = [_task(f"pkg/m{i}.py") for i in range(5)]
+
+    by_count = plan_batches(tasks, lambda _: 10, max_files=2)
+    by_tokens = plan_batches(tasks, lambda _: 400, max_tokens=1000)
+
+    assert [len(b) for b in by_count] == [2, 2, 1]
+    assert [len(b) for b in by_tokens] == [2, 2, 1]
+
+
+def test_plan_batch_size_one_disables_batching() -> None:
+    tasks = [_task("pkg/a.py"), _task("pkg/b.py")]
+    assert [len(b) for b in plan_batches(tasks, lambda _: 10, max_files=1)] == [1, 1]
+
+
+# ── combine_prompts / split_batch_response ───────────────────────
+
+
+def test_combine_prompts_shares_system_instruction() -> None:
+    messages = combine_prompts(
+        [
+            ("pkg/a.py", _prompt("Write pytest tests.", "## Source\na")),
+            ("pkg/b.py", _prompt("Write pytest tests.", "## Source\nb")),
+        ]
+    )
+
+    assert [m.role for m in messages] == ["system", "user"]
+    assert messages[0].content.startswith("Write pytest tests.")
+    assert messages[0].content.count("Write pytest tests.") == 1
+    assert FILE_MARKER.format(path="pkg/a.py") in messages[0].content
+    assert "# Source file 1: pkg/a.py" in messages[1].content
+    assert "# Source file 2: pkg/b.py" in messages[1].content
+
+
+def test_split_batch_response() -> None:
+    text = (
+        "=== FILE: pkg/a.py ===\n"
+        "```python\ndef test_a():\n    assert True\n```\n\n"
+        "=== FILE: pkg/b.py ===\n"
+        "def test_b():\n    assert True\n"
+        "=== FILE: pkg/unknown.py ===\n"
+        "def test_x():\n    pass\n"
+    )
+
+    result = split_batch_response(text, ["pkg/a.py", "pkg/b.py", "pkg/c.py"])
+
+    assert result == {
+        "pkg/a.py": "def test_a():\n    assert True",
+        "pkg/b.py": "def test_b():\n    assert True",
+    }
+
+
+def test_split_batch_response_without_markers() -> None:
+    assert split_batch_response("def test_a():\n    pass\n", ["pkg/a.py"]) == {}
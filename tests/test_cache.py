@@ -4,8 +4,22 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from nit.utils.cache import FileContentCache, MemoryCache, content_hash
+from nit.utils.cache import (
+    CACHE_DIR,
+    FileContentCache,
+    MemoryCache,
+    VersionedJsonCache,
+    content_hash,
+    load_json_cache,
+    project_cache_dir,
+    save_json_cache,
+    write_atomic,
+)
+
+if TYPE_CHECKING:
+    import pytest
 
 
 class TestMemoryCache:
@@ -130,3 +144,116 @@ class TestContentHash:
 
     def test_length_is_16(self) -> None:
         assert len(content_hash("anything")) == 16
+
+
+class TestProjectCacheDir:
+    def test_creates_ignored_directory(self, tmp_path: Path) -> None:
+        cache_dir = project_cache_dir(tmp_path)
+
+        assert cache_dir == tmp_path / CACHE_DIR
+        assert (cache_dir / ".gitignore").read_text().splitlines()[-1] == "*"
+
+    def test_existing_gitignore_is_kept(self, tmp_path: Path) -> None:
+        (tmp_path / CACHE_DIR).mkdir(parents=True)
+        (tmp_path / CACHE_DIR / ".gitignore").write_text("custom\n")
+
+        project_cache_dir(tmp_path)
+
+        assert (tmp_path / CACHE_DIR / ".gitignore").read_text() == "custom\n"
+
+
+class TestWriteAtomic:
+    def test_replaces_file_without_leftovers(self, tmp_path: Path) -> None:
+        target = tmp_path / "data.bin"
+        target.write_bytes(b"old")
+
+        write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.bin"]
+
+
+class TestJsonCache:
+    def test_roundtrip_in_ignored_cache_dir(self, tmp_path: Path) -> None:
+        cache_path = CACHE_DIR / "example.json"
+
+        save_json_cache(tmp_path, cache_path, {"format": 1, "files": {"a.py": [1, 2]}})
+
+        assert load_json_cache(tmp_path, cache_path) == {"format": 1, "files": {"a.py": [1, 2]}}
+        assert (tmp_path / CACHE_DIR / ".gitignore").is_file()
+
+    def test_missing_or_invalid_returns_none(self, tmp_path: Path) -> None:
+        cache_path = CACHE_DIR / "example.json"
+        assert load_json_cache(tmp_path, cache_path) is None
+
+        project_cache_dir(tmp_path)
+        (tmp_path / cache_path).write_text("[1, 2]")
+        assert load_json_cache(tmp_path, cache_path) is None
+
+        (tmp_path / cache_path).write_text("{not json")
+        assert load_json_cache(tmp_path, cache_path) is None
+
+    def test_unserialisable_data_is_not_written(self, tmp_path: Path) -> None:
+        cache_path = CACHE_DIR / "example.json"
+
+        save_json_cache(tmp_path, cache_path, {"bad": object()})
+
+        assert not (tmp_path / cache_path).exists()
+
+
+class _NotesCache(VersionedJsonCache):
+    cache_path = CACHE_DIR / "notes.json"
+    revision = "a"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.notes: dict[str, str] = {}
+
+    @property
+    def version(self) -> str:
+        return self.revision
+
+    def add(self, key: str, note: str) -> None:
+        self.notes[key] = note
+        self._dirty = True
+
+    def _entries_to_json(self) -> dict[str, Any]:
+        return dict(self.notes)
+
+    def _entries_from_json(self, entries: dict[str, Any]) -> None:
+        for key, note in entries.items():
+            if not isinstance(note, str):
+                raise TypeError(key)
+            self.notes[key] = note
+
+
+class TestVersionedJsonCache:
+    def test_roundtrip_only_saves_changes(self, tmp_path: Path) -> None:
+        _NotesCache().save(tmp_path)
+        assert not (tmp_path / _NotesCache.cache_path).exists()
+
+        cache = _NotesCache()
+        cache.add("a.py", "checked")
+        cache.save(tmp_path)
+
+        loaded = _NotesCache.load(tmp_path)
+        assert loaded.notes == {"a.py": "checked"}
+        assert not loaded.dirty
+
+    def test_other_versions_and_malformed_entries_load_empty(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = _NotesCache()
+        cache.add("a.py", "checked")
+        cache.save(tmp_path)
+
+        monkeypatch.setattr(_NotesCache, "revision", "b")
+        assert _NotesCache.load(tmp_path).notes == {}
+
+        monkeypatch.setattr(_NotesCache, "format_version", 2)
+        save_json_cache(tmp_path, _NotesCache.cache_path, {"format": 2, "version": "b"})
+        assert _NotesCache.load(tmp_path).notes == {}
+
+        data = {"format": 2, "version": "b", "entries": {"a.py": 1}}
+        save_json_cache(tmp_path, _NotesCache.cache_path, data)
+        assert _NotesCache.load(tmp_path).notes == {}
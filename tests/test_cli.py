@@ -2407,6 +2407,42 @@ class TestPickDeepPaths:
 
         assert result.exit_code != 0
 
+    def test_pick_upload_abort_still_joins_prompt_sync(self, tmp_path: Path) -> None:
+        (tmp_path / ".nit.yml").write_text(
+            "llm:\n"
+            "  mode: builtin\n"
+            "  provider: openai\n"
+            "  model: gpt-4o\n"
+            "  api_key: sk-test\n"
+            "platform:\n"
+            "  mode: byok\n"
+            "  url: https://platform.getnit.dev\n"
+            "  api_key: nit_key_abc\n",
+            encoding="utf-8",
+        )
+        mock_result = PickPipelineResult(success=True, tests_run=1, tests_passed=1)
+        pending = MagicMock()
+
+        runner = CliRunner()
+        with (
+            patch("nit.cli.PickPipeline.run", return_value=mock_result),
+            patch("nit.cli._try_pull_memory"),
+            patch("nit.cli._start_prompt_sync", return_value=pending),
+            patch("nit.cli._finish_prompt_sync") as finish,
+            patch(
+                "nit.cli.post_platform_report",
+                side_effect=PlatformClientError("Upload failed"),
+            ),
+        ):
+            result = runner.invoke(
+                cli,
+                ["--ci", "pick", "--path", str(tmp_path), "--report"],
+            )
+
+        assert result.exit_code != 0
+        finish.assert_called_once()
+        assert finish.call_args.args == (pending, True)
+
     def test_pick_exception_aborts(self, tmp_path: Path) -> None:
         self._write_valid_config(tmp_path)
         runner = CliRunner()
@@ -21,6 +21,7 @@ from nit.agents.analyzers.code import (
     SideEffectType,
 )
 from nit.agents.base import TaskInput, TaskStatus
+from nit.parsing.symbol_index import SymbolIndex
 
 # ── Sample source files ──────────────────────────────────────────
 
@@ -345,6 +346,22 @@ def test_build_call_graph_javascript(analyzer: CodeAnalyzer, project_root: Path)
     assert "simpleFunction" in func_names
 
 
+def test_build_call_graph_includes_imported_functions(tmp_path: Path) -> None:
+    """With a symbol index, calls into imported project files are recorded."""
+    (tmp_path / "store.py").write_text("def save(item):\n    return item\n")
+    (tmp_path / "api.py").write_text(
+        "from store import save\n\n\ndef checkout(cart):\n    log(cart)\n    return save(cart)\n"
+    )
+    symbols = SymbolIndex(tmp_path)
+    symbols.update(["store.py", "api.py"])
+
+    per_file = CodeAnalyzer(tmp_path).analyze_file(tmp_path / "api.py")
+    cross_file = CodeAnalyzer(tmp_path, symbols=symbols).analyze_file(tmp_path / "api.py")
+
+    assert per_file.call_graph == []
+    assert [(c.caller, c.callee) for c in cross_file.call_graph] == [("checkout", "save")]
+
+
 # ── Tests: Side effect detection ─────────────────────────────────
 
 
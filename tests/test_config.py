@@ -12,6 +12,7 @@ from nit.config import (
     CoverageConfig,
     DocsConfig,
     E2EConfig,
+    ExecutionConfig,
     LLMConfig,
     NitConfig,
     PipelineConfig,
@@ -21,11 +22,13 @@ from nit.config import (
     _parse_auth_config,
     _parse_docs_config,
     _parse_e2e_config,
+    _parse_execution_config,
     _parse_pipeline_config,
     _parse_sentry_config,
     _resolve_dict,
     _resolve_env_vars,
     _validate_coverage_config,
+    _validate_execution_config,
     _validate_llm_config,
     _validate_pipeline_config,
     _validate_platform_config,
@@ -173,6 +176,7 @@ class TestLoadConfig:
                     "function_threshold": 95.0,
                     "complexity_threshold": 15,
                     "undertested_threshold": 40.0,
+                    "bounded_memory": True,
                 },
                 "pipeline": {"max_fix_loops": 3},
                 "sentry": {
@@ -216,6 +220,7 @@ class TestLoadConfig:
         assert len(config.workspace.packages) == 2
         assert config.e2e.enabled is True
         assert config.coverage.line_threshold == 90.0
+        assert config.coverage.bounded_memory is True
         assert config.docs.style == "google"
         assert config.docs.framework == "sphinx"
         assert config.docs.write_to_source is True
@@ -460,6 +465,29 @@ class TestValidatePipelineConfig:
         assert any("max_fix_loops" in e for e in errors)
 
 
+# ── _validate_execution_config ───────────────────────────────────────
+
+
+class TestValidateExecutionConfig:
+    def test_valid_defaults(self) -> None:
+        assert _validate_execution_config(ExecutionConfig()) == []
+
+    def test_zero_generation_concurrency(self) -> None:
+        cfg = ExecutionConfig(generation_concurrency=0)
+        errors = _validate_execution_config(cfg)
+        assert any("generation_concurrency" in e for e in errors)
+
+    def test_zero_generation_batch_size(self) -> None:
+        cfg = ExecutionConfig(generation_batch_size=0)
+        errors = _validate_execution_config(cfg)
+        assert any("generation_batch_size" in e for e in errors)
+
+    def test_zero_analysis_concurrency(self) -> None:
+        cfg = ExecutionConfig(analysis_concurrency=0)
+        errors = _validate_execution_config(cfg)
+        assert any("analysis_concurrency" in e for e in errors)
+
+
 # ── _validate_sentry_config ──────────────────────────────────────────
 
 
@@ -564,6 +592,26 @@ class TestParsePipelineConfig:
         assert result.max_fix_loops == 1
 
 
+class TestParseExecutionConfig:
+    def test_default(self) -> None:
+        result = _parse_execution_config({})
+        assert result.generation_concurrency == 4
+        assert result.generation_batch_size == 4
+        assert result.analysis_concurrency == 4
+
+    def test_generation_concurrency(self) -> None:
+        result = _parse_execution_config({"execution": {"generation_concurrency": 8}})
+        assert result.generation_concurrency == 8
+
+    def test_generation_batch_size(self) -> None:
+        result = _parse_execution_config({"execution": {"generation_batch_size": 1}})
+        assert result.generation_batch_size == 1
+
+    def test_analysis_concurrency(self) -> None:
+        result = _parse_execution_config({"execution": {"analysis_concurrency": 2}})
+        assert result.analysis_concurrency == 2
+
+
 class TestParseSentryConfig:
     def test_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv("NIT_SENTRY_ENABLED", raising=False)
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 from nit.llm.context import (
     AssembledContext,
+    AssemblyCache,
     ContextAssembler,
     DetectedTestPattern,
     _default_token_count,
@@ -27,6 +32,7 @@ from nit.llm.context import (
     _truncate_to_tokens,
     extract_test_patterns,
 )
+from nit.parsing.symbol_index import SymbolIndex, load_symbol_index
 from nit.parsing.treesitter import (
     ClassInfo,
     FunctionInfo,
@@ -459,3 +465,126 @@ def test_assembler_resolve_relative(tmp_path: Path) -> None:
     assembler = ContextAssembler(tmp_path)
     rel_path = Path("src/file.py")
     assert assembler._resolve(rel_path) == tmp_path / "src" / "file.py"
+
+
+# ── AssemblyCache ────────────────────────────────────────────────
+
+
+def _package(root: Path, modules: int) -> list[Path]:
+    _write(root, "src/pkg/__init__.py", "")
+    _write(root, "src/pkg/util.py", "def helper():\n    return 1\n")
+    _write(root, "tests/test_other.py", "def test_other():\n    assert True\n")
+    return [
+        _write(root, f"src/pkg/mod{i}.py", "from pkg.util import helper\n\ndef f():\n    pass\n")
+        for i in range(modules)
+    ]
+
+
+def test_assembly_cache_existence_checks(tmp_path: Path) -> None:
+    _write(tmp_path, "pkg/a.py", "")
+    cache = AssemblyCache()
+
+    assert cache.is_file(tmp_path / "pkg" / "a.py")
+    assert not cache.is_file(tmp_path / "pkg")
+    assert cache.is_dir(tmp_path / "pkg")
+    assert cache.is_dir(tmp_path / "pkg" / "..")
+    assert not cache.is_file(tmp_path / "missing" / "a.py")
+
+    # Listings are snapshots until cleared
+    _write(tmp_path, "pkg/b.py", "")
+    assert not cache.is_file(tmp_path / "pkg" / "b.py")
+    cache.clear()
+    assert cache.is_file(tmp_path / "pkg" / "b.py")
+
+
+def test_assembly_cache_snippet_revalidates_on_mtime(tmp_path: Path) -> None:
+    f = _write(tmp_path, "util.py", "old\n")
+    cache = AssemblyCache()
+    assert cache.read_snippet(f) == "old\n"
+
+    f.write_text("new\n", encoding="utf-8")
+    stat = f.stat()
+    os.utime(f, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.read_snippet(f) == "new\n"
+
+
+def test_repeated_assembly_hits_cache(tmp_path: Path) -> None:
+    modules = _package(tmp_path, 5)
+    assembler = ContextAssembler(tmp_path)
+
+    with (
+        patch("nit.llm.context._find_any_test_files", wraps=_find_any_test_files) as scan,
+        patch("nit.llm.context.extract_test_patterns", wraps=extract_test_patterns) as extract,
+        patch("nit.llm.context._read_snippet", wraps=_read_snippet) as read,
+    ):
+        contexts = [assembler.assemble(m) for m in modules]
+
+    assert scan.call_count == 1
+    assert extract.call_count == 1
+    assert read.call_count == 1  # pkg/util.py, shared by every module
+    for ctx in contexts:
+        assert [rf.path for rf in ctx.related_files] == ["src/pkg/util.py"]
+        assert ctx.test_patterns is not None
+        assert ctx.test_patterns.naming_style == "function"
+
+
+def test_assembly_cache_shared_between_assemblers(tmp_path: Path) -> None:
+    modules = _package(tmp_path, 2)
+    cache = AssemblyCache()
+    ContextAssembler(tmp_path, cache=cache).assemble(modules[0])
+
+    with patch("nit.llm.context._list_directory") as listdir:
+        ctx = ContextAssembler(tmp_path, cache=cache).assemble(modules[1])
+
+    listdir.assert_not_called()
+    assert [rf.path for rf in ctx.related_files] == ["src/pkg/util.py"]
+
+
+def test_assembly_cache_symbol_index_supplies_imports(tmp_path: Path) -> None:
+    main = _write(tmp_path, "cmd/main.go", 'package main\nimport "example.com/app/store"\n')
+    store = _write(tmp_path, "store/store.go", "package store\n")
+    symbols = SymbolIndex(tmp_path)
+    symbols.update([main, store])
+
+    ctx = ContextAssembler(tmp_path, cache=AssemblyCache(symbols=symbols)).assemble(main)
+
+    assert [(rf.path, rf.relationship) for rf in ctx.related_files] == [
+        ("store/store.go", "import")
+    ]
+
+
+def test_assembly_cache_loads_project_symbol_index_on_first_use(tmp_path: Path) -> None:
+    main = _write(tmp_path, "cmd/main.go", 'package main\nimport "example.com/app/store"\n')
+    _write(tmp_path, "store/store.go", "package store\n")
+    cache = AssemblyCache(project_root=tmp_path)
+
+    with patch("nit.llm.context.load_symbol_index", wraps=load_symbol_index) as load:
+        ctx = ContextAssembler(tmp_path, cache=cache).assemble(main)
+        ContextAssembler(tmp_path, cache=cache).assemble(main)
+
+    load.assert_called_once_with(tmp_path)
+    assert [rf.path for rf in ctx.related_files] == ["store/store.go"]
+
+
+def test_assembly_cache_loads_symbol_index_off_the_event_loop(tmp_path: Path) -> None:
+    main = _write(tmp_path, "cmd/main.go", 'package main\nimport "example.com/app/store"\n')
+    _write(tmp_path, "store/store.go", "package store\n")
+    cache = AssemblyCache(project_root=tmp_path)
+    assembler = ContextAssembler(tmp_path, cache=cache)
+    threads: list[int] = []
+
+    def recording_load(root: Path) -> SymbolIndex:
+        threads.append(threading.get_ident())
+        return load_symbol_index(root)
+
+    async def assemble_concurrently() -> None:
+        await asyncio.gather(*(assembler.load_symbols() for _ in range(3)))
+
+    with patch("nit.llm.context.load_symbol_index", side_effect=recording_load):
+        asyncio.run(assemble_concurrently())
+        ctx = assembler.assemble(main)
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+    assert [rf.path for rf in ctx.related_files] == ["store/store.go"]
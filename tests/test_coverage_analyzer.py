@@ -13,7 +13,9 @@ Covers:
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
@@ -28,11 +30,16 @@ from nit.adapters.coverage.base import (
 from nit.agents.analyzers.coverage import (
     CoverageAnalysisTask,
     CoverageAnalyzer,
+    CoverageGapReport,
+    FunctionGap,
     GapPriority,
 )
 from nit.agents.base import TaskInput, TaskStatus
 from nit.parsing.treesitter import FunctionInfo
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # ── Sample source files ──────────────────────────────────────────
 
 
@@ -515,3 +522,117 @@ async def test_private_function_low_priority(project_root: Path) -> None:
     # Should still create a gap, but with low priority
     assert gap is not None
     assert gap.priority in (GapPriority.LOW, GapPriority.MEDIUM)
+
+
+# ── Bounded-memory mode ──────────────────────────────────────────
+
+
+@pytest.fixture
+def streaming_adapter(mock_adapter: Mock, mock_coverage_report: CoverageReport) -> Mock:
+    """A mock adapter whose coverage run is streamed file by file."""
+    mock_adapter.stream_coverage = AsyncMock(return_value=iter(mock_coverage_report.files.values()))
+    return mock_adapter
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_streams_a_fresh_coverage_run(
+    project_root: Path, streaming_adapter: Mock, mock_coverage_report: CoverageReport
+) -> None:
+    analyzer = CoverageAnalyzer(project_root)
+    analyzer._coverage_adapters = [streaming_adapter]
+    task = CoverageAnalysisTask(project_root=str(project_root), bounded_memory=True)
+
+    result = await analyzer.run(task)
+
+    gap_report = result.result["gap_report"]
+    assert result.status == TaskStatus.COMPLETED
+    streaming_adapter.stream_coverage.assert_awaited_once_with(project_root)
+    streaming_adapter.run_coverage.assert_not_awaited()
+    assert gap_report.untested_files == ["src/pricing.ts"]
+    assert gap_report.overall_coverage == mock_coverage_report.overall_line_coverage
+    assert [t.test_file for t in gap_report.stale_tests] == ["tests/test_old_module.py"]
+    assert result.result["coverage_report"].files == {}
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_keeps_files_parsed_before_failure(
+    project_root: Path, streaming_adapter: Mock, mock_coverage_report: CoverageReport
+) -> None:
+    def truncated_report() -> Iterator[FileCoverage]:
+        yield mock_coverage_report.files["src/calculator.py"]
+        raise ValueError("truncated report")
+
+    streaming_adapter.stream_coverage = AsyncMock(return_value=truncated_report())
+    analyzer = CoverageAnalyzer(project_root)
+    analyzer._coverage_adapters = [streaming_adapter]
+    task = CoverageAnalysisTask(project_root=str(project_root), bounded_memory=True)
+
+    result = await analyzer.run(task)
+
+    gap_report = result.result["gap_report"]
+    assert result.status == TaskStatus.COMPLETED
+    assert gap_report.untested_files == []
+    assert gap_report.overall_coverage == pytest.approx(3 / 7 * 100)
+
+
+@pytest.mark.asyncio
+async def test_bounded_memory_iterates_reports_off_the_event_loop(
+    project_root: Path, streaming_adapter: Mock, mock_coverage_report: CoverageReport
+) -> None:
+    iterated_on: list[int] = []
+
+    def report() -> Iterator[FileCoverage]:
+        iterated_on.append(threading.get_ident())
+        yield from mock_coverage_report.files.values()
+
+    streaming_adapter.stream_coverage = AsyncMock(return_value=report())
+    analyzer = CoverageAnalyzer(project_root)
+    analyzer._coverage_adapters = [streaming_adapter]
+    task = CoverageAnalysisTask(project_root=str(project_root), bounded_memory=True)
+
+    await analyzer.run(task)
+
+    assert iterated_on
+    assert iterated_on != [threading.get_ident()]
+
+
+# ── Gap index ────────────────────────────────────────────────────
+
+
+def _gap(file_path: str, function_name: str, coverage: float = 0.0) -> FunctionGap:
+    return FunctionGap(
+        file_path=file_path,
+        function_name=function_name,
+        line_number=1,
+        end_line=2,
+        coverage_percentage=coverage,
+        complexity=1,
+        is_public=True,
+        priority=GapPriority.MEDIUM,
+    )
+
+
+def test_gap_index_lookups() -> None:
+    gaps = [_gap("a.py", "f", 10.0), _gap("b.py", "g"), _gap("a.py", "h"), _gap("a.py", "f", 90.0)]
+    report = CoverageGapReport(function_gaps=gaps)
+
+    index = report.gap_index
+
+    assert index.for_file("a.py") == [gaps[0], gaps[2], gaps[3]]
+    assert index.for_file("missing.py") == []
+    assert index.for_function("a.py", "f") is gaps[0]
+    assert index.for_function("b.py", "f") is None
+    assert report.gap_index is index
+
+
+def test_gap_index_follows_report_changes() -> None:
+    report = CoverageGapReport(function_gaps=[_gap("a.py", "f")])
+    first = report.gap_index
+
+    report.function_gaps.append(_gap("a.py", "g"))
+    assert report.gap_index.for_function("a.py", "g") is not None
+
+    report.function_gaps = [_gap("c.py", "k")]
+    assert report.gap_index.for_file("a.py") == []
+    assert report.gap_index is not first
+    assert report == CoverageGapReport(function_gaps=report.function_gaps)
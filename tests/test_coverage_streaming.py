@@ -0,0 +1,328 @@
+"""Tests for streaming coverage report parsing (adapters/coverage/streaming.py).
+
+Covers the incremental ``JsonStream`` reader and ``iter_coverage_file`` of
+the JSON (coverage.py, Istanbul, llvm-cov) and XML (JaCoCo, Cobertura)
+adapters.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+from defusedxml.ElementTree import ParseError as DefusedParseError
+
+from nit.adapters.coverage import (
+    CoveragePyAdapter,
+    GcovAdapter,
+    IstanbulAdapter,
+    JaCoCoAdapter,
+)
+from nit.adapters.coverage.base import CoverageReport, FileCoverage, LineCoverage
+from nit.adapters.coverage.coverlet_adapter import CoverletAdapter
+from nit.adapters.coverage.streaming import JsonStream
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# ── Samples ──────────────────────────────────────────────────────
+
+_DOCUMENT = {
+    "meta": {"version": "7.4", "tags": ["a", 'b\\"c']},
+    "files": {
+        "src/app.py": {"executed_lines": [1, 2, 30], "missing_lines": [], "ratio": 0.25},
+        "src/ünicode.py": {"executed_lines": [], "missing_lines": [4], "flag": None},
+    },
+    "totals": [1e3, -2, True, False, "x" * 100],
+}
+
+_COVERAGE_PY = {
+    "meta": {"version": "7.4"},
+    "files": {
+        "src/a.py": {"executed_lines": [1, 2], "missing_lines": [3]},
+        "src/b.py": {"executed_lines": [], "missing_lines": [1]},
+    },
+    "totals": {"percent_covered": 50.0},
+}
+
+_ISTANBUL = {
+    "/repo/src/a.ts": {
+        "path": "/repo/src/a.ts",
+        "statementMap": {"0": {"start": {"line": 1}, "end": {"line": 1}}},
+        "s": {"0": 2},
+        "fnMap": {},
+        "f": {},
+        "branchMap": {},
+        "b": {},
+    },
+    "/repo/src/b.ts": {
+        "path": "/repo/src/b.ts",
+        "statementMap": {"0": {"start": {"line": 3}, "end": {"line": 3}}},
+        "s": {"0": 0},
+        "fnMap": {},
+        "f": {},
+        "branchMap": {},
+        "b": {},
+    },
+}
+
+_LLVM_COV = {
+    "type": "llvm.coverage.json.export",
+    "data": [
+        {
+            "files": [
+                {"filename": "src/a.c", "segments": [[1, 1, 4, True, True]]},
+                {"filename": "src/b.c", "segments": [[2, 1, 0, True, True]]},
+            ],
+            "totals": {},
+        }
+    ],
+}
+
+_JACOCO_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<report name="demo">
+  <package name="com/acme">
+    <class name="com/acme/App" sourcefilename="App.java">
+      <method name="run" desc="()V" line="3">
+        <counter type="LINE" missed="0" covered="1"/>
+      </method>
+    </class>
+    <sourcefile name="App.java">
+      <line nr="3" mi="0" ci="2" mb="0" cb="0"/>
+    </sourcefile>
+  </package>
+  <package name="com/acme/util">
+    <class name="com/acme/util/Strings" sourcefilename="Strings.java">
+      <method name="trim" desc="()V" line="5">
+        <counter type="LINE" missed="1" covered="0"/>
+      </method>
+    </class>
+  </package>
+</report>
+"""
+
+_COBERTURA_XML = """<?xml version="1.0" encoding="utf-8"?>
+<coverage line-rate="0.5" version="1.9">
+  <packages>
+    <package name="Acme">
+      <classes>
+        <class name="Acme.Calc" filename="Calc.cs">
+          <methods>
+            <method name="Add" signature="(int,int)">
+              <lines><line number="3" hits="1"/></lines>
+            </method>
+          </methods>
+          <lines><line number="3" hits="1"/></lines>
+        </class>
+      </classes>
+    </package>
+    <package name="Acme.Util">
+      <classes>
+        <class name="Acme.Util.Text" filename="Text.cs">
+          <lines><line number="7" hits="0"/></lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+
+def _write(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+# ── JsonStream ───────────────────────────────────────────────────
+
+
+def _read_all(stream: JsonStream) -> object:
+    """Rebuild the document by walking every container through the stream."""
+    start = stream.peek()
+    if start == "{":
+        return {key: _read_all(stream) for key in stream.members()}
+    if start == "[":
+        return [_read_all(stream) for _ in stream.elements()]
+    return stream.value()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+def test_json_stream_walks_document_across_chunk_sizes(chunk_size: int) -> None:
+    text = json.dumps(_DOCUMENT, indent=2, ensure_ascii=False)
+    stream = JsonStream(io.StringIO(text), chunk_size=chunk_size)
+
+    assert _read_all(stream) == _DOCUMENT
+    assert stream.peek() == ""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+def test_json_stream_decodes_and_skips_selected_values(chunk_size: int) -> None:
+    stream = JsonStream(io.StringIO(json.dumps(_DOCUMENT)), chunk_size=chunk_size)
+
+    files: dict[str, object] = {}
+    for key in stream.members():
+        if key == "files":
+            for name in stream.members():
+                files[name] = stream.value()
+        else:
+            stream.skip()
+
+    assert files == _DOCUMENT["files"]
+
+
+def test_json_stream_empty_containers() -> None:
+    stream = JsonStream(io.StringIO('{"a": {}, "b": [ ]}'))
+
+    assert _read_all(stream) == {"a": {}, "b": []}
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a": 1', '{"a" 1}', '{"a": 1,}', "[1 2]", '{"a": tru}', "", "{1: 2}"],
+)
+def test_json_stream_rejects_malformed_input(text: str) -> None:
+    with pytest.raises(ValueError):
+        _read_all(JsonStream(io.StringIO(text), chunk_size=2))
+
+
+# ── JSON adapters ────────────────────────────────────────────────
+
+
+def test_coverage_py_iter_matches_parse(tmp_path: Path) -> None:
+    report_path = _write(tmp_path / "coverage.json", json.dumps(_COVERAGE_PY))
+    adapter = CoveragePyAdapter()
+
+    streamed = list(adapter.iter_coverage_file(report_path))
+
+    assert [fc.file_path for fc in streamed] == ["src/a.py", "src/b.py"]
+    assert CoverageReport.from_files(streamed) == adapter.parse_coverage_file(report_path)
+
+
+def test_istanbul_iter_matches_parse(tmp_path: Path) -> None:
+    report_path = _write(tmp_path / "coverage-final.json", json.dumps(_ISTANBUL))
+    adapter = IstanbulAdapter()
+
+    streamed = list(adapter.iter_coverage_file(report_path))
+
+    assert len(streamed) == len(_ISTANBUL)
+    assert CoverageReport.from_files(streamed) == adapter.parse_coverage_file(report_path)
+
+
+def test_llvm_cov_iter_matches_parse(tmp_path: Path) -> None:
+    report_path = _write(tmp_path / "coverage.json", json.dumps(_LLVM_COV))
+    adapter = GcovAdapter()
+
+    streamed = list(adapter.iter_coverage_file(report_path))
+
+    assert [fc.file_path for fc in streamed] == ["src/a.c", "src/b.c"]
+    assert CoverageReport.from_files(streamed) == adapter.parse_coverage_file(report_path)
+
+
+def test_truncated_json_report_raises_when_iterated(tmp_path: Path) -> None:
+    text = json.dumps(_COVERAGE_PY)
+    report_path = _write(tmp_path / "coverage.json", text[: text.index('"src/b.py"') + 20])
+    adapter = CoveragePyAdapter()
+
+    files = adapter.iter_coverage_file(report_path)
+
+    assert next(files).file_path == "src/a.py"
+    with pytest.raises(ValueError):
+        next(files)
+    assert adapter.parse_coverage_file(report_path).files == {}
+
+
+# ── XML adapters ─────────────────────────────────────────────────
+
+
+def test_jacoco_iter_yields_files_per_package(tmp_path: Path) -> None:
+    report_path = _write(tmp_path / "jacoco.xml", _JACOCO_XML)
+    adapter = JaCoCoAdapter()
+
+    streamed = list(adapter.iter_coverage_file(report_path))
+
+    assert [fc.file_path for fc in streamed] == [
+        "com/acme/App.java",
+        "com/acme/util/Strings.java",
+    ]
+    assert CoverageReport.from_files(streamed) == adapter.parse_coverage_file(report_path)
+
+
+def test_jacoco_iter_ignores_non_report_root(tmp_path: Path) -> None:
+    report_path = _write(tmp_path / "jacoco.xml", "<coverage><package/></coverage>")
+
+    assert list(JaCoCoAdapter().iter_coverage_file(report_path)) == []
+
+
+def test_cobertura_iter_yields_files_per_package(tmp_path: Path) -> None:
+    report_path = _write(tmp_path / "coverage.cobertura.xml", _COBERTURA_XML)
+    adapter = CoverletAdapter()
+
+    streamed = list(adapter.iter_coverage_file(report_path))
+
+    assert [fc.file_path for fc in streamed] == ["Acme/Calc.cs", "Acme/Util/Text.cs"]
+    assert CoverageReport.from_files(streamed) == adapter.parse_coverage_file(report_path)
+    assert adapter.find_coverage_file(tmp_path) == report_path
+
+
+def test_truncated_xml_report_raises_when_iterated(tmp_path: Path) -> None:
+    cut = _COBERTURA_XML.index('<package name="Acme.Util">') + 40
+    report_path = _write(tmp_path / "coverage.cobertura.xml", _COBERTURA_XML[:cut])
+    adapter = CoverletAdapter()
+
+    files = adapter.iter_coverage_file(report_path)
+
+    assert next(files).file_path == "Acme/Calc.cs"
+    with pytest.raises(DefusedParseError):
+        next(files)
+    assert adapter.parse_coverage_file(report_path).files == {}
+
+
+# ── Running then streaming ───────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_stream_coverage_reads_the_report_of_a_fresh_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    report_path = _write(tmp_path / "coverage.json", json.dumps({"files": {}}))
+
+    async def run_pytest_coverage(*_: object) -> None:
+        report_path.write_text(json.dumps(_COVERAGE_PY), encoding="utf-8")
+
+    adapter = CoveragePyAdapter()
+    monkeypatch.setattr(adapter, "_run_pytest_coverage", run_pytest_coverage)
+
+    streamed = list(await adapter.stream_coverage(tmp_path))
+
+    assert [fc.file_path for fc in streamed] == ["src/a.py", "src/b.py"]
+
+
+@pytest.mark.asyncio
+async def test_stream_coverage_defaults_to_run_coverage(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_coverage = FileCoverage(file_path="src/a.c")
+    report = CoverageReport.from_files([file_coverage])
+    adapter = GcovAdapter()
+    run_coverage = AsyncMock(return_value=report)
+    monkeypatch.setattr(adapter, "run_coverage", run_coverage)
+
+    streamed = list(await adapter.stream_coverage(tmp_path, timeout=5.0))
+
+    assert streamed == [file_coverage]
+    run_coverage.assert_awaited_once_with(tmp_path, test_files=None, timeout=5.0)
+
+
+# ── CoverageReport ───────────────────────────────────────────────
+
+
+def test_from_files_merges_duplicate_paths() -> None:
+    first = FileCoverage(file_path="a.py", lines=[LineCoverage(line_number=1, execution_count=1)])
+    second = FileCoverage(file_path="a.py", lines=[LineCoverage(line_number=2, execution_count=0)])
+
+    report = CoverageReport.from_files([first, second])
+
+    assert [line.line_number for line in report.files["a.py"].lines] == [1, 2]
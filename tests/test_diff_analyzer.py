@@ -419,6 +419,10 @@ async def test_diff_analyzer_compares_refs(git_repo_with_files: Path) -> None:
     # Should detect the new file
     assert any("src/feature.py" in f.path for f in diff_result.changed_files)
 
+    # Recent churn comes from the git history index
+    feature = next(f for f in diff_result.changed_files if f.path == "src/feature.py")
+    assert feature.recent_commits == 1
+
 
 @pytest.mark.asyncio
 async def test_diff_analyzer_categorizes_files(git_repo_with_files: Path) -> None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -12,9 +12,10 @@ from nit.adapters.base import RunResult, ValidationResult
 from nit.agents.base import TaskInput, TaskStatus
 from nit.agents.builders.e2e import E2EBuilder, E2ETask
 from nit.agents.healers.self_healing import HealingResult
-from nit.llm.context import AssembledContext
+from nit.llm.context import AssembledContext, AssemblyCache
 from nit.llm.engine import GenerationRequest, LLMMessage, LLMResponse
 from nit.llm.prompts.base import RenderedPrompt
+from nit.llm.tokenizer import heuristic_tokenizer
 from nit.parsing.treesitter import ParseResult
 
 # ---------------------------------------------------------------------------
@@ -25,6 +26,7 @@ from nit.parsing.treesitter import ParseResult
 def _make_llm_engine(text: str = "test code") -> MagicMock:
     """Create a mock LLM engine that returns *text*."""
     engine = MagicMock()
+    engine.tokenizer = heuristic_tokenizer()
     engine.generate = AsyncMock(
         return_value=LLMResponse(
             text=text,
@@ -116,8 +118,9 @@ class TestE2EBuilderInit:
         assert builder._enable_validation is True
         assert builder._max_retries == 3
         mock_assembler_cls.assert_called_once_with(
-            root=tmp_path, max_context_tokens=8000, token_counter=engine.count_tokens
+            root=tmp_path, max_context_tokens=8000, tokenizer=engine.tokenizer, cache=ANY
         )
+        assert isinstance(mock_assembler_cls.call_args.kwargs["cache"], AssemblyCache)
         mock_memory_cls.assert_called_once_with(tmp_path)
 
     @patch("nit.agents.builders.e2e.get_registry")
@@ -148,7 +151,7 @@ class TestE2EBuilderInit:
         assert builder._enable_validation is False
         assert builder._max_retries == 5
         mock_assembler_cls.assert_called_once_with(
-            root=tmp_path, max_context_tokens=4000, token_counter=engine.count_tokens
+            root=tmp_path, max_context_tokens=4000, tokenizer=engine.tokenizer, cache=ANY
         )
 
     @patch("nit.agents.builders.e2e.get_registry")
@@ -165,7 +168,7 @@ class TestE2EBuilderInit:
         bad_config: Any = {"max_context_tokens": "not_int"}
         E2EBuilder(engine, tmp_path, config=bad_config)
         mock_assembler_cls.assert_called_once_with(
-            root=tmp_path, max_context_tokens=8000, token_counter=engine.count_tokens
+            root=tmp_path, max_context_tokens=8000, tokenizer=engine.tokenizer, cache=ANY
         )
 
     @patch("nit.agents.builders.e2e.get_registry")
@@ -364,6 +367,7 @@ class TestAssembleE2EContext:
             total_tokens=100,
         )
         mock_assembler_cls.return_value.assemble.return_value = mock_ctx
+        mock_assembler_cls.return_value.load_symbols = AsyncMock()
 
         builder = E2EBuilder(_make_llm_engine(), tmp_path)
         task = E2ETask(
@@ -7,7 +7,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from click.testing import CliRunner
 
-from nit.cli import _determine_test_output_path, cli
+from nit.agents.builders.unit import BuildTask
+from nit.cli import (
+    _coalesce_build_tasks,
+    _determine_test_output_path,
+    _generation_priority,
+    cli,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -89,3 +95,26 @@ class TestDetermineTestOutputPath:
         result = _determine_test_output_path("src/bar.py", adapter, tmp_path)
         assert "tests" in str(result)
         assert result.name == "test_bar.py"
+
+
+class TestGenerationScheduling:
+    def test_priority_rank(self) -> None:
+        critical = BuildTask(source_file="a.py", context={"priority": "critical"})
+        low = BuildTask(source_file="a.py", context={"priority": "low"})
+        unknown = BuildTask(source_file="a.py")
+        assert _generation_priority(critical) < _generation_priority(low)
+        assert _generation_priority(low) < _generation_priority(unknown)
+
+    def test_coalesce_keeps_most_urgent_task_per_output(self) -> None:
+        tasks = [
+            BuildTask(source_file="a.py", output_file="test_a.py", context={"priority": "low"}),
+            BuildTask(source_file="b.py", output_file="test_b.py", context={"priority": "high"}),
+            BuildTask(
+                source_file="a.py", output_file="test_a.py", context={"priority": "critical"}
+            ),
+        ]
+
+        result = _coalesce_build_tasks(tasks)
+
+        assert [t.output_file for t in result] == ["test_a.py", "test_b.py"]
+        assert result[0].context["priority"] == "critical"
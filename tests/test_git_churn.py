@@ -0,0 +1,258 @@
+"""Tests for the function-level churn index (nit.utils.git_churn)."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from nit.utils import git_churn
+from nit.utils.git_churn import (
+    CHURN_CACHE_PATH,
+    _compose,
+    _file_changes,
+    _map_range,
+    _parse_diff,
+    _unchanged_runs,
+    load_function_churn,
+)
+from nit.utils.git_history import FileHistory, git_output
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _git(repo: Path, *args: str, author: str = "Alice", days_ago: int = 0) -> None:
+    date = (datetime.now(UTC) - timedelta(days=days_ago)).isoformat()
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": author,
+        "GIT_AUTHOR_EMAIL": f"{author.lower()}@example.com",
+        "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_NAME": author,
+        "GIT_COMMITTER_EMAIL": f"{author.lower()}@example.com",
+        "GIT_COMMITTER_DATE": date,
+    }
+    subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+def _commit(repo: Path, path: str, lines: list[str], *, author: str, days_ago: int) -> None:
+    file_path = repo / path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text("".join(f"{line}\n" for line in lines))
+    _git(repo, "add", path)
+    _git(repo, "commit", "-m", f"update {path}", author=author, days_ago=days_ago)
+
+
+def _authors(history: FileHistory) -> list[str]:
+    return sorted(history.authors)
+
+
+FIRST = ["def first():", "    return 1", "", "", "def second():", "    return 2"]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_changes_cache() -> None:
+    git_churn._changes_cache.clear()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init")
+    _commit(tmp_path, "src/app.py", FIRST, author="Alice", days_ago=200)
+    # Bob changes only second()
+    second = [*FIRST[:5], "    return 3"]
+    _commit(tmp_path, "src/app.py", second, author="Bob", days_ago=20)
+    # Carol inserts a header, shifting every line down by two
+    _commit(tmp_path, "src/app.py", ["# header", "", *second], author="Carol", days_ago=3)
+    return tmp_path
+
+
+# ── Line maps ────────────────────────────────────────────────────
+
+
+def test_unchanged_runs_track_shifts() -> None:
+    # Line 1 replaced by two lines, lines 5-6 deleted, one line inserted after 9
+    runs = _unchanged_runs([(1, 1, 1, 2), (5, 2, 6, 0), (9, 0, 8, 1)])
+
+    assert runs[:3] == [(2, 4, 1), (7, 9, -1), (10, git_churn._MAX_LINE, 0)]
+
+
+def test_compose_drops_rewritten_lines() -> None:
+    older = _unchanged_runs([(3, 1, 3, 1)])  # line 3 rewritten
+    newer = _unchanged_runs([(0, 0, 1, 2)])  # two lines inserted at the top
+
+    mapping = _compose(older, _compose(newer, git_churn._IDENTITY))
+
+    assert _map_range(1, 4, mapping) == [(3, 4), (6, 6)]
+
+
+def test_file_changes_place_hunks_on_head_lines() -> None:
+    commits = [
+        (300, "Carol", [(0, 0, 1, 2)]),  # header inserted
+        (200, "Bob", [(6, 1, 6, 1)]),  # last line changed
+        (100, "Alice", [(0, 0, 1, 6)]),  # file created
+    ]
+
+    changes = _file_changes(commits)
+
+    assert [(c.author, c.ranges) for c in changes] == [
+        ("Carol", [(1, 2)]),
+        ("Bob", [(8, 8)]),
+        ("Alice", [(3, 7)]),
+    ]
+
+
+def test_file_changes_stop_when_every_line_is_rewritten() -> None:
+    commits = [
+        (300, "Bob", [(1, 2, 1, 2)]),
+        (100, "Alice", [(0, 0, 1, 2)]),
+    ]
+
+    assert [c.author for c in _file_changes(commits)] == ["Bob"]
+
+
+def test_parse_diff_reads_hunks_per_file() -> None:
+    text = (
+        "diff --git a/src/a b.py b/src/a b.py\n"
+        "--- a/src/a b.py\n"
+        "+++ b/src/a b.py\n"
+        "@@ -3 +3,2 @@ def f():\n"
+        "-x\n"
+        "+y\n"
+        "+z\n"
+        "diff --git a/other.py b/other.py\n"
+        "@@ -5,2 +4,0 @@\n"
+    )
+
+    assert _parse_diff(text) == {"src/a b.py": [(3, 1, 3, 2)], "other.py": [(5, 2, 4, 0)]}
+
+
+# ── Index ────────────────────────────────────────────────────────
+
+
+def test_function_history_follows_moved_lines(repo: Path) -> None:
+    index = load_function_churn(repo, ["src/app.py"])
+
+    first = index.function_history("src/app.py", 3, 4)
+    second = index.function_history(repo / "src" / "app.py", 7, 8)
+
+    assert index.has_file("src/app.py")
+    assert _authors(first) == ["Alice"]
+    assert _authors(second) == ["Alice", "Bob"]
+    assert len(second.timestamps) == 2
+    assert second.timestamps == sorted(second.timestamps)
+    assert _authors(index.function_history("src/app.py", 1, 1)) == ["Carol"]
+
+
+def test_window_limits_commits(repo: Path) -> None:
+    index = load_function_churn(repo, ["src/app.py"], max_age_days=90, persist=False)
+
+    assert index.function_history("src/app.py", 3, 4).timestamps == []
+    assert _authors(index.function_history("src/app.py", 7, 8)) == ["Bob"]
+
+
+def test_merged_branch_hunks_land_on_head_lines(tmp_path: Path) -> None:
+    base = [f"line {n}" for n in range(1, 31)]
+    _git(tmp_path, "init", "-b", "main")
+    _commit(tmp_path, "app.py", base, author="Alice", days_ago=30)
+    _git(tmp_path, "checkout", "-b", "side")
+    header = [f"top {n}" for n in range(10)]
+    _commit(tmp_path, "app.py", [*header, *base], author="Sam", days_ago=20)
+    _git(tmp_path, "checkout", "main")
+    edited = [*base[:17], "line 18 edited", *base[18:]]
+    _commit(tmp_path, "app.py", edited, author="Eve", days_ago=10)
+    _git(tmp_path, "merge", "--no-edit", "side", author="Max", days_ago=5)
+
+    index = load_function_churn(tmp_path, ["app.py"], persist=False)
+
+    assert (tmp_path / "app.py").read_text().splitlines()[27] == "line 18 edited"
+    assert _authors(index.function_history("app.py", 28, 28)) == ["Eve"]
+    assert _authors(index.function_history("app.py", 18, 18)) == ["Alice"]
+    assert _authors(index.function_history("app.py", 1, 10)) == ["Max"]
+
+
+def test_working_tree_edits_shift_ranges(repo: Path) -> None:
+    app = repo / "src" / "app.py"
+    app.write_text("# new\n" + app.read_text())
+
+    index = load_function_churn(repo, ["src/app.py"], persist=False)
+
+    assert _authors(index.function_history("src/app.py", 8, 9)) == ["Alice", "Bob"]
+    assert index.function_history("src/app.py", 1, 1).timestamps == []
+
+
+def test_untracked_and_non_git_files(repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    (repo / "new.py").write_text("x = 1\n")
+
+    index = load_function_churn(repo, ["new.py"], persist=False)
+    outside = load_function_churn(tmp_path_factory.mktemp("plain"), ["a.py"])
+
+    assert not index.has_file("new.py")
+    assert not outside.has_file("a.py")
+    assert outside.function_history("a.py", 1, 10).timestamps == []
+
+
+def test_cache_is_persisted_by_blob(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    load_function_churn(repo, ["src/app.py"])
+    data = json.loads((repo / CHURN_CACHE_PATH).read_text())
+    assert set(data["files"]) == {"src/app.py"}
+
+    git_churn._changes_cache.clear()
+    calls: list[str] = []
+
+    def recording_output(git: str, cwd: Path, args: list[str]) -> str | None:
+        calls.append(args[0])
+        return git_output(git, cwd, args)
+
+    monkeypatch.setattr(git_churn, "git_output", recording_output)
+    index = load_function_churn(repo, ["src/app.py"])
+
+    assert "log" not in calls
+    assert _authors(index.function_history("src/app.py", 7, 8)) == ["Alice", "Bob"]
+
+    _commit(repo, "src/app.py", ["# header", "changed"], author="Dana", days_ago=0)
+    calls.clear()
+    index = load_function_churn(repo, ["src/app.py"])
+
+    assert "log" in calls
+    assert _authors(index.function_history("src/app.py", 2, 2)) == ["Dana"]
+
+
+def test_cache_expires_when_window_moves(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    load_function_churn(repo, ["src/app.py"])
+    data = json.loads((repo / CHURN_CACHE_PATH).read_text())
+    data["files"]["src/app.py"]["since"] = "2000-01-01"
+    (repo / CHURN_CACHE_PATH).write_text(json.dumps(data))
+
+    git_churn._changes_cache.clear()
+    calls: list[str] = []
+
+    def recording_output(git: str, cwd: Path, args: list[str]) -> str | None:
+        calls.append(args[0])
+        return git_output(git, cwd, args)
+
+    monkeypatch.setattr(git_churn, "git_output", recording_output)
+    load_function_churn(repo, ["src/app.py"])
+
+    assert "log" in calls
+
+
+def test_failed_log_is_not_cached(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def failing_log(git: str, cwd: Path, args: list[str]) -> str | None:
+        return None if args[0] == "log" else git_output(git, cwd, args)
+
+    monkeypatch.setattr(git_churn, "git_output", failing_log)
+    index = load_function_churn(repo, ["src/app.py"])
+
+    assert not index.has_file("src/app.py")
+    assert not (repo / CHURN_CACHE_PATH).exists()
+
+    monkeypatch.setattr(git_churn, "git_output", git_output)
+    index = load_function_churn(repo, ["src/app.py"])
+
+    assert _authors(index.function_history("src/app.py", 7, 8)) == ["Alice", "Bob"]
@@ -0,0 +1,148 @@
+"""Tests for the git history index (nit.utils.git_history)."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from nit.utils import git_history
+from nit.utils.git_history import HISTORY_CACHE_PATH, GitHistoryIndex, load_history_index
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _git(repo: Path, *args: str, author: str = "Alice", days_ago: int = 0) -> None:
+    date = (datetime.now(UTC) - timedelta(days=days_ago)).isoformat()
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": author,
+        "GIT_AUTHOR_EMAIL": f"{author.lower()}@example.com",
+        "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_NAME": author,
+        "GIT_COMMITTER_EMAIL": f"{author.lower()}@example.com",
+        "GIT_COMMITTER_DATE": date,
+    }
+    subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+def _commit(repo: Path, path: str, content: str, *, author: str, days_ago: int) -> None:
+    file_path = repo / path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(content)
+    _git(repo, "add", path)
+    _git(repo, "commit", "-m", f"update {path}", author=author, days_ago=days_ago)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index_cache() -> None:
+    git_history._index_cache.clear()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init")
+    _commit(tmp_path, "src/app.py", "v1\n", author="Alice", days_ago=200)
+    _commit(tmp_path, "src/app.py", "v2\n", author="Bob", days_ago=30)
+    _commit(tmp_path, "README.md", "readme\n", author="Carol", days_ago=10)
+    _commit(tmp_path, "src/app.py", "v3\n", author="Alice", days_ago=2)
+    return tmp_path
+
+
+def test_index_answers_per_file_queries(repo: Path) -> None:
+    index = load_history_index(repo)
+    since = datetime.now(UTC) - timedelta(days=90)
+
+    assert index.commit_count("src/app.py") == 3
+    assert index.commit_count("src/app.py", since=since) == 2
+    assert index.authors("src/app.py") == ["Alice", "Bob"]
+    assert index.authors("src/app.py", since=datetime.now(UTC) - timedelta(days=7)) == ["Alice"]
+    last = index.last_modified(repo / "src" / "app.py")
+    assert last is not None
+    assert (datetime.now(UTC) - last).days == 2
+    assert index.changed_since(datetime.now(UTC) - timedelta(days=20)) == [
+        "README.md",
+        "src/app.py",
+    ]
+
+
+def test_unknown_file_has_no_history(repo: Path) -> None:
+    index = load_history_index(repo)
+
+    assert index.last_modified("missing.py") is None
+    assert index.commit_count("missing.py") == 0
+    assert index.authors("missing.py") == []
+
+
+def test_paths_resolve_from_a_subdirectory_project(repo: Path) -> None:
+    index = load_history_index(repo / "src")
+
+    assert index.commit_count("app.py") == 3
+
+
+def test_index_is_shared_until_head_moves(repo: Path) -> None:
+    first = load_history_index(repo)
+    assert load_history_index(repo) is first
+
+    _commit(repo, "src/app.py", "v4\n", author="Dana", days_ago=0)
+    second = load_history_index(repo)
+
+    assert second is not first
+    assert second.commit_count("src/app.py") == 4
+
+
+def test_persisted_index_is_updated_incrementally(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    load_history_index(repo)
+    cache_file = repo / HISTORY_CACHE_PATH
+    assert json.loads(cache_file.read_text())["head"] is not None
+    assert (cache_file.parent / ".gitignore").is_file()
+
+    _commit(repo, "src/app.py", "v4\n", author="Dana", days_ago=0)
+    git_history._index_cache.clear()
+
+    def no_full_build(*_args: object) -> None:
+        raise AssertionError("expected an incremental update")
+
+    monkeypatch.setattr(git_history, "_build", no_full_build)
+    index = load_history_index(repo)
+
+    assert index.commit_count("src/app.py") == 4
+    assert "Dana" in index.authors("src/app.py")
+
+
+def test_rewritten_history_is_rebuilt(repo: Path) -> None:
+    load_history_index(repo)
+    _git(repo, "reset", "--hard", "HEAD~1")
+    _commit(repo, "src/other.py", "x\n", author="Eve", days_ago=0)
+    git_history._index_cache.clear()
+
+    index = load_history_index(repo)
+
+    assert index.commit_count("src/app.py") == 2
+    assert index.commit_count("src/other.py") == 1
+
+
+def test_outside_git_returns_empty_index(tmp_path: Path) -> None:
+    index = load_history_index(tmp_path)
+
+    assert index.head is None
+    assert index.file_count == 0
+    assert not (tmp_path / HISTORY_CACHE_PATH).exists()
+
+
+def test_round_trips_through_dict(repo: Path) -> None:
+    index = load_history_index(repo, persist=False)
+
+    restored = GitHistoryIndex.from_dict(repo, index.to_dict())
+
+    assert restored is not None
+    assert restored.head == index.head
+    assert restored.authors("src/app.py") == index.authors("src/app.py")
+    assert GitHistoryIndex.from_dict(repo, {"format": 0}) is None
@@ -28,6 +28,7 @@ from nit.utils.git import (
     get_pr_info_from_env,
     get_pr_info_from_git,
     get_remote_url,
+    get_worktree_content_hash,
     is_gh_cli_available,
     push_branch,
 )
@@ -790,3 +791,73 @@ class TestCommitInfo:
         assert ci.sha == "abc"
         assert ci.subject == "msg"
         assert ci.body == "details"
+
+
+# ---------------------------------------------------------------------------
+# Working tree content hash
+# ---------------------------------------------------------------------------
+
+
+class TestGetWorktreeContentHash:
+    def test_tracks_uncommitted_changes(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+        (tmp_path / "a.py").write_text("x = 1\n")
+
+        first = get_worktree_content_hash(tmp_path)
+        assert get_worktree_content_hash(tmp_path) == first
+
+        (tmp_path / "a.py").write_text("x = 2\n")
+        assert get_worktree_content_hash(tmp_path) != first
+
+        # The real index is left untouched
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert status.stdout.startswith("??")
+
+    def test_excluded_paths_do_not_change_hash(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+        (tmp_path / "a.py").write_text("x = 1\n")
+        before = get_worktree_content_hash(tmp_path, exclude=(".nit",))
+
+        (tmp_path / ".nit").mkdir()
+        (tmp_path / ".nit" / "profile.json").write_text("{}")
+
+        assert get_worktree_content_hash(tmp_path, exclude=(".nit",)) == before
+
+    def test_untracked_suffix_filter(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+        (tmp_path / "a.py").write_text("x = 1\n")
+        sources = frozenset({".py"})
+        before = get_worktree_content_hash(tmp_path, untracked_suffixes=sources)
+
+        (tmp_path / "report.json").write_text("{}")
+        assert get_worktree_content_hash(tmp_path, untracked_suffixes=sources) == before
+
+        (tmp_path / "b.py").write_text("y = 1\n")
+        assert get_worktree_content_hash(tmp_path, untracked_suffixes=sources) != before
+
+    def test_tracked_edits_and_deletions_without_writing_objects(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("y = 1\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True, capture_output=True)
+        objects = tmp_path / ".git" / "objects"
+        stored = sorted(objects.rglob("*"))
+        staged = get_worktree_content_hash(tmp_path)
+
+        (tmp_path / "a.py").write_text("x = 2\n")
+        edited = get_worktree_content_hash(tmp_path)
+        (tmp_path / "b.py").unlink()
+        deleted = get_worktree_content_hash(tmp_path)
+
+        assert len({staged, edited, deleted}) == 3
+        assert sorted(objects.rglob("*")) == stored
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        with pytest.raises(GitOperationError):
+            get_worktree_content_hash(tmp_path)
@@ -25,6 +25,7 @@ from nit.llm.prompts.integration_test import (
     PytestIntegrationTemplate,
     VitestIntegrationTemplate,
 )
+from nit.llm.tokenizer import heuristic_tokenizer
 from nit.parsing.languages import extract_from_file
 
 # ── Fixtures ─────────────────────────────────────────────────────────
@@ -36,6 +37,7 @@ def mock_llm_engine() -> MagicMock:
     engine = MagicMock()
     engine.model_name = "gpt-4o"
     engine.count_tokens = MagicMock(return_value=100)
+    engine.tokenizer = heuristic_tokenizer()
 
     # Mock the generate method to return integration test code
     async def mock_generate(request: GenerationRequest) -> LLMResponse:
@@ -30,6 +30,7 @@ from nit.llm.engine import (
     LLMResponse,
 )
 from nit.llm.factory import create_engine
+from nit.llm.tokenizer import heuristic_tokenizer
 from nit.llm.usage_callback import _SINGLETONS
 from nit.utils.platform_client import get_platform_api_key
 
@@ -554,16 +555,18 @@ async def test_builtin_connection_error_exhausted() -> None:
 
 def test_count_tokens_fallback() -> None:
     engine = BuiltinLLM(BuiltinLLMConfig(model="gpt-4o", api_key="sk-test"))
-    with patch("nit.llm.builtin.litellm.token_counter", side_effect=Exception("no tokenizer")):
+    with patch("nit.llm.builtin.get_tokenizer", return_value=heuristic_tokenizer()):
         count = engine.count_tokens("hello world")
     # Fallback: ~4 chars per token -> 11 // 4 = 2
     assert count == 2
 
 
-def test_count_tokens_uses_litellm() -> None:
+def test_count_tokens_uses_model_tokenizer() -> None:
     engine = BuiltinLLM(BuiltinLLMConfig(model="gpt-4o", api_key="sk-test"))
-    with patch("nit.llm.builtin.litellm.token_counter", return_value=42):
+    with patch("nit.llm.builtin.get_tokenizer") as get:
+        get.return_value.count.return_value = 42
         count = engine.count_tokens("some text")
+    get.assert_called_once_with("gpt-4o")
     assert count == 42
 
 
@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
 from nit.cli import _try_pull_memory, _try_push_memory
+from nit.memory.global_memory import GlobalMemory
+from nit.memory.package_memory import PackageMemory
 from nit.memory.sync import (
+    acknowledge_push,
     apply_pull_response,
     build_push_payload,
     get_sync_version,
+    plan_push,
     set_sync_version,
 )
+from nit.utils.platform_client import (
+    PlatformRuntimeConfig,
+    pull_platform_memory,
+    push_platform_memory,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @pytest.fixture()
@@ -259,3 +275,286 @@ def test_try_push_memory_noop_when_disabled(tmp_path: Path) -> None:
     with patch("nit.utils.platform_client.push_platform_memory") as mock_push:
         _try_push_memory(config, tmp_path, ci_mode=False, source="local")
         mock_push.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Delta sync against a local stub platform
+# ---------------------------------------------------------------------------
+
+
+class _StubPlatform:
+    """Minimal in-process stand-in for the platform memory endpoint."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.pushes: list[dict[str, Any]] = []
+        self.push_headers: list[dict[str, str]] = []
+        self.pull_params: list[dict[str, list[str]]] = []
+        self.pull_response: dict[str, Any] = {}
+        self.not_modified = False
+        self.capabilities = ["delta", "gzip"]
+
+
+def _make_handler(stub: _StubPlatform) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+        def _reply(self, status: int, body: dict[str, Any] | None = None) -> None:
+            data = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self) -> None:
+            raw = self.rfile.read(int(self.headers["Content-Length"]))
+            if self.headers.get("Content-Encoding") == "gzip":
+                raw = gzip.decompress(raw)
+            stub.pushes.append(json.loads(raw))
+            stub.push_headers.append(dict(self.headers))
+            stub.version += 1
+            self._reply(
+                200,
+                {"version": stub.version, "merged": True, "capabilities": stub.capabilities},
+            )
+
+        def do_GET(self) -> None:
+            stub.pull_params.append(parse_qs(urlsplit(self.path).query))
+            if stub.not_modified:
+                self._reply(304)
+                return
+            self._reply(200, stub.pull_response)
+
+    return _Handler
+
+
+@pytest.fixture()
+def stub_platform() -> Iterator[tuple[_StubPlatform, PlatformRuntimeConfig]]:
+    stub = _StubPlatform()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(stub))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    config = PlatformRuntimeConfig(
+        url=f"http://127.0.0.1:{server.server_address[1]}", api_key="nit_test"
+    )
+    try:
+        yield stub, config
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _push(project_root: Path, config: PlatformRuntimeConfig) -> bool:
+    push = plan_push(project_root, project_id="proj-1")
+    if push.empty:
+        return False
+    result = push_platform_memory(config, push.payload, compress=push.compress)
+    acknowledge_push(project_root, push, result["version"], capabilities=result.get("capabilities"))
+    return True
+
+
+def test_first_push_is_full_and_uncompressed(
+    project_root: Path, stub_platform: tuple[_StubPlatform, PlatformRuntimeConfig]
+) -> None:
+    stub, config = stub_platform
+    GlobalMemory(project_root).add_known_pattern("use fixtures")
+    PackageMemory(project_root, "web").add_known_issue("flaky")
+
+    assert _push(project_root, config)
+
+    assert "Content-Encoding" not in stub.push_headers[0]
+    payload = stub.pushes[0]
+    assert "mode" not in payload
+    assert set(payload["global"]) == {
+        "conventions",
+        "knownPatterns",
+        "failedPatterns",
+        "generationStats",
+    }
+    assert payload["packages"]["web"]["knownIssues"][0]["issue"] == "flaky"
+    assert get_sync_version(project_root) == 1
+
+
+def test_push_sends_only_changed_entries(
+    project_root: Path, stub_platform: tuple[_StubPlatform, PlatformRuntimeConfig]
+) -> None:
+    stub, config = stub_platform
+    memory = GlobalMemory(project_root)
+    memory.add_known_pattern("use fixtures")
+    memory.set_conventions({"language": "python"})
+    PackageMemory(project_root, "web").add_known_issue("flaky")
+    PackageMemory(project_root, "api").add_known_issue("slow")
+    assert _push(project_root, config)
+
+    # Nothing changed: no request at all
+    assert not _push(project_root, config)
+    assert len(stub.pushes) == 1
+
+    memory.add_failed_pattern("mock everything", reason="brittle")
+    PackageMemory(project_root, "api").add_coverage_snapshot(81.0)
+    assert _push(project_root, config)
+
+    assert stub.push_headers[1]["Content-Encoding"] == "gzip"
+    delta = stub.pushes[1]
+    assert delta["mode"] == "delta"
+    assert "removed" not in delta
+    assert delta["baseVersion"] == 1
+    assert list(delta["global"]) == ["failedPatterns"]
+    assert [p["pattern"] for p in delta["global"]["failedPatterns"]] == ["mock everything"]
+    assert list(delta["packages"]) == ["api"]
+    assert list(delta["packages"]["api"]) == ["coverageHistory"]
+    assert get_sync_version(project_root) == 2
+
+
+def test_push_resends_modified_entries_only(
+    project_root: Path, stub_platform: tuple[_StubPlatform, PlatformRuntimeConfig]
+) -> None:
+    stub, config = stub_platform
+    memory = GlobalMemory(project_root)
+    memory.add_known_pattern("alpha")
+    memory.add_known_pattern("beta")
+    assert _push(project_root, config)
+
+    memory.add_known_pattern("beta")
+    assert _push(project_root, config)
+
+    changed = stub.pushes[1]["global"]["knownPatterns"]
+    assert [(p["pattern"], p["success_count"]) for p in changed] == [("beta", 2)]
+    # The previous version of the entry is replaced, not kept next to it
+    assert len(stub.pushes[1]["removed"]["global"]["knownPatterns"]) == 1
+
+
+def test_push_sends_removed_entries(
+    project_root: Path, stub_platform: tuple[_StubPlatform, PlatformRuntimeConfig]
+) -> None:
+    stub, config = stub_platform
+    memory = GlobalMemory(project_root)
+    memory.add_known_pattern("alpha")
+    memory.add_known_pattern("beta")
+    PackageMemory(project_root, "web").add_known_issue("flaky")
+    assert _push(project_root, config)
+    acked = plan_push(project_root).fingerprints
+
+    def _drop_alpha(data: dict[str, Any]) -> None:
+        data["known_patterns"] = [p for p in data["known_patterns"] if p["pattern"] != "alpha"]
+
+    memory.apply_changes(_drop_alpha)
+    PackageMemory(project_root, "web").apply_changes(lambda data: data["known_issues"].clear())
+    assert _push(project_root, config)
+
+    delta = stub.pushes[1]
+    assert "global" not in delta
+    assert "packages" not in delta
+    assert delta["removed"] == {
+        "global": {"knownPatterns": acked["global/knownPatterns"][:1]},
+        "packages": {"web": {"knownIssues": acked["packages/web/knownIssues"]}},
+    }
+    assert not _push(project_root, config)
+
+
+def test_push_stays_full_without_delta_capability(
+    project_root: Path, stub_platform: tuple[_StubPlatform, PlatformRuntimeConfig]
+) -> None:
+    stub, config = stub_platform
+    stub.capabilities = []
+    memory = GlobalMemory(project_root)
+    memory.add_known_pattern("alpha")
+    assert _push(project_root, config)
+
+    # Unchanged memory is still not re-sent
+    assert not _push(project_root, config)
+
+    memory.add_known_pattern("beta")
+    assert _push(project_root, config)
+
+    assert len(stub.pushes) == 2
+    assert "mode" not in stub.pushes[1]
+    assert "Content-Encoding" not in stub.push_headers[1]
+    assert [p["pattern"] for p in stub.pushes[1]["global"]["knownPatterns"]] == ["alpha", "beta"]
+
+
+def test_full_push_ignores_sync_state(project_root: Path) -> None:
+    GlobalMemory(project_root).add_known_pattern("alpha")
+    push = plan_push(project_root)
+    acknowledge_push(project_root, push, 1)
+
+    assert plan_push(project_root).empty
+    full = plan_push(project_root, full=True)
+    assert not full.is_delta
+    assert len(full.payload["global"]["knownPatterns"]) == 1
+
+
+def test_pull_delta_merges_and_is_not_pushed_back(
+    project_root: Path, stub_platform: tuple[_StubPlatform, PlatformRuntimeConfig]
+) -> None:
+    stub, config = stub_platform
+    GlobalMemory(project_root).add_known_pattern("local pattern")
+    assert _push(project_root, config)
+
+    stub.version = 4
+    stub.pull_response = {
+        "version": 4,
+        "mode": "delta",
+        "global": {
+            "conventions": {"language": "python"},
+            "knownPatterns": [
+                {"pattern": "remote pattern", "success_count": 3, "last_used": "", "context": {}}
+            ],
+        },
+        "packages": {"web": {"knownIssues": [{"issue": "from CI", "workaround": None}]}},
+    }
+
+    response = pull_platform_memory(config, "proj-1", since_version=get_sync_version(project_root))
+    apply_pull_response(project_root, response)
+
+    assert stub.pull_params[0]["sinceVersion"] == ["1"]
+    memory = GlobalMemory(project_root)
+    assert {p["pattern"] for p in memory.get_known_patterns()} == {
+        "local pattern",
+        "remote pattern",
+    }
+    assert memory.get_conventions() == {"language": "python"}
+    assert PackageMemory(project_root, "web").get_known_issues()[0]["issue"] == "from CI"
+    assert get_sync_version(project_root) == 4
+
+    # Entries received from the platform are already known to it
+    assert plan_push(project_root).empty
+
+
+def test_pull_not_modified(
+    project_root: Path, stub_platform: tuple[_StubPlatform, PlatformRuntimeConfig]
+) -> None:
+    stub, config = stub_platform
+    stub.not_modified = True
+
+    assert pull_platform_memory(config, "proj-1", since_version=3) == {}
+
+
+def test_full_pull_records_sync_state(project_root: Path) -> None:
+    apply_pull_response(
+        project_root,
+        {
+            "version": 2,
+            "global": {
+                "conventions": {"language": "go"},
+                "knownPatterns": [],
+                "failedPatterns": [],
+                "generationStats": {},
+            },
+        },
+    )
+
+    assert get_sync_version(project_root) == 2
+    assert plan_push(project_root).empty
+
+
+def test_set_sync_version_preserves_sections(project_root: Path) -> None:
+    GlobalMemory(project_root).add_known_pattern("alpha")
+    acknowledge_push(project_root, plan_push(project_root), 1)
+
+    set_sync_version(project_root, 9)
+
+    assert get_sync_version(project_root) == 9
+    assert plan_push(project_root).empty
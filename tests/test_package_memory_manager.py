@@ -136,3 +136,20 @@ def test_package_memory_persistence(temp_project: Path) -> None:
     assert len(issues) == 1
     assert issues[0]["issue"] == "test issue"
     assert issues[0]["workaround"] == "test workaround"
+
+
+def test_flush_all(temp_project: Path) -> None:
+    """flush_all writes every package memory with pending changes."""
+    manager = PackageMemoryManager(temp_project)
+    api = manager.get_package_memory("api")
+    web = manager.get_package_memory("web")
+    manager.get_package_memory("idle")
+
+    with api.deferred(), web.deferred():
+        api.add_known_issue("Flaky")
+        web.set_test_patterns({"naming": "describe"})
+        assert manager.flush_all() == 2
+
+    assert not api.dirty
+    assert not web.dirty
+    assert manager.flush_all() == 0
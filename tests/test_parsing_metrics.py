@@ -0,0 +1,220 @@
+"""Tests for per-function metrics from one AST walk (parsing/metrics.py)."""
+
+import pytest
+
+from nit.parsing.languages import extract_from_source
+from nit.parsing.metrics import LANGUAGE_NODES, FunctionFacts, collect_function_facts
+from nit.parsing.treesitter import SUPPORTED_LANGUAGES, FunctionInfo, parse_code
+
+# Each snippet defines ``check`` with one if, one loop, one && / and, and a
+# call to ``helper`` on line 4, plus a branch-free ``helper``.
+_SNIPPETS = {
+    "python": """def check(a, b):
+    for x in a:
+        if x and b:
+            helper(x)
+
+def helper(x):
+    return x
+""",
+    "javascript": """function check(a, b) {
+  for (const x of a) {
+    if (x && b) {
+      helper(x);
+    }
+  }
+}
+function helper(x) { return x; }
+""",
+    "typescript": """function check(a: number[], b: boolean): void {
+  for (const x of a) {
+    if (x && b) {
+      helper(x);
+    }
+  }
+}
+function helper(x: number): number { return x; }
+""",
+    "tsx": """function check(a: number[], b: boolean): void {
+  for (const x of a) {
+    if (x && b) {
+      helper(x);
+    }
+  }
+}
+function helper(x: number): number { return x; }
+""",
+    "c": """void check(int *a, int n, int b) {
+  for (int i = 0; i < n; i++) {
+    if (a[i] && b) {
+      helper(a[i]);
+    }
+  }
+}
+int helper(int x) { return x; }
+""",
+    "cpp": """void check(int *a, int n, int b) {
+  for (int i = 0; i < n; i++) {
+    if (a[i] && b) {
+      helper(a[i]);
+    }
+  }
+}
+int helper(int x) { return x; }
+""",
+    "java": """class Checker {
+  void check(int[] a, boolean b) { for (int x : a) {
+    if (x > 0 && b) {
+      helper(x);
+    }
+  } }
+  int helper(int x) { return x; }
+}
+""",
+    "go": """package main
+func check(a []int, b bool) { for _, x := range a {
+	if x > 0 && b {
+		helper(x)
+	}
+} }
+func helper(x int) int { return x }
+""",
+    "rust": """fn check(a: &[i32], b: bool) {
+    for x in a {
+        if *x > 0 && b {
+            helper(*x);
+        }
+    }
+}
+fn helper(x: i32) -> i32 { x }
+""",
+    "csharp": """class Checker {
+  void Check(int[] a, bool b) { foreach (var x in a) {
+    if (x > 0 && b) {
+      helper(x);
+    }
+  } }
+  int helper(int x) { return x; }
+}
+""",
+}
+
+
+def _functions(source: str, language: str) -> list[FunctionInfo]:
+    result = extract_from_source(source.encode(), language)
+    return result.functions + [m for cls in result.classes for m in cls.methods]
+
+
+def _facts(
+    source: str, language: str, *, watch: set[str] | None = None
+) -> dict[str, FunctionFacts | None]:
+    functions = _functions(source, language)
+    tree = parse_code(source.encode(), language)
+    facts = collect_function_facts(
+        tree.root_node, language, [f.body_text for f in functions], watch=watch or ()
+    )
+    return {f.name: fact for f, fact in zip(functions, facts, strict=True)}
+
+
+def test_every_supported_language_has_node_tables() -> None:
+    assert set(LANGUAGE_NODES) == SUPPORTED_LANGUAGES
+
+
+@pytest.mark.parametrize("language", sorted(_SNIPPETS))
+def test_complexity_and_calls_per_language(language: str) -> None:
+    facts = _facts(_SNIPPETS[language], language)
+    check = facts.get("check") or facts.get("Check")
+    helper = facts["helper"]
+
+    assert check is not None
+    assert helper is not None
+    assert check.cyclomatic == 4
+    assert check.decision_points["if"] == 1
+    assert check.decision_points["for"] == 1
+    assert check.decision_points["and"] == 1
+    assert ("helper", 4) in check.calls
+    assert helper.cyclomatic == 1
+    assert helper.calls == []
+
+
+def test_else_does_not_add_complexity() -> None:
+    source = """def pick(x):
+    if x:
+        return 1
+    elif x is None:
+        return 2
+    else:
+        return 3
+"""
+    facts = _facts(source, "python")["pick"]
+
+    assert facts is not None
+    assert facts.decision_points == {"if": 2, "else": 1}
+    assert facts.cyclomatic == 3
+
+
+def test_default_case_is_not_a_decision() -> None:
+    source = """function grade(x) {
+  switch (x) {
+    case 1: return "a";
+    case 2: return "b";
+    default: return "c";
+  }
+}
+"""
+    facts = _facts(source, "javascript")["grade"]
+
+    assert facts is not None
+    assert facts.decision_points == {"case": 2}
+
+
+def test_minified_functions_on_one_line_are_separate() -> None:
+    source = (
+        "function a(x){if(x){return b(x)}return 0}"
+        "function b(y){return y&&y>1||y<0?1:2}function c(){return 1}\n"
+    )
+    facts = _facts(source, "javascript")
+
+    assert facts["a"] is not None
+    assert facts["a"].cyclomatic == 2
+    assert facts["a"].calls == [("b", 1)]
+    assert facts["b"] is not None
+    assert facts["b"].decision_points == {"and": 1, "or": 1, "ternary": 1}
+    assert facts["c"] is not None
+    assert facts["c"].cyclomatic == 1
+
+
+def test_nested_closures_count_towards_their_function() -> None:
+    source = """def outer(items):
+    def inner(x):
+        if x:
+            return save(x)
+    return [inner(i) for i in items if i]
+"""
+    facts = _facts(source, "python")["outer"]
+
+    assert facts is not None
+    assert facts.decision_points == {"if": 2, "for": 1}
+    assert [name for name, _ in facts.calls] == ["save", "inner"]
+
+
+def test_watched_identifiers_record_first_use() -> None:
+    source = """import requests
+
+def fetch(url):
+    session = object()
+    response = requests.get(url)
+    return requests.post(url, data=response)
+"""
+    facts = _facts(source, "python", watch={"requests", "os"})["fetch"]
+
+    assert facts is not None
+    assert facts.identifiers == {"requests": 5}
+    assert [name for name, _ in facts.calls] == ["object", "get", "post"]
+
+
+def test_unmatched_bodies_and_languages() -> None:
+    tree = parse_code(b"def f():\n    return 1\n", "python")
+
+    assert collect_function_facts(tree.root_node, "python", ["", "not a body"]) == [None, None]
+    assert collect_function_facts(tree.root_node, "cobol", ["    return 1"]) == [None]
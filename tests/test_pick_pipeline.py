@@ -18,7 +18,9 @@ from nit.agents.detectors.signals import DetectedFramework, FrameworkCategory
 from nit.agents.detectors.stack import LanguageInfo
 from nit.agents.detectors.workspace import PackageInfo
 from nit.agents.pipelines import PickPipeline, PickPipelineConfig, PickPipelineResult
+from nit.agents.pipelines.checkpoint import RunCheckpoint
 from nit.agents.pipelines.pick import _StepTracker
+from nit.agents.pipelines.stages import StageScheduler
 from nit.llm.usage_callback import SessionUsageStats
 from nit.models.profile import ProjectProfile
 from nit.utils.ci_context import CIContext
@@ -157,6 +159,17 @@ async def test_pick_pipeline_basic_flow(
         assert result.tests_passed == 10
         assert result.tests_failed == 0
         assert len(result.bugs_found) == 0
+        assert {t.name for t in result.stage_timings} == {
+            "tests",
+            "bugs",
+            "code_analysis",
+            "risk_analysis",
+            "specialized",
+            "fixes",
+            "report",
+        }
+        assert result.trace is not None
+        assert {"profile", "tests", "report"} <= {s.name for s in result.trace.stage_spans()}
 
 
 @pytest.mark.asyncio
@@ -3544,44 +3557,121 @@ async def test_coverage_gap_analysis_returns_failed_status(
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_run_deep_analysis_steps_with_gaps(tmp_path: Path) -> None:
-    """_run_deep_analysis_steps runs analysis when gaps exist."""
+def test_pick_stages_dependency_order(tmp_path: Path) -> None:
+    """Analysis stages overlap; fixes and reporting wait for them."""
 
-    gap_report = CoverageGapReport(
-        function_gaps=[
-            FunctionGap(
-                file_path="src/a.py",
-                function_name="foo",
-                line_number=1,
-                end_line=5,
-                coverage_percentage=0.0,
-                complexity=3,
-                is_public=True,
-                priority=GapPriority.HIGH,
-            ),
-        ],
+    config = PickPipelineConfig(project_root=tmp_path, ci_mode=True)
+    pipeline = PickPipeline(config)
+    profile = ProjectProfile(root=str(tmp_path), languages=[], frameworks=[], packages=[])
+    stages = pipeline._pick_stages(
+        _StepTracker(9, ci_mode=True), profile, Mock(), PickPipelineResult()
     )
 
-    config = PickPipelineConfig(project_root=tmp_path, ci_mode=True)
+    order = StageScheduler(stages).order
+
+    assert order[0] in {"tests", "specialized"}
+    assert order.index("bugs") > order.index("tests")
+    assert order.index("risk_analysis") > order.index("code_analysis")
+    assert order[-2:] == ["fixes", "report"]
+
+
+@pytest.mark.asyncio
+async def test_pick_stages_resume_restores_checkpoint(tmp_path: Path) -> None:
+    """On resume, a checkpointed stage restores its output instead of running."""
+
+    config = PickPipelineConfig(project_root=tmp_path, ci_mode=True, resume=True)
     pipeline = PickPipeline(config)
+    pipeline._checkpoint = RunCheckpoint(tmp_path / "run")
+    pipeline._checkpoint.save("tests", {"test_result": None, "tests_run": 7, "tests_passed": 7})
+    profile = ProjectProfile(root=str(tmp_path), languages=[], frameworks=[], packages=[])
+    result = PickPipelineResult()
+    adapter = AsyncMock()
+    tracker = Mock()
+    stages = {
+        stage.name: stage for stage in pipeline._pick_stages(tracker, profile, adapter, result)
+    }
+
+    await stages["tests"].run()
+
+    adapter.run_tests.assert_not_called()
+    assert result.tests_run == 7
+    assert result.resumed_stages == ["tests"]
+    tracker.skip.assert_called_once()
+
 
-    result = PickPipelineResult(gap_report=gap_report)
+@pytest.mark.asyncio
+async def test_pick_stages_rerun_upstream_invalidates_checkpoint(tmp_path: Path) -> None:
+    """A stage is re-run, and re-saved, when a stage it depends on was re-run."""
+
+    config = PickPipelineConfig(project_root=tmp_path, ci_mode=True, resume=True)
+    pipeline = PickPipeline(config)
+    checkpoint = RunCheckpoint(tmp_path / "run")
+    checkpoint.save("bugs", {"bugs_found": ["stale"]})
+    pipeline._checkpoint = checkpoint
     profile = ProjectProfile(root=str(tmp_path), languages=[], frameworks=[], packages=[])
-    tracker = _StepTracker(9, ci_mode=True)
+    result = PickPipelineResult()
+    stages = {stage.name: stage for stage in pipeline._pick_stages(Mock(), profile, Mock(), result)}
+    test_result = RunResult(passed=1, failed=0, skipped=0, errors=0, duration_ms=1)
 
     with (
-        patch.object(pipeline, "_run_deep_code_analysis", new_callable=AsyncMock) as mock_dca,
-        patch.object(
-            pipeline,
-            "_run_risk_and_semantic_analysis",
-            new_callable=AsyncMock,
-        ) as mock_rsa,
+        patch.object(pipeline, "_run_tests", new=AsyncMock(return_value=test_result)),
+        patch.object(pipeline, "_analyze_bugs", new=AsyncMock(return_value=[])) as mock_bugs,
     ):
-        await pipeline._run_deep_analysis_steps(tracker, profile, result)
+        await stages["tests"].run()
+        await stages["bugs"].run()
+
+    mock_bugs.assert_called_once_with(test_result)
+    assert result.bugs_found == []
+    assert result.resumed_stages == []
+    assert checkpoint.load("bugs") == {"bugs_found": []}
+    assert checkpoint.completed_stages() == ["bugs", "tests"]
+
+
+@pytest.mark.asyncio
+async def test_pick_stages_failed_analysis_is_not_checkpointed(tmp_path: Path) -> None:
+    """A stage whose helpers swallowed a failure is not saved for later runs."""
+
+    config = PickPipelineConfig(project_root=tmp_path, ci_mode=True)
+    pipeline = PickPipeline(config)
+    checkpoint = RunCheckpoint(tmp_path / "run")
+    pipeline._checkpoint = checkpoint
+    profile = ProjectProfile(root=str(tmp_path), languages=[], frameworks=[], packages=[])
+    result = PickPipelineResult()
+    stages = {stage.name: stage for stage in pipeline._pick_stages(Mock(), profile, Mock(), result)}
+    result.code_maps = {"src/app.py": Mock()}
+
+    with patch(
+        "nit.agents.pipelines.pick.load_config", side_effect=RuntimeError("config unreadable")
+    ):
+        await stages["risk_analysis"].run()
+
+    assert result.security_report is None
+    assert checkpoint.load("risk_analysis") is None
+
+    result.code_maps = {}
+    await stages["risk_analysis"].run()
+
+    assert checkpoint.completed_stages() == ["risk_analysis"]
+
+
+@pytest.mark.asyncio
+async def test_run_deep_code_analysis_skipped_without_gaps(tmp_path: Path) -> None:
+    """The code analysis stage skips its step when there are no coverage gaps."""
+
+    config = PickPipelineConfig(project_root=tmp_path, ci_mode=True)
+    pipeline = PickPipeline(config)
+    result = PickPipelineResult(gap_report=CoverageGapReport())
+    profile = ProjectProfile(root=str(tmp_path), languages=[], frameworks=[], packages=[])
+    tracker = Mock()
+    stages = {
+        stage.name: stage for stage in pipeline._pick_stages(tracker, profile, Mock(), result)
+    }
+
+    with patch.object(pipeline, "_run_deep_code_analysis", new_callable=AsyncMock) as mock_dca:
+        await stages["code_analysis"].run()
 
-    mock_dca.assert_called_once()
-    mock_rsa.assert_called_once()
+    mock_dca.assert_not_called()
+    tracker.skip.assert_called_once_with("Analyzing code patterns and conventions")
 
 
 @pytest.mark.asyncio
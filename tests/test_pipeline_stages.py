@@ -0,0 +1,117 @@
+"""Tests for dependency-ordered pipeline stages (nit.agents.pipelines.stages)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nit.agents.pipelines.stages import (
+    STAGE_COMPLETED,
+    STAGE_FAILED,
+    STAGE_SKIPPED,
+    Stage,
+    StageGraphError,
+    StageScheduler,
+)
+
+
+def _recorder(log: list[str], name: str, delay: float = 0.0) -> Stage:
+    async def run() -> None:
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{name}")
+
+    return Stage(name, run)
+
+
+# ── Graph construction ───────────────────────────────────────────
+
+
+def test_order_follows_declared_inputs() -> None:
+    async def noop() -> None:
+        return None
+
+    stages = [
+        Stage("report", noop, inputs=("risk",), after=("fix",)),
+        Stage("fix", noop, inputs=("bugs",)),
+        Stage("risk", noop, inputs=("maps",), outputs=("risk",)),
+        Stage("maps", noop, inputs=("profile",), outputs=("maps",)),
+        Stage("bugs", noop, outputs=("bugs",)),
+    ]
+
+    order = StageScheduler(stages).order
+
+    assert order.index("maps") < order.index("risk") < order.index("report")
+    assert order.index("bugs") < order.index("fix") < order.index("report")
+
+
+def test_cycle_is_rejected() -> None:
+    async def noop() -> None:
+        return None
+
+    stages = [
+        Stage("a", noop, inputs=("y",), outputs=("x",)),
+        Stage("b", noop, inputs=("x",), outputs=("y",)),
+    ]
+    with pytest.raises(StageGraphError, match="cycle"):
+        StageScheduler(stages)
+
+
+def test_duplicate_producer_is_rejected() -> None:
+    async def noop() -> None:
+        return None
+
+    with pytest.raises(StageGraphError, match="produced by both"):
+        StageScheduler([Stage("a", noop, outputs=("x",)), Stage("b", noop, outputs=("x",))])
+
+
+def test_unknown_after_is_rejected() -> None:
+    async def noop() -> None:
+        return None
+
+    with pytest.raises(StageGraphError, match="unknown stage"):
+        StageScheduler([Stage("a", noop, after=("missing",))])
+
+
+# ── Execution ────────────────────────────────────────────────────
+
+
+async def test_independent_stages_overlap() -> None:
+    log: list[str] = []
+    slow = _recorder(log, "slow", delay=0.05)
+    fast = _recorder(log, "fast")
+    last = _recorder(log, "last")
+    last.after = ("slow", "fast")
+
+    timings = await StageScheduler([slow, fast, last]).run()
+
+    assert log.index("start:fast") < log.index("end:slow")
+    assert log[-2:] == ["start:last", "end:last"]
+    assert [t.name for t in timings][-1] == "last"
+    assert all(t.status == STAGE_COMPLETED for t in timings)
+
+
+async def test_failure_skips_dependents_and_is_raised() -> None:
+    log: list[str] = []
+
+    async def broken() -> None:
+        raise RuntimeError("boom")
+
+    stages = [
+        Stage("broken", broken, outputs=("x",)),
+        Stage("dependent", _recorder(log, "dependent").run, inputs=("x",)),
+        Stage("independent", _recorder(log, "independent", delay=0.01).run),
+    ]
+    scheduler = StageScheduler(stages)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await scheduler.run()
+
+    statuses = {t.name: t.status for t in scheduler.timings}
+    assert statuses == {
+        "broken": STAGE_FAILED,
+        "dependent": STAGE_SKIPPED,
+        "independent": STAGE_COMPLETED,
+    }
+    assert log == ["start:independent", "end:independent"]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 from types import SimpleNamespace
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 import requests as req_mod
@@ -25,6 +27,7 @@ from nit.utils.platform_client import (
     build_routes_url,
     build_security_url,
     build_usage_url,
+    create_platform_session,
     get_platform_prompts,
     post_platform_bug,
     post_platform_coverage_gaps,
@@ -181,11 +184,11 @@ def test_batched_reporter_posts_to_usage_url(monkeypatch: pytest.MonkeyPatch) ->
     """Verify the batched usage reporter posts to /api/v1/usage."""
     captured: dict[str, Any] = {}
 
-    def _fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+    def _fake_post(_session: req_mod.Session, url: str, **kwargs: Any) -> SimpleNamespace:
         captured["url"] = url
         return SimpleNamespace(status_code=200, text="ok")
 
-    monkeypatch.setattr(req_mod, "post", _fake_post)
+    monkeypatch.setattr(req_mod.Session, "post", _fake_post)
 
     monkeypatch.setenv("NIT_PLATFORM_URL", "https://platform.getnit.dev")
     monkeypatch.setenv("NIT_PLATFORM_INGEST_TOKEN", "test-ingest-token")
@@ -223,7 +226,7 @@ def test_push_platform_memory_success(monkeypatch: pytest.MonkeyPatch) -> None:
     def _fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
         captured["url"] = url
         captured["headers"] = kwargs["headers"]
-        captured["json"] = kwargs["json"]
+        captured["json"] = json.loads(gzip.decompress(kwargs["data"]))
         return SimpleNamespace(
             status_code=201,
             text=json.dumps({"version": 3, "merged": True}),
@@ -235,14 +238,35 @@ def test_push_platform_memory_success(monkeypatch: pytest.MonkeyPatch) -> None:
     result = push_platform_memory(
         PlatformRuntimeConfig(url="https://platform.getnit.dev", api_key="nit_key"),
         {"baseVersion": 0, "source": "local", "global": {"conventions": {}}},
+        compress=True,
     )
 
     assert result == {"version": 3, "merged": True}
     assert captured["url"] == "https://platform.getnit.dev/api/v1/memory"
     assert captured["headers"]["Authorization"] == "Bearer nit_key"
+    assert captured["headers"]["Content-Encoding"] == "gzip"
     assert captured["json"]["source"] == "local"
 
 
+def test_push_platform_memory_uncompressed_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def _fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+        captured["headers"] = kwargs["headers"]
+        captured["data"] = kwargs["data"]
+        return SimpleNamespace(status_code=201, text="{}", json=dict)
+
+    monkeypatch.setattr("nit.utils.platform_client.requests.post", _fake_post)
+
+    push_platform_memory(
+        PlatformRuntimeConfig(url="https://platform.getnit.dev", api_key="nit_key"),
+        {"baseVersion": 0},
+    )
+
+    assert "Content-Encoding" not in captured["headers"]
+    assert json.loads(captured["data"]) == {"baseVersion": 0}
+
+
 def test_push_platform_memory_raises_on_http_error(monkeypatch: pytest.MonkeyPatch) -> None:
     def _fake_post(*args: Any, **kwargs: Any) -> SimpleNamespace:
         return SimpleNamespace(status_code=500, text="Internal Server Error")
@@ -296,6 +320,25 @@ def test_pull_platform_memory_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert captured["params"]["projectId"] == "proj-123"
 
 
+def test_pull_platform_memory_since_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def _fake_get(url: str, **kwargs: Any) -> SimpleNamespace:
+        captured["params"] = kwargs["params"]
+        return SimpleNamespace(status_code=304, text="")
+
+    monkeypatch.setattr("nit.utils.platform_client.requests.get", _fake_get)
+
+    result = pull_platform_memory(
+        PlatformRuntimeConfig(url="https://platform.getnit.dev", api_key="nit_key"),
+        "proj-123",
+        since_version=4,
+    )
+
+    assert result == {}
+    assert captured["params"] == {"projectId": "proj-123", "sinceVersion": 4}
+
+
 def test_pull_platform_memory_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
     def _fake_get(*args: Any, **kwargs: Any) -> SimpleNamespace:
         return SimpleNamespace(status_code=404, text="Not Found")
@@ -441,6 +484,25 @@ def test_post_platform_prompts_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert result == {"id": "ok"}
 
 
+def test_post_platform_prompts_gzip_over_session() -> None:
+    session = MagicMock()
+    session.post.return_value = SimpleNamespace(status_code=200, text="{}", json=dict)
+
+    post_platform_prompts(_VALID_CFG, [{"id": "p1"}], session=session)
+
+    kwargs = session.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == {"records": [{"id": "p1"}]}
+
+
+def test_create_platform_session_mounts_pool() -> None:
+    session = create_platform_session(pool_size=2)
+    try:
+        assert session.get_adapter("https://platform.getnit.dev")._pool_maxsize == 2  # type: ignore[attr-defined]
+    finally:
+        session.close()
+
+
 def test_post_platform_prompts_requires_url_and_key() -> None:
     with pytest.raises(PlatformClientError, match="required"):
         post_platform_prompts(PlatformRuntimeConfig(), [])
@@ -0,0 +1,141 @@
+"""Tests for static import checks of generated tests (agents/builders/prevalidation.py)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from nit.agents.builders.prevalidation import available_symbols, check_imports
+from nit.llm.context import AssembledContext
+from nit.parsing.languages import extract_from_source
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_PY_SOURCE = """\
+MAX_ITEMS = 10
+
+
+def add(a, b):
+    return a + b
+
+
+class Calculator:
+    pass
+"""
+
+_TS_SOURCE = """\
+export const LIMIT = 3;
+
+export function add(a: number, b: number): number {
+  return a + b;
+}
+"""
+
+
+def _context(root: Path, rel_path: str, source: str, language: str) -> AssembledContext:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+    return AssembledContext(
+        source_path=str(path),
+        source_code=source,
+        language=language,
+        parse_result=extract_from_source(source.encode("utf-8"), language),
+    )
+
+
+def _python_project(root: Path) -> AssembledContext:
+    (root / "src" / "calc").mkdir(parents=True)
+    (root / "src" / "calc" / "__init__.py").write_text("", encoding="utf-8")
+    return _context(root, "src/calc/ops.py", _PY_SOURCE, "python")
+
+
+def _check(code: str, context: AssembledContext, test_file: Path, root: Path) -> list[str]:
+    return check_imports(code, context, test_file=test_file, project_root=root)
+
+
+def test_python_valid_imports_pass(tmp_path: Path) -> None:
+    context = _python_project(tmp_path)
+    code = (
+        "import os\n"
+        "import pytest\n"
+        "from calc import ops\n"
+        "from calc.ops import MAX_ITEMS, Calculator, add\n"
+        "from .helpers import build\n"
+    )
+
+    assert _check(code, context, tmp_path / "tests" / "test_ops.py", tmp_path) == []
+
+
+def test_python_missing_module(tmp_path: Path) -> None:
+    context = _python_project(tmp_path)
+    code = "from calc.operations import add\n"
+
+    errors = _check(code, context, tmp_path / "tests" / "test_ops.py", tmp_path)
+
+    assert errors == ["ModuleNotFoundError: No module named 'calc.operations' (line 1)"]
+
+
+def test_python_missing_symbol(tmp_path: Path) -> None:
+    context = _python_project(tmp_path)
+    code = "import pytest\nfrom calc.ops import add, subtract\n"
+
+    errors = _check(code, context, tmp_path / "tests" / "test_ops.py", tmp_path)
+
+    assert errors == ["ImportError: cannot import name 'subtract' from 'calc.ops' (line 2)"]
+
+
+def test_python_third_party_imports_are_not_checked(tmp_path: Path) -> None:
+    context = _python_project(tmp_path)
+    code = "from requests import does_not_exist\nimport numpy.missing\n"
+
+    assert _check(code, context, tmp_path / "tests" / "test_ops.py", tmp_path) == []
+
+
+def test_python_star_reexports_and_getattr_may_define_any_name(tmp_path: Path) -> None:
+    context = _python_project(tmp_path)
+    (tmp_path / "src" / "calc" / "__init__.py").write_text("from .ops import *\n")
+    (tmp_path / "src" / "calc" / "lazy.py").write_text("def __getattr__(name):\n    ...\n")
+    code = "from calc import helper\nfrom calc.lazy import anything\n"
+
+    assert _check(code, context, tmp_path / "tests" / "test_ops.py", tmp_path) == []
+
+
+def test_python_directories_without_init_are_not_checked(tmp_path: Path) -> None:
+    context = _python_project(tmp_path)
+    (tmp_path / "yaml").mkdir()
+    (tmp_path / "yaml" / "fixture.yml").write_text("a: 1\n")
+    (tmp_path / "src" / "calc" / "plugins").mkdir()
+    code = "from yaml import safe_load\nfrom calc.plugins import extra\n"
+
+    assert _check(code, context, tmp_path / "tests" / "test_ops.py", tmp_path) == []
+
+
+def test_js_relative_imports(tmp_path: Path) -> None:
+    context = _context(tmp_path, "src/math.ts", _TS_SOURCE, "typescript")
+    test_file = tmp_path / "src" / "math.test.ts"
+    code = (
+        "import { describe, it } from 'vitest';\n"
+        "import { add, LIMIT } from './math';\n"
+        "import { subtract } from './math.js';\n"
+        "import { helper } from './utils';\n"
+    )
+
+    errors = _check(code, context, test_file, tmp_path)
+
+    assert errors == [
+        "Module './math.js' has no exported member 'subtract' (line 3)",
+        "Cannot find module './utils' (line 4)",
+    ]
+
+
+def test_unsupported_language_is_skipped(tmp_path: Path) -> None:
+    context = _context(tmp_path, "main.go", "package main\n", "go")
+
+    assert _check('import "fmt"\n', context, tmp_path / "main_test.go", tmp_path) == []
+
+
+def test_available_symbols(tmp_path: Path) -> None:
+    context = _python_project(tmp_path)
+
+    assert available_symbols(context) == ["add", "Calculator"]
@@ -7,6 +7,7 @@ Covers:
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -19,6 +20,7 @@ from nit.sharding.prioritizer import (
     distribute_prioritized_shards,
     prioritize_test_files_by_risk,
 )
+from nit.utils.git_history import FileHistory, GitHistoryIndex
 
 # ── Fixtures ──────────────────────────────────────────────────────
 
@@ -153,6 +155,26 @@ def test_plan_length_matches_input(
     assert len(plan.risk_scores) == len(test_files)
 
 
+def test_history_orders_equal_scores_by_churn(project_root: Path, test_files: list[Path]) -> None:
+    """With a history index, equally risky tests are ordered by source churn."""
+    now = int(datetime.now(UTC).timestamp())
+    history = GitHistoryIndex(
+        project_root,
+        "head",
+        {
+            "src/db.py": FileHistory(timestamps=[now - 3, now - 2, now - 1]),
+            "src/utils.py": FileHistory(timestamps=[now - 1]),
+        },
+    )
+
+    plan = prioritize_test_files_by_risk(
+        test_files, test_mapper=TestMapper(project_root), history=history
+    )
+
+    assert [p.name for p in plan.test_files[:2]] == ["test_db.py", "test_utils.py"]
+    assert plan.risk_scores[0].recent_commits == 3
+
+
 # ── distribute_prioritized_shards tests ──────────────────────────
 
 
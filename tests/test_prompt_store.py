@@ -220,6 +220,66 @@ class TestOutcomeUpdates:
         assert records[0].error_message == "assert failed"
 
 
+class TestReadSince:
+    """Tests for incremental reads from a byte offset."""
+
+    def test_reads_in_file_order_and_resumes(self, recorder: PromptRecorder) -> None:
+        ids = [recorder.record(_make_request(), _make_response(), duration_ms=1) for _ in range(3)]
+
+        first = recorder.read_since(0, limit=2)
+        assert [r.id for r in first.records] == ids[:2]
+
+        rest = recorder.read_since(first.offset)
+        assert [r.id for r in rest.records] == ids[2:]
+        assert recorder.read_since(rest.offset).records == []
+
+    def test_merges_updates_within_chunk(self, recorder: PromptRecorder) -> None:
+        synced = recorder.record(_make_request(), _make_response(), duration_ms=1)
+        offset = recorder.read_since(0).offset
+        fresh = recorder.record(_make_request(), _make_response(), duration_ms=1)
+        recorder.update_outcome(fresh, "success")
+        recorder.update_outcome(synced, "test_failure")
+
+        chunk = recorder.read_since(offset)
+
+        assert [(r.id, r.outcome) for r in chunk.records] == [(fresh, "success")]
+        assert [(u.record_id, u.outcome) for u in chunk.updates] == [(synced, "test_failure")]
+
+    def test_limit_still_consumes_trailing_updates(self, recorder: PromptRecorder) -> None:
+        first = recorder.record(_make_request(), _make_response(), duration_ms=1)
+        recorder.update_outcome(first, "success")
+        recorder.record(_make_request(), _make_response(), duration_ms=1)
+
+        chunk = recorder.read_since(0, limit=1)
+
+        assert chunk.records[0].outcome == "success"
+        assert chunk.updates == []
+        assert len(recorder.read_since(chunk.offset).records) == 1
+
+    def test_ignores_incomplete_last_line(self, recorder: PromptRecorder) -> None:
+        recorder.record(_make_request(), _make_response(), duration_ms=1)
+        path = recorder.project_root / ".nit" / "history" / "prompts.jsonl"
+        with path.open("a", encoding="utf-8") as f:
+            f.write('{"id": "partial"')
+
+        chunk = recorder.read_since(0)
+
+        assert len(chunk.records) == 1
+        assert chunk.offset < path.stat().st_size
+
+    def test_restarts_when_file_shrinks(self, recorder: PromptRecorder) -> None:
+        recorder.record(_make_request(), _make_response(), duration_ms=1)
+
+        chunk = recorder.read_since(10_000)
+
+        assert len(chunk.records) == 1
+
+    def test_missing_file(self, recorder: PromptRecorder) -> None:
+        chunk = recorder.read_since(42)
+        assert chunk.records == []
+        assert chunk.offset == 0
+
+
 class TestSingleton:
     """Tests for singleton management."""
 
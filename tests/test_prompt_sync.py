@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
-from nit.memory.prompt_sync import PromptSyncer, _find_record_index, _sha256
-from nit.models.prompt_record import PromptRecord
+import pytest
+
+from nit.memory.prompt_store import PromptRecorder
+from nit.memory.prompt_sync import PromptSyncer, _sha256
+from nit.models.prompt_record import OutcomeUpdate, PromptRecord
 from nit.utils.platform_client import PlatformClientError, PlatformRuntimeConfig
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def _make_record(record_id: str = "rec-1") -> PromptRecord:
     """Build a minimal PromptRecord for testing."""
@@ -23,48 +30,46 @@ def _make_record(record_id: str = "rec-1") -> PromptRecord:
     )
 
 
-# ── _sha256 helper ───────────────────────────────────────────────
+@pytest.fixture
+def recorder(tmp_path: Path) -> PromptRecorder:
+    return PromptRecorder(tmp_path)
 
 
-def test_sha256_deterministic() -> None:
-    assert _sha256("hello") == _sha256("hello")
+def _add(recorder: PromptRecorder, *record_ids: str) -> None:
+    """Append records directly to the recorder's JSONL file."""
+    for record_id in record_ids:
+        recorder._append_json(_make_record(record_id).to_dict())
 
 
-def test_sha256_differs_for_different_input() -> None:
-    assert _sha256("hello") != _sha256("world")
+def _posted_ids(mock_post: MagicMock) -> list[list[str]]:
+    return [[p["id"] for p in call.args[1]] for call in mock_post.call_args_list]
 
 
-# ── _find_record_index ───────────────────────────────────────────
+# ── _sha256 helper ───────────────────────────────────────────────
 
 
-def test_find_record_index_found() -> None:
-    records = [_make_record("a"), _make_record("b"), _make_record("c")]
-    assert _find_record_index(records, "b") == 1
+def test_sha256_deterministic() -> None:
+    assert _sha256("hello") == _sha256("hello")
 
 
-def test_find_record_index_not_found() -> None:
-    records = [_make_record("a")]
-    assert _find_record_index(records, "z") is None
+def test_sha256_differs_for_different_input() -> None:
+    assert _sha256("hello") != _sha256("world")
 
 
 # ── PromptSyncer ─────────────────────────────────────────────────
 
 
-def test_sync_no_records() -> None:
+def test_sync_no_records(recorder: PromptRecorder) -> None:
     """Syncing with no records returns 0."""
-    recorder = MagicMock()
-    recorder.read_all.return_value = []
     config = PlatformRuntimeConfig()
     syncer = PromptSyncer(recorder, config)
     assert syncer.sync() == 0
 
 
 @patch("nit.memory.prompt_sync.post_platform_prompts")
-def test_sync_posts_records(mock_post: MagicMock) -> None:
+def test_sync_posts_records(mock_post: MagicMock, recorder: PromptRecorder) -> None:
     """Syncing with records posts to platform."""
-    rec = _make_record("rec-1")
-    recorder = MagicMock()
-    recorder.read_all.return_value = [rec]
+    _add(recorder, "rec-1")
     config = PlatformRuntimeConfig()
     syncer = PromptSyncer(recorder, config)
 
@@ -75,44 +80,103 @@ def test_sync_posts_records(mock_post: MagicMock) -> None:
 
 
 @patch("nit.memory.prompt_sync.post_platform_prompts")
-def test_sync_skips_already_synced(mock_post: MagicMock) -> None:
-    """Records before the last synced ID should be skipped."""
-    records = [_make_record("a"), _make_record("b")]
-    recorder = MagicMock()
-    recorder.read_all.return_value = records
+def test_sync_skips_already_synced(mock_post: MagicMock, recorder: PromptRecorder) -> None:
+    """Records at or below the high-water mark are not sent again."""
+    _add(recorder, "a", "b")
     config = PlatformRuntimeConfig()
-    syncer = PromptSyncer(recorder, config)
 
-    # First sync sends both
-    syncer.sync()
+    assert PromptSyncer(recorder, config).sync() == 2
     assert mock_post.call_count == 1
 
-    # Second sync: last_synced_id is "a", so records[:0] is empty
-    recorder.read_all.return_value = records
-    count = syncer.sync()
-    assert count == 0
+    # A fresh syncer resumes from the persisted mark
+    syncer = PromptSyncer(recorder, config)
+    assert syncer.sync() == 0
+    assert syncer.offset > 0
+
+    _add(recorder, "c")
+    assert syncer.sync() == 1
+    assert _posted_ids(mock_post) == [["a", "b"], ["c"]]
 
 
 @patch("nit.memory.prompt_sync.post_platform_prompts")
-def test_sync_handles_api_error(mock_post: MagicMock) -> None:
+def test_sync_uploads_in_batches(mock_post: MagicMock, recorder: PromptRecorder) -> None:
+    """Records are uploaded in batch_size chunks over one session."""
+    _add(recorder, "a", "b", "c", "d", "e")
+    syncer = PromptSyncer(recorder, PlatformRuntimeConfig(), batch_size=2)
+
+    assert syncer.sync() == 5
+
+    assert _posted_ids(mock_post) == [["a", "b"], ["c", "d"], ["e"]]
+    sessions = {id(call.kwargs["session"]) for call in mock_post.call_args_list}
+    assert len(sessions) == 1
+    syncer.close()
+
+
+@patch("nit.memory.prompt_sync.post_platform_prompts")
+def test_sync_respects_limit(mock_post: MagicMock, recorder: PromptRecorder) -> None:
+    _add(recorder, "a", "b", "c")
+    syncer = PromptSyncer(recorder, PlatformRuntimeConfig(), batch_size=2)
+
+    assert syncer.sync(limit=1) == 1
+    assert syncer.sync() == 2
+    assert _posted_ids(mock_post) == [["a"], ["b", "c"]]
+
+
+@patch("nit.memory.prompt_sync.post_platform_prompts")
+def test_sync_handles_api_error(mock_post: MagicMock, recorder: PromptRecorder) -> None:
     """API errors should be caught and return 0."""
     mock_post.side_effect = PlatformClientError("fail")
-    recorder = MagicMock()
-    recorder.read_all.return_value = [_make_record()]
+    _add(recorder, "rec-1")
     config = PlatformRuntimeConfig()
     syncer = PromptSyncer(recorder, config)
 
     count = syncer.sync()
 
     assert count == 0
+    assert syncer.offset == 0
+
+
+@patch("nit.memory.prompt_sync.post_platform_prompts")
+def test_sync_failed_batch_is_retried(mock_post: MagicMock, recorder: PromptRecorder) -> None:
+    """Only batches the platform accepted advance the high-water mark."""
+    mock_post.side_effect = [{}, PlatformClientError("fail"), {}, {}]
+    _add(recorder, "a", "b", "c", "d")
+    syncer = PromptSyncer(recorder, PlatformRuntimeConfig(), batch_size=2)
+
+    assert syncer.sync() == 2
+    assert syncer.sync() == 2
+    assert _posted_ids(mock_post) == [["a", "b"], ["c", "d"], ["c", "d"]]
+
+
+@patch("nit.memory.prompt_sync.post_platform_prompts")
+def test_sync_sends_late_outcome_updates(mock_post: MagicMock, recorder: PromptRecorder) -> None:
+    """Outcome updates for already-synced records are forwarded."""
+    _add(recorder, "a")
+    syncer = PromptSyncer(recorder, PlatformRuntimeConfig())
+    syncer.sync()
+
+    recorder.update_outcome("a", "success", validation_attempts=1)
+    assert syncer.sync() == 0
+
+    sent = mock_post.call_args_list[-1].args[1]
+    assert OutcomeUpdate.from_dict(sent[0]).record_id == "a"
+
+
+@patch("nit.memory.prompt_sync.post_platform_prompts")
+def test_sync_in_background(mock_post: MagicMock, recorder: PromptRecorder) -> None:
+    _add(recorder, "a", "b")
+    syncer = PromptSyncer(recorder, PlatformRuntimeConfig())
+
+    future = syncer.start()
+
+    assert future.result(timeout=10) == 2
+    mock_post.assert_called_once()
 
 
 @patch("nit.memory.prompt_sync.post_platform_prompts")
-def test_sync_redact_source(mock_post: MagicMock) -> None:
+def test_sync_redact_source(mock_post: MagicMock, recorder: PromptRecorder) -> None:
     """With redact_source, message content should be hashed."""
-    rec = _make_record()
-    recorder = MagicMock()
-    recorder.read_all.return_value = [rec]
+    _add(recorder, "rec-1")
     config = PlatformRuntimeConfig()
     syncer = PromptSyncer(recorder, config, redact_source=True)
 
@@ -7,6 +7,8 @@ tree-sitter validation with sample Python fixtures.
 from __future__ import annotations
 
 import json
+import sys
+import types
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -20,6 +22,7 @@ from nit.adapters.base import (
 )
 from nit.adapters.unit.pytest_adapter import (
     PytestAdapter,
+    PytestWarmRunner,
     _extract_json_object,
     _has_conftest,
     _has_pyproject_pytest_config,
@@ -32,6 +35,7 @@ from nit.adapters.unit.pytest_adapter import (
     _to_float,
     _validate_python,
 )
+from nit.adapters.unit.pytest_worker import _imports_project_code
 from nit.llm.prompts.pytest_prompt import PytestTemplate
 
 # ── Helpers ──────────────────────────────────────────────────────
@@ -894,6 +898,51 @@ class TestPytestRunTestsMocked:
         assert isinstance(result, RunResult)
 
 
+class TestPytestWarmRunner:
+    def test_create_warm_runner(self, tmp_path: Path) -> None:
+        runner = PytestAdapter().create_warm_runner(tmp_path)
+        assert isinstance(runner, PytestWarmRunner)
+
+    def test_run_parses_worker_report(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        runner = PytestWarmRunner(Path(sys.executable), tmp_path)
+
+        def _fake_request(payload: dict[str, object], timeout: float) -> dict[str, object]:
+            report = {"tests": [{"nodeid": "test_a.py::test_ok", "outcome": "passed"}]}
+            Path(str(payload["report"])).write_text(json.dumps(report), encoding="utf-8")
+            return {"exit_code": 0, "output": "1 passed"}
+
+        monkeypatch.setattr(runner, "request", _fake_request)
+        result = runner.run([tmp_path / "test_a.py"], timeout=5)
+
+        assert result.success
+        assert result.passed == 1
+        assert result.raw_output == "1 passed"
+
+    def test_worker_recycles_after_importing_project_code(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        test_file = tmp_path / "tests" / "test_a.py"
+        modules = {
+            "test_a": test_file,
+            "requests": tmp_path / ".venv" / "lib" / "site-packages" / "requests" / "api.py",
+            "json": Path(json.__file__),
+            "conftest": tmp_path / "conftest.py",
+            "app.models": tmp_path / "app" / "models.py",
+        }
+        for name, path in modules.items():
+            module = types.ModuleType(name)
+            module.__file__ = str(path)
+            monkeypatch.setitem(sys.modules, name, module)
+        root = tmp_path.resolve()
+        files = [str(test_file)]
+
+        assert not _imports_project_code({"test_a", "requests", "json"}, root, files)
+        assert _imports_project_code({"test_a", "conftest"}, root, files)
+        assert _imports_project_code({"app.models"}, root, files)
+
+
 class TestExtractJsonObjectEdgeCases:
     """Cover edge cases in _extract_json_object."""
 
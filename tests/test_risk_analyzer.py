@@ -3,7 +3,7 @@
 Covers:
 - Composite risk scoring based on complexity, coverage, recency, criticality
 - Domain criticality detection (auth, payment, PII, encryption, security)
-- Recency scoring via git log
+- Recency scoring via the git history and function churn indexes
 - Prioritized risk report generation
 - Integration with CodeMap and FunctionGap
 """
@@ -12,8 +12,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -29,6 +28,8 @@ from nit.agents.analyzers.risk import (
 )
 from nit.agents.base import TaskInput, TaskStatus
 from nit.parsing.treesitter import FunctionInfo, ImportInfo
+from nit.utils.git_churn import FunctionChurnIndex, _Change
+from nit.utils.git_history import FileHistory, GitHistoryIndex
 
 # ── Fixtures ─────────────────────────────────────────────────────
 
@@ -265,88 +266,156 @@ def test_detect_function_criticality(risk_analyzer: RiskAnalyzer) -> None:
 # ── Recency Scoring Tests ────────────────────────────────────────
 
 
-def test_get_recency_info_recent_file(risk_analyzer: RiskAnalyzer, tmp_project: Path) -> None:
-    """Test recency info for recently modified file."""
-    file_path = tmp_project / "src/recent.py"
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text("# test file")
-
-    # Mock git log output for recent file (5 days ago)
+def _history(tmp_project: Path, commits: dict[str, list[tuple[int, str]]]) -> GitHistoryIndex:
+    """Build a history index from ``{path: [(days_ago, author), ...]}``."""
     now = datetime.now(UTC)
-    five_days_ago = now - timedelta(days=5)
-    timestamp = int(five_days_ago.timestamp())
+    files: dict[str, FileHistory] = {}
+    for path, entries in commits.items():
+        history = FileHistory()
+        for days_ago, author in entries:
+            history.add(int((now - timedelta(days=days_ago)).timestamp()), author)
+        history.timestamps.sort()
+        files[path] = history
+    return GitHistoryIndex(tmp_project, "head", files)
 
-    with patch("subprocess.run") as mock_run:
-        # Mock last modification time
-        mock_run.return_value = Mock(returncode=0, stdout=f"{timestamp}\n", stderr="")
-        recency_info = risk_analyzer._get_recency_info(str(file_path))
 
-        assert recency_info.last_modified is not None
-        assert recency_info.days_since_modified is not None
-        assert recency_info.days_since_modified <= 7
+def test_get_recency_info_recent_file(tmp_project: Path) -> None:
+    """Test recency info for recently modified file."""
+    history = _history(tmp_project, {"src/recent.py": [(5, "Alice")]})
+    risk_analyzer = RiskAnalyzer(project_root=tmp_project, history=history)
 
+    recency_info = risk_analyzer._get_recency_info(str(tmp_project / "src/recent.py"))
 
-def test_get_recency_info_old_file(risk_analyzer: RiskAnalyzer, tmp_project: Path) -> None:
-    """Test recency info for old file."""
-    file_path = tmp_project / "src/old.py"
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text("# test file")
+    assert recency_info.last_modified is not None
+    assert recency_info.days_since_modified is not None
+    assert recency_info.days_since_modified <= 7
 
-    # Mock git log output for old file (200 days ago)
-    now = datetime.now(UTC)
-    old_date = now - timedelta(days=200)
-    timestamp = int(old_date.timestamp())
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = Mock(returncode=0, stdout=f"{timestamp}\n", stderr="")
-        recency_info = risk_analyzer._get_recency_info(str(file_path))
+def test_get_recency_info_old_file(tmp_project: Path) -> None:
+    """Test recency info for old file."""
+    history = _history(tmp_project, {"src/old.py": [(200, "Alice")]})
+    risk_analyzer = RiskAnalyzer(project_root=tmp_project, history=history)
+
+    recency_info = risk_analyzer._get_recency_info("src/old.py")
 
-        assert recency_info.last_modified is not None
-        assert recency_info.days_since_modified is not None
-        assert recency_info.days_since_modified >= 100
+    assert recency_info.last_modified is not None
+    assert recency_info.days_since_modified is not None
+    assert recency_info.days_since_modified >= 100
+    assert recency_info.commit_count_90d == 0
+    assert recency_info.recent_authors == []
 
 
 def test_get_recency_info_no_git(risk_analyzer: RiskAnalyzer, tmp_project: Path) -> None:
-    """Test recency info when git is not available."""
+    """Test recency info when the project is not a git repository."""
     file_path = tmp_project / "src/no_git.py"
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text("# test file")
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="not a git repository")
-        recency_info = risk_analyzer._get_recency_info(str(file_path))
+    recency_info = risk_analyzer._get_recency_info(str(file_path))
 
-        assert recency_info.last_modified is None
-        assert recency_info.days_since_modified is None
-        assert recency_info.commit_count_90d == 0
+    assert recency_info.last_modified is None
+    assert recency_info.days_since_modified is None
+    assert recency_info.commit_count_90d == 0
 
 
-def test_get_recency_info_multiple_commits(risk_analyzer: RiskAnalyzer, tmp_project: Path) -> None:
+def test_get_recency_info_multiple_commits(tmp_project: Path) -> None:
     """Test recency info with multiple recent commits."""
-    file_path = tmp_project / "src/active.py"
-
-    # Mock git responses
-    def mock_git_command(*args: Any, **kwargs: Any) -> Mock:
-        cmd = args[0]
-        if "--format=%at" in cmd:
-            # Last modification: 3 days ago
-            timestamp = int((datetime.now(UTC) - timedelta(days=3)).timestamp())
-            return Mock(returncode=0, stdout=f"{timestamp}\n", stderr="")
-        if "--format=%H" in cmd:
-            # 15 commits in last 90 days
-            commits = "\n".join([f"commit{i}" for i in range(15)])
-            return Mock(returncode=0, stdout=commits, stderr="")
-        if "--format=%an" in cmd:
-            # 3 authors
-            return Mock(returncode=0, stdout="Alice\nBob\nCharlie\n", stderr="")
-        return Mock(returncode=1, stdout="", stderr="")
-
-    with patch("subprocess.run", side_effect=mock_git_command):
-        recency_info = risk_analyzer._get_recency_info(str(file_path))
-
-        assert recency_info.commit_count_90d == 15
-        assert len(recency_info.recent_authors) == 3
-        assert "Alice" in recency_info.recent_authors
+    entries = [(3 + i, ("Alice", "Bob", "Charlie")[i % 3]) for i in range(15)]
+    entries.append((120, "Dana"))
+    history = _history(tmp_project, {"src/active.py": entries})
+    risk_analyzer = RiskAnalyzer(project_root=tmp_project, history=history)
+
+    recency_info = risk_analyzer._get_recency_info("src/active.py")
+
+    assert recency_info.days_since_modified == 3
+    assert recency_info.commit_count_90d == 15
+    assert recency_info.recent_authors == ["Alice", "Bob", "Charlie"]
+
+
+def test_recency_looked_up_once_per_file(tmp_project: Path, sample_code_map: CodeMap) -> None:
+    """File and function risks share one recency lookup per file."""
+    history = _history(tmp_project, {"src/auth.py": [(1, "Alice")]})
+    risk_analyzer = RiskAnalyzer(project_root=tmp_project, history=history)
+    task = RiskAnalysisTask(
+        project_root=str(tmp_project),
+        code_maps={"src/auth.py": sample_code_map},
+    )
+
+    with patch.object(
+        risk_analyzer, "_get_recency_info", wraps=risk_analyzer._get_recency_info
+    ) as lookup:
+        report = risk_analyzer.analyze_risk(task)
+
+    assert lookup.call_count == 1
+    assert report.file_risks[0].recency_info.commit_count_90d == 1
+
+
+def _churn(
+    tmp_project: Path, changes: list[tuple[int, str, list[tuple[int, int]]]]
+) -> FunctionChurnIndex:
+    """Build a churn index of src/auth.py from (days ago, author, line ranges) entries."""
+    now = datetime.now(UTC)
+    return FunctionChurnIndex(
+        tmp_project,
+        {
+            "src/auth.py": [
+                _Change(int((now - timedelta(days=days_ago)).timestamp()), author, ranges)
+                for days_ago, author, ranges in changes
+            ]
+        },
+    )
+
+
+def test_function_recency_uses_line_history(tmp_project: Path, sample_code_map: CodeMap) -> None:
+    """Functions are scored on changes to their own lines, not the whole file."""
+    history = _history(tmp_project, {"src/auth.py": [(2, "Bob"), (200, "Alice")]})
+    churn = _churn(tmp_project, [(2, "Bob", [(12, 14)]), (200, "Alice", [(1, 40)])])
+    risk_analyzer = RiskAnalyzer(project_root=tmp_project, history=history, churn=churn)
+    task = RiskAnalysisTask(
+        project_root=str(tmp_project),
+        code_maps={"src/auth.py": sample_code_map},
+    )
+
+    report = risk_analyzer.analyze_risk(task)
+    by_name = {f.function_name: f for f in report.function_risks}
+
+    changed = by_name["authenticate_user"]
+    untouched = by_name["generate_token"]
+    assert changed.recency_info.days_since_modified == 2
+    assert changed.recency_info.recent_authors == ["Bob"]
+    assert untouched.recency_info.days_since_modified == 200
+    assert untouched.recency_info.commit_count_90d == 0
+    assert changed.risk_score.recency_score > untouched.risk_score.recency_score
+
+
+def test_function_recency_without_line_history(tmp_project: Path, sample_code_map: CodeMap) -> None:
+    """Functions fall back to file recency when the file has no line history."""
+    history = _history(tmp_project, {"src/auth.py": [(2, "Bob")]})
+    churn = FunctionChurnIndex(tmp_project)
+    risk_analyzer = RiskAnalyzer(project_root=tmp_project, history=history, churn=churn)
+    task = RiskAnalysisTask(
+        project_root=str(tmp_project),
+        code_maps={"src/auth.py": sample_code_map},
+    )
+
+    report = risk_analyzer.analyze_risk(task)
+
+    assert all(f.recency_info.days_since_modified == 2 for f in report.function_risks)
+
+
+def test_function_recency_outside_window(tmp_project: Path, sample_code_map: CodeMap) -> None:
+    """Functions untouched within the churn window count as old."""
+    history = _history(tmp_project, {"src/auth.py": [(2, "Bob")]})
+    churn = _churn(tmp_project, [(2, "Bob", [(1, 5)])])
+    risk_analyzer = RiskAnalyzer(project_root=tmp_project, history=history, churn=churn)
+    file_recency = risk_analyzer._get_recency_info("src/auth.py")
+
+    recency = risk_analyzer._get_function_recency(
+        "src/auth.py", sample_code_map.functions[0], file_recency
+    )
+
+    assert recency.last_modified is None
+    assert recency.days_since_modified == churn.max_age_days
 
 
 # ── Risk Score Calculation Tests ─────────────────────────────────
@@ -617,3 +686,68 @@ def test_risk_report_empty(risk_analyzer: RiskAnalyzer) -> None:
     assert len(report.file_risks) == 0
     assert len(report.function_risks) == 0
     assert len(report.critical_files) == 0
+
+
+# ── Gap lookups at scale ─────────────────────────────────────────
+
+
+def _gap_reads(tmp_project: Path, file_count: int, functions_per_file: int = 5) -> int:
+    """Attribute reads on coverage gaps during one ``analyze_risk`` run."""
+    reads = [0]
+
+    class CountingGap(FunctionGap):
+        def __getattribute__(self, name: str) -> object:
+            reads[0] += 1
+            return super().__getattribute__(name)
+
+    code_maps: dict[str, CodeMap] = {}
+    gaps: list[FunctionGap] = []
+    for i in range(file_count):
+        path = f"src/mod{i}.py"
+        names = [f"func{j}" for j in range(functions_per_file)]
+        code_maps[path] = CodeMap(
+            file_path=path,
+            language="python",
+            functions=[
+                FunctionInfo(name=name, start_line=j * 3 + 1, end_line=j * 3 + 2)
+                for j, name in enumerate(names)
+            ],
+        )
+        gaps.extend(
+            CountingGap(
+                file_path=path,
+                function_name=name,
+                line_number=1,
+                end_line=2,
+                coverage_percentage=20.0,
+                complexity=3,
+                is_public=True,
+                priority=GapPriority.MEDIUM,
+            )
+            for name in names
+        )
+    risk_analyzer = RiskAnalyzer(
+        project_root=tmp_project,
+        history=GitHistoryIndex(tmp_project, "head", {}),
+        churn=FunctionChurnIndex(tmp_project),
+    )
+    task = RiskAnalysisTask(project_root=str(tmp_project), code_maps=code_maps, function_gaps=gaps)
+
+    reads[0] = 0
+    report = risk_analyzer.analyze_risk(task)
+
+    assert len(report.function_risks) == len(gaps)
+    assert all(f.coverage_percentage == 20.0 for f in report.function_risks)
+    return reads[0]
+
+
+def test_gap_lookups_scale_linearly(tmp_project: Path) -> None:
+    """Benchmark: work on gaps grows linearly with files and gaps.
+
+    Filtering every gap per file and per function made this quadratic
+    (8x the files and gaps meant 64x the reads).
+    """
+    small = _gap_reads(tmp_project, 50)
+    large = _gap_reads(tmp_project, 400)
+
+    assert large == 8 * small
@@ -0,0 +1,127 @@
+"""Tests for resumable pipeline run checkpoints (nit.agents.pipelines.checkpoint)."""
+
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+from nit.agents.pipelines.checkpoint import RunCheckpoint, open_run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _git_project(tmp_path: Path) -> Path:
+    subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+    (tmp_path / "app.py").write_text("def f():\n    return 1\n")
+    return tmp_path
+
+
+# ── RunCheckpoint ────────────────────────────────────────────────
+
+
+def test_save_and_load_roundtrip(tmp_path: Path) -> None:
+    checkpoint = RunCheckpoint(tmp_path / "run")
+
+    assert checkpoint.save("tests", {"tests_run": 3, "gap_report": {"a.py": [1, 2]}})
+
+    assert checkpoint.load("tests") == {"tests_run": 3, "gap_report": {"a.py": [1, 2]}}
+    assert checkpoint.completed_stages() == ["tests"]
+
+
+def test_load_missing_or_corrupt_stage(tmp_path: Path) -> None:
+    checkpoint = RunCheckpoint(tmp_path / "run")
+    assert checkpoint.load("bugs") is None
+
+    checkpoint.path.mkdir()
+    (checkpoint.path / "bugs.pkl").write_bytes(b"not a pickle")
+    assert checkpoint.load("bugs") is None
+
+
+def test_unpicklable_fragment_is_not_saved(tmp_path: Path) -> None:
+    checkpoint = RunCheckpoint(tmp_path / "run")
+
+    assert not checkpoint.save("tests", {"callback": lambda: None})
+    assert checkpoint.completed_stages() == []
+
+
+# ── open_run ─────────────────────────────────────────────────────
+
+
+def test_same_inputs_reuse_run(tmp_path: Path) -> None:
+    root = _git_project(tmp_path)
+
+    first = open_run(root, {"test_type": "unit"})
+    assert first is not None
+    first.save("tests", {"tests_run": 1})
+    second = open_run(root, {"test_type": "unit"})
+
+    assert second is not None
+    assert second.run_id == first.run_id
+    assert second.load("tests") == {"tests_run": 1}
+
+
+def test_changed_inputs_start_new_run(tmp_path: Path) -> None:
+    root = _git_project(tmp_path)
+    base = open_run(root, {"test_type": "unit"})
+    assert base is not None
+
+    other_options = open_run(root, {"test_type": "e2e"})
+    (root / "app.py").write_text("def f():\n    return 2\n")
+    edited = open_run(root, {"test_type": "unit"})
+    (root / ".nit.yml").write_text("llm:\n  model: other\n")
+    reconfigured = open_run(root, {"test_type": "unit"})
+
+    run_ids = {base.run_id}
+    for run in (other_options, edited, reconfigured):
+        assert run is not None
+        run_ids.add(run.run_id)
+    assert len(run_ids) == 4
+
+
+def test_tool_outputs_keep_run_id(tmp_path: Path) -> None:
+    root = _git_project(tmp_path)
+    base = open_run(root, {})
+    assert base is not None
+
+    run_ids = set()
+    for stamp in range(3):
+        (root / "coverage.json").write_text(f'{{"meta": {{"timestamp": "{stamp}"}}}}')
+        (root / "notes.txt").write_text(str(stamp))
+        run = open_run(root, {})
+        assert run is not None
+        run_ids.add(run.run_id)
+
+    assert run_ids == {base.run_id}
+
+
+def test_checkpoints_are_git_ignored(tmp_path: Path) -> None:
+    root = _git_project(tmp_path)
+    run = open_run(root, {})
+    assert run is not None
+    run.save("tests", {"tests_run": 1})
+
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=all"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert ".nit/runs" not in status.stdout
+
+
+def test_old_runs_are_pruned(tmp_path: Path) -> None:
+    root = _git_project(tmp_path)
+    for index in range(4):
+        (root / "app.py").write_text(f"x = {index}\n")
+        run = open_run(root, {}, max_runs=2)
+        assert run is not None
+        run.save("tests", {"index": index})
+
+    runs = [p for p in (root / ".nit" / "runs").iterdir() if p.is_dir()]
+    assert len(runs) == 2
+
+
+def test_outside_git_returns_none(tmp_path: Path) -> None:
+    assert open_run(tmp_path, {}) is None
@@ -21,6 +21,7 @@ from nit.agents.analyzers.code import CodeMap
 from nit.agents.analyzers.security import (
     CWE_MAP,
     DEFAULT_SEVERITY,
+    MAX_BATCH_FINDINGS,
     MAX_LLM_VALIDATIONS,
     SecurityAnalysisTask,
     SecurityAnalyzer,
@@ -28,10 +29,17 @@ from nit.agents.analyzers.security import (
     SecurityReport,
     SecuritySeverity,
     VulnerabilityType,
+    _code_excerpt,
     _deduplicate,
     _language_from_path,
+    _parse_batch_validation,
     _parse_llm_validation,
 )
+from nit.agents.analyzers.security_cache import SECURITY_CACHE_PATH, SecurityScanCache
+from nit.agents.analyzers.security_patterns.base import (
+    get_patterns_for_language,
+    pattern_set_version,
+)
 from nit.agents.base import TaskInput, TaskStatus
 from nit.parsing.treesitter import FunctionInfo
 
@@ -511,3 +519,265 @@ class TestLLMValidation:
         ]
         await analyzer._validate_with_llm(findings)
         assert mock_engine.generate.call_count == MAX_LLM_VALIDATIONS
+
+
+# ── Batched LLM validation ──────────────────────────────────────
+
+
+class TestBatchedValidation:
+    """Findings of one file share a single JSON-answered request."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_per_file(self, tmp_project: Path) -> None:
+        engine = _validating_engine(
+            'Verdicts:\n```json\n[{"id": 1, "is_valid": true, "confidence": 0.9},'
+            ' {"id": 2, "is_valid": false, "confidence": 0.2}]\n```'
+        )
+        analyzer = SecurityAnalyzer(project_root=tmp_project, llm_engine=engine)
+        findings = [
+            _make_finding(confidence=0.7, line_number=5),
+            _make_finding(confidence=0.9, line_number=2),
+            _make_finding(confidence=0.7, line_number=3),
+        ]
+
+        result = await analyzer._validate_with_llm(findings, batched=True)
+
+        engine.generate.assert_called_once()
+        assert [(f.line_number, f.detection_method) for f in result] == [
+            (2, "heuristic"),
+            (3, "llm_validated"),
+        ]
+        assert result[1].confidence == pytest.approx(0.9)
+        prompt = engine.generate.call_args.args[0].messages[-1].content
+        assert "### Finding 1" in prompt
+        assert "### Finding 2" in prompt
+        assert prompt.count('cursor.execute(f"SELECT * FROM users') == 1
+
+    @pytest.mark.asyncio
+    async def test_verdicts_follow_line_order(self, tmp_project: Path) -> None:
+        engine = _validating_engine(
+            '[{"id": 1, "is_valid": false}, {"id": 2, "is_valid": true, "confidence": 0.95}]'
+        )
+        analyzer = SecurityAnalyzer(project_root=tmp_project, llm_engine=engine)
+        findings = [
+            _make_finding(confidence=0.7, line_number=5),
+            _make_finding(confidence=0.7, line_number=3),
+        ]
+
+        [kept] = await analyzer._validate_with_llm(findings, batched=True)
+
+        assert kept.line_number == 5
+        assert kept.confidence == pytest.approx(0.95)
+        assert kept.detection_method == "llm_validated"
+
+    @pytest.mark.asyncio
+    async def test_files_are_validated_concurrently(self, tmp_project: Path) -> None:
+        engine = _validating_engine("IS_VALID: true\nCONFIDENCE: 0.85")
+        analyzer = SecurityAnalyzer(project_root=tmp_project, llm_engine=engine)
+        findings = [
+            _make_finding(confidence=0.7, file_path=f"mod{i}.py")
+            for i in range(MAX_LLM_VALIDATIONS + 3)
+        ]
+
+        result = await analyzer._validate_with_llm(findings, batched=True)
+
+        assert engine.generate.call_count == MAX_LLM_VALIDATIONS
+        methods = [f.detection_method for f in result]
+        assert methods.count("llm_validated") == MAX_LLM_VALIDATIONS
+        assert methods.count("heuristic") == 3
+
+    @pytest.mark.asyncio
+    async def test_large_files_are_split(self, tmp_project: Path) -> None:
+        engine = _validating_engine("[]")
+        analyzer = SecurityAnalyzer(project_root=tmp_project, llm_engine=engine)
+        findings = [
+            _make_finding(confidence=0.7, line_number=i) for i in range(MAX_BATCH_FINDINGS + 1)
+        ]
+
+        result = await analyzer._validate_with_llm(findings, batched=True)
+
+        assert engine.generate.call_count == 2
+        assert len(result) == MAX_BATCH_FINDINGS + 1
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_keeps_findings(self, tmp_project: Path) -> None:
+        engine = _validating_engine("IS_VALID: false")
+        analyzer = SecurityAnalyzer(project_root=tmp_project, llm_engine=engine)
+        findings = [_make_finding(confidence=0.7, line_number=i) for i in (3, 5)]
+
+        result = await analyzer._validate_with_llm(findings, batched=True)
+
+        assert [f.detection_method for f in result] == ["heuristic", "heuristic"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_uses_task_setting(self, tmp_path: Path) -> None:
+        root = tmp_path / "project"
+        code_maps = _weak_hash_project(root)
+        (root / "other.py").write_text("import hashlib\nhashlib.md5(a)\nhashlib.sha1(b)\n")
+        code_maps["other.py"] = CodeMap(file_path="other.py", language="python", functions=[])
+        engine = _validating_engine('[{"id": 1, "is_valid": true}, {"id": 2, "is_valid": true}]')
+        analyzer = SecurityAnalyzer(project_root=root, llm_engine=engine, use_cache=False)
+
+        report = await analyzer.analyze(
+            SecurityAnalysisTask(
+                code_maps=code_maps, confidence_threshold=0.0, batch_validation=True
+            )
+        )
+
+        assert engine.generate.call_count == 2
+        assert len(report.findings) == 3
+
+    def test_parse_batch_validation(self) -> None:
+        text = (
+            '[{"id": 1, "is_valid": "false", "confidence": 0.3},'
+            ' {"id": "2", "is_valid": true, "confidence": 7},'
+            ' {"id": 3, "confidence": 0.9}, {"id": 4, "is_valid": "maybe"},'
+            ' {"is_valid": true}, "noise"]'
+        )
+
+        assert _parse_batch_validation(text) == {1: (False, 0.3), 2: (True, 1.0)}
+        assert _parse_batch_validation('{"id": 1}') == {}
+        assert _parse_batch_validation("[not json]") == {}
+
+    def test_code_excerpt_merges_windows(self) -> None:
+        source = "\n".join(f"line {n}" for n in range(1, 21))
+
+        excerpt = _code_excerpt(source, [2, 6, 18, None, 99])
+
+        numbers = [int(row.split("|")[0]) for row in excerpt.splitlines() if "|" in row]
+        assert numbers == [*range(1, 10), *range(15, 21)]
+        assert excerpt.count("...") == 1
+
+
+# ── Persisted scan cache ────────────────────────────────────────
+
+
+def _weak_hash_project(root: Path) -> dict[str, Any]:
+    """Project with an MD5 use (medium confidence, so it gets validated)."""
+    root.mkdir(exist_ok=True)
+    (root / "digest.py").write_text("import hashlib\ndef digest(x):\n    return hashlib.md5(x)\n")
+    return {"digest.py": CodeMap(file_path="digest.py", language="python", functions=[])}
+
+
+def _validating_engine(text: str) -> AsyncMock:
+    mock_engine = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.text = text
+    mock_engine.generate = AsyncMock(return_value=mock_response)
+    return mock_engine
+
+
+class TestScanCache:
+    """Unchanged files reuse matches and LLM verdicts from earlier runs."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_not_rescanned(
+        self, tmp_project: Path, code_maps_with_vuln: dict[str, Any], monkeypatch: Any
+    ) -> None:
+        analyzer = SecurityAnalyzer(project_root=tmp_project, enable_llm_validation=False)
+        task = SecurityAnalysisTask(code_maps=code_maps_with_vuln, confidence_threshold=0.0)
+        first = await analyzer.analyze(task)
+        assert (tmp_project / SECURITY_CACHE_PATH).is_file()
+
+        patterns = get_patterns_for_language("python")
+        monkeypatch.setattr(type(patterns), "scan", pytest.fail)
+        second = await SecurityAnalyzer(
+            project_root=tmp_project, enable_llm_validation=False
+        ).analyze(task)
+
+        assert second.findings == first.findings
+        assert second.findings
+
+    @pytest.mark.asyncio
+    async def test_changed_files_are_rescanned(
+        self, tmp_project: Path, code_maps_with_vuln: dict[str, Any]
+    ) -> None:
+        analyzer = SecurityAnalyzer(project_root=tmp_project, enable_llm_validation=False)
+        task = SecurityAnalysisTask(code_maps=code_maps_with_vuln, confidence_threshold=0.0)
+        assert (await analyzer.analyze(task)).findings
+
+        (tmp_project / "app.py").write_text("def get_user(user_id):\n    return user_id\n")
+
+        assert (await analyzer.analyze(task)).findings == []
+
+    @pytest.mark.asyncio
+    async def test_llm_verdicts_are_reused(self, tmp_path: Path) -> None:
+        code_maps = _weak_hash_project(tmp_path / "project")
+        task = SecurityAnalysisTask(code_maps=code_maps, confidence_threshold=0.0)
+        engine = _validating_engine("IS_VALID: true\nCONFIDENCE: 0.9")
+
+        for _ in range(2):
+            analyzer = SecurityAnalyzer(project_root=tmp_path / "project", llm_engine=engine)
+            [finding] = (await analyzer.analyze(task)).findings
+            assert finding.detection_method == "llm_validated"
+            assert finding.confidence == pytest.approx(0.9)
+        engine.generate.assert_called_once()
+
+        (tmp_path / "project" / "digest.py").write_text(
+            "import hashlib\n\ndef digest(x):\n    return hashlib.md5(x)\n"
+        )
+        await analyzer.analyze(task)
+        assert engine.generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unparsed_verdicts_are_not_cached(self, tmp_path: Path) -> None:
+        code_maps = _weak_hash_project(tmp_path / "project")
+        task = SecurityAnalysisTask(code_maps=code_maps, confidence_threshold=0.0)
+        engine = _validating_engine("")
+
+        for _ in range(2):
+            analyzer = SecurityAnalyzer(project_root=tmp_path / "project", llm_engine=engine)
+            [finding] = (await analyzer.analyze(task)).findings
+            assert finding.confidence == pytest.approx(0.75)
+
+        assert engine.generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_entries_without_is_valid_are_not_cached(self, tmp_path: Path) -> None:
+        root = tmp_path / "project"
+        code_maps = _weak_hash_project(root)
+        (root / "digest.py").write_text("import hashlib\nhashlib.md5(a)\nhashlib.sha1(b)\n")
+        task = SecurityAnalysisTask(
+            code_maps=code_maps, confidence_threshold=0.0, batch_validation=True
+        )
+        engine = _validating_engine('[{"id": 1, "is_valid": false}, {"id": 2}]')
+
+        analyzer = SecurityAnalyzer(project_root=root, llm_engine=engine)
+
+        [finding] = (await analyzer.analyze(task)).findings
+        assert (finding.line_number, finding.detection_method) == (3, "heuristic")
+
+        # The dismissal is reused; the finding without a verdict is asked about again
+        await analyzer.analyze(task)
+        assert engine.generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dismissals_are_reused(self, tmp_path: Path) -> None:
+        code_maps = _weak_hash_project(tmp_path / "project")
+        task = SecurityAnalysisTask(code_maps=code_maps, confidence_threshold=0.0)
+        engine = _validating_engine("IS_VALID: false\nCONFIDENCE: 0.1")
+        analyzer = SecurityAnalyzer(project_root=tmp_path / "project", llm_engine=engine)
+
+        assert (await analyzer.analyze(task)).findings == []
+        assert (await analyzer.analyze(task)).findings == []
+        engine.generate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(
+        self, tmp_project: Path, code_maps_with_vuln: dict[str, Any]
+    ) -> None:
+        analyzer = SecurityAnalyzer(
+            project_root=tmp_project, enable_llm_validation=False, use_cache=False
+        )
+        await analyzer.analyze(SecurityAnalysisTask(code_maps=code_maps_with_vuln))
+
+        assert not (tmp_project / SECURITY_CACHE_PATH).exists()
+
+    def test_stale_pattern_version_discards_entries(self) -> None:
+        cache = SecurityScanCache(pattern_version="old")
+        cache.store("app.py", "abc", [])
+        data = cache.to_dict()
+
+        assert SecurityScanCache.from_dict(data).lookup("app.py", "abc") is None
+        data["version"] = pattern_set_version()
+        assert SecurityScanCache.from_dict(data).lookup("app.py", "abc") is not None
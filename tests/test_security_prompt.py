@@ -4,6 +4,7 @@ Covers:
 - SecurityAnalysisContext data model
 - SecurityAnalysisPrompt rendering
 - Validation prompt structure (system + user messages)
+- Batched validation prompt
 """
 
 from __future__ import annotations
@@ -11,6 +12,8 @@ from __future__ import annotations
 from nit.llm.prompts.security_analysis import (
     SecurityAnalysisContext,
     SecurityAnalysisPrompt,
+    SecurityBatchContext,
+    SecurityBatchFinding,
 )
 
 # ── SecurityAnalysisContext ──────────────────────────────────────
@@ -152,3 +155,44 @@ class TestSecurityAnalysisPrompt:
         assert "path_traversal" in user_msg
         assert "files.py" in user_msg
         assert "python" in user_msg
+
+
+# ── Batched validation ───────────────────────────────────────────
+
+
+class TestBatchValidationPrompt:
+    """render_batch_validation: shared code, one entry per finding."""
+
+    def test_render_batch_validation(self) -> None:
+        ctx = SecurityBatchContext(
+            file_path="app/db.py",
+            language="python",
+            code_excerpt="   12 | cursor.execute(query)\n   13 | os.system(cmd)",
+            findings=[
+                SecurityBatchFinding(
+                    finding_id=1,
+                    vulnerability_type="sql_injection",
+                    line_number=12,
+                    code_snippet="cursor.execute(query)",
+                    heuristic_description="Query built from input",
+                ),
+                SecurityBatchFinding(
+                    finding_id=2,
+                    vulnerability_type="command_injection",
+                    line_number=None,
+                    code_snippet="os.system(cmd)",
+                    heuristic_description="Shell command from input",
+                ),
+            ],
+        )
+
+        rendered = SecurityAnalysisPrompt().render_batch_validation(ctx)
+
+        system, user = rendered.messages
+        assert system.role == "system"
+        assert "security" in system.content.lower()
+        assert user.content.count("   12 | cursor.execute(query)") == 1
+        assert "### Finding 1" in user.content
+        assert "**Line**: unknown" in user.content
+        assert '"is_valid"' in user.content
+        assert "JSON array" in user.content
@@ -12,18 +12,21 @@ Covers:
 - _call_llm_analysis prompt construction
 - _parse_llm_response section splitting
 - _parse_gap_section field extraction and defaults
-- Caching of function analysis results
+- Caching of function analysis results, within and across runs
+- Concurrent analysis and reuse of code map function bodies
 - Confidence filtering
 - Error handling and edge cases
 """
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from nit.agents.analyzers.code import CodeMap
 from nit.agents.analyzers.coverage import CoverageGapReport, FunctionGap, GapPriority
 from nit.agents.analyzers.semantic_gap import (
     DEFAULT_CONFIDENCE_THRESHOLD,
@@ -33,7 +36,10 @@ from nit.agents.analyzers.semantic_gap import (
     SemanticGapDetector,
     SemanticGapTask,
 )
+from nit.agents.analyzers.semantic_gap_cache import SEMANTIC_GAP_CACHE_PATH, SemanticGapCache
 from nit.agents.base import TaskInput, TaskStatus
+from nit.llm.prompts.semantic_gap import NO_GAPS_MARKER
+from nit.parsing.treesitter import FunctionInfo, ParameterInfo
 
 # ── Helpers ───────────────────────────────────────────────────────
 
@@ -255,6 +261,177 @@ class TestSemanticGapDetectorRun:
         assert result.result["functions_analyzed"] == 2
 
 
+# ── Concurrency and persisted cache ───────────────────────────────
+
+_EDGE_CASE_RESPONSE = "**CATEGORY**: edge_case\n**DESCRIPTION**: zero input\n**CONFIDENCE**: 0.9\n"
+
+
+def _code_map(file_path: str, name: str, body: str) -> CodeMap:
+    function = FunctionInfo(
+        name=name,
+        start_line=10,
+        end_line=30,
+        parameters=[ParameterInfo(name="x", type_annotation="int")],
+        body_text=body,
+    )
+    return CodeMap(file_path=file_path, language="python", functions=[function])
+
+
+def _prompt_text(engine: AsyncMock) -> str:
+    request = engine.generate.call_args.args[0]
+    return "\n".join(message.content for message in request.messages)
+
+
+class TestConcurrentAnalysis:
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, tmp_path: Path) -> None:
+        detector, engine = _make_detector(tmp_path)
+        running = peak = 0
+
+        async def generate(_request: object) -> MagicMock:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return MagicMock(text=_EDGE_CASE_RESPONSE)
+
+        engine.generate.side_effect = generate
+        gaps = [_make_function_gap(function_name=f"func{i}") for i in range(6)]
+        code_maps = {
+            "src/calc.py": CodeMap(
+                file_path="src/calc.py",
+                language="python",
+                functions=[
+                    FunctionInfo(name=f"func{i}", start_line=1, end_line=2, body_text=f"return {i}")
+                    for i in range(6)
+                ],
+            )
+        }
+        task = SemanticGapTask(
+            task_type="semantic_gap",
+            target="project",
+            function_gaps=gaps,
+            code_maps=code_maps,
+            max_concurrency=2,
+        )
+        result = await detector.run(task)
+
+        assert engine.generate.call_count == 6
+        assert peak == 2
+        assert [g.function_name for g in result.result["semantic_gaps"]] == [
+            f"func{i}" for i in range(6)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_uses_code_map_body(self, tmp_path: Path) -> None:
+        detector, engine = _make_detector(tmp_path)
+        engine.generate.return_value = MagicMock(text=_EDGE_CASE_RESPONSE)
+        task = SemanticGapTask(
+            task_type="semantic_gap",
+            target="project",
+            function_gaps=[_make_function_gap()],
+            code_maps={"src/calc.py": _code_map("src/calc.py", "compute", "return x * 2")},
+        )
+        # No source file on disk: the body comes from the code map
+        result = await detector.run(task)
+
+        assert len(result.result["semantic_gaps"]) == 1
+        assert "compute(x: int)\nreturn x * 2" in _prompt_text(engine)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_body_is_not_reanalyzed(self, tmp_path: Path) -> None:
+        code_maps = {"src/calc.py": _code_map("src/calc.py", "compute", "return x * 2")}
+        task = SemanticGapTask(
+            task_type="semantic_gap",
+            target="project",
+            function_gaps=[_make_function_gap()],
+            code_maps=code_maps,
+        )
+        first, first_engine = _make_detector(tmp_path)
+        first_engine.generate.return_value = MagicMock(text=_EDGE_CASE_RESPONSE)
+        first_gaps = (await first.run(task)).result["semantic_gaps"]
+        assert (tmp_path / SEMANTIC_GAP_CACHE_PATH).is_file()
+
+        second, second_engine = _make_detector(tmp_path)
+        second_gaps = (await second.run(task)).result["semantic_gaps"]
+
+        second_engine.generate.assert_not_called()
+        assert second_gaps == first_gaps
+
+        code_maps["src/calc.py"] = _code_map("src/calc.py", "compute", "return x * 3")
+        third, third_engine = _make_detector(tmp_path)
+        await third.run(task)
+        assert third_engine.generate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_gaps_are_filtered_by_threshold(self, tmp_path: Path) -> None:
+        task = SemanticGapTask(
+            task_type="semantic_gap",
+            target="project",
+            function_gaps=[_make_function_gap()],
+            code_maps={"src/calc.py": _code_map("src/calc.py", "compute", "return x")},
+        )
+        detector, engine = _make_detector(tmp_path)
+        engine.generate.return_value = MagicMock(text=_EDGE_CASE_RESPONSE)
+        await detector.run(task)
+
+        strict, strict_engine = _make_detector(tmp_path, confidence_threshold=0.95)
+        result = await strict.run(task)
+
+        strict_engine.generate.assert_not_called()
+        assert result.result["semantic_gaps"] == []
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_not_cached(self, tmp_path: Path) -> None:
+        task = SemanticGapTask(
+            task_type="semantic_gap",
+            target="project",
+            function_gaps=[_make_function_gap()],
+            code_maps={"src/calc.py": _code_map("src/calc.py", "compute", "return x")},
+        )
+        detector, engine = _make_detector(tmp_path)
+        engine.generate.side_effect = RuntimeError("LLM down")
+        await detector.run(task)
+
+        retry, retry_engine = _make_detector(tmp_path)
+        retry_engine.generate.return_value = MagicMock(text=_EDGE_CASE_RESPONSE)
+        result = await retry.run(task)
+
+        assert retry_engine.generate.call_count == 1
+        assert len(result.result["semantic_gaps"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_unparsed_reply_is_not_cached(self, tmp_path: Path) -> None:
+        task = SemanticGapTask(
+            task_type="semantic_gap",
+            target="project",
+            function_gaps=[_make_function_gap()],
+            code_maps={"src/calc.py": _code_map("src/calc.py", "compute", "return x")},
+        )
+        for reply in ("", "I could not analyse this function."):
+            detector, engine = _make_detector(tmp_path)
+            engine.generate.return_value = MagicMock(text=reply)
+            assert (await detector.run(task)).result["semantic_gaps"] == []
+            assert engine.generate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_no_gaps_reply_is_cached(self, tmp_path: Path) -> None:
+        task = SemanticGapTask(
+            task_type="semantic_gap",
+            target="project",
+            function_gaps=[_make_function_gap()],
+            code_maps={"src/calc.py": _code_map("src/calc.py", "compute", "return x")},
+        )
+        detector, engine = _make_detector(tmp_path)
+        engine.generate.return_value = MagicMock(text=NO_GAPS_MARKER)
+        await detector.run(task)
+
+        again, again_engine = _make_detector(tmp_path)
+        assert (await again.run(task)).result["semantic_gaps"] == []
+        again_engine.generate.assert_not_called()
+
+
 # ── _prioritize_gaps ──────────────────────────────────────────────
 
 
@@ -277,6 +454,12 @@ class TestPrioritizeGaps:
         detector, _ = _make_detector(tmp_path)
         assert detector._prioritize_gaps([]) == []
 
+    def test_limit_keeps_sorted_prefix(self, tmp_path: Path) -> None:
+        detector, _ = _make_detector(tmp_path)
+        priorities = list(GapPriority)
+        gaps = [_make_function_gap(priority=priorities[i % 4], complexity=i % 7) for i in range(40)]
+        assert detector._prioritize_gaps(gaps, limit=5) == detector._prioritize_gaps(gaps)[:5]
+
 
 # ── _extract_function_code ────────────────────────────────────────
 
@@ -444,3 +627,15 @@ class TestSemanticGapDataclass:
         assert gap.suggested_test_cases == []
         assert gap.reasoning == ""
         assert gap.line_number is None
+
+
+class TestSemanticGapCache:
+    def test_only_changes_mark_the_cache_dirty(self) -> None:
+        cache = SemanticGapCache()
+        cache.store("k", [{"category": "edge_case"}])
+        assert cache.dirty
+
+        loaded = SemanticGapCache.from_dict(cache.to_dict())
+        assert loaded.lookup("k") == [{"category": "edge_case"}]
+        assert loaded.lookup("missing") is None
+        assert not loaded.dirty
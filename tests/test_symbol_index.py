@@ -0,0 +1,252 @@
+"""Tests for the project symbol index (nit.parsing.symbol_index)."""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from nit.parsing import symbol_index
+from nit.parsing.symbol_index import (
+    KIND_CLASS,
+    KIND_METHOD,
+    SYMBOL_INDEX_CACHE_PATH,
+    SymbolIndex,
+    load_symbol_index,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(root: Path, files: dict[str, str]) -> list[str]:
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return list(files)
+
+
+def _index(root: Path, files: dict[str, str]) -> SymbolIndex:
+    index = SymbolIndex(root)
+    index.update(_write(root, files))
+    return index
+
+
+PYTHON_PROJECT = {
+    "src/shop/__init__.py": "",
+    "src/shop/db.py": "def save(item):\n    return item\n",
+    "src/shop/models.py": (
+        "from shop.db import save\n\n"
+        "class Cart:\n"
+        "    def add(self, item):\n"
+        "        return save(item)\n"
+    ),
+    "src/shop/api.py": (
+        "from . import models\n\n"
+        "def checkout(cart):\n"
+        "    cart.add(1)\n"
+        "    return total(cart)\n\n"
+        "def total(cart):\n"
+        "    return 0\n"
+    ),
+    "scripts/report.py": "import shop.api\n\ndef main():\n    shop.api.checkout(None)\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index_cache() -> None:
+    symbol_index._index_cache.clear()
+
+
+# ── Queries ──────────────────────────────────────────────────────
+
+
+def test_definitions_by_bare_and_qualified_name(tmp_path: Path) -> None:
+    index = _index(tmp_path, PYTHON_PROJECT)
+
+    [method] = index.definitions("add")
+
+    assert method == index.definitions("Cart.add")[0]
+    assert (method.kind, method.path, method.start_line) == (KIND_METHOD, "src/shop/models.py", 4)
+    assert [s.kind for s in index.definitions("Cart")] == [KIND_CLASS]
+    assert index.definitions("missing") == []
+
+
+def test_callers_across_files(tmp_path: Path) -> None:
+    index = _index(tmp_path, PYTHON_PROJECT)
+
+    sites = index.callers("save")
+    checkout = index.callers("checkout")
+
+    assert [(s.path, s.caller, s.line) for s in sites] == [("src/shop/models.py", "Cart.add", 5)]
+    assert [(s.path, s.caller) for s in checkout] == [("scripts/report.py", "main")]
+    assert [s.caller for s in index.callers("Cart.add")] == ["checkout"]
+    assert [s.caller for s in index.callers("total", path="src/shop/api.py")] == ["checkout"]
+    assert index.callers("save", path="src/shop/api.py") == []
+
+
+def test_dependencies_and_transitive_dependents(tmp_path: Path) -> None:
+    index = _index(tmp_path, PYTHON_PROJECT)
+
+    assert index.dependencies("src/shop/models.py") == ["src/shop/db.py"]
+    assert index.dependencies(tmp_path / "src/shop/api.py") == [
+        "src/shop/__init__.py",
+        "src/shop/models.py",
+    ]
+    assert index.dependents("src/shop/db.py", transitive=False) == ["src/shop/models.py"]
+    assert index.dependents("src/shop/db.py") == [
+        "scripts/report.py",
+        "src/shop/api.py",
+        "src/shop/models.py",
+    ]
+
+
+def test_import_resolution_per_language(tmp_path: Path) -> None:
+    index = _index(
+        tmp_path,
+        {
+            "web/app.ts": "import { util } from './lib/util.js';\nimport x from 'react';\n",
+            "web/lib/util.ts": "export function util() { return 1; }\n",
+            "web/lib/index.js": "import { util } from '.';\n",
+            "java/com/acme/App.java": "import com.acme.model.User;\nclass App {}\n",
+            "java/com/acme/model/User.java": "package com.acme.model;\nclass User {}\n",
+            "go/cmd/main.go": 'package main\nimport "example.com/repo/pkg/util"\n',
+            "go/pkg/util/a.go": "package util\n",
+            "go/pkg/util/b.go": "package util\n",
+            "c/main.c": '#include "lib/math.h"\n#include <stdio.h>\n',
+            "c/lib/math.h": "int add(int a, int b);\n",
+            "rs/src/main.rs": "use crate::net::client::{get, post};\nuse std::io;\n",
+            "rs/src/net/client.rs": "pub fn get() {}\n",
+            "cs/App.cs": "using Acme.Models;\nclass App {}\n",
+        },
+    )
+
+    assert index.dependencies("web/app.ts") == ["web/lib/util.ts"]
+    assert index.dependencies("java/com/acme/App.java") == ["java/com/acme/model/User.java"]
+    assert index.dependencies("go/cmd/main.go") == ["go/pkg/util/a.go", "go/pkg/util/b.go"]
+    assert index.dependencies("c/main.c") == ["c/lib/math.h"]
+    assert index.dependencies("rs/src/main.rs") == ["rs/src/net/client.rs"]
+    assert index.dependencies("cs/App.cs") == []
+
+
+def test_absolute_python_import_needs_an_unambiguous_module(tmp_path: Path) -> None:
+    index = _index(
+        tmp_path,
+        {
+            "app.py": "import utils\nimport config\n",
+            "pkg/__init__.py": "",
+            "pkg/utils.py": "def helper():\n    pass\n",
+            "src/config.py": "DEBUG = False\n",
+            "tools/config.py": "DEBUG = True\n",
+        },
+    )
+
+    # pkg/utils.py is ``pkg.utils``; config.py exists in two source roots
+    assert index.dependencies("app.py") == []
+
+
+# ── Incremental updates and persistence ──────────────────────────
+
+
+def test_update_reindexes_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths = _write(tmp_path, PYTHON_PROJECT)
+    index = SymbolIndex(tmp_path)
+    assert index.update(paths) == len(paths)
+
+    indexed: list[Path] = []
+    real_index_file = symbol_index._index_file
+
+    def recording_index_file(
+        path: Path, relative: str, signature: tuple[int, int]
+    ) -> symbol_index._FileEntry | None:
+        indexed.append(path)
+        return real_index_file(path, relative, signature)
+
+    monkeypatch.setattr(symbol_index, "_index_file", recording_index_file)
+    assert index.update(paths) == 0
+
+    db = tmp_path / "src/shop/db.py"
+    db.write_text("def save(item):\n    return item\n\n\ndef purge():\n    save(None)\n")
+    os.utime(db, ns=(db.stat().st_mtime_ns + 10**9,) * 2)
+
+    assert index.update(paths) == 1
+    assert indexed == [db]
+    assert [s.caller for s in index.callers("save")] == ["purge", "Cart.add"]
+
+
+def test_new_module_is_resolved_for_existing_importers(tmp_path: Path) -> None:
+    files = {"app.py": "from helpers import tidy\n\ndef run():\n    tidy()\n"}
+    index = _index(tmp_path, files)
+    assert index.dependencies("app.py") == []
+
+    index.update([*_write(tmp_path, {"helpers.py": "def tidy():\n    pass\n"}), "app.py"])
+
+    assert index.dependencies("app.py") == ["helpers.py"]
+
+
+def test_removed_files_are_dropped(tmp_path: Path) -> None:
+    paths = _write(tmp_path, PYTHON_PROJECT)
+    index = SymbolIndex(tmp_path)
+    index.update(paths)
+
+    (tmp_path / "src/shop/db.py").unlink()
+    index.update(paths)
+
+    assert not index.has_file("src/shop/db.py")
+    assert index.definitions("save") == []
+    assert index.dependencies("src/shop/models.py") == []
+
+
+def test_load_persists_and_reuses_the_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths = _write(tmp_path, PYTHON_PROJECT)
+    load_symbol_index(tmp_path, paths)
+    data = json.loads((tmp_path / SYMBOL_INDEX_CACHE_PATH).read_text())
+    assert set(data["files"]) == set(paths)
+
+    symbol_index._index_cache.clear()
+    monkeypatch.setattr(symbol_index, "_index_file", pytest.fail)
+    index = load_symbol_index(tmp_path, paths)
+
+    assert index.dependents("src/shop/db.py", transitive=False) == ["src/shop/models.py"]
+    assert [s.caller for s in index.callers("save")] == ["Cart.add"]
+
+
+def test_load_without_paths_indexes_the_project(tmp_path: Path) -> None:
+    paths = _write(tmp_path, PYTHON_PROJECT)
+    _write(tmp_path, {"node_modules/lib/index.js": "export const x = 1;\n", "notes.txt": "x\n"})
+
+    index = load_symbol_index(tmp_path, persist=False)
+
+    assert index.file_count == len(paths)
+    assert [s.name for s in index.defined_in("src/shop/db.py")] == ["save"]
+
+
+def test_concurrent_loads_share_one_index(tmp_path: Path) -> None:
+    paths = _write(tmp_path, PYTHON_PROJECT)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        indexes = list(pool.map(lambda _: load_symbol_index(tmp_path, paths), range(8)))
+
+    assert all(index is indexes[0] for index in indexes)
+    assert indexes[0].file_count == len(paths)
+    data = json.loads((tmp_path / SYMBOL_INDEX_CACHE_PATH).read_text())
+    assert set(data["files"]) == set(paths)
+
+
+def test_unreadable_cache_is_rebuilt(tmp_path: Path) -> None:
+    paths = _write(tmp_path, PYTHON_PROJECT)
+    cache = tmp_path / SYMBOL_INDEX_CACHE_PATH
+    cache.parent.mkdir(parents=True)
+    cache.write_text('{"format": 1, "files": {"a.py": []}}')
+
+    index = load_symbol_index(tmp_path, paths)
+
+    assert index.file_count == len(paths)
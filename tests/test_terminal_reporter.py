@@ -26,6 +26,7 @@ from nit.agents.reporters.terminal import (
 )
 from nit.models.coverage import CoverageReport, PackageCoverage
 from nit.models.test_result import TestResult
+from nit.telemetry.tracing import SPAN_LLM, SPAN_STAGE, Tracer, trace_span
 
 # ── Fixtures ────────────────────────────────────────────────────
 
@@ -1321,6 +1322,38 @@ class TestPrintSemanticGaps:
         assert mock_console.print.call_count == 2
 
 
+# ── print_trace_summary ────────────────────────────────────────
+
+
+class TestPrintTraceSummary:
+    """Tests for CLIReporter.print_trace_summary."""
+
+    def test_no_stages_prints_nothing(
+        self, cli_reporter: CLIReporter, mock_console: MagicMock
+    ) -> None:
+        cli_reporter.print_trace_summary(Tracer())
+        mock_console.print.assert_not_called()
+
+    def test_prints_stage_table_and_totals(
+        self, cli_reporter: CLIReporter, mock_console: MagicMock
+    ) -> None:
+        tracer = Tracer()
+        with (
+            tracer.activate(),
+            trace_span("tests", SPAN_STAGE),
+            trace_span("gpt-4o", SPAN_LLM) as span,
+        ):
+            assert span is not None
+            span.add_tokens(120)
+
+        cli_reporter.print_trace_summary(tracer)
+
+        tables = [c.args[0] for c in mock_console.print.call_args_list if c.args]
+        table = next(t for t in tables if isinstance(t, Table))
+        assert table.row_count == 1
+        assert any("1 LLM call(s), 120 tokens" in str(t) for t in tables)
+
+
 # ── Singleton instance ─────────────────────────────────────────
 
 
@@ -0,0 +1,201 @@
+"""Tests for the local tokenizer service (nit.llm.tokenizer)."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from nit.llm.context import ContextAssembler, _truncate_to_tokens
+from nit.llm.tokenizer import (
+    DEFAULT_ENCODING,
+    TRUNCATION_MARKER,
+    Tokenizer,
+    _vocab_dir,
+    get_tokenizer,
+    heuristic_tokenizer,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _ByteEncoding:
+    """One token per UTF-8 byte; counts calls to ``encode``."""
+
+    def __init__(self) -> None:
+        self.encode_calls = 0
+
+    def encode(self, text: str, *, disallowed_special: tuple[str, ...] = ()) -> list[int]:
+        self.encode_calls += 1
+        return list(text.encode("utf-8"))
+
+    def decode_bytes(self, tokens: list[int]) -> bytes:
+        return bytes(tokens)
+
+
+# ── Tokenizer ────────────────────────────────────────────────────
+
+
+def test_heuristic_count() -> None:
+    tokenizer = heuristic_tokenizer()
+    assert not tokenizer.is_exact
+    assert tokenizer.count("hello world") == 2
+
+
+def test_count_is_cached_by_content() -> None:
+    encoding = _ByteEncoding()
+    tokenizer = Tokenizer("bytes", encoding)
+    text = "x = 1\n" * 100
+
+    assert tokenizer.count(text) == len(text)
+    assert tokenizer.count("".join(["x = 1\n"] * 100)) == len(text)
+    assert encoding.encode_calls == 1
+
+
+def test_truncate_single_encode_keeps_lines() -> None:
+    encoding = _ByteEncoding()
+    tokenizer = Tokenizer("bytes", encoding)
+    text = "aaaa\nbbbb\ncccc\n"
+
+    result = tokenizer.truncate(text, 12)
+
+    assert result == "aaaa\nbbbb\n" + TRUNCATION_MARKER
+    assert encoding.encode_calls == 1
+
+
+def test_truncate_within_budget_returns_text() -> None:
+    tokenizer = Tokenizer("bytes", _ByteEncoding())
+    assert tokenizer.truncate("short\n", 100) == "short\n"
+
+
+def test_truncate_ignores_split_multibyte_character() -> None:
+    tokenizer = Tokenizer("bytes", _ByteEncoding())
+    text = "ok\nééé\n"
+    # Cut inside the second two-byte character
+    assert tokenizer.truncate(text, 6) == "ok\n" + TRUNCATION_MARKER
+
+
+def test_heuristic_truncate() -> None:
+    text = "short\n" * 50
+    result = heuristic_tokenizer().truncate(text, 5)
+    assert result == "short\n" * 3 + TRUNCATION_MARKER
+
+
+# ── get_tokenizer ────────────────────────────────────────────────
+
+
+@pytest.fixture
+def vocab_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A tiktoken cache directory holding (placeholder) vocab files."""
+    for name in ("bytes", DEFAULT_ENCODING):
+        url = f"https://openaipublic.blob.core.windows.net/encodings/{name}.tiktoken"
+        (tmp_path / hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()).write_text("")
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.usefixtures("vocab_dir")
+def test_get_tokenizer_loads_encoding_once() -> None:
+    with (
+        patch("nit.llm.tokenizer._tokenizers", {}),
+        patch("nit.llm.tokenizer._encoding_name_for", return_value="bytes"),
+        patch("nit.llm.tokenizer.tiktoken.get_encoding", return_value=_ByteEncoding()) as load,
+    ):
+        first = get_tokenizer("openai/gpt-4o")
+        second = get_tokenizer("gpt-4o")
+
+    assert first is second
+    assert first.is_exact
+    load.assert_called_once_with("bytes")
+
+
+@pytest.mark.usefixtures("vocab_dir")
+def test_get_tokenizer_falls_back_to_heuristic() -> None:
+    with (
+        patch("nit.llm.tokenizer._tokenizers", {}),
+        patch("nit.llm.tokenizer.tiktoken.get_encoding", side_effect=OSError("offline")),
+    ):
+        tokenizer = get_tokenizer("claude-sonnet-4-5")
+
+    assert tokenizer is heuristic_tokenizer()
+
+
+def test_missing_vocab_is_not_downloaded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+    with (
+        patch("nit.llm.tokenizer._tokenizers", {}),
+        patch("nit.llm.tokenizer.tiktoken.get_encoding") as load,
+        caplog.at_level(logging.WARNING, logger="nit.llm.tokenizer"),
+    ):
+        tokenizer = get_tokenizer("gpt-4")
+
+    assert tokenizer is heuristic_tokenizer()
+    load.assert_not_called()
+    assert "token counts are estimated" in caplog.text
+
+
+def test_bundled_litellm_vocab_is_used(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    package = tmp_path / "litellm"
+    (package / "litellm_core_utils" / "tokenizers").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    # setenv first so the variable _vocab_dir sets is removed afterwards
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", "")
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "litellm", raising=False)
+
+    vocab_dir = _vocab_dir()
+
+    assert vocab_dir == package / "litellm_core_utils" / "tokenizers"
+    assert os.environ["TIKTOKEN_CACHE_DIR"] == str(vocab_dir)
+
+
+@pytest.mark.usefixtures("vocab_dir")
+def test_unknown_model_uses_default_encoding() -> None:
+    with (
+        patch("nit.llm.tokenizer._tokenizers", {}),
+        patch("nit.llm.tokenizer.tiktoken.get_encoding", return_value=_ByteEncoding()) as load,
+    ):
+        get_tokenizer("anthropic/claude-sonnet-4-5")
+
+    load.assert_called_once_with(DEFAULT_ENCODING)
+
+
+# ── Context windowing ────────────────────────────────────────────
+
+
+def test_truncate_to_tokens_counts_logarithmically() -> None:
+    calls = 0
+
+    def counter(text: str) -> int:
+        nonlocal calls
+        calls += 1
+        return len(text) // 4
+
+    text = "0123456\n" * 1000
+    result = _truncate_to_tokens(text, 100, counter)
+
+    assert result == "0123456\n" * 50 + TRUNCATION_MARKER
+    assert calls < 20
+
+
+def test_assembler_uses_tokenizer_for_windowing(tmp_path: Path) -> None:
+    source = tmp_path / "big.py"
+    source.write_text("".join(f"x{i} = {i}\n" for i in range(2000)), encoding="utf-8")
+    encoding = _ByteEncoding()
+
+    assembler = ContextAssembler(
+        tmp_path, max_context_tokens=200, tokenizer=Tokenizer("bytes", encoding)
+    )
+    ctx = assembler.assemble(source)
+
+    assert ctx.source_code.endswith(TRUNCATION_MARKER)
+    assert len(ctx.source_code.encode("utf-8")) <= 200 + len(TRUNCATION_MARKER)
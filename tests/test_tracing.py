@@ -0,0 +1,206 @@
+"""Tests for local run tracing (nit.telemetry.tracing)."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pytest
+
+from nit.telemetry.tracing import (
+    SPAN_AGENT,
+    SPAN_LLM,
+    SPAN_STAGE,
+    Tracer,
+    current_span,
+    trace_span,
+    traced_async,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_traced_llm = functools.partial(traced_async, category=SPAN_LLM, name_of=lambda e: e.model_name)
+_traced_agent = functools.partial(traced_async, category=SPAN_AGENT, name_of=lambda a: a.name)
+
+
+@dataclass
+class _Response:
+    total_tokens: int
+
+
+class _Engine:
+    model_name = "test-model"
+
+    @_traced_llm
+    async def generate(self, tokens: int) -> _Response:
+        return _Response(total_tokens=tokens)
+
+
+class _Agent:
+    name = "agent"
+
+    def __init__(self, engine: _Engine) -> None:
+        self.engine = engine
+
+    @_traced_agent
+    async def run(self) -> int:
+        response = await self.engine.generate(5)
+        return response.total_tokens
+
+
+class _SubAgent(_Agent):
+    name = "sub"
+
+    @_traced_agent
+    async def run(self) -> int:
+        return await super().run()
+
+
+# ── Spans ────────────────────────────────────────────────────────
+
+
+def test_trace_span_without_tracer_records_nothing() -> None:
+    with trace_span("stage", SPAN_STAGE) as span:
+        assert span is None
+        assert current_span() is None
+
+
+def test_spans_nest_and_roll_up_tokens() -> None:
+    tracer = Tracer()
+    with tracer.activate(), trace_span("tests", SPAN_STAGE) as stage:
+        with trace_span("llm", SPAN_LLM) as call:
+            assert call is not None
+            call.add_tokens(10)
+        assert current_span() is stage
+
+    llm, tests = tracer.spans
+    assert llm.parent_id == tests.span_id
+    assert tests.tokens == 10
+    assert tests.duration_ms >= llm.duration_ms
+
+
+def test_failed_span_is_marked_as_error() -> None:
+    tracer = Tracer()
+    with (
+        tracer.activate(),
+        pytest.raises(ValueError, match="boom"),
+        trace_span("broken", SPAN_STAGE),
+    ):
+        raise ValueError("boom")
+
+    assert tracer.spans[0].status == "error"
+    assert tracer.spans[0].attributes["error"] == "boom"
+
+
+def test_subprocesses_are_counted() -> None:
+    tracer = Tracer()
+    with tracer.activate(), trace_span("tests", SPAN_STAGE):
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+    assert tracer.spans[0].subprocesses == 1
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="current RSS is read from /proc")
+def test_span_records_its_own_rss_delta() -> None:
+    tracer = Tracer()
+    with tracer.activate():
+        with trace_span("grow", SPAN_STAGE):
+            held = b"x" * (64 * 1024 * 1024)
+        with trace_span("idle", SPAN_STAGE):
+            pass
+        del held
+
+    by_name = {span.name: span for span in tracer.spans}
+    assert by_name["grow"].rss_delta_mb > 32
+    assert abs(by_name["idle"].rss_delta_mb) < 32
+    assert by_name["idle"].rss_start_mb >= by_name["grow"].rss_end_mb - 1
+
+
+async def test_spans_in_concurrent_tasks_attach_to_their_parent() -> None:
+    tracer = Tracer()
+
+    async def stage(name: str) -> None:
+        with trace_span(name, SPAN_STAGE):
+            await asyncio.sleep(0.01)
+            with trace_span(f"{name}-llm", SPAN_LLM) as span:
+                assert span is not None
+                span.add_tokens(3)
+
+    with tracer.activate():
+        await asyncio.gather(stage("a"), stage("b"))
+
+    by_name = {span.name: span for span in tracer.spans}
+    assert by_name["a-llm"].parent_id == by_name["a"].span_id
+    assert by_name["b-llm"].parent_id == by_name["b"].span_id
+    assert by_name["a"].tokens == 3
+    assert by_name["b"].tokens == 3
+
+
+# ── traced_async ─────────────────────────────────────────────────
+
+
+async def test_traced_methods_record_agent_and_llm_spans() -> None:
+    tracer = Tracer()
+    with tracer.activate(), trace_span("risk", SPAN_STAGE):
+        assert await _SubAgent(_Engine()).run() == 5
+
+    categories = sorted(span.category for span in tracer.spans)
+    # The super().run() call of the subclass is not traced a second time
+    assert categories == [SPAN_AGENT, SPAN_LLM, SPAN_STAGE]
+    assert [s.tokens for s in tracer.stage_spans()] == [5]
+    assert tracer.totals()[SPAN_LLM]["tokens"] == 5
+
+
+async def test_traced_methods_without_tracer() -> None:
+    assert await _Agent(_Engine()).run() == 5
+
+
+# ── Export ───────────────────────────────────────────────────────
+
+
+def test_summary_and_chrome_trace(tmp_path: Path) -> None:
+    tracer = Tracer()
+    with tracer.activate():
+        with trace_span("tests", SPAN_STAGE), trace_span("llm", SPAN_LLM, model="m") as span:
+            assert span is not None
+            span.add_tokens(7)
+        with trace_span("bugs", SPAN_STAGE):
+            pass
+
+    summary = tracer.summary()
+    assert [stage["name"] for stage in summary["stages"]] == ["tests", "bugs"]
+    assert summary["stages"][0]["tokens"] == 7
+    assert summary["totals"][SPAN_STAGE]["count"] == 2
+    json.dumps(summary)
+
+    path = tracer.write_chrome_trace(tmp_path / "out" / "trace.json")
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert {event["name"] for event in events} == {"tests", "llm", "bugs"}
+    assert all(event["ph"] == "X" for event in events)
+    llm = next(event for event in events if event["name"] == "llm")
+    assert llm["args"]["model"] == "m"
+    assert llm["args"]["tokens"] == 7
+
+
+def test_overlapping_spans_get_separate_lanes(tmp_path: Path) -> None:
+    tracer = Tracer()
+    with tracer.activate():
+        with trace_span("a", SPAN_STAGE):
+            pass
+        with trace_span("b", SPAN_STAGE):
+            pass
+    first, second = tracer.spans
+    # Make the spans overlap without nesting
+    first.start_ms, first.duration_ms = 0.0, 10.0
+    second.start_ms, second.duration_ms = 5.0, 10.0
+
+    events = json.loads(tracer.write_chrome_trace(tmp_path / "t.json").read_text())["traceEvents"]
+
+    assert len({event["tid"] for event in events}) == 2
@@ -10,17 +10,21 @@ import pytest
 from nit.adapters.base import CaseResult, CaseStatus, RunResult
 from nit.agents.base import TaskInput, TaskStatus
 from nit.agents.builders.unit import (
+    BatchBuildTask,
     BuildTask,
     FailureType,
     UnitBuilder,
     ValidationAttempt,
 )
+from nit.llm.context import AssembledContext
 from nit.llm.engine import (
     GenerationRequest,
     LLMAuthError,
     LLMConnectionError,
     LLMResponse,
 )
+from nit.llm.tokenizer import heuristic_tokenizer
+from nit.parsing.languages import extract_from_source
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -32,6 +36,7 @@ def mock_llm_engine() -> MagicMock:
     engine = MagicMock()
     engine.model_name = "gpt-4o"
     engine.count_tokens = MagicMock(return_value=100)
+    engine.tokenizer = heuristic_tokenizer()
 
     # Mock the generate method to return a test code response
     async def mock_generate(request: GenerationRequest) -> LLMResponse:
@@ -718,6 +723,7 @@ def test_failure_type_values() -> None:
     assert FailureType.MISSING_DEP.value == "missing_dep"
     assert FailureType.TIMEOUT.value == "timeout"
     assert FailureType.UNKNOWN.value == "unknown"
+    assert FailureType.IMPORT_ERROR.value == "import_error"
 
 
 def test_classify_failure_timeout(
@@ -1256,6 +1262,41 @@ async def test_validate_and_run_test_success(
     assert attempt.failure_type is None
 
 
+@pytest.mark.asyncio
+async def test_validate_and_run_test_import_error_skips_run(
+    mock_llm_engine: MagicMock,
+    tmp_path: Path,
+) -> None:
+    """Unresolvable project imports are reported without running the test."""
+    source = "def add(a, b):\n    return a + b\n"
+    (tmp_path / "calc.py").write_text(source, encoding="utf-8")
+    context = AssembledContext(
+        source_path=str(tmp_path / "calc.py"),
+        source_code=source,
+        language="python",
+        parse_result=extract_from_source(source.encode("utf-8"), "python"),
+    )
+    builder = UnitBuilder(
+        llm_engine=mock_llm_engine,
+        project_root=tmp_path,
+        enable_memory=False,
+    )
+
+    adapter = MagicMock()
+    adapter.validate_test.return_value = MagicMock(valid=True, errors=[])
+    adapter.run_tests = AsyncMock()
+
+    attempt = await builder._validate_and_run_test(
+        "from calc import subtract\n", adapter, tmp_path / "test_calc.py", context=context
+    )
+
+    assert attempt.failure_type == FailureType.IMPORT_ERROR
+    assert not attempt.passed
+    assert "cannot import name 'subtract'" in attempt.error_message
+    assert "add" in attempt.error_message
+    adapter.run_tests.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_retry_with_feedback(
     mock_llm_engine: MagicMock,
@@ -1607,3 +1648,125 @@ async def test_run_with_validation_and_memory_update(
     assert result.status == TaskStatus.COMPLETED
     assert result.result["validation_enabled"] is True
     assert result.result["validation_attempts"] >= 1
+
+
+# ── Batched generation ───────────────────────────────────────────────
+
+
+def _write_ts_sources(root: Path, names: list[str]) -> list[Path]:
+    src_dir = root / "src"
+    src_dir.mkdir(exist_ok=True)
+    paths = []
+    for name in names:
+        path = src_dir / f"{name}.ts"
+        path.write_text(f"export function {name}(a: number): number {{\n  return a;\n}}\n")
+        paths.append(path)
+    return paths
+
+
+def test_plan_tasks_batches_small_files(mock_llm_engine: MagicMock, tmp_path: Path) -> None:
+    paths = _write_ts_sources(tmp_path, ["one", "two"])
+    builder = UnitBuilder(llm_engine=mock_llm_engine, project_root=tmp_path)
+    tasks = [BuildTask(source_file=str(p), framework="vitest") for p in paths]
+
+    planned = builder.plan_tasks(tasks)
+    unbatched = builder.plan_tasks(tasks, max_files=1)
+
+    assert len(planned) == 1
+    assert isinstance(planned[0], BatchBuildTask)
+    assert planned[0].tasks == tasks
+    assert unbatched == tasks
+
+
+async def test_batch_generates_each_file_from_one_request(
+    mock_llm_engine: MagicMock,
+    vitest_project: Path,
+) -> None:
+    paths = _write_ts_sources(vitest_project, ["one", "two"])
+
+    async def mock_generate(request: GenerationRequest) -> LLMResponse:
+        text = "".join(
+            f"=== FILE: {p} ===\nimport {{ it }} from 'vitest';\nit('{p.stem}', () => {{}});\n"
+            for p in paths
+        )
+        return LLMResponse(text=text, model="gpt-4o", prompt_tokens=800, completion_tokens=200)
+
+    mock_llm_engine.configure_mock(generate=AsyncMock(side_effect=mock_generate))
+    builder = UnitBuilder(
+        llm_engine=mock_llm_engine,
+        project_root=vitest_project,
+        enable_memory=False,
+        validation_config={"enabled": False},
+    )
+    batch = BatchBuildTask(tasks=[BuildTask(source_file=str(p), framework="vitest") for p in paths])
+
+    result = await builder.run(batch)
+
+    assert result.status == TaskStatus.COMPLETED
+    assert mock_llm_engine.generate.await_count == 1
+    outputs = result.result["outputs"]
+    assert [o.result["source_file"] for o in outputs] == [str(p) for p in paths]
+    assert "it('one'" in outputs[0].result["test_code"]
+    assert "it('two'" in outputs[1].result["test_code"]
+    assert outputs[0].result["tokens_used"] == 500
+    assert outputs[0].result["batch_size"] == 2
+
+
+async def test_batch_generates_individually_when_prompts_exceed_budget(
+    mock_llm_engine: MagicMock,
+    vitest_project: Path,
+) -> None:
+    paths = _write_ts_sources(vitest_project, ["one", "two"])
+    mock_llm_engine.configure_mock(
+        count_tokens=MagicMock(return_value=3000),
+        generate=AsyncMock(
+            return_value=LLMResponse(
+                text="it('single', () => {});", model="gpt-4o", prompt_tokens=10
+            )
+        ),
+    )
+    builder = UnitBuilder(
+        llm_engine=mock_llm_engine,
+        project_root=vitest_project,
+        enable_memory=False,
+        validation_config={"enabled": False},
+        max_context_tokens=4000,
+    )
+    batch = BatchBuildTask(tasks=[BuildTask(source_file=str(p), framework="vitest") for p in paths])
+
+    result = await builder.run(batch)
+
+    assert result.status == TaskStatus.COMPLETED
+    requests = [call.args[0] for call in mock_llm_engine.generate.await_args_list]
+    assert len(requests) == 2
+    assert not any(r.metadata.get("nit_batch_size") for r in requests)
+
+
+async def test_batch_falls_back_for_files_missing_from_response(
+    mock_llm_engine: MagicMock,
+    vitest_project: Path,
+) -> None:
+    paths = _write_ts_sources(vitest_project, ["one", "two"])
+
+    async def mock_generate(request: GenerationRequest) -> LLMResponse:
+        if request.metadata.get("nit_batch_size"):
+            text = f"=== FILE: {paths[0]} ===\nit('one', () => {{}});\n"
+        else:
+            text = "it('single', () => {});"
+        return LLMResponse(text=text, model="gpt-4o", prompt_tokens=10, completion_tokens=10)
+
+    mock_llm_engine.configure_mock(generate=AsyncMock(side_effect=mock_generate))
+    builder = UnitBuilder(
+        llm_engine=mock_llm_engine,
+        project_root=vitest_project,
+        enable_memory=False,
+        validation_config={"enabled": False},
+    )
+    batch = BatchBuildTask(tasks=[BuildTask(source_file=str(p), framework="vitest") for p in paths])
+
+    result = await builder.run(batch)
+
+    outputs = result.result["outputs"]
+    assert mock_llm_engine.generate.await_count == 2
+    assert "it('one'" in outputs[0].result["test_code"]
+    assert outputs[1].result["test_code"] == "it('single', () => {});"
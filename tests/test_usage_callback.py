@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import gzip
+import json
+import threading
+import time
 from datetime import UTC, datetime
 from types import SimpleNamespace
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import litellm
 import pytest
@@ -12,14 +16,55 @@ import requests
 
 from nit.llm import usage_callback
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
 _TEST_INGEST_TOKEN = "test-ingest-" + "token"
 
 
+def _install_post(monkeypatch: pytest.MonkeyPatch, fake_post: Callable[..., Any]) -> None:
+    """Route the reporter's session posts to *fake_post* with the decoded JSON body."""
+
+    def _session_post(
+        _session: requests.Session,
+        url: str,
+        *,
+        headers: dict[str, str],
+        data: bytes,
+        timeout: float,
+    ) -> Any:
+        assert headers["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(data))
+        return fake_post(url, headers=headers, json=payload, timeout=timeout)
+
+    monkeypatch.setattr(requests.Session, "post", _session_post)
+
+
+def _drain() -> None:
+    """Wait until the singleton reporter has uploaded everything queued."""
+    usage_callback.get_usage_reporter().flush()
+
+
+def _close_reporter() -> None:
+    """Stop the singleton reporter's worker thread, if one was created."""
+    reporter = usage_callback._SINGLETONS.reporter
+    if reporter is not None:
+        reporter.close()
+
+
+def _wait_for(predicate: Callable[[], object], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
 @pytest.fixture(autouse=True)
-def _reset_singletons(monkeypatch: pytest.MonkeyPatch) -> None:
+def _reset_singletons(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[None]:
     """Reset reporter/callback singleton state between tests."""
     usage_callback._SINGLETONS.reporter = None
     usage_callback._SINGLETONS.callback = None
+    monkeypatch.setenv("NIT_USAGE_SPILL_DIR", str(tmp_path / "usage-spill"))
 
     monkeypatch.setenv("NIT_PLATFORM_URL", "https://platform.example")
     monkeypatch.setenv("NIT_PLATFORM_INGEST_TOKEN", "ingest-token")
@@ -27,6 +72,8 @@ def _reset_singletons(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("NIT_PLATFORM_PROJECT_ID", "project-456")
     monkeypatch.setenv("NIT_USAGE_BATCH_SIZE", "1")
     monkeypatch.setenv("NIT_USAGE_FLUSH_INTERVAL_SECONDS", "999")
+    yield
+    _close_reporter()
 
 
 def test_report_cli_usage_event_posts_payload(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -41,7 +88,7 @@ def test_report_cli_usage_event_posts_payload(monkeypatch: pytest.MonkeyPatch) -
         captured["timeout"] = timeout
         return SimpleNamespace(status_code=200, text="ok")
 
-    monkeypatch.setattr(requests, "post", _fake_post)
+    _install_post(monkeypatch, _fake_post)
 
     usage_callback.report_cli_usage_event(
         usage_callback.CLIUsageEvent(
@@ -56,6 +103,7 @@ def test_report_cli_usage_event_posts_payload(monkeypatch: pytest.MonkeyPatch) -
             metadata={"nit_cli_command": "claude --print"},
         )
     )
+    _drain()
 
     payload = captured["json"]
     assert isinstance(payload, dict)
@@ -81,7 +129,7 @@ def test_callback_extracts_litellm_usage(monkeypatch: pytest.MonkeyPatch) -> Non
         captured["json"] = json
         return SimpleNamespace(status_code=200, text="ok")
 
-    monkeypatch.setattr(requests, "post", _fake_post)
+    _install_post(monkeypatch, _fake_post)
 
     callback = usage_callback.NitUsageCallback()
 
@@ -108,6 +156,7 @@ def test_callback_extracts_litellm_usage(monkeypatch: pytest.MonkeyPatch) -> Non
     start = datetime(2026, 2, 10, 10, 30, 0, tzinfo=UTC)
     end = datetime(2026, 2, 10, 10, 30, 1, tzinfo=UTC)
     callback.log_success_event(kwargs, response_obj, start, end)
+    _drain()
 
     payload = captured["json"]
     assert isinstance(payload, dict)
@@ -132,7 +181,7 @@ def test_callback_respects_emit_flag(monkeypatch: pytest.MonkeyPatch) -> None:
         posted["count"] += 1
         return SimpleNamespace(status_code=200, text="ok")
 
-    monkeypatch.setattr(requests, "post", _fake_post)
+    _install_post(monkeypatch, _fake_post)
 
     callback = usage_callback.NitUsageCallback()
 
@@ -156,6 +205,7 @@ def test_callback_respects_emit_flag(monkeypatch: pytest.MonkeyPatch) -> None:
         datetime.now(UTC),
         datetime.now(UTC),
     )
+    _drain()
 
     assert posted["count"] == 0
 
@@ -583,7 +633,7 @@ class TestBatchedUsageReporterFlushAndPost:
             posted.append(json)
             return SimpleNamespace(status_code=200, text="ok")
 
-        monkeypatch.setattr(requests, "post", _fake_post)
+        _install_post(monkeypatch, _fake_post)
 
         config = self._make_config(batch_size=100)
         reporter = usage_callback.BatchedUsageReporter(config)
@@ -610,7 +660,7 @@ class TestBatchedUsageReporterFlushAndPost:
                 return SimpleNamespace(status_code=500, text="error")
             return SimpleNamespace(status_code=200, text="ok")
 
-        monkeypatch.setattr(requests, "post", _fake_post)
+        _install_post(monkeypatch, _fake_post)
         monkeypatch.setattr("time.sleep", lambda _: None)
 
         config = self._make_config(max_retries=3)
@@ -622,7 +672,7 @@ class TestBatchedUsageReporterFlushAndPost:
         def _fake_post(*args: object, **kwargs: object) -> None:
             raise requests.RequestException("timeout")
 
-        monkeypatch.setattr(requests, "post", _fake_post)
+        _install_post(monkeypatch, _fake_post)
         monkeypatch.setattr("time.sleep", lambda _: None)
 
         config = self._make_config(max_retries=2)
@@ -630,11 +680,207 @@ class TestBatchedUsageReporterFlushAndPost:
         # Should not raise
         reporter._post_batch([{"e": 1}])
 
-    def test_drain_empty_buffer(self) -> None:
+    def test_flush_without_events_is_noop(self) -> None:
         config = self._make_config()
         reporter = usage_callback.BatchedUsageReporter(config)
-        batch = reporter._drain_unlocked()
-        assert batch == []
+        reporter.flush()
+        reporter.close()
+        assert reporter._worker is None
+
+    def test_enqueue_does_not_block_on_slow_platform(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        release = threading.Event()
+        posted: list[dict[str, Any]] = []
+
+        def _slow_post(url: str, **kwargs: Any) -> SimpleNamespace:
+            release.wait(5)
+            posted.append(kwargs["json"])
+            return SimpleNamespace(status_code=200, text="ok")
+
+        _install_post(monkeypatch, _slow_post)
+
+        reporter = usage_callback.BatchedUsageReporter(self._make_config(batch_size=1))
+        started = time.monotonic()
+        for i in range(5):
+            reporter.enqueue({"e": i})
+        assert time.monotonic() - started < 1.0
+        assert posted == []
+
+        release.set()
+        reporter.close()
+        assert sum(len(p["events"]) for p in posted) == 5
+
+    def test_full_queue_drops_without_spill_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        release = threading.Event()
+
+        def _blocked_post(url: str, **kwargs: Any) -> SimpleNamespace:
+            release.wait(5)
+            return SimpleNamespace(status_code=200, text="ok")
+
+        _install_post(monkeypatch, _blocked_post)
+
+        config = self._make_config(batch_size=1)
+        config.max_queue_size = 2
+        reporter = usage_callback.BatchedUsageReporter(config)
+        for i in range(10):
+            reporter.enqueue({"e": i})
+
+        assert reporter.dropped_events > 0
+        release.set()
+        reporter.close()
+
+    def test_full_queue_overflow_is_spilled_in_one_batch_by_the_worker(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        release = threading.Event()
+        posted: list[Any] = []
+
+        def _blocked_post(url: str, **kwargs: Any) -> SimpleNamespace:
+            release.wait(5)
+            posted.extend(e["e"] for e in kwargs["json"]["events"])
+            return SimpleNamespace(status_code=200, text="ok")
+
+        _install_post(monkeypatch, _blocked_post)
+        spill_writes: list[tuple[str, int]] = []
+        write_spill_file = usage_callback._write_spill_file
+
+        def _recording_write(path: Path, events: list[dict[str, Any]]) -> None:
+            spill_writes.append((threading.current_thread().name, len(events)))
+            write_spill_file(path, events)
+
+        monkeypatch.setattr(usage_callback, "_write_spill_file", _recording_write)
+        config = self._make_config(batch_size=1)
+        config.max_queue_size = 2
+        config.spill_dir = tmp_path / "spill"
+        reporter = usage_callback.BatchedUsageReporter(config)
+        for i in range(8):
+            reporter.enqueue({"e": i})
+
+        assert spill_writes == []
+        release.set()
+        reporter.close()
+
+        assert [name for name, _ in spill_writes] == ["nit-usage-reporter"]
+        assert spill_writes[0][1] == 2
+        assert sorted(posted) == sorted(set(posted))
+        assert len(posted) + reporter.dropped_events == 8
+        assert list(config.spill_dir.rglob("*.jsonl")) == []
+
+    def test_abandoned_replay_is_reclaimed_at_startup(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        posted: list[Any] = []
+
+        def _fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+            posted.extend(e["e"] for e in kwargs["json"]["events"])
+            return SimpleNamespace(status_code=200, text="ok")
+
+        _install_post(monkeypatch, _fake_post)
+        config = self._make_config(batch_size=10)
+        config.spill_dir = tmp_path / "spill"
+        reporter = usage_callback.BatchedUsageReporter(config)
+        spill_dir = reporter._spill_dir()
+        assert spill_dir is not None
+        spill_dir.mkdir(parents=True)
+        stale_ns = time.time_ns() - (usage_callback._STALE_REPLAY_SECONDS + 60) * 1_000_000_000
+        (spill_dir / f".1-a.{stale_ns}.nonce.replay").write_text('{"e": "abandoned"}\n')
+        (spill_dir / f".2-b.{time.time_ns()}.nonce.replay").write_text('{"e": "in flight"}\n')
+
+        reporter.enqueue({"e": "new"})
+        reporter.close()
+
+        assert posted == ["new", "abandoned"]
+        assert [p.name for p in spill_dir.iterdir()] == [p.name for p in spill_dir.glob(".2-b.*")]
+
+    def test_failed_batch_is_spilled_and_replayed(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        posted: list[dict[str, Any]] = []
+        platform_up = {"value": False}
+
+        def _fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+            if not platform_up["value"]:
+                raise requests.ConnectionError("unreachable")
+            posted.append(kwargs["json"])
+            return SimpleNamespace(status_code=200, text="ok")
+
+        _install_post(monkeypatch, _fake_post)
+        spill_dir = tmp_path / "spill"
+        config = self._make_config(batch_size=10)
+        config.spill_dir = spill_dir
+
+        first = usage_callback.BatchedUsageReporter(config)
+        first.enqueue({"e": "lost"})
+        first.close()
+        assert len(list(spill_dir.rglob("*.jsonl"))) == 1
+
+        # A later process replays the spilled batch once the platform is back
+        platform_up["value"] = True
+        second = usage_callback.BatchedUsageReporter(config)
+        second.enqueue({"e": "new"})
+        second.close()
+
+        assert [e["e"] for p in posted for e in p["events"]] == ["new", "lost"]
+        assert list(spill_dir.rglob("*.jsonl")) == []
+
+    def test_spilled_batch_is_only_replayed_to_its_destination(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        posted: list[tuple[str, Any]] = []
+        platform_up = {"value": False}
+
+        def _fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+            if not platform_up["value"]:
+                raise requests.ConnectionError("unreachable")
+            posted.append((kwargs["headers"]["Authorization"], kwargs["json"]))
+            return SimpleNamespace(status_code=200, text="ok")
+
+        _install_post(monkeypatch, _fake_post)
+        config = self._make_config(batch_size=10)
+        config.spill_dir = tmp_path / "spill"
+        first = usage_callback.BatchedUsageReporter(config)
+        first.enqueue({"e": "lost"})
+        first.close()
+
+        platform_up["value"] = True
+        other = self._make_config(batch_size=10)
+        other.ingest_token = "other-" + "tok"
+        other.spill_dir = config.spill_dir
+        second = usage_callback.BatchedUsageReporter(other)
+        second.enqueue({"e": "new"})
+        second.close()
+
+        assert [e["e"] for _, p in posted for e in p["events"]] == ["new"]
+        assert len(list(config.spill_dir.rglob("*.jsonl"))) == 1
+
+    def test_partial_replay_keeps_only_undelivered_chunks(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        posted: list[Any] = []
+        failures = {"remaining": 0}
+
+        def _fake_post(url: str, **kwargs: Any) -> SimpleNamespace:
+            if posted and failures["remaining"]:
+                failures["remaining"] -= 1
+                raise requests.ConnectionError("unreachable")
+            posted.extend(e["e"] for e in kwargs["json"]["events"])
+            return SimpleNamespace(status_code=200, text="ok")
+
+        _install_post(monkeypatch, _fake_post)
+        config = self._make_config(batch_size=1)
+        config.spill_dir = tmp_path / "spill"
+        reporter = usage_callback.BatchedUsageReporter(config)
+        assert reporter._spill([{"e": 1}, {"e": 2}, {"e": 3}])
+
+        # The first chunk is delivered, the second fails
+        failures["remaining"] = 1
+        reporter._replay_spilled()
+        assert posted == [1]
+        [spilled] = config.spill_dir.rglob("*.jsonl")
+        assert [json.loads(line)["e"] for line in spilled.read_text().splitlines()] == [2, 3]
+
+        reporter._replay_spilled()
+        assert posted == [1, 2, 3]
+        assert list(config.spill_dir.rglob("*.jsonl")) == []
 
     def test_enqueue_triggers_batch_by_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
         posted: list[dict[str, object]] = []
@@ -649,12 +895,11 @@ class TestBatchedUsageReporterFlushAndPost:
             posted.append(json)
             return SimpleNamespace(status_code=200, text="ok")
 
-        monkeypatch.setattr(requests, "post", _fake_post)
+        _install_post(monkeypatch, _fake_post)
 
         config = self._make_config(batch_size=100)
         reporter = usage_callback.BatchedUsageReporter(config)
-        # Force interval flush by setting last_flush far in past
-        reporter._last_flush = 0.0
+        # Force an interval flush on the first queued event
         _token = "test-" + "tok"
         reporter._config = usage_callback.UsageReporterConfig(
             platform_url="https://example.com",
@@ -668,7 +913,9 @@ class TestBatchedUsageReporterFlushAndPost:
             request_timeout_seconds=5.0,
         )
         reporter.enqueue({"test": 1})
+        _wait_for(lambda: posted)
         assert len(posted) == 1
+        reporter.close()
 
 
 # ── report_cli_usage_event edge cases ─────────────────────────────────
@@ -690,7 +937,7 @@ class TestReportCliUsageEventEdgeCases:
             captured["json"] = json
             return SimpleNamespace(status_code=200, text="ok")
 
-        monkeypatch.setattr(requests, "post", _fake_post)
+        _install_post(monkeypatch, _fake_post)
 
         usage_callback.report_cli_usage_event(
             usage_callback.CLIUsageEvent(
@@ -701,6 +948,7 @@ class TestReportCliUsageEventEdgeCases:
                 cost_usd=0.01,
             )
         )
+        _drain()
         event = captured["json"]["events"][0]
         assert "durationMs" not in event
 
@@ -717,7 +965,7 @@ class TestReportCliUsageEventEdgeCases:
             captured["json"] = json
             return SimpleNamespace(status_code=200, text="ok")
 
-        monkeypatch.setattr(requests, "post", _fake_post)
+        _install_post(monkeypatch, _fake_post)
 
         usage_callback.report_cli_usage_event(
             usage_callback.CLIUsageEvent(
@@ -727,6 +975,7 @@ class TestReportCliUsageEventEdgeCases:
                 completion_tokens=5,
             )
         )
+        _drain()
         event = captured["json"]["events"][0]
         assert "metadata" not in event
 
@@ -765,7 +1014,7 @@ class TestNitUsageCallbackAsync:
             captured["json"] = json
             return SimpleNamespace(status_code=200, text="ok")
 
-        monkeypatch.setattr(requests, "post", _fake_post)
+        _install_post(monkeypatch, _fake_post)
 
         callback = usage_callback.NitUsageCallback()
 
@@ -783,6 +1032,7 @@ class TestNitUsageCallbackAsync:
             start,
             end,
         )
+        _drain()
 
         assert "json" in captured
 
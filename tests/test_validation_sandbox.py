@@ -0,0 +1,117 @@
+"""Tests for the validation sandbox (agents/builders/sandbox.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from nit.agents.builders.sandbox import SCRATCH_PREFIX, ValidationSandbox
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _markers(root: Path) -> list[Path]:
+    return list((root / ".nit" / "tmp" / "sandbox").glob("*.json"))
+
+
+async def test_reserve_gives_unique_sibling_paths(tmp_path: Path) -> None:
+    sandbox = ValidationSandbox(tmp_path)
+    target = tmp_path / "tests" / "test_foo.py"
+
+    async with sandbox.reserve(target) as first, sandbox.reserve(target) as second:
+        assert first != second
+        assert first.parent == second.parent == target.parent
+        assert first.name.startswith(SCRATCH_PREFIX)
+        assert first.name.endswith("_test_foo.py")
+        first.parent.mkdir(parents=True, exist_ok=True)
+        first.write_text("a", encoding="utf-8")
+        second.write_text("b", encoding="utf-8")
+        assert len(_markers(tmp_path)) == 2
+
+    assert not first.exists()
+    assert not second.exists()
+    assert _markers(tmp_path) == []
+
+
+async def test_reserve_leaves_existing_test_untouched(tmp_path: Path) -> None:
+    target = tmp_path / "foo.test.ts"
+    target.write_text("original", encoding="utf-8")
+    sandbox = ValidationSandbox(tmp_path)
+
+    async with sandbox.reserve(target) as scratch:
+        scratch.write_text("candidate", encoding="utf-8")
+
+    assert target.read_text(encoding="utf-8") == "original"
+    assert not scratch.exists()
+
+
+async def test_reserve_cleans_up_on_error(tmp_path: Path) -> None:
+    sandbox = ValidationSandbox(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        async with sandbox.reserve(tmp_path / "test_foo.py") as scratch:
+            scratch.write_text("x", encoding="utf-8")
+            raise RuntimeError("boom")
+
+    assert not scratch.exists()
+    assert _markers(tmp_path) == []
+
+
+async def test_exclusive_reservation_restores_original(tmp_path: Path) -> None:
+    target = tmp_path / "foo_test.go"
+    target.write_text("original", encoding="utf-8")
+    sandbox = ValidationSandbox(tmp_path)
+
+    async with sandbox.reserve(target) as path:
+        assert path == target
+        assert not target.exists()
+        path.write_text("candidate", encoding="utf-8")
+
+    assert target.read_text(encoding="utf-8") == "original"
+    assert [p.name for p in tmp_path.iterdir() if p.is_file()] == ["foo_test.go"]
+
+
+async def test_exclusive_reservations_are_serialised(tmp_path: Path) -> None:
+    target = tmp_path / "FooTest.java"
+    holders: list[str] = []
+
+    async def _hold(name: str) -> None:
+        async with ValidationSandbox(tmp_path).reserve(target):
+            holders.append(f"{name}-in")
+            await asyncio.sleep(0.01)
+            holders.append(f"{name}-out")
+
+    await asyncio.gather(_hold("a"), _hold("b"))
+
+    assert holders in (["a-in", "a-out", "b-in", "b-out"], ["b-in", "b-out", "a-in", "a-out"])
+
+
+def test_sweep_removes_stale_scratch_files(tmp_path: Path) -> None:
+    scratch = tmp_path / f"{SCRATCH_PREFIX}deadbeef_test_foo.py"
+    scratch.write_text("left behind", encoding="utf-8")
+    backup = tmp_path / f"{SCRATCH_PREFIX}cafebabe.bak"
+    backup.write_text("original", encoding="utf-8")
+    target = tmp_path / "foo_test.go"
+
+    state_dir = tmp_path / ".nit" / "tmp" / "sandbox"
+    state_dir.mkdir(parents=True)
+    stale = state_dir / "1-a.json"
+    stale.write_text(json.dumps({"scratch": str(scratch), "backup": None}), encoding="utf-8")
+    restored = state_dir / "1-b.json"
+    restored.write_text(json.dumps({"scratch": str(target), "backup": str(backup)}))
+    fresh = state_dir / "2-c.json"
+    fresh.write_text(json.dumps({"scratch": str(tmp_path / "live.py"), "backup": None}))
+    for marker in (stale, restored):
+        os.utime(marker, (0, 0))
+
+    assert ValidationSandbox(tmp_path).sweep() == 2
+
+    assert not scratch.exists()
+    assert target.read_text(encoding="utf-8") == "original"
+    assert not backup.exists()
+    assert _markers(tmp_path) == [fresh]
@@ -0,0 +1,233 @@
+"""Tests for the warm test-runner worker pool (adapters/worker_pool.py)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nit.adapters.base import RunResult
+from nit.adapters.worker_pool import JsonLineRunner, WarmRunner, WarmRunnerError, WorkerPool
+
+COLD = RunResult(passed=1, success=True, raw_output="cold")
+
+
+class FakeRunner(WarmRunner):
+    """In-process runner returning queued outcomes."""
+
+    def __init__(
+        self,
+        *outcomes: RunResult | Exception,
+        fail_start: bool = False,
+        single_use: bool = False,
+    ) -> None:
+        self.outcomes = list(outcomes)
+        self.fail_start = fail_start
+        self.single_use = single_use
+        self.started = 0
+        self.closed = False
+        self.runs: list[list[Path]] = []
+
+    def start(self) -> None:
+        self.started += 1
+        if self.fail_start:
+            raise WarmRunnerError("no interpreter")
+
+    def run(self, test_files: list[Path], timeout: float) -> RunResult:
+        self.runs.append(test_files)
+        outcome = self.outcomes.pop(0) if self.outcomes else RunResult(passed=1, success=True)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def close(self) -> None:
+        self.closed = True
+
+    @property
+    def reusable(self) -> bool:
+        return not (self.single_use and self.runs)
+
+
+def _adapter(*runners: WarmRunner | None) -> MagicMock:
+    adapter = MagicMock()
+    adapter.name = "fake"
+    adapter.create_warm_runner = MagicMock(side_effect=list(runners))
+    adapter.run_tests = AsyncMock(return_value=COLD)
+    return adapter
+
+
+async def test_adapter_without_warm_support_runs_cold(tmp_path: Path) -> None:
+    adapter = _adapter(None)
+    pool = WorkerPool()
+
+    assert await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5) is COLD
+    assert await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5) is COLD
+
+    # Unsupported adapters are remembered and not asked again
+    adapter.create_warm_runner.assert_called_once()
+    assert adapter.run_tests.await_count == 2
+
+
+async def test_warm_runner_is_reused(tmp_path: Path) -> None:
+    runner = FakeRunner()
+    adapter = _adapter(runner)
+    pool = WorkerPool()
+
+    for _ in range(3):
+        result = await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5)
+        assert result.success
+
+    assert runner.started == 1
+    assert len(runner.runs) == 3
+    adapter.run_tests.assert_not_awaited()
+    pool.close()
+    assert runner.closed
+
+
+async def test_failed_start_falls_back_to_cold(tmp_path: Path) -> None:
+    adapter = _adapter(FakeRunner(fail_start=True))
+    pool = WorkerPool()
+
+    assert await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5) is COLD
+    assert await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5) is COLD
+    adapter.create_warm_runner.assert_called_once()
+
+
+async def test_broken_worker_is_recycled_and_run_cold(tmp_path: Path) -> None:
+    broken = FakeRunner(WarmRunnerError("worker exited"))
+    replacement = FakeRunner()
+    adapter = _adapter(broken, replacement)
+    pool = WorkerPool()
+
+    assert await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5) is COLD
+    assert broken.closed
+
+    result = await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5)
+    assert result.success
+    assert replacement.runs
+
+
+async def test_timeout_recycles_worker(tmp_path: Path) -> None:
+    runner = FakeRunner(TimeoutError("too slow"))
+    adapter = _adapter(runner, FakeRunner())
+    pool = WorkerPool()
+
+    result = await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5)
+
+    assert not result.success
+    assert "timed out" in result.raw_output
+    assert runner.closed
+    adapter.run_tests.assert_not_awaited()
+
+
+async def test_worker_retired_after_max_runs(tmp_path: Path) -> None:
+    first, second = FakeRunner(), FakeRunner()
+    adapter = _adapter(first, second)
+    pool = WorkerPool(max_runs_per_worker=2)
+
+    for _ in range(3):
+        await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5)
+
+    assert len(first.runs) == 2
+    assert first.closed
+    assert len(second.runs) == 1
+
+
+async def test_single_use_worker_is_replaced_in_background(tmp_path: Path) -> None:
+    first, spare = FakeRunner(single_use=True), FakeRunner()
+    adapter = _adapter(first, spare)
+    pool = WorkerPool()
+
+    result = await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5)
+
+    assert result.success
+    assert first.closed
+    for thread in pool._spares:
+        thread.join()
+    assert spare.started == 1
+
+    await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5)
+    assert len(spare.runs) == 1
+    adapter.run_tests.assert_not_awaited()
+    pool.close()
+    assert spare.closed
+
+
+async def test_close_stops_a_spare_still_starting(tmp_path: Path) -> None:
+    first, spare = FakeRunner(single_use=True), FakeRunner()
+    adapter = _adapter(first, spare)
+    pool = WorkerPool()
+
+    await pool.run_tests(adapter, tmp_path, [tmp_path / "t.py"], timeout=5)
+    pool.close()
+
+    assert spare.started == 1
+    assert spare.closed
+
+
+# ── JsonLineRunner ──────────────────────────────────────────────
+
+_ECHO_WORKER = """
+import json, sys, time
+print(json.dumps({"ready": True}), flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    time.sleep(request.get("sleep", 0))
+    print(json.dumps({"echo": request["value"]}), flush=True)
+"""
+
+
+class EchoRunner(JsonLineRunner):
+    def __init__(self, script: str, cwd: Path) -> None:
+        super().__init__([sys.executable, "-c", script], cwd)
+
+    def run(self, test_files: list[Path], timeout: float) -> RunResult:
+        response = self.request({"value": [f.name for f in test_files]}, timeout)
+        return RunResult(raw_output=str(response["echo"]), success=True)
+
+
+def test_json_line_runner_round_trip(tmp_path: Path) -> None:
+    runner = EchoRunner(_ECHO_WORKER, tmp_path)
+    runner.start()
+    try:
+        assert runner.request({"value": 1}, timeout=10) == {"echo": 1}
+        assert runner.run([tmp_path / "test_x.py"], timeout=10).raw_output == "['test_x.py']"
+    finally:
+        runner.close()
+
+
+def test_json_line_runner_times_out(tmp_path: Path) -> None:
+    runner = EchoRunner(_ECHO_WORKER, tmp_path)
+    runner.start()
+
+    with pytest.raises(TimeoutError):
+        runner.request({"value": 1, "sleep": 30}, timeout=0.5)
+
+    with pytest.raises(WarmRunnerError):
+        runner.request({"value": 2}, timeout=10)
+
+
+def test_json_line_runner_honours_recycle(tmp_path: Path) -> None:
+    script = """
+import json, sys
+print(json.dumps({"ready": True}), flush=True)
+sys.stdin.readline()
+print(json.dumps({"echo": 1, "recycle": True}), flush=True)
+"""
+    runner = EchoRunner(script, tmp_path)
+    runner.start()
+    assert runner.reusable
+
+    assert runner.request({"value": 1}, timeout=10)["echo"] == 1
+    assert not runner.reusable
+    runner.close()
+
+
+def test_json_line_runner_reports_failed_start(tmp_path: Path) -> None:
+    script = 'import json; print(json.dumps({"ready": False, "error": "no pytest"}))'
+    runner = EchoRunner(script, tmp_path)
+
+    with pytest.raises(WarmRunnerError, match="no pytest"):
+        runner.start()